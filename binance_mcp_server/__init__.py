@@ -5,4 +5,10 @@ This package provides a Model Context Protocol (MCP) server for interacting with
 the Binance cryptocurrency exchange API.
 """
 
-from binance_mcp_server.server import mcp
\ No newline at end of file
+from dotenv import load_dotenv
+
+# Load .env before any module reads BinanceConfig at import time (rate limits,
+# cache sizes and directories are fixed when the global instances are created)
+load_dotenv()
+
+from binance_mcp_server.server import mcp  # noqa: E402
\ No newline at end of file
@@ -0,0 +1,413 @@
+"""
+Live account state maintained from the Binance user data streams.
+
+When enabled, the spot user data stream (outboundAccountPosition and
+executionReport events) keeps balances and open orders in memory, and the
+USD-M futures user data stream (ACCOUNT_UPDATE events) keeps positions in
+memory. Account tools answer from this state while it is synced instead of
+polling the heavy account endpoints.
+
+Listen key creation, keepalive and reconnection are handled by the shared
+ThreadedWebsocketManager. Each state follows the same protocol as the local
+order books: buffer events, load a REST snapshot, replay buffered events
+that are newer than the snapshot, and resync after any stream error since
+events may have been missed while disconnected.
+"""
+
+import time
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from binance_mcp_server.config import BinanceConfig
+from binance_mcp_server.rate_limiter import (
+    binance_rate_limiter,
+    futures_rate_limiter,
+    RateLimiter,
+    RequestPriority,
+    DEFAULT_MAX_WAIT,
+)
+from binance_mcp_server.request_weights import get_request_weight
+from binance_mcp_server.streams import get_stream_manager
+
+
+logger = logging.getLogger(__name__)
+
+# Events buffered while syncing; older events are dropped beyond this
+_MAX_BUFFERED_EVENTS = 1000
+
+# Wait before the stream restarts a resync that ran out of snapshot attempts,
+# doubled after every further failed resync up to the maximum (seconds)
+_RESYNC_RETRY_DELAY = 30.0
+_RESYNC_RETRY_MAX_DELAY = 600.0
+
+# Spot order statuses after which an order is no longer open
+_TERMINAL_ORDER_STATUSES = frozenset({"FILLED", "CANCELED", "REJECTED", "EXPIRED", "EXPIRED_IN_MATCH"})
+
+# Futures position fields that move with the mark price; the user data stream
+# does not keep them current, so positions served from it leave them out
+MARK_PRICE_FIELDS = (
+    "markPrice", "unRealizedProfit", "liquidationPrice", "notional",
+    "isolatedMargin", "initialMargin", "maintMargin", "positionInitialMargin",
+)
+
+
+class _UserStreamState:
+    """
+    Base class for state kept in sync from one user data stream.
+
+    Subclasses provide the stream method, the snapshot fetch/load and the
+    event handler. Stream callbacks run on the WebSocket thread; snapshots are
+    fetched on a separate thread so the stream is never blocked.
+    """
+
+    stream_key = ""
+    stream_method = ""
+
+    def __init__(self, max_snapshot_attempts: int = 5):
+        """
+        Initialize an unsynced state.
+
+        Args:
+            max_snapshot_attempts: Snapshot attempts per resync; once exhausted, the
+                next stream event after a growing delay starts another resync
+        """
+        self.max_snapshot_attempts = max_snapshot_attempts
+        self.synced = False
+        self.synced_at: Optional[float] = None
+        self.last_event_time: Optional[int] = None
+        self._buffer: List[Dict[str, Any]] = []
+        self._resyncing = False
+        self._failed_resyncs = 0
+        self._retry_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._stats = {"events": 0, "resyncs": 0, "errors": 0}
+
+    def start(self) -> None:
+        """Subscribe to the user data stream and load the initial snapshot."""
+        get_stream_manager().subscribe(self.stream_key, self.stream_method, self.on_message)
+        self.resync()
+
+    def stop(self) -> None:
+        """Unsubscribe from the stream and drop the state."""
+        get_stream_manager().unsubscribe(self.stream_key)
+        with self._lock:
+            self.synced = False
+            self._buffer = []
+
+    def on_message(self, message: Dict[str, Any]) -> None:
+        """
+        Handle one user data stream message.
+
+        Args:
+            message: Decoded user data event (or an error message)
+        """
+        if message.get("e") == "error":
+            # The stream reconnects on its own; events in between are lost
+            logger.warning(f"User data stream error ({self.stream_key}): {message.get('m')}")
+            with self._lock:
+                self._stats["errors"] += 1
+                self.synced = False
+                self._buffer = []
+            self.resync()
+            return
+
+        with self._lock:
+            self._stats["events"] += 1
+            if self.synced:
+                self._apply_locked(message)
+                return
+            self._buffer.append(message)
+            if len(self._buffer) > _MAX_BUFFERED_EVENTS:
+                del self._buffer[0]
+            # A resync that ran out of attempts is restarted once its retry delay has passed
+            if self._resyncing or self._retry_at is None or time.time() < self._retry_at:
+                return
+
+        self.resync()
+
+    def _apply_locked(self, event: Dict[str, Any]) -> None:
+        """Apply one event to the state. Caller holds the lock."""
+        raise NotImplementedError
+
+    def _fetch_snapshot(self) -> Any:
+        """Fetch the REST snapshot the state is rebuilt from."""
+        raise NotImplementedError
+
+    def _load_snapshot_locked(self, snapshot: Any) -> None:
+        """Replace the state with a snapshot. Caller holds the lock."""
+        raise NotImplementedError
+
+    def resync(self) -> None:
+        """Start a background resynchronization unless one is already running."""
+        with self._lock:
+            if self._resyncing:
+                return
+            self._resyncing = True
+
+        threading.Thread(
+            target=self._resync,
+            name=f"binance-{self.stream_key}",
+            daemon=True
+        ).start()
+
+    def _resync(self) -> None:
+        """Fetch a snapshot and replay the events buffered meanwhile."""
+        synced = False
+        try:
+            for attempt in range(1, self.max_snapshot_attempts + 1):
+                try:
+                    snapshot = self._fetch_snapshot()
+                except Exception as e:
+                    logger.warning(f"Snapshot for {self.stream_key} failed (attempt {attempt}): {str(e)}")
+                    time.sleep(min(2 ** attempt, 30))
+                    continue
+
+                with self._lock:
+                    self._load_snapshot_locked(snapshot)
+                    buffered, self._buffer = self._buffer, []
+                    for event in buffered:
+                        self._apply_locked(event)
+                    self.synced = True
+                    self.synced_at = time.time()
+                    self._stats["resyncs"] += 1
+                synced = True
+                logger.info(f"Account state for {self.stream_key} synced")
+                return
+        finally:
+            with self._lock:
+                self._resyncing = False
+                if synced:
+                    self._failed_resyncs = 0
+                    self._retry_at = None
+                else:
+                    self._failed_resyncs += 1
+                    delay = min(_RESYNC_RETRY_DELAY * 2 ** (self._failed_resyncs - 1), _RESYNC_RETRY_MAX_DELAY)
+                    self._retry_at = time.time() + delay
+                    logger.error(
+                        f"Could not sync {self.stream_key} after {self.max_snapshot_attempts} attempts; "
+                        f"retrying in {delay:.0f}s"
+                    )
+
+    @staticmethod
+    def _acquire(limiter: RateLimiter, weight: int) -> None:
+        """Charge a snapshot request against a weight budget."""
+        admitted, reason = limiter.acquire(weight, timeout=DEFAULT_MAX_WAIT, priority=RequestPriority.ACCOUNT)
+        if not admitted:
+            raise RuntimeError(f"Rate limit exceeded while fetching account snapshot ({reason})")
+
+    def freshness(self) -> Dict[str, Any]:
+        """Metadata describing how current the state is."""
+        return {
+            "source": "user_data_stream",
+            "synced_at": int(self.synced_at * 1000) if self.synced_at else None,
+            "last_event_time": self.last_event_time,
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get sync state and counters for monitoring."""
+        return {**self._stats, "synced": self.synced, "buffered": len(self._buffer)}
+
+
+class SpotAccountState(_UserStreamState):
+    """
+    Spot balances and open orders fed by the spot user data stream.
+
+    Balances come from outboundAccountPosition events and open orders from
+    executionReport events (which also carry each order's cumulative fills).
+    """
+
+    stream_key = "user:spot"
+    stream_method = "start_user_socket"
+
+    def __init__(self, max_snapshot_attempts: int = 5):
+        super().__init__(max_snapshot_attempts)
+        self._balances: Dict[str, Tuple[float, float]] = {}
+        self._balances_update_time = 0
+        self._open_orders: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+    def _fetch_snapshot(self) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        from binance_mcp_server.utils import get_binance_client
+
+        client = get_binance_client()
+        self._acquire(binance_rate_limiter, get_request_weight("account") + get_request_weight("openOrders"))
+        return client.get_account(), client.get_open_orders()
+
+    def _load_snapshot_locked(self, snapshot: Tuple[Dict[str, Any], List[Dict[str, Any]]]) -> None:
+        account, open_orders = snapshot
+        self._balances = {
+            balance["asset"]: (float(balance["free"]), float(balance["locked"]))
+            for balance in account["balances"]
+        }
+        self._balances_update_time = account.get("updateTime", 0)
+        self._open_orders = {(order["symbol"], order["orderId"]): order for order in open_orders}
+
+    def _apply_locked(self, event: Dict[str, Any]) -> None:
+        event_type = event.get("e")
+        if event_type == "outboundAccountPosition":
+            # Older than the snapshot: already reflected in it
+            if event["u"] < self._balances_update_time:
+                return
+            for balance in event["B"]:
+                self._balances[balance["a"]] = (float(balance["f"]), float(balance["l"]))
+            self._balances_update_time = event["u"]
+        elif event_type == "executionReport":
+            self._apply_execution_report(event)
+        else:
+            return
+        self.last_event_time = event.get("E")
+
+    def _apply_execution_report(self, event: Dict[str, Any]) -> None:
+        """Update an open order from an executionReport."""
+        key = (event["s"], event["i"])
+        current = self._open_orders.get(key)
+        if current is not None and event["T"] < current.get("updateTime", 0):
+            return
+
+        if event["X"] in _TERMINAL_ORDER_STATUSES:
+            self._open_orders.pop(key, None)
+            return
+
+        self._open_orders[key] = {
+            "symbol": event["s"],
+            "orderId": event["i"],
+            "clientOrderId": event["c"],
+            "price": event["p"],
+            "origQty": event["q"],
+            "executedQty": event["z"],
+            "cummulativeQuoteQty": event["Z"],
+            "status": event["X"],
+            "timeInForce": event["f"],
+            "type": event["o"],
+            "side": event["S"],
+            "stopPrice": event["P"],
+            "time": event["O"],
+            "updateTime": event["T"],
+            "lastFillPrice": event["L"],
+            "lastFillQty": event["l"],
+        }
+
+    def get_balances(self) -> Optional[Dict[str, Dict[str, float]]]:
+        """
+        Get non-zero balances in the get_balance response layout.
+
+        Returns:
+            Optional[Dict]: Balances by asset, or None if the state is not synced
+        """
+        with self._lock:
+            if not self.synced:
+                return None
+            return {
+                asset: {"free": free, "locked": locked}
+                for asset, (free, locked) in self._balances.items()
+                if free > 0 or locked > 0
+            }
+
+    def get_open_orders(self, symbol: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get open orders for a symbol, oldest first.
+
+        Args:
+            symbol: Normalized trading pair symbol
+
+        Returns:
+            Optional[List[Dict]]: Open orders, or None if the state is not synced
+        """
+        with self._lock:
+            if not self.synced:
+                return None
+            orders = [dict(order) for (order_symbol, _), order in self._open_orders.items() if order_symbol == symbol]
+        return sorted(orders, key=lambda order: order.get("time", 0))
+
+
+class FuturesAccountState(_UserStreamState):
+    """
+    USD-M futures positions fed by ACCOUNT_UPDATE events.
+
+    Events carry position amount, entry price, break-even price, margin type
+    and isolated wallet. Fields that move with the mark price (MARK_PRICE_FIELDS:
+    mark price, unrealized PnL, liquidation price, notional and margins) are
+    only pushed when the position itself changes, so they are not kept: a
+    snapshot value would be presented as live long after it went stale.
+    """
+
+    stream_key = "user:futures"
+    stream_method = "start_futures_user_socket"
+
+    def __init__(self, max_snapshot_attempts: int = 5):
+        super().__init__(max_snapshot_attempts)
+        self._positions: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+    def _fetch_snapshot(self) -> List[Dict[str, Any]]:
+        from binance_mcp_server.utils import get_binance_client
+
+        client = get_binance_client()
+        self._acquire(futures_rate_limiter, get_request_weight("fapi/positionRisk"))
+        return client.futures_position_information()
+
+    def _load_snapshot_locked(self, snapshot: List[Dict[str, Any]]) -> None:
+        self._positions = {
+            (position["symbol"], position.get("positionSide", "BOTH")): {
+                field: value for field, value in position.items() if field not in MARK_PRICE_FIELDS
+            }
+            for position in snapshot
+        }
+
+    def _apply_locked(self, event: Dict[str, Any]) -> None:
+        if event.get("e") != "ACCOUNT_UPDATE":
+            return
+
+        transaction_time = event["T"]
+        for update in event["a"].get("P", []):
+            key = (update["s"], update.get("ps", "BOTH"))
+            position = self._positions.get(key)
+            if position is None:
+                position = self._positions[key] = {"symbol": update["s"], "positionSide": key[1]}
+            elif transaction_time < position.get("updateTime", 0):
+                continue
+            position["positionAmt"] = update["pa"]
+            position["entryPrice"] = update["ep"]
+            position["marginType"] = update["mt"]
+            position["isolatedWallet"] = update["iw"]
+            if "bep" in update:
+                position["breakEvenPrice"] = update["bep"]
+            position["updateTime"] = transaction_time
+        self.last_event_time = event.get("E")
+
+    def get_positions(self, open_only: bool = False) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get positions in the futures_position_information layout.
+
+        Args:
+            open_only: Skip flat positions (positionAmt of zero) without copying them
+
+        Returns:
+            Optional[List[Dict]]: Positions sorted by symbol, or None if not synced
+        """
+        with self._lock:
+            if not self.synced:
+                return None
+            positions = [
+                dict(position) for position in self._positions.values()
+                if not open_only or float(position.get("positionAmt") or 0) != 0
+            ]
+        return sorted(positions, key=lambda position: (position["symbol"], position["positionSide"]))
+
+
+# Global account states
+spot_account_state = SpotAccountState()
+futures_account_state = FuturesAccountState()
+
+
+def start_user_streams() -> None:
+    """Start the user data streams enabled by BINANCE_USER_STREAM / BINANCE_FUTURES_USER_STREAM."""
+    config = BinanceConfig()
+    for enabled, state in (
+        (config.user_stream, spot_account_state),
+        (config.futures_user_stream, futures_account_state),
+    ):
+        if not enabled:
+            continue
+        try:
+            state.start()
+        except Exception as e:
+            logger.error(f"Failed to start user data stream {state.stream_key}: {str(e)}")
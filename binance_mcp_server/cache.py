@@ -0,0 +1,349 @@
+"""
+Response cache for slowly changing tool results.
+
+Tools opt in with the ``@cached`` decorator, placed above ``@coalesced`` and
+``@rate_limited`` so a cache hit neither queues for nor spends request weight.
+Each tool has a policy: a TTL during which responses are served as fresh, and
+a stale window after it during which the stale response is served immediately
+while one background call refreshes it (stale-while-revalidate). Entries are
+evicted least-recently-used once the cache is full.
+
+TTLs can be overridden per tool with BINANCE_CACHE_TTL (or --cache-ttl), e.g.
+``get_fee_info=600,get_balance=5``; a TTL of 0 disables caching for that tool.
+
+Tools registered with ``persist=True`` are also written to the persistent
+store when BINANCE_CACHE_DIR is set, so their responses survive restarts.
+"""
+
+import time
+import inspect
+import logging
+import threading
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+from binance_mcp_server.config import BinanceConfig
+from binance_mcp_server.coalescing import _freeze_arguments
+from binance_mcp_server.persistent_cache import PersistentStore, persistent_store
+
+
+logger = logging.getLogger(__name__)
+
+# Version stamp of persisted responses; bump when tool response layouts change
+RESPONSE_FORMAT_VERSION = "1"
+
+_STORE_NAMESPACE = "response"
+
+
+class CachePolicy:
+    """Freshness policy of one cached tool."""
+
+    __slots__ = ("ttl", "stale_ttl", "persist")
+
+    def __init__(self, ttl: float, stale_ttl: float = 0.0, persist: bool = False):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.persist = persist
+
+
+class _Entry:
+    """A cached response and when it was stored."""
+
+    __slots__ = ("value", "stored_at")
+
+    def __init__(self, value: Any, stored_at: float):
+        self.value = value
+        self.stored_at = stored_at
+
+
+class ResponseCache:
+    """
+    LRU cache of tool responses with per-tool TTL policies.
+
+    Keys are (tool name, credential fingerprint, normalized arguments), so
+    account data cached for one API key is never served to another.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_overrides: Optional[Dict[str, float]] = None,
+        store: Optional[PersistentStore] = None
+    ):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of cached responses across all tools
+            ttl_overrides: Optional mapping of tool name to TTL in seconds
+            store: Optional persistent store for tools registered with persist=True
+        """
+        self.max_entries = max_entries
+        self._store = store
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._policies: Dict[str, CachePolicy] = {}
+        self._overrides: Dict[str, float] = dict(ttl_overrides or {})
+        self._refreshing: set = set()
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, ttl: float, stale_ttl: float = 0.0, persist: bool = False) -> CachePolicy:
+        """
+        Register a tool's default policy (TTL overrides take precedence).
+
+        Args:
+            name: Tool name
+            ttl: Default seconds a response is fresh
+            stale_ttl: Seconds after expiry a stale response may still be served
+            persist: Whether responses are also kept in the persistent store
+
+        Returns:
+            CachePolicy: The tool's effective policy
+        """
+        with self._lock:
+            policy = CachePolicy(self._overrides.get(name, ttl), stale_ttl, persist)
+            self._policies[name] = policy
+            self._stats.setdefault(name, {"hits": 0, "stale_hits": 0, "misses": 0, "restored": 0})
+            return policy
+
+    def set_ttls(self, ttls: Dict[str, float]) -> None:
+        """
+        Override TTLs per tool, e.g. from the command line.
+
+        Args:
+            ttls: Mapping of tool name to TTL in seconds (0 disables caching)
+        """
+        with self._lock:
+            self._overrides.update(ttls)
+            for name, ttl in ttls.items():
+                if name in self._policies:
+                    self._policies[name].ttl = ttl
+        self.invalidate(*ttls)
+
+    def get_policy(self, name: str) -> Optional[CachePolicy]:
+        """Get the effective policy of a tool, or None if it is not cached."""
+        return self._policies.get(name)
+
+    def lookup(self, name: str, key: Hashable) -> Tuple[Optional[_Entry], str]:
+        """
+        Look up a response.
+
+        Returns:
+            Tuple of (entry, state) where state is 'fresh', 'stale' or 'miss'
+        """
+        policy = self._policies[name]
+        if policy.persist and self._store is not None and key not in self._entries:
+            self._restore(name, key)
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                age = now - entry.stored_at
+                if age <= policy.ttl:
+                    self._entries.move_to_end(key)
+                    self._stats[name]["hits"] += 1
+                    return entry, "fresh"
+                if age <= policy.ttl + policy.stale_ttl:
+                    self._entries.move_to_end(key)
+                    self._stats[name]["stale_hits"] += 1
+                    return entry, "stale"
+                del self._entries[key]
+            self._stats[name]["misses"] += 1
+            return None, "miss"
+
+    def store(self, key: Hashable, value: Any) -> None:
+        """Store a response, evicting the least recently used entries if full."""
+        with self._lock:
+            self._insert_locked(key, _Entry(value, time.monotonic()))
+
+        policy = self._policies.get(key[0])
+        if policy is not None and policy.persist and self._store is not None:
+            try:
+                self._store.put(_STORE_NAMESPACE, repr(key), value, RESPONSE_FORMAT_VERSION)
+            except Exception as e:
+                logger.warning(f"Cannot persist cached response of {key[0]}: {str(e)}")
+
+    def _insert_locked(self, key: Hashable, entry: _Entry) -> None:
+        """Insert an entry and evict down to max_entries. Caller must hold the lock."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _restore(self, name: str, key: Hashable) -> None:
+        """Load a persisted response into memory, keeping its original age."""
+        try:
+            record = self._store.get(_STORE_NAMESPACE, repr(key), RESPONSE_FORMAT_VERSION)
+        except Exception as e:
+            logger.warning(f"Cannot read persisted response of {name}: {str(e)}")
+            return
+        if record is None:
+            return
+
+        value, _, stored_at = record
+        age = max(0.0, time.time() - stored_at)
+        with self._lock:
+            if key not in self._entries:
+                self._insert_locked(key, _Entry(value, time.monotonic() - age))
+                self._stats[name]["restored"] += 1
+
+    def refresh_in_background(self, key: Hashable, func: Callable[[], Any]) -> None:
+        """Refresh a stale entry on a daemon thread unless a refresh is already running."""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def run():
+            try:
+                result = func()
+                if _is_cacheable(result):
+                    self.store(key, result)
+            except Exception as e:
+                logger.warning(f"Background cache refresh failed for {key[0]}: {str(e)}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=run, name=f"cache-refresh-{key[0]}", daemon=True).start()
+
+    def invalidate(self, *names: str) -> int:
+        """
+        Drop cached responses of the given tools (all tools if none are given).
+
+        Args:
+            names: Tool names to invalidate
+
+        Returns:
+            int: Number of entries removed
+        """
+        with self._lock:
+            if not names:
+                removed = len(self._entries)
+                self._entries.clear()
+            else:
+                wanted = set(names)
+                stale_keys = [key for key in self._entries if key[0] in wanted]
+                for key in stale_keys:
+                    del self._entries[key]
+                removed = len(stale_keys)
+
+        if self._store is not None:
+            try:
+                if not names:
+                    self._store.delete(_STORE_NAMESPACE)
+                for name in names:
+                    self._store.delete(_STORE_NAMESPACE, key_prefix=repr((name,))[:-1])
+            except Exception as e:
+                logger.warning(f"Cannot invalidate persisted responses: {str(e)}")
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-tool policies and hit/miss counters for monitoring."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "tools": {
+                    name: {
+                        "ttl": self._policies[name].ttl,
+                        "stale_ttl": self._policies[name].stale_ttl,
+                        "persist": self._policies[name].persist,
+                        **stats
+                    }
+                    for name, stats in self._stats.items()
+                }
+            }
+
+
+def _is_cacheable(result: Any) -> bool:
+    """Only successful tool responses are cached."""
+    return isinstance(result, dict) and result.get("success") is True
+
+
+def _credential_scope() -> Optional[str]:
+    """Fingerprint of the active credentials, or None if they are not configured."""
+    from binance_mcp_server.utils import get_config
+    try:
+        return get_config().fingerprint()
+    except RuntimeError:
+        return None
+
+
+def _with_cache_metadata(response: Dict[str, Any], entry: _Entry, state: str) -> Dict[str, Any]:
+    """Copy a cached response, adding its cache state and age to the metadata."""
+    served = dict(response)
+    served["metadata"] = {
+        **response.get("metadata", {}),
+        "cache": state,
+        "cache_age_ms": int((time.monotonic() - entry.stored_at) * 1000)
+    }
+    return served
+
+
+# Global response cache
+_config = BinanceConfig()
+response_cache = ResponseCache(
+    max_entries=_config.cache_max_entries,
+    ttl_overrides=_config.cache_ttls,
+    store=persistent_store
+)
+
+
+def cached(ttl: float, stale_ttl: float = 0.0, persist: bool = False, cache: Optional[ResponseCache] = None):
+    """
+    Decorator that serves a tool's successful responses from the response cache.
+
+    Args:
+        ttl: Default seconds a response is served as fresh (BINANCE_CACHE_TTL overrides it)
+        stale_ttl: Seconds after expiry during which the stale response is served
+            while it is refreshed in the background
+        persist: Keep responses in the persistent store (BINANCE_CACHE_DIR) across restarts
+        cache: Optional ResponseCache instance (defaults to the global cache)
+    """
+    def decorator(func):
+        store = cache or response_cache
+        name = func.__name__
+        signature = inspect.signature(func)
+        policy = store.register(name, ttl, stale_ttl, persist)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if policy.ttl <= 0:
+                return func(*args, **kwargs)
+            try:
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                key = (name, _credential_scope(), _freeze_arguments(bound.arguments))
+            except TypeError:
+                return func(*args, **kwargs)
+
+            entry, state = store.lookup(name, key)
+            if state == "stale":
+                store.refresh_in_background(key, lambda: func(*args, **kwargs))
+            if entry is not None:
+                return _with_cache_metadata(entry.value, entry, state)
+
+            result = func(*args, **kwargs)
+            if _is_cacheable(result):
+                store.store(key, result)
+            return result
+        return wrapper
+    return decorator
+
+
+def invalidate_cache(*names: str) -> int:
+    """
+    Invalidate cached responses of the given tools in the global cache.
+
+    Tools that change account state call this after a successful request, e.g.
+    create_order invalidates get_balance.
+
+    Args:
+        names: Tool names to invalidate (all tools if none are given)
+
+    Returns:
+        int: Number of entries removed
+    """
+    return response_cache.invalidate(*names)
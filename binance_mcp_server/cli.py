@@ -66,6 +66,11 @@ def binance_mcp_server(
         "--host",
         "-h", 
         help="Host for HTTP transport (only used with --transport streamable-http or sse)"
+    ),
+    cache_ttl: Optional[str] = typer.Option(
+        None,
+        "--cache-ttl",
+        help="Per-tool response cache TTLs, e.g. get_fee_info=600,get_balance=5 (0 disables caching)"
     )
 ) -> None:
     """
@@ -84,6 +89,14 @@ def binance_mcp_server(
     if binance_testnet:
         os.environ["BINANCE_TESTNET"] = str(binance_testnet).lower()
     
+    if cache_ttl:
+        from binance_mcp_server.cache import response_cache
+        try:
+            response_cache.set_ttls(BinanceConfig.parse_ttl_map(cache_ttl))
+        except ValueError as e:
+            typer.echo(f"Configuration Error: {str(e)}", err=True)
+            raise typer.Exit(1)
+    
     # Initialize and validate configuration
     config = BinanceConfig()
     
@@ -98,6 +111,10 @@ def binance_mcp_server(
         typer.echo("  • .env file in the current directory", err=True)
         raise typer.Exit(1)
     
+    # Start the WebSocket-backed caches enabled by configuration
+    from binance_mcp_server.server import start_background_streams
+    start_background_streams()
+    
     # Display configuration summary
     typer.echo("🚀 Starting Binance MCP Server...")
     typer.echo(f"📡 Transport: {transport.value.upper()}")
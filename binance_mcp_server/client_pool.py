@@ -0,0 +1,277 @@
+"""
+Pooled Binance client management for the Binance MCP Server.
+
+This module keeps one long-lived python-binance Client per credential set so
+tools reuse keep-alive HTTP connections instead of constructing (and pinging)
+a fresh client on every invocation. Connectivity is verified by a background
+health checker rather than inline on the request path.
+"""
+
+import time
+import logging
+import threading
+from typing import Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from binance.client import Client
+from binance_mcp_server.config import BinanceConfig
+from binance_mcp_server.rate_limiter import sync_rate_limits
+
+
+logger = logging.getLogger(__name__)
+
+
+class _PooledClient:
+    """Bookkeeping for a single pooled client instance."""
+
+    def __init__(self, client: Client, fingerprint: str):
+        self.client = client
+        self.fingerprint = fingerprint
+        self.created_at = time.time()
+        self.checkouts = 0
+        self.requests = 0
+        self.healthy = True
+        self.consecutive_failures = 0
+        self.last_health_check: Optional[float] = None
+        self.in_flight = 0
+        self.retired = False
+
+
+class BinanceClientPool:
+    """
+    Registry of long-lived Binance clients keyed by credential fingerprint.
+
+    Each client owns a keep-alive ``requests.Session`` mounted with a sized
+    HTTPAdapter, so concurrent tool calls share warm TCP/TLS connections.
+    Clients whose credentials are no longer current are retired on the next
+    checkout, and clients that fail background health checks are rebuilt.
+    A retired client's session is closed only once it has no request in
+    flight, so calls still using it are not cut off.
+    """
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 64, health_check_interval: float = 60.0):
+        """
+        Initialize the client pool.
+
+        Args:
+            pool_connections: Number of host connection pools to cache per session
+            pool_maxsize: Maximum number of keep-alive connections per host
+            health_check_interval: Seconds between background pings (0 disables)
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.health_check_interval = health_check_interval
+        self._clients: Dict[str, _PooledClient] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._health_thread: Optional[threading.Thread] = None
+        self._rebuilds = 0
+
+    def get_client(self, config: BinanceConfig) -> Client:
+        """
+        Return the pooled client for the given configuration, creating it if needed.
+
+        Args:
+            config: Validated Binance configuration
+
+        Returns:
+            Client: Long-lived Binance API client
+        """
+        fingerprint = config.fingerprint()
+
+        with self._lock:
+            entry = self._clients.get(fingerprint)
+
+            if entry is not None and not entry.healthy:
+                logger.warning("Rebuilding unhealthy Binance client")
+                self._retire_entry(entry)
+                entry = None
+                self._rebuilds += 1
+
+            if entry is None:
+                # Credentials changed: retire clients built for previous settings
+                for stale in list(self._clients.values()):
+                    self._retire_entry(stale)
+
+                entry = _PooledClient(self._create_client(config, fingerprint), fingerprint)
+                self._track_in_flight(entry)
+                self._clients[fingerprint] = entry
+                logger.info(f"Initialized pooled Binance client (testnet: {config.testnet})")
+
+            entry.checkouts += 1
+
+        self._ensure_health_checker()
+        return entry.client
+
+    def _create_client(self, config: BinanceConfig, fingerprint: str) -> Client:
+        """Build a client with a keep-alive session and no inline ping."""
+        client = Client(
+            api_key=config.api_key,
+            api_secret=config.api_secret,
+            # testnet=config.testnet
+            ping=False
+        )
+
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize
+        )
+        client.session.mount("https://", adapter)
+        client.session.mount("http://", adapter)
+        client.session.hooks["response"].append(
+            lambda response, *args, **kwargs: self.record_request(fingerprint)
+        )
+        # Keep local rate limit budgets aligned with Binance's usage headers
+        client.session.hooks["response"].append(
+            lambda response, *args, **kwargs: sync_rate_limits(response)
+        )
+
+        return client
+
+    def _track_in_flight(self, entry: _PooledClient) -> None:
+        """Count requests in flight on a client's session, closing it after its last request once retired."""
+        send = entry.client.session.request
+
+        def request(*args, **kwargs):
+            with self._lock:
+                entry.in_flight += 1
+            try:
+                return send(*args, **kwargs)
+            finally:
+                with self._lock:
+                    entry.in_flight -= 1
+                    idle_retired = entry.retired and entry.in_flight == 0
+                if idle_retired:
+                    self._close_entry(entry)
+
+        entry.client.session.request = request
+
+    def _retire_entry(self, entry: _PooledClient) -> None:
+        """Remove a client from the pool, closing its session now if idle. Caller must hold the lock."""
+        if self._clients.get(entry.fingerprint) is entry:
+            del self._clients[entry.fingerprint]
+        entry.retired = True
+        if entry.in_flight == 0:
+            self._close_entry(entry)
+
+    def _close_entry(self, entry: _PooledClient) -> None:
+        """Close the HTTP session held by a pooled client."""
+        try:
+            entry.client.session.close()
+        except Exception as e:
+            logger.debug(f"Error closing Binance client session: {str(e)}")
+
+    def _ensure_health_checker(self) -> None:
+        """Start the background health check thread if it is not running."""
+        if self.health_check_interval <= 0:
+            return
+
+        if self._health_thread is not None and self._health_thread.is_alive():
+            return
+
+        with self._lock:
+            if self._health_thread is not None and self._health_thread.is_alive():
+                return
+            self._stop_event.clear()
+            self._health_thread = threading.Thread(
+                target=self._health_check_loop,
+                name="binance-client-health",
+                daemon=True
+            )
+            self._health_thread.start()
+
+    def _health_check_loop(self) -> None:
+        """Periodically ping every pooled client until the pool is closed."""
+        while not self._stop_event.wait(self.health_check_interval):
+            self.run_health_checks()
+
+    def run_health_checks(self) -> None:
+        """Ping every pooled client once and record the outcome."""
+        with self._lock:
+            entries = list(self._clients.values())
+
+        for entry in entries:
+            try:
+                entry.client.ping()
+                entry.healthy = True
+                entry.consecutive_failures = 0
+            except Exception as e:
+                entry.consecutive_failures += 1
+                entry.healthy = False
+                logger.warning(f"Binance client health check failed: {str(e)}")
+            finally:
+                entry.last_health_check = time.time()
+
+    def record_request(self, fingerprint: str) -> None:
+        """Count an HTTP request made through the pooled client."""
+        entry = self._clients.get(fingerprint)
+        if entry is not None:
+            entry.requests += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool statistics for monitoring.
+
+        Returns:
+            Dict containing pool settings and per-client usage counters
+        """
+        with self._lock:
+            clients = [
+                {
+                    "created_at": int(entry.created_at * 1000),
+                    "checkouts": entry.checkouts,
+                    "requests": entry.requests,
+                    "healthy": entry.healthy,
+                    "consecutive_failures": entry.consecutive_failures,
+                    "last_health_check": (
+                        int(entry.last_health_check * 1000) if entry.last_health_check else None
+                    ),
+                }
+                for entry in self._clients.values()
+            ]
+
+        return {
+            "pool_connections": self.pool_connections,
+            "pool_maxsize": self.pool_maxsize,
+            "health_check_interval": self.health_check_interval,
+            "active_clients": len(clients),
+            "rebuilds": self._rebuilds,
+            "clients": clients,
+        }
+
+    def close(self) -> None:
+        """Stop the health checker and close all pooled sessions."""
+        self._stop_event.set()
+        with self._lock:
+            for entry in self._clients.values():
+                self._close_entry(entry)
+            self._clients.clear()
+
+
+# Global client pool instance
+_client_pool: Optional[BinanceClientPool] = None
+_client_pool_lock = threading.Lock()
+
+
+def get_client_pool(config: Optional[BinanceConfig] = None) -> BinanceClientPool:
+    """
+    Get the process-wide client pool, creating it on first use.
+
+    Args:
+        config: Optional configuration used to size the pool on creation
+
+    Returns:
+        BinanceClientPool: The shared client pool
+    """
+    global _client_pool
+
+    if _client_pool is None:
+        with _client_pool_lock:
+            if _client_pool is None:
+                config = config or BinanceConfig()
+                _client_pool = BinanceClientPool(
+                    pool_connections=config.pool_connections,
+                    pool_maxsize=config.pool_maxsize,
+                    health_check_interval=config.health_check_interval
+                )
+
+    return _client_pool
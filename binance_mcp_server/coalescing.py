@@ -0,0 +1,198 @@
+"""
+Single-flight request coalescing for the Binance MCP Server.
+
+When several sessions make the same read-only tool call at the same time,
+only the first caller (the leader) performs the upstream request; concurrent
+identical callers wait for it and receive the same response. Calls are
+identical when they target the same tool with the same normalized arguments.
+"""
+
+import inspect
+import logging
+import threading
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class _Flight:
+    """An in-progress call that followers can wait on."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Registry of in-flight calls keyed by tool and normalized arguments.
+
+    Tracks per-tool counters: leaders (upstream calls made), coalesced
+    (callers served by another caller's request) and weight_saved (request
+    weight those coalesced callers would have spent).
+    """
+
+    def __init__(self):
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def do(self, name: str, key: Hashable, func: Callable[[], Any], weight: Callable[[], int] = lambda: 0) -> Any:
+        """
+        Run func unless an identical call is in flight, in which case wait for it.
+
+        Args:
+            name: Tool name used for statistics
+            key: Hashable identity of the call
+            func: Zero-argument callable performing the call
+            weight: Callable returning the request weight a coalesced call saves
+
+        Returns:
+            The leader's result (shared by all coalesced callers)
+
+        Raises:
+            Exception: Whatever the leader's call raised
+        """
+        with self._lock:
+            stats = self._stats.setdefault(name, {"leaders": 0, "coalesced": 0, "weight_saved": 0})
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                stats["leaders"] += 1
+            else:
+                stats["coalesced"] += 1
+
+        if not leader:
+            try:
+                saved = weight()
+            except Exception:
+                saved = 0
+            with self._lock:
+                stats["weight_saved"] += saved
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = func()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    def in_flight(self) -> int:
+        """Number of calls currently in flight."""
+        return len(self._flights)
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get per-tool coalescing counters.
+
+        Returns:
+            Dict mapping tool name to leaders/coalesced/weight_saved counters
+        """
+        with self._lock:
+            return {name: dict(stats) for name, stats in self._stats.items()}
+
+    def reset_stats(self) -> None:
+        """Clear all counters."""
+        with self._lock:
+            self._stats.clear()
+
+
+# Arguments naming symbols or assets, compared case-insensitively in call keys
+_CASE_INSENSITIVE_ARGUMENTS = frozenset({"symbol", "symbols", "asset", "assets", "coin", "coins"})
+
+
+def _freeze(value: Any, normalize: bool = False) -> Hashable:
+    """Turn an argument into a hashable key component, upper-casing strings if normalize is set."""
+    if isinstance(value, str):
+        return value.strip().upper() if normalize else value
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item, normalize) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze(v, normalize)) for k, v in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item, normalize) for item in value)
+    hash(value)
+    return value
+
+
+def _freeze_arguments(arguments: Dict[str, Any]) -> Hashable:
+    """
+    Turn bound call arguments into a hashable key.
+
+    Only symbol and asset arguments (e.g. symbol, coins, quote_asset) are
+    normalized; other strings such as cursors, field names and transfer types
+    are compared exactly.
+    """
+    return tuple(sorted(
+        (name, _freeze(value, name in _CASE_INSENSITIVE_ARGUMENTS or name.endswith("_asset")))
+        for name, value in arguments.items()
+    ))
+
+
+# Global single-flight registry shared by all tools
+single_flight = SingleFlight()
+
+
+def coalesced(registry: Optional[SingleFlight] = None):
+    """
+    Decorator that coalesces identical concurrent calls of a read-only tool.
+
+    Place it above ``@rate_limited`` so coalesced callers neither queue for nor
+    spend request weight. Symbol and asset arguments are compared
+    case-insensitively after stripping whitespace, so get_order_book("btcusdt")
+    and get_order_book("BTCUSDT") share one request; other arguments must match
+    exactly.
+    The shared response must be treated as read-only by callers.
+
+    Args:
+        registry: Optional SingleFlight instance (defaults to the global registry)
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        name = func.__name__
+        request_weight = getattr(func, "request_weight", None)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            flights = registry or single_flight
+            try:
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                key = (name, _freeze_arguments(bound.arguments))
+            except TypeError:
+                # Unbindable or unhashable arguments: run without coalescing
+                return func(*args, **kwargs)
+
+            weight = (lambda: request_weight(args, kwargs)) if request_weight else (lambda: 0)
+            return flights.do(name, key, lambda: func(*args, **kwargs), weight)
+        return wrapper
+    return decorator
+
+
+def get_coalescing_stats() -> Dict[str, Any]:
+    """
+    Get coalescing statistics for all tools.
+
+    Returns:
+        Dict with per-tool counters and totals across tools
+    """
+    per_tool = single_flight.get_stats()
+    totals = {"leaders": 0, "coalesced": 0, "weight_saved": 0}
+    for stats in per_tool.values():
+        for counter in totals:
+            totals[counter] += stats[counter]
+    return {"tools": per_tool, "totals": totals, "in_flight": single_flight.in_flight()}
@@ -1,7 +1,15 @@
 import os
+import hashlib
+import logging
 from typing import Optional
 
 
+logger = logging.getLogger(__name__)
+
+# Invalid BINANCE_CACHE_TTL entries already logged, so each is reported once per process
+_reported_ttl_entries: set[str] = set()
+
+
 class BinanceConfig:
     """Configuration management for Binance MCP Server."""
     
@@ -10,6 +18,25 @@ class BinanceConfig:
         self.api_secret = os.getenv("BINANCE_API_SECRET")
         self.testnet = os.getenv("BINANCE_TESTNET", "false").lower() == "true"
         self.base_url = self._get_base_url()
+        self.pool_connections = int(os.getenv("BINANCE_POOL_CONNECTIONS", "10"))
+        self.pool_maxsize = int(os.getenv("BINANCE_POOL_MAXSIZE", "64"))
+        self.health_check_interval = float(os.getenv("BINANCE_HEALTH_CHECK_INTERVAL", "60"))
+        self.max_workers = int(os.getenv("BINANCE_MAX_WORKERS", "64"))
+        self.request_weight_limit = int(os.getenv("BINANCE_REQUEST_WEIGHT_LIMIT", "6000"))
+        self.rate_limit_max_wait = float(os.getenv("BINANCE_RATE_LIMIT_MAX_WAIT", "10"))
+        self.rate_limit_max_queue = int(os.getenv("BINANCE_RATE_LIMIT_MAX_QUEUE", "256"))
+        self.exchange_info_ttl = float(os.getenv("BINANCE_EXCHANGE_INFO_TTL", "300"))
+        self.depth_stream_symbols = self._get_symbol_list("BINANCE_DEPTH_STREAM_SYMBOLS")
+        self.depth_snapshot_limit = int(os.getenv("BINANCE_DEPTH_SNAPSHOT_LIMIT", "1000"))
+        self.ticker_stream = os.getenv("BINANCE_TICKER_STREAM", "false").lower() == "true"
+        self.ticker_stream_max_age = float(os.getenv("BINANCE_TICKER_MAX_AGE", "5"))
+        self.cache_ttls = self._get_ttl_map("BINANCE_CACHE_TTL")
+        self.cache_max_entries = int(os.getenv("BINANCE_CACHE_MAX_ENTRIES", "1024"))
+        self.cache_dir = os.getenv("BINANCE_CACHE_DIR") or None
+        self.history_dir = os.getenv("BINANCE_HISTORY_DIR") or self.cache_dir
+        self.history_sync_interval = float(os.getenv("BINANCE_HISTORY_SYNC_INTERVAL", "60"))
+        self.user_stream = os.getenv("BINANCE_USER_STREAM", "false").lower() == "true"
+        self.futures_user_stream = os.getenv("BINANCE_FUTURES_USER_STREAM", "false").lower() == "true"
     
     
     def _get_base_url(self) -> str:
@@ -19,6 +46,61 @@ class BinanceConfig:
         return "https://api.binance.com"
     
     
+    @staticmethod
+    def _get_symbol_list(name: str) -> list[str]:
+        """Parse a comma-separated list of symbols from an environment variable."""
+        raw = os.getenv(name, "")
+        return [symbol.strip().upper() for symbol in raw.split(",") if symbol.strip()]
+    
+    
+    @staticmethod
+    def _get_ttl_map(name: str) -> dict[str, float]:
+        """
+        Parse per-tool TTLs from an environment variable, skipping invalid entries.
+
+        Configuration is read at import time by several modules, so a malformed
+        entry is logged and left at its default TTL instead of raising.
+        """
+        ttls = {}
+        for item in os.getenv(name, "").split(","):
+            try:
+                ttls.update(BinanceConfig.parse_ttl_map(item))
+            except ValueError as e:
+                if item not in _reported_ttl_entries:
+                    _reported_ttl_entries.add(item)
+                    logger.warning(f"Ignoring invalid {name} entry '{item.strip()}' ({str(e)}); using the default TTL")
+        return ttls
+    
+    
+    @staticmethod
+    def parse_ttl_map(raw: str) -> dict[str, float]:
+        """Parse per-tool TTLs in the form 'tool=seconds,tool=seconds', raising ValueError on a malformed entry."""
+        ttls = {}
+        for item in raw.split(","):
+            if not item.strip():
+                continue
+            name, separator, seconds = item.partition("=")
+            if not separator:
+                raise ValueError(f"Invalid cache TTL '{item.strip()}', expected tool=seconds")
+            ttls[name.strip()] = float(seconds)
+        return ttls
+    
+    
+    def fingerprint(self) -> str:
+        """Get a stable, non-reversible identifier for the credential set."""
+        raw = f"{self.api_key}:{self.api_secret}:{self.testnet}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+    
+    
+    def has_changed(self) -> bool:
+        """Check whether the environment no longer matches this configuration."""
+        return (
+            os.getenv("BINANCE_API_KEY") != self.api_key
+            or os.getenv("BINANCE_API_SECRET") != self.api_secret
+            or (os.getenv("BINANCE_TESTNET", "false").lower() == "true") != self.testnet
+        )
+    
+    
     def is_valid(self) -> bool:
         """Check if configuration is valid."""
         return bool(self.api_key and self.api_secret)
@@ -0,0 +1,444 @@
+"""
+Cached exchange information for the Binance MCP Server.
+
+This module keeps an in-process copy of Binance exchangeInfo with prebuilt
+indexes by symbol, base asset, quote asset, status and permission. The copy is
+refreshed in the background on a TTL, and a content digest is used as an
+ETag-like change marker so indexes are only rebuilt when the data changes.
+When BINANCE_CACHE_DIR is set the raw data is also persisted so a restarted
+server can answer from disk while it refreshes in the background.
+"""
+
+import json
+import time
+import bisect
+import hashlib
+import logging
+import threading
+from typing import Dict, Any, Optional, Set, List, Iterable, Tuple
+from binance_mcp_server.config import BinanceConfig
+from binance_mcp_server.rate_limiter import (
+    binance_rate_limiter,
+    futures_rate_limiter,
+    RequestPriority,
+    DEFAULT_MAX_WAIT
+)
+from binance_mcp_server.request_weights import get_request_weight
+from binance_mcp_server.persistent_cache import PersistentStore, persistent_store
+
+
+logger = logging.getLogger(__name__)
+
+# Intermediate assets preferred when several conversion routes have the same length
+ROUTING_HUBS = ("USDT", "BTC", "ETH", "BNB", "USDC", "FDUSD")
+
+# Per market: client method, request weight endpoint and rate limiter of the exchangeInfo request
+_MARKETS = {
+    "spot": ("get_exchange_info", "exchangeInfo", binance_rate_limiter),
+    "futures": ("futures_exchange_info", "fapi/exchangeInfo", futures_rate_limiter),
+}
+
+
+class ExchangeInfoIndex:
+    """
+    Immutable snapshot of exchange information with lookup indexes.
+
+    Attributes:
+        symbols: Mapping of symbol name to its full exchangeInfo entry
+        by_base_asset: Symbols grouped by base asset
+        by_quote_asset: Symbols grouped by quote asset
+        by_status: Symbols grouped by trading status
+        by_permission: Symbols grouped by permission (SPOT, MARGIN, ...)
+        digest: Content digest used to detect changes between refreshes
+        version: Monotonic counter bumped whenever the content changes
+        fetched_at: Unix timestamp (seconds) of the last successful fetch
+    """
+
+    def __init__(self, exchange_info: Dict[str, Any], digest: str, version: int):
+        self.server_time = exchange_info.get("serverTime")
+        self.rate_limits = exchange_info.get("rateLimits", [])
+        self.digest = digest
+        self.version = version
+        self.fetched_at = time.time()
+
+        self.symbols: Dict[str, Dict[str, Any]] = {}
+        self.by_base_asset: Dict[str, Set[str]] = {}
+        self.by_quote_asset: Dict[str, Set[str]] = {}
+        self.by_status: Dict[str, Set[str]] = {}
+        self.by_permission: Dict[str, Set[str]] = {}
+
+        for entry in exchange_info.get("symbols", []):
+            name = entry["symbol"]
+            self.symbols[name] = entry
+            self.by_base_asset.setdefault(entry.get("baseAsset"), set()).add(name)
+            self.by_quote_asset.setdefault(entry.get("quoteAsset"), set()).add(name)
+            self.by_status.setdefault(entry.get("status"), set()).add(name)
+            for permission in _symbol_permissions(entry):
+                self.by_permission.setdefault(permission, set()).add(name)
+
+        # Sorted names allow prefix lookups by bisection
+        self.sorted_symbols: List[str] = sorted(self.symbols)
+
+        # Conversion routes per (target asset, max hops), built on first use
+        self._routes: Dict[Tuple[str, int], Dict[str, List[Tuple[str, bool]]]] = {}
+
+    def get_symbol(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Get the exchangeInfo entry for a symbol, or None if it is not listed."""
+        return self.symbols.get(symbol)
+
+    def symbols_with_prefix(self, prefix: str) -> List[str]:
+        """Get all symbol names starting with prefix, in sorted order."""
+        start = bisect.bisect_left(self.sorted_symbols, prefix)
+        end = bisect.bisect_left(self.sorted_symbols, prefix + "\uffff")
+        return self.sorted_symbols[start:end]
+
+    def select(
+        self,
+        quote_asset: Optional[str] = None,
+        base_asset: Optional[str] = None,
+        status: Optional[str] = None,
+        permissions: Optional[Iterable[str]] = None,
+        symbol_prefix: Optional[str] = None
+    ) -> List[str]:
+        """
+        Select symbol names matching all given criteria using the indexes.
+
+        Args:
+            quote_asset: Quote asset the symbol must use (e.g. 'USDT')
+            base_asset: Base asset the symbol must use (e.g. 'BTC')
+            status: Trading status the symbol must have (e.g. 'TRADING')
+            permissions: Symbol must carry at least one of these permissions
+            symbol_prefix: Symbol name must start with this prefix
+
+        Returns:
+            List[str]: Matching symbol names in sorted order
+        """
+        candidates: List[Set[str]] = []
+        if quote_asset is not None:
+            candidates.append(self.by_quote_asset.get(quote_asset, set()))
+        if base_asset is not None:
+            candidates.append(self.by_base_asset.get(base_asset, set()))
+        if status is not None:
+            candidates.append(self.by_status.get(status, set()))
+        if permissions:
+            allowed: Set[str] = set()
+            for permission in permissions:
+                allowed |= self.by_permission.get(permission, set())
+            candidates.append(allowed)
+        if symbol_prefix:
+            candidates.append(set(self.symbols_with_prefix(symbol_prefix)))
+
+        if not candidates:
+            return list(self.sorted_symbols)
+
+        # Intersect starting from the most selective index
+        candidates.sort(key=len)
+        selected = set(candidates[0])
+        for other in candidates[1:]:
+            if not selected:
+                break
+            selected &= other
+        return sorted(selected)
+
+    def conversion_routes(self, target: str, max_hops: int = 3) -> Dict[str, List[Tuple[str, bool]]]:
+        """
+        Get the shortest conversion route from every reachable asset to a target asset.
+
+        Routes follow TRADING symbols only and are computed once per snapshot
+        and target. Among routes of equal length, routes through ROUTING_HUBS
+        are preferred.
+
+        Args:
+            target: Asset to convert into (e.g. 'USDT')
+            max_hops: Longest route considered
+
+        Returns:
+            Dict[str, List[Tuple[str, bool]]]: Mapping of asset to its (symbol, inverse)
+            steps; each step multiplies by the symbol price, or divides when inverse
+            is True. The target itself maps to an empty route.
+        """
+        key = (target, max_hops)
+        routes = self._routes.get(key)
+        if routes is not None:
+            return routes
+
+        trading = self.by_status.get("TRADING", set())
+        routes = {target: []}
+        frontier = [target]
+        for _ in range(max_hops):
+            reached = []
+            for asset in frontier:
+                # Symbols quoted in the asset convert their base into it by price;
+                # symbols with the asset as base convert their quote by 1 / price
+                for symbols, side, inverse in (
+                    (self.by_quote_asset.get(asset, ()), "baseAsset", False),
+                    (self.by_base_asset.get(asset, ()), "quoteAsset", True),
+                ):
+                    for symbol in sorted(symbols):
+                        other = self.symbols[symbol].get(side)
+                        if symbol in trading and other not in routes:
+                            routes[other] = [(symbol, inverse)] + routes[asset]
+                            reached.append(other)
+            frontier = sorted(reached, key=_hub_rank)
+
+        self._routes[key] = routes
+        return routes
+
+
+def _hub_rank(asset: str) -> Tuple[int, str]:
+    """Sort key putting ROUTING_HUBS first, in their order, then other assets by name."""
+    return (ROUTING_HUBS.index(asset) if asset in ROUTING_HUBS else len(ROUTING_HUBS), asset)
+
+
+def _symbol_permissions(entry: Dict[str, Any]) -> Set[str]:
+    """Collect permissions from both the legacy and the permissionSets layouts."""
+    permissions = set(entry.get("permissions") or [])
+    for permission_set in entry.get("permissionSets") or []:
+        permissions.update(permission_set)
+    if entry.get("isSpotTradingAllowed"):
+        permissions.add("SPOT")
+    if entry.get("isMarginTradingAllowed"):
+        permissions.add("MARGIN")
+    return permissions
+
+
+def _digest(exchange_info: Dict[str, Any]) -> str:
+    """Hash the parts of exchangeInfo that change meaningfully (not serverTime)."""
+    payload = json.dumps(
+        {"symbols": exchange_info.get("symbols", []), "rateLimits": exchange_info.get("rateLimits", [])},
+        sort_keys=True,
+        separators=(",", ":")
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class ExchangeInfoCache:
+    """
+    TTL cache for exchangeInfo with background refresh.
+
+    Readers get the current index without touching the API while it is fresh.
+    A daemon thread refreshes the data ahead of expiry so readers rarely wait;
+    if the data is older than the TTL (e.g. the refresher failed) the next
+    reader refreshes synchronously. Only one fetch runs at a time.
+    """
+
+    _STORE_NAMESPACE = "exchange_info"
+
+    def __init__(self, ttl: float = 300.0, store: Optional[PersistentStore] = None, market: str = "spot"):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds after which cached exchange information is considered stale
+            store: Optional persistent store used to survive restarts
+            market: 'spot' (/api/v3/exchangeInfo) or 'futures' (/fapi/v1/exchangeInfo)
+        """
+        if market not in _MARKETS:
+            raise ValueError(f"market must be one of: {', '.join(_MARKETS)}")
+        self.ttl = ttl
+        self.market = market
+        self._store = store
+        self._index: Optional[ExchangeInfoIndex] = None
+        self._refresh_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._refresher: Optional[threading.Thread] = None
+        self._stats = {"hits": 0, "fetches": 0, "changes": 0, "errors": 0, "restored": 0}
+
+    def get(self) -> ExchangeInfoIndex:
+        """
+        Get the cached exchange information, fetching it if missing or stale.
+
+        Returns:
+            ExchangeInfoIndex: Current exchange information snapshot
+
+        Raises:
+            RuntimeError: If the data cannot be fetched and no cached copy exists
+        """
+        index = self._index
+        if index is None and self._store is not None:
+            index = self._restore()
+
+        if index is None or time.time() - index.fetched_at > self.ttl:
+            if index is not None and self._refresh_lock.locked():
+                # A refresh is already running; serve the stale copy instead of waiting
+                return index
+            with self._refresh_lock:
+                index = self._index
+                # Another thread may have refreshed while we waited for the lock
+                if index is None or time.time() - index.fetched_at > self.ttl:
+                    try:
+                        index = self._refresh_locked()
+                    except Exception:
+                        if index is None:
+                            raise
+                        logger.warning("Serving stale exchange info after refresh failure")
+        else:
+            self._stats["hits"] += 1
+
+        self._ensure_refresher()
+        return index
+
+    def get_symbol(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the exchangeInfo entry for a symbol from the cache.
+
+        Args:
+            symbol: Normalized trading pair symbol
+
+        Returns:
+            Optional[Dict]: Symbol entry, or None if the symbol is not listed
+        """
+        return self.get().get_symbol(symbol)
+
+    def refresh(self) -> ExchangeInfoIndex:
+        """
+        Fetch exchange information now, replacing the cached copy.
+
+        Returns:
+            ExchangeInfoIndex: The refreshed snapshot
+        """
+        with self._refresh_lock:
+            return self._refresh_locked()
+
+    def _refresh_locked(self) -> ExchangeInfoIndex:
+        """Fetch and index exchangeInfo. Caller must hold the refresh lock."""
+        from binance_mcp_server.utils import get_binance_client
+
+        method, endpoint, limiter = _MARKETS[self.market]
+        weight = get_request_weight(endpoint)
+        admitted, reason = limiter.acquire(
+            weight, timeout=DEFAULT_MAX_WAIT, priority=RequestPriority.MARKET_DATA
+        )
+        if not admitted:
+            self._stats["errors"] += 1
+            raise RuntimeError(f"Rate limit exceeded while refreshing exchange info ({reason})")
+
+        try:
+            exchange_info = getattr(get_binance_client(), method)()
+        except Exception:
+            self._stats["errors"] += 1
+            raise
+
+        self._stats["fetches"] += 1
+        digest = _digest(exchange_info)
+        current = self._index
+
+        if current is not None and current.digest == digest:
+            # Unchanged content: keep the existing indexes and just renew the TTL
+            current.fetched_at = time.time()
+            current.server_time = exchange_info.get("serverTime")
+            self._persist(current, exchange_info, changed=False)
+            return current
+
+        version = current.version + 1 if current is not None else 1
+        self._index = ExchangeInfoIndex(exchange_info, digest, version)
+        self._persist(self._index, exchange_info, changed=True)
+        self._stats["changes"] += 1
+        logger.info(f"Exchange info updated: {len(self._index.symbols)} symbols (version {version})")
+        return self._index
+
+    def _restore(self) -> Optional[ExchangeInfoIndex]:
+        """
+        Load the persisted copy on first use, refreshing it in the background if stale.
+
+        The stored digest doubles as the version stamp: a copy whose content no
+        longer matches its digest is discarded.
+        """
+        with self._refresh_lock:
+            if self._index is not None:
+                return self._index
+            try:
+                record = self._store.get(self._STORE_NAMESPACE, self.market)
+            except Exception as e:
+                logger.warning(f"Cannot read persisted exchange info: {str(e)}")
+                return None
+            if record is None:
+                return None
+
+            exchange_info, digest, stored_at = record
+            if _digest(exchange_info) != digest:
+                logger.warning("Discarding persisted exchange info with a mismatched digest")
+                return None
+
+            index = ExchangeInfoIndex(exchange_info, digest, 1)
+            index.fetched_at = stored_at
+            self._index = index
+            self._stats["restored"] += 1
+            logger.info(f"Restored exchange info from disk: {len(index.symbols)} symbols")
+
+        if time.time() - index.fetched_at > self.ttl:
+            threading.Thread(target=self._refresh_quietly, name="binance-exchange-info-restore", daemon=True).start()
+        return index
+
+    def _refresh_quietly(self) -> None:
+        """Refresh, logging instead of raising on failure."""
+        try:
+            self.refresh()
+        except Exception as e:
+            logger.warning(f"Background exchange info refresh failed: {str(e)}")
+
+    def _persist(self, index: ExchangeInfoIndex, exchange_info: Dict[str, Any], changed: bool) -> None:
+        """Write the raw data to the persistent store (only the timestamp if unchanged)."""
+        if self._store is None:
+            return
+        try:
+            if changed:
+                self._store.put(
+                    self._STORE_NAMESPACE, self.market, exchange_info, index.digest, index.fetched_at
+                )
+            else:
+                self._store.touch(self._STORE_NAMESPACE, self.market, index.fetched_at)
+        except Exception as e:
+            logger.warning(f"Cannot persist exchange info: {str(e)}")
+
+    def _ensure_refresher(self) -> None:
+        """Start the background refresh thread if it is not running."""
+        if self.ttl <= 0 or (self._refresher is not None and self._refresher.is_alive()):
+            return
+
+        with self._refresh_lock:
+            if self._refresher is not None and self._refresher.is_alive():
+                return
+            self._stop_event.clear()
+            self._refresher = threading.Thread(
+                target=self._refresh_loop,
+                name=f"binance-exchange-info-{self.market}",
+                daemon=True
+            )
+            self._refresher.start()
+
+    def _refresh_loop(self) -> None:
+        """Refresh ahead of expiry until stopped."""
+        while not self._stop_event.wait(self.ttl * 0.8):
+            self._refresh_quietly()
+
+    def invalidate(self) -> None:
+        """Drop the cached copy so the next reader fetches fresh data."""
+        self._index = None
+
+    def stop(self) -> None:
+        """Stop the background refresher."""
+        self._stop_event.set()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics for monitoring.
+
+        Returns:
+            Dict containing hit/fetch/change counters and the current version
+        """
+        index = self._index
+        return {
+            **self._stats,
+            "ttl": self.ttl,
+            "version": index.version if index else None,
+            "symbols": len(index.symbols) if index else 0,
+            "fetched_at": int(index.fetched_at * 1000) if index else None,
+        }
+
+
+# Global exchange info cache instances
+exchange_info_cache = ExchangeInfoCache(ttl=BinanceConfig().exchange_info_ttl, store=persistent_store)
+futures_exchange_info_cache = ExchangeInfoCache(
+    ttl=BinanceConfig().exchange_info_ttl, store=persistent_store, market="futures"
+)
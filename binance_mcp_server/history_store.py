@@ -0,0 +1,478 @@
+"""
+Local account history store with incremental (delta) sync.
+
+When BINANCE_HISTORY_DIR (or BINANCE_CACHE_DIR) is set, order, deposit and
+withdrawal history is kept in a SQLite database. Every history key (the
+orders of one symbol, the deposits of one coin, ...) has a sync mark holding
+the covered time range and the point the next sync resumes from, so later
+calls only fetch records newer than the mark, plus records that were still
+pending (their status may have changed), and time-range queries are answered
+from the local index without spending request weight.
+
+Records are partitioned by the credential fingerprint, so history of one
+API key is never served to another.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from binance_mcp_server.config import BinanceConfig
+
+
+logger = logging.getLogger(__name__)
+
+# Bumped whenever the table layout changes; older databases are recreated
+SCHEMA_VERSION = 1
+
+_DB_FILENAME = "binance-mcp-history.sqlite3"
+
+# A stored record: (record id, event time in ms, whether it can still change, value)
+HistoryRecord = Tuple[str, int, bool, Any]
+
+
+class HistorySyncError(Exception):
+    """A history request was rejected (e.g. by the rate limiter) during a sync."""
+
+    def __init__(self, response: Dict[str, Any]):
+        super().__init__(response.get("error", {}).get("message", "history sync failed"))
+        self.response = response
+
+
+class HistoryStore:
+    """
+    SQLite store of history records and per-key sync marks.
+
+    One connection is shared by all threads and serialized with a lock.
+    Syncs of the same key are serialized with a per-key lock so concurrent
+    calls do not download the same delta twice.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Open (or create) the history database.
+
+        Args:
+            directory: Directory holding the database file (created if missing)
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, _DB_FILENAME)
+        self._lock = threading.Lock()
+        self._key_locks: Dict[Tuple[str, str, str], threading.Lock] = {}
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._migrate()
+
+    def _migrate(self) -> None:
+        """Create the tables, discarding a database written with another schema version."""
+        with self._lock:
+            current = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if current != SCHEMA_VERSION:
+                self._conn.execute("DROP TABLE IF EXISTS records")
+                self._conn.execute("DROP TABLE IF EXISTS marks")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS records ("
+                " dataset TEXT NOT NULL,"
+                " scope TEXT NOT NULL,"
+                " key TEXT NOT NULL,"
+                " record_id TEXT NOT NULL,"
+                " time INTEGER NOT NULL,"
+                " pending INTEGER NOT NULL,"
+                " value TEXT NOT NULL,"
+                " PRIMARY KEY (dataset, scope, key, record_id))"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS records_by_time ON records (dataset, scope, key, time, record_id)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS marks ("
+                " dataset TEXT NOT NULL,"
+                " scope TEXT NOT NULL,"
+                " key TEXT NOT NULL,"
+                " low_water INTEGER NOT NULL,"
+                " high_water INTEGER NOT NULL,"
+                " resume_from INTEGER NOT NULL,"
+                " synced_at REAL NOT NULL,"
+                " PRIMARY KEY (dataset, scope, key))"
+            )
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def key_lock(self, dataset: str, scope: str, key: str) -> threading.Lock:
+        """Get the lock serializing syncs of one history key."""
+        with self._lock:
+            return self._key_locks.setdefault((dataset, scope, key), threading.Lock())
+
+    def get_mark(self, dataset: str, scope: str, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the sync mark of a history key.
+
+        Returns:
+            Optional[Dict]: low_water and high_water (covered time range in ms),
+            resume_from (dataset-specific position the next sync starts at) and
+            synced_at (wall-clock seconds of the last forward sync), or None if
+            the key was never synced
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT low_water, high_water, resume_from, synced_at FROM marks"
+                " WHERE dataset = ? AND scope = ? AND key = ?",
+                (dataset, scope, key)
+            ).fetchone()
+        if row is None:
+            return None
+        return {"low_water": row[0], "high_water": row[1], "resume_from": row[2], "synced_at": row[3]}
+
+    def save(
+        self,
+        dataset: str,
+        scope: str,
+        key: str,
+        records: Iterable[HistoryRecord] = (),
+        mark: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """
+        Insert or replace records and optionally update the sync mark, atomically.
+
+        Args:
+            dataset: History dataset (e.g. 'orders', 'deposits')
+            scope: Credential fingerprint
+            key: History key within the dataset (symbol or coin)
+            records: Records as (record_id, time, pending, value)
+            mark: New sync mark (see get_mark), or None to leave it unchanged
+
+        Returns:
+            int: Number of records written
+        """
+        rows = [
+            (dataset, scope, key, record_id, int(event_time), int(pending), json.dumps(value, separators=(",", ":")))
+            for record_id, event_time, pending, value in records
+        ]
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO records (dataset, scope, key, record_id, time, pending, value)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+                if mark is not None:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO marks (dataset, scope, key, low_water, high_water, resume_from, synced_at)"
+                        " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (dataset, scope, key, mark["low_water"], mark["high_water"], mark["resume_from"], mark["synced_at"])
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return len(rows)
+
+    def expire(self, dataset: str, scope: str, key: str) -> None:
+        """Force the next query of a key to sync forward (e.g. after placing an order)."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE marks SET synced_at = 0 WHERE dataset = ? AND scope = ? AND key = ?",
+                (dataset, scope, key)
+            )
+
+    def query(
+        self,
+        dataset: str,
+        scope: str,
+        key: str,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        after: Optional[Tuple[int, str]] = None,
+        limit: Optional[int] = None,
+        descending: bool = False
+    ) -> List[Tuple[int, str, Any]]:
+        """
+        Query stored records of a key by time range.
+
+        Args:
+            dataset: History dataset
+            scope: Credential fingerprint
+            key: History key within the dataset
+            start_time: Earliest record time in ms (inclusive)
+            end_time: Latest record time in ms (inclusive)
+            after: (time, record_id) keyset position to continue after (ascending only)
+            limit: Maximum number of records
+            descending: Return newest records first
+
+        Returns:
+            List[Tuple]: (time, record_id, value) ordered by time and record id
+        """
+        sql = "SELECT time, record_id, value FROM records WHERE dataset = ? AND scope = ? AND key = ?"
+        params: List[Any] = [dataset, scope, key]
+        if start_time is not None:
+            sql += " AND time >= ?"
+            params.append(int(start_time))
+        if end_time is not None:
+            sql += " AND time <= ?"
+            params.append(int(end_time))
+        if after is not None:
+            sql += " AND (time > ? OR (time = ? AND record_id > ?))"
+            params.extend([after[0], after[0], after[1]])
+        order = "DESC" if descending else "ASC"
+        sql += f" ORDER BY time {order}, record_id {order}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [(row[0], row[1], json.loads(row[2])) for row in rows]
+
+    def pending(self, dataset: str, scope: str, key: str) -> List[Any]:
+        """Get stored records of a key that may still change (e.g. open orders, pending deposits)."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT value FROM records WHERE dataset = ? AND scope = ? AND key = ? AND pending = 1",
+                (dataset, scope, key)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def open_history_store(directory: Optional[str]) -> Optional[HistoryStore]:
+    """
+    Open the history store if a history directory is configured.
+
+    Args:
+        directory: History directory, or None/empty to disable the store
+
+    Returns:
+        Optional[HistoryStore]: The store, or None if disabled or unavailable
+    """
+    if not directory:
+        return None
+    try:
+        return HistoryStore(os.path.expanduser(directory))
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"History store disabled, cannot open {directory}: {str(e)}")
+        return None
+
+
+def history_scope() -> str:
+    """Credential fingerprint records are partitioned by ('' if credentials are not configured)."""
+    from binance_mcp_server.utils import get_config
+    try:
+        return get_config().fingerprint()
+    except RuntimeError:
+        return ""
+
+
+def now_ms() -> int:
+    """Current wall-clock time in milliseconds."""
+    return int(time.time() * 1000)
+
+
+_config = BinanceConfig()
+
+# Global history store (None unless BINANCE_HISTORY_DIR or BINANCE_CACHE_DIR is set)
+history_store = open_history_store(_config.history_dir)
+
+
+def expire_history(dataset: str, key: str) -> None:
+    """
+    Make the next query of a history key sync forward, ignoring the sync interval.
+
+    Tools that create history call this after a successful request, e.g.
+    create_order expires the order history of its symbol.
+
+    Args:
+        dataset: History dataset (e.g. 'orders')
+        key: History key within the dataset (e.g. symbol)
+    """
+    if history_store is None:
+        return
+    try:
+        history_store.expire(dataset, history_scope(), key)
+    except Exception as e:
+        logger.warning(f"Cannot expire {dataset} history of {key}: {str(e)}")
+
+
+class WindowedHistory:
+    """
+    Delta sync of a history endpoint queried by startTime/endTime windows.
+
+    The first sync of a key covers the requested start (or one window back)
+    up to now. Later syncs fetch forward from the oldest still-pending record
+    or the previous sync time, whichever is earlier, and backfill only the
+    part of a requested range older than what is already stored. Forward
+    syncs are skipped within BINANCE_HISTORY_SYNC_INTERVAL seconds of the
+    previous one, and whenever the queried range ends before any record that
+    could still change.
+    """
+
+    def __init__(
+        self,
+        dataset: str,
+        fetch_window: Callable[..., Any],
+        record_id: Callable[[Dict[str, Any]], str],
+        record_time: Callable[[Dict[str, Any]], int],
+        is_pending: Callable[[Dict[str, Any]], bool],
+        window_ms: int,
+        page_size: Optional[int] = None,
+        store: Optional[HistoryStore] = None,
+        sync_interval: Optional[float] = None,
+        page_by_time: bool = False
+    ):
+        """
+        Initialize a windowed history.
+
+        Args:
+            dataset: Dataset name in the store
+            fetch_window: Callable(key, start_time, end_time, offset, limit) returning a
+                list of records, or an error response if the request was rejected
+            record_id: Extracts a record's unique id
+            record_time: Extracts a record's time in ms
+            is_pending: Whether a record may still change
+            window_ms: Longest time range the endpoint accepts per request
+            page_size: Records per request when paging a window by offset (None for no paging)
+            store: History store (defaults to the global store)
+            sync_interval: Minimum seconds between forward syncs of a key
+            page_by_time: Page a window by moving startTime to the last record's time
+                instead of by offset, for endpoints that return records oldest first
+                and have no offset parameter
+        """
+        self.dataset = dataset
+        self.window_ms = window_ms
+        self.page_size = page_size
+        self.store = store if store is not None else history_store
+        self.sync_interval = _config.history_sync_interval if sync_interval is None else sync_interval
+        self.record_id = record_id
+        self.record_time = record_time
+        self.is_pending = is_pending
+        self.page_by_time = page_by_time
+        self._fetch_window = fetch_window
+
+    def windows(self, start_time: int, end_time: int) -> List[Tuple[int, int]]:
+        """Split an inclusive time range into ranges the endpoint accepts."""
+        return [
+            (window_start, min(window_start + self.window_ms - 1, end_time))
+            for window_start in range(start_time, end_time + 1, self.window_ms)
+        ]
+
+    def fetch_window(self, key: str, start_time: int, end_time: int) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Fetch all records of one window from the API, paging by offset or by time.
+
+        Returns:
+            Tuple of (records, requests made)
+
+        Raises:
+            HistorySyncError: If a request was rejected
+        """
+        records: List[Dict[str, Any]] = []
+        seen = set()
+        requests = 0
+        page_start = start_time
+        while True:
+            if self.page_by_time:
+                page = self._fetch_window(key, page_start, end_time, 0, self.page_size)
+            else:
+                page = self._fetch_window(key, start_time, end_time, len(records), self.page_size)
+            requests += 1
+            if isinstance(page, dict):
+                raise HistorySyncError(page)
+            if not self.page_by_time:
+                records.extend(page)
+                if self.page_size is None or len(page) < self.page_size:
+                    return records, requests
+                continue
+
+            # The next page starts at the last record's time, so records of that
+            # millisecond come back again and are skipped by id
+            fresh = [record for record in page if self.record_id(record) not in seen]
+            seen.update(self.record_id(record) for record in fresh)
+            records.extend(fresh)
+            if self.page_size is None or len(page) < self.page_size or not fresh:
+                return records, requests
+            page_start = max(self.record_time(record) for record in page)
+
+    def _fetch_range(self, key: str, range_start: int, range_end: int, scope: str) -> int:
+        """Fetch a time range window by window into the store; returns requests made."""
+        requests = 0
+        for window_start, window_end in self.windows(range_start, range_end):
+            records, window_requests = self.fetch_window(key, window_start, window_end)
+            requests += window_requests
+            self.store.save(self.dataset, scope, key, [
+                (self.record_id(record), self.record_time(record), self.is_pending(record), record)
+                for record in records
+            ])
+        return requests
+
+    def sync(self, key: str, start_time: Optional[int] = None, end_time: Optional[int] = None) -> int:
+        """
+        Bring the stored history of a key up to date for a query range.
+
+        Args:
+            key: History key (e.g. coin)
+            start_time: Earliest time the query needs, in ms (default: one window back)
+            end_time: Latest time the query needs, in ms (default: now)
+
+        Returns:
+            int: Number of requests made (0 when answered from the store alone)
+
+        Raises:
+            HistorySyncError: If a request was rejected; records fetched so far are kept
+        """
+        scope = history_scope()
+        with self.store.key_lock(self.dataset, scope, key):
+            mark = self.store.get_mark(self.dataset, scope, key)
+            now = now_ms()
+            requests = 0
+
+            if mark is None:
+                low_water = now - self.window_ms + 1 if start_time is None else min(int(start_time), now)
+                requests += self._fetch_range(key, low_water, now, scope)
+                forward = True
+            else:
+                low_water = mark["low_water"]
+                if start_time is not None and start_time < low_water:
+                    requests += self._fetch_range(key, int(start_time), low_water - 1, scope)
+                    low_water = int(start_time)
+                forward = (
+                    time.time() - mark["synced_at"] >= self.sync_interval
+                    and (end_time is None or end_time >= mark["resume_from"])
+                )
+                if forward:
+                    requests += self._fetch_range(key, mark["resume_from"], now, scope)
+                elif requests == 0:
+                    return 0
+
+            high_water = now if forward else mark["high_water"]
+            pending_times = [self.record_time(record) for record in self.store.pending(self.dataset, scope, key)]
+            self.store.save(self.dataset, scope, key, mark={
+                "low_water": low_water,
+                "high_water": high_water,
+                "resume_from": min(pending_times + [high_water]),
+                "synced_at": time.time() if forward else mark["synced_at"]
+            })
+            return requests
+
+    def query(
+        self,
+        key: str,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        descending: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Get stored records of a key in a time range (sync first).
+
+        Returns:
+            List[Dict]: Records, newest first by default
+        """
+        rows = self.store.query(
+            self.dataset, history_scope(), key, start_time=start_time, end_time=end_time, descending=descending
+        )
+        return [value for _, _, value in rows]
@@ -0,0 +1,539 @@
+"""
+Local order books maintained from the Binance diff-depth WebSocket stream.
+
+Each subscribed symbol keeps a sorted, array-backed price ladder per side that
+follows Binance's documented snapshot + <symbol>@depth@100ms protocol:
+
+1. Open the diff stream and buffer events.
+2. Fetch a REST depth snapshot.
+3. Drop buffered events with u <= lastUpdateId.
+4. Apply events in order; each event must satisfy U <= last_u + 1 <= u where
+   last_u is the last applied update ID, otherwise updates were missed and
+   the book is resynchronized.
+
+Synced books are served from memory without spending REST weight.
+"""
+
+import math
+import time
+import bisect
+import logging
+import operator
+import itertools
+import threading
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from binance_mcp_server.config import BinanceConfig
+from binance_mcp_server.rate_limiter import binance_rate_limiter, RequestPriority, DEFAULT_MAX_WAIT
+from binance_mcp_server.request_weights import get_request_weight
+from binance_mcp_server.streams import get_stream_manager
+
+
+logger = logging.getLogger(__name__)
+
+# Events buffered while syncing; older events are dropped beyond this
+_MAX_BUFFERED_EVENTS = 1000
+
+# Wait before the stream restarts a resync that ran out of snapshot attempts,
+# doubled after every further failed resync up to the maximum (seconds)
+_RESYNC_RETRY_DELAY = 30.0
+_RESYNC_RETRY_MAX_DELAY = 600.0
+
+
+class PriceLadder:
+    """
+    One side of an order book as parallel, sorted arrays of doubles.
+
+    Prices are stored as sort keys (negated for bids) so both sides are kept in
+    ascending key order and best-first iteration is a plain slice.
+    """
+
+    __slots__ = ("descending", "keys", "quantities")
+
+    def __init__(self, descending: bool):
+        """
+        Initialize an empty ladder.
+
+        Args:
+            descending: True for bids (best = highest price), False for asks
+        """
+        self.descending = descending
+        self.keys = array("d")
+        self.quantities = array("d")
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _key(self, price: float) -> float:
+        return -price if self.descending else price
+
+    @classmethod
+    def from_levels(cls, levels: Iterable[Sequence[Any]], descending: bool) -> "PriceLadder":
+        """
+        Build a ladder from [price, quantity] pairs.
+
+        Binance returns levels best first, so the input is only sorted when an
+        O(n) check finds it out of order.
+
+        Args:
+            levels: Iterable of [price, quantity] pairs (strings or numbers)
+            descending: True for bids, False for asks
+
+        Returns:
+            PriceLadder: Ladder holding the levels with a positive quantity
+        """
+        ladder = cls(descending)
+        sign = -1.0 if descending else 1.0
+        keys, quantities = ladder.keys, ladder.quantities
+        for price, quantity in levels:
+            quantity = float(quantity)
+            if quantity > 0:
+                keys.append(sign * float(price))
+                quantities.append(quantity)
+
+        if any(previous > current for previous, current in zip(keys, keys[1:])):
+            order = sorted(range(len(keys)), key=keys.__getitem__)
+            ladder.keys = array("d", (keys[index] for index in order))
+            ladder.quantities = array("d", (quantities[index] for index in order))
+        return ladder
+
+    def replace(self, levels: Iterable[Sequence[Any]]) -> None:
+        """
+        Replace the ladder with a full set of levels.
+
+        Args:
+            levels: Iterable of [price, quantity] pairs (strings or numbers)
+        """
+        ladder = PriceLadder.from_levels(levels, self.descending)
+        self.keys, self.quantities = ladder.keys, ladder.quantities
+
+    def update(self, price: float, quantity: float) -> None:
+        """
+        Set the quantity at a price level; a quantity of 0 removes the level.
+
+        Args:
+            price: Level price
+            quantity: New absolute quantity at the level
+        """
+        key = self._key(price)
+        index = bisect.bisect_left(self.keys, key)
+        exists = index < len(self.keys) and self.keys[index] == key
+
+        if quantity == 0:
+            if exists:
+                del self.keys[index]
+                del self.quantities[index]
+        elif exists:
+            self.quantities[index] = quantity
+        else:
+            self.keys.insert(index, key)
+            self.quantities.insert(index, quantity)
+
+    def top(self, limit: Optional[int] = None) -> List[Tuple[float, float]]:
+        """
+        Get the best levels, best first.
+
+        Args:
+            limit: Maximum number of levels (all levels if None)
+
+        Returns:
+            List of (price, quantity) tuples
+        """
+        keys = self.keys[:limit] if limit is not None else self.keys
+        sign = -1.0 if self.descending else 1.0
+        return [(sign * key, quantity) for key, quantity in zip(keys, self.quantities)]
+
+    def head(self, limit: Optional[int] = None) -> "PriceLadder":
+        """
+        Copy the best levels into a new ladder.
+
+        Args:
+            limit: Maximum number of levels (all levels if None)
+
+        Returns:
+            PriceLadder: Independent copy safe to analyse without locking
+        """
+        ladder = PriceLadder(self.descending)
+        ladder.keys = self.keys[:limit] if limit is not None else self.keys[:]
+        ladder.quantities = self.quantities[:limit] if limit is not None else self.quantities[:]
+        return ladder
+
+    def best_price(self) -> Optional[float]:
+        """Get the best price, or None if the ladder is empty."""
+        if not self.keys:
+            return None
+        return -self.keys[0] if self.descending else self.keys[0]
+
+    def prices(self) -> array:
+        """Get level prices, best first."""
+        return array("d", map(operator.neg, self.keys)) if self.descending else self.keys
+
+    def depth_within(self, limit_price: float) -> Tuple[float, float]:
+        """
+        Total quantity and quote notional resting at or better than a price.
+
+        Args:
+            limit_price: Worst price to include (lowest bid or highest ask)
+
+        Returns:
+            Tuple of (base quantity, quote notional)
+        """
+        key = self._key(limit_price)
+        end = bisect.bisect_right(self.keys, key)
+        quantities = self.quantities[:end]
+        notional = sum(map(operator.mul, self.prices()[:end], quantities))
+        return math.fsum(quantities), notional
+
+    def fill(self, size: float) -> Dict[str, Any]:
+        """
+        Simulate taking liquidity for a base quantity against this side.
+
+        Args:
+            size: Base asset quantity to fill
+
+        Returns:
+            Dict with filled quantity, notional, VWAP, worst price, levels
+            consumed and whether the visible book could fill the whole size
+        """
+        prices = self.prices()
+        cumulative = array("d", itertools.accumulate(self.quantities))
+        # First level at which the cumulative quantity reaches the size
+        index = bisect.bisect_left(cumulative, size)
+
+        if index >= len(cumulative):
+            filled = cumulative[-1] if cumulative else 0.0
+            notional = sum(map(operator.mul, prices, self.quantities))
+            levels = len(cumulative)
+        else:
+            before = cumulative[index - 1] if index > 0 else 0.0
+            notional = sum(map(operator.mul, prices[:index], self.quantities[:index]))
+            notional += (size - before) * prices[index]
+            filled = size
+            levels = index + 1
+
+        return {
+            "filledQuantity": filled,
+            "notional": notional,
+            "vwap": notional / filled if filled > 0 else None,
+            "worstPrice": prices[levels - 1] if levels else None,
+            "levelsConsumed": levels,
+            "complete": filled >= size,
+        }
+
+
+class LocalOrderBook:
+    """
+    Order book for one symbol kept in sync from the diff-depth stream.
+
+    Stream callbacks run on the WebSocket thread; snapshots are fetched on a
+    separate thread so the stream is never blocked by a REST call.
+    """
+
+    def __init__(self, symbol: str, snapshot_limit: int = 1000, max_snapshot_attempts: int = 5):
+        """
+        Initialize an unsynced book.
+
+        Args:
+            symbol: Normalized trading pair symbol
+            snapshot_limit: Depth requested for REST snapshots (levels per side)
+            max_snapshot_attempts: Snapshot attempts per resync; once exhausted, the
+                next stream event after a growing delay starts another resync
+        """
+        self.symbol = symbol
+        self.snapshot_limit = snapshot_limit
+        self.max_snapshot_attempts = max_snapshot_attempts
+        self.bids = PriceLadder(descending=True)
+        self.asks = PriceLadder(descending=False)
+        self.last_update_id = 0
+        self.event_time: Optional[int] = None
+        self.updated_at: Optional[float] = None
+        self.synced = False
+        self._buffer: List[Dict[str, Any]] = []
+        self._resyncing = False
+        self._failed_resyncs = 0
+        self._retry_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._stats = {"events": 0, "gaps": 0, "resyncs": 0}
+
+    def on_message(self, message: Dict[str, Any]) -> None:
+        """
+        Handle one diff-depth stream message.
+
+        Args:
+            message: Decoded depthUpdate event (or an error message)
+        """
+        if message.get("e") == "error":
+            # The stream reconnects on its own; updates in between are lost
+            logger.warning(f"Depth stream error for {self.symbol}: {message.get('m')}")
+            with self._lock:
+                self.synced = False
+                self._buffer = []
+            self.resync()
+            return
+        if message.get("e") != "depthUpdate":
+            return
+
+        with self._lock:
+            self._stats["events"] += 1
+            if not self.synced:
+                self._buffer.append(message)
+                if len(self._buffer) > _MAX_BUFFERED_EVENTS:
+                    del self._buffer[0]
+                # A resync that ran out of attempts is restarted once its retry delay has passed
+                if self._resyncing or self._retry_at is None or time.time() < self._retry_at:
+                    return
+            elif self._apply_locked(message):
+                return
+            else:
+                # Missed updates: keep this event and rebuild from a fresh snapshot
+                self._stats["gaps"] += 1
+                self.synced = False
+                self._buffer = [message]
+                logger.warning(f"Sequence gap in {self.symbol} depth stream, resyncing")
+
+        self.resync()
+
+    def _apply_locked(self, event: Dict[str, Any]) -> bool:
+        """
+        Apply one event if it continues the sequence. Caller holds the lock.
+
+        Returns:
+            bool: False if the event reveals a gap, True if applied or stale
+        """
+        if event["u"] <= self.last_update_id:
+            return True
+        if event["U"] > self.last_update_id + 1:
+            return False
+
+        for price, quantity in event["b"]:
+            self.bids.update(float(price), float(quantity))
+        for price, quantity in event["a"]:
+            self.asks.update(float(price), float(quantity))
+
+        self.last_update_id = event["u"]
+        self.event_time = event.get("E")
+        self.updated_at = time.time()
+        return True
+
+    def resync(self) -> None:
+        """Start a background resynchronization unless one is already running."""
+        with self._lock:
+            if self._resyncing:
+                return
+            self._resyncing = True
+
+        threading.Thread(
+            target=self._resync,
+            name=f"binance-depth-{self.symbol}",
+            daemon=True
+        ).start()
+
+    def _resync(self) -> None:
+        """Fetch snapshots until one lines up with the buffered stream."""
+        synced = False
+        try:
+            for attempt in range(1, self.max_snapshot_attempts + 1):
+                try:
+                    snapshot = self._fetch_snapshot()
+                except Exception as e:
+                    logger.warning(f"Depth snapshot for {self.symbol} failed (attempt {attempt}): {str(e)}")
+                    time.sleep(min(2 ** attempt, 30))
+                    continue
+
+                if self._load_snapshot(snapshot):
+                    synced = True
+                    self._stats["resyncs"] += 1
+                    logger.info(f"Local order book for {self.symbol} synced at {self.last_update_id}")
+                    return
+                # Snapshot older than the first buffered event; wait for the stream and retry
+                time.sleep(0.5)
+        finally:
+            with self._lock:
+                self._resyncing = False
+                if synced:
+                    self._failed_resyncs = 0
+                    self._retry_at = None
+                else:
+                    self._failed_resyncs += 1
+                    delay = min(_RESYNC_RETRY_DELAY * 2 ** (self._failed_resyncs - 1), _RESYNC_RETRY_MAX_DELAY)
+                    self._retry_at = time.time() + delay
+                    logger.error(
+                        f"Could not sync {self.symbol} order book after {self.max_snapshot_attempts} attempts; "
+                        f"retrying in {delay:.0f}s"
+                    )
+
+    def _fetch_snapshot(self) -> Dict[str, Any]:
+        """Fetch a REST depth snapshot, charged against the spot weight budget."""
+        from binance_mcp_server.utils import get_binance_client
+
+        weight = get_request_weight("depth", limit=self.snapshot_limit)
+        admitted, reason = binance_rate_limiter.acquire(
+            weight, timeout=DEFAULT_MAX_WAIT, priority=RequestPriority.MARKET_DATA
+        )
+        if not admitted:
+            raise RuntimeError(f"Rate limit exceeded while fetching depth snapshot ({reason})")
+
+        return get_binance_client().get_order_book(symbol=self.symbol, limit=self.snapshot_limit)
+
+    def _load_snapshot(self, snapshot: Dict[str, Any]) -> bool:
+        """
+        Install a snapshot and replay buffered events.
+
+        Returns:
+            bool: True if the book is now synced, False if the snapshot is too old
+        """
+        with self._lock:
+            last_update_id = snapshot["lastUpdateId"]
+            if self._buffer and self._buffer[0]["U"] > last_update_id + 1:
+                return False
+
+            self.bids.replace(snapshot["bids"])
+            self.asks.replace(snapshot["asks"])
+            self.last_update_id = last_update_id
+            self.updated_at = time.time()
+
+            buffered, self._buffer = self._buffer, []
+            for event in buffered:
+                if not self._apply_locked(event):
+                    self._buffer = [event]
+                    return False
+
+            self.synced = True
+            return True
+
+    def snapshot(self, limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Get a consistent copy of the best levels.
+
+        Args:
+            limit: Maximum levels per side
+
+        Returns:
+            Dict with lastUpdateId, bids and asks as (price, quantity) tuples,
+            best first, and the stream event time
+        """
+        with self._lock:
+            return {
+                "lastUpdateId": self.last_update_id,
+                "bids": self.bids.top(limit),
+                "asks": self.asks.top(limit),
+                "eventTime": self.event_time,
+                "updatedAt": self.updated_at,
+            }
+
+    def ladders(self, limit: Optional[int] = None) -> Tuple["PriceLadder", "PriceLadder", int]:
+        """
+        Get consistent copies of both ladders.
+
+        Args:
+            limit: Maximum levels per side
+
+        Returns:
+            Tuple of (bids, asks, lastUpdateId)
+        """
+        with self._lock:
+            return self.bids.head(limit), self.asks.head(limit), self.last_update_id
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get sync state and counters for monitoring."""
+        return {
+            **self._stats,
+            "synced": self.synced,
+            "last_update_id": self.last_update_id,
+            "bid_levels": len(self.bids),
+            "ask_levels": len(self.asks),
+        }
+
+
+class OrderBookManager:
+    """Registry of local order books, one diff-depth stream per symbol."""
+
+    def __init__(self, snapshot_limit: int = 1000):
+        """
+        Initialize the manager.
+
+        Args:
+            snapshot_limit: Depth requested for REST snapshots (levels per side)
+        """
+        self.snapshot_limit = snapshot_limit
+        self._books: Dict[str, LocalOrderBook] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, symbol: str) -> LocalOrderBook:
+        """
+        Start maintaining a local book for a symbol.
+
+        Args:
+            symbol: Normalized trading pair symbol
+
+        Returns:
+            LocalOrderBook: The (possibly still syncing) book
+        """
+        with self._lock:
+            book = self._books.get(symbol)
+            if book is not None:
+                return book
+            book = LocalOrderBook(symbol, snapshot_limit=self.snapshot_limit)
+            self._books[symbol] = book
+
+        # Stream first so no update between snapshot and subscription is lost
+        get_stream_manager().subscribe(
+            f"depth:{symbol}",
+            "start_depth_socket",
+            book.on_message,
+            symbol=symbol,
+            interval=100
+        )
+        book.resync()
+        return book
+
+    def unsubscribe(self, symbol: str) -> None:
+        """
+        Stop maintaining the local book for a symbol.
+
+        Args:
+            symbol: Normalized trading pair symbol
+        """
+        with self._lock:
+            self._books.pop(symbol, None)
+        get_stream_manager().unsubscribe(f"depth:{symbol}")
+
+    def get_book(self, symbol: str, limit: Optional[int] = None) -> Optional[LocalOrderBook]:
+        """
+        Get a synced local book able to answer a request of the given depth.
+
+        Args:
+            symbol: Normalized trading pair symbol
+            limit: Requested levels per side
+
+        Returns:
+            Optional[LocalOrderBook]: The book, or None if the request must go to REST
+        """
+        book = self._books.get(symbol)
+        if book is None or not book.synced:
+            return None
+        if limit is not None and limit > book.snapshot_limit:
+            return None
+        return book
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-symbol sync state."""
+        return {symbol: book.get_stats() for symbol, book in list(self._books.items())}
+
+
+# Global order book manager instance
+order_book_manager = OrderBookManager(snapshot_limit=BinanceConfig().depth_snapshot_limit)
+
+
+def start_depth_streams(symbols: Optional[Iterable[str]] = None) -> None:
+    """
+    Subscribe local order books for the configured symbols.
+
+    Args:
+        symbols: Symbols to subscribe (defaults to BINANCE_DEPTH_STREAM_SYMBOLS)
+    """
+    for symbol in symbols if symbols is not None else BinanceConfig().depth_stream_symbols:
+        try:
+            order_book_manager.subscribe(symbol)
+        except Exception as e:
+            logger.error(f"Failed to start depth stream for {symbol}: {str(e)}")
@@ -0,0 +1,171 @@
+"""
+Persistent on-disk cache for slowly changing reference data.
+
+When BINANCE_CACHE_DIR is set, exchange information and cached responses of
+reference tools (fee schedules, deposit addresses) are written to a SQLite
+database in that directory. After a restart they are answered from disk
+immediately and refreshed from the API in the background.
+
+Every entry carries a version stamp chosen by its owner (a content digest for
+exchange information, a response format version for tool responses); entries
+whose stamp no longer matches are ignored. The database itself is wiped when
+its schema version changes.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import logging
+import threading
+from typing import Any, Optional, Tuple
+from binance_mcp_server.config import BinanceConfig
+
+
+logger = logging.getLogger(__name__)
+
+# Bumped whenever the table layout changes; older databases are recreated
+SCHEMA_VERSION = 1
+
+_DB_FILENAME = "binance-mcp-cache.sqlite3"
+
+
+class PersistentStore:
+    """
+    Small key-value store on SQLite, partitioned by namespace.
+
+    Values are stored as JSON. One connection is shared by all threads and
+    serialized with a lock; writes are committed immediately.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            directory: Directory holding the database file (created if missing)
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, _DB_FILENAME)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._migrate()
+
+    def _migrate(self) -> None:
+        """Create the tables, discarding a database written with another schema version."""
+        with self._lock:
+            current = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if current != SCHEMA_VERSION:
+                self._conn.execute("DROP TABLE IF EXISTS entries")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " namespace TEXT NOT NULL,"
+                " key TEXT NOT NULL,"
+                " version TEXT NOT NULL,"
+                " stored_at REAL NOT NULL,"
+                " value TEXT NOT NULL,"
+                " PRIMARY KEY (namespace, key))"
+            )
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def get(self, namespace: str, key: str, version: Optional[str] = None) -> Optional[Tuple[Any, str, float]]:
+        """
+        Read an entry.
+
+        Args:
+            namespace: Entry namespace (e.g. 'exchange_info', 'response')
+            key: Entry key within the namespace
+            version: Required version stamp, or None to accept any
+
+        Returns:
+            Optional[Tuple]: (value, version, stored_at wall-clock seconds), or
+            None if the entry is missing, has another version or cannot be decoded
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, version, stored_at FROM entries WHERE namespace = ? AND key = ?",
+                (namespace, key)
+            ).fetchone()
+        if row is None or (version is not None and row[1] != version):
+            return None
+        try:
+            return json.loads(row[0]), row[1], row[2]
+        except ValueError:
+            logger.warning(f"Discarding undecodable cache entry {namespace}/{key}")
+            self.delete(namespace, key)
+            return None
+
+    def put(self, namespace: str, key: str, value: Any, version: str, stored_at: Optional[float] = None) -> None:
+        """
+        Write an entry, replacing any previous value.
+
+        Args:
+            namespace: Entry namespace
+            key: Entry key within the namespace
+            value: JSON-serializable value
+            version: Version stamp of the value
+            stored_at: Wall-clock time the value was fetched (defaults to now)
+        """
+        payload = json.dumps(value, separators=(",", ":"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (namespace, key, version, stored_at, value) VALUES (?, ?, ?, ?, ?)",
+                (namespace, key, version, time.time() if stored_at is None else stored_at, payload)
+            )
+
+    def touch(self, namespace: str, key: str, stored_at: Optional[float] = None) -> None:
+        """Renew an entry's timestamp without rewriting its value."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE entries SET stored_at = ? WHERE namespace = ? AND key = ?",
+                (time.time() if stored_at is None else stored_at, namespace, key)
+            )
+
+    def delete(self, namespace: str, key: Optional[str] = None, key_prefix: Optional[str] = None) -> None:
+        """
+        Delete one entry, entries whose key starts with a prefix, or a whole namespace.
+
+        Args:
+            namespace: Entry namespace
+            key: Exact key to delete
+            key_prefix: Key prefix to delete
+        """
+        with self._lock:
+            if key is not None:
+                self._conn.execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key))
+            elif key_prefix is not None:
+                self._conn.execute(
+                    "DELETE FROM entries WHERE namespace = ? AND substr(key, 1, ?) = ?",
+                    (namespace, len(key_prefix), key_prefix)
+                )
+            else:
+                self._conn.execute("DELETE FROM entries WHERE namespace = ?", (namespace,))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def open_persistent_store(directory: Optional[str]) -> Optional[PersistentStore]:
+    """
+    Open the persistent store if a cache directory is configured.
+
+    Args:
+        directory: Cache directory, or None/empty to disable persistence
+
+    Returns:
+        Optional[PersistentStore]: The store, or None if disabled or unavailable
+    """
+    if not directory:
+        return None
+    try:
+        return PersistentStore(os.path.expanduser(directory))
+    except (OSError, sqlite3.Error) as e:
+        logger.warning(f"Persistent cache disabled, cannot open {directory}: {str(e)}")
+        return None
+
+
+# Global persistent store (None unless BINANCE_CACHE_DIR is set)
+persistent_store = open_persistent_store(BinanceConfig().cache_dir)
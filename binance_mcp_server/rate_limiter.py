@@ -0,0 +1,506 @@
+"""
+Rate limiting primitives for the Binance MCP Server.
+
+This module provides a thread-safe, weight-aware sliding-window rate limiter
+whose admission check runs in amortized constant time regardless of how full
+the window is, plus the process-wide limiters for each Binance API family and
+the logic that resynchronizes them from Binance's usage response headers.
+"""
+
+import time
+import bisect
+import asyncio
+import logging
+import threading
+from collections import deque
+from enum import Enum as PyEnum
+from typing import Any, Deque, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlparse
+from binance_mcp_server.config import BinanceConfig
+
+
+logger = logging.getLogger(__name__)
+
+
+class RequestPriority(PyEnum):
+    """
+    Enum for rate limit priority classes, highest priority first.
+
+    Attributes:
+        ORDER: Order entry (create_order and friends)
+        ACCOUNT: Account state (balances, positions, fees)
+        MARKET_DATA: Public market data (tickers, order books, exchange info)
+        HISTORY: Historical queries (order, deposit and withdrawal history)
+    """
+    ORDER = 0
+    ACCOUNT = 1
+    MARKET_DATA = 2
+    HISTORY = 3
+
+
+class Reservation(NamedTuple):
+    """
+    Handle of a charge admitted by a RateLimiter, used to refund exactly that charge.
+
+    Attributes:
+        timestamp: Monotonic time the charge was admitted
+        weight: Weight charged
+        klass: Value of the RequestPriority class charged
+        reported: True for usage Binance reported beyond local accounting
+    """
+    timestamp: float
+    weight: int
+    klass: int
+    reported: bool = False
+
+
+class RateLimiter:
+    """
+    Rate limiter for API calls to respect Binance limits.
+
+    Binance limits most endpoints by request weight per minute rather than by
+    call count, so every admission charges a weight (1 by default) against
+    ``max_calls``, which is the weight budget for the window.
+
+    Charges are kept in a deque ordered by time together with running totals,
+    so expired entries are popped from the left and each charge is appended and
+    evicted exactly once. Timestamps come from the monotonic clock so wall-clock
+    adjustments cannot open or close the window, and all state is guarded by a
+    lock.
+
+    Every charge belongs to a RequestPriority class. A class may reserve a
+    fraction of the budget: the reserved headroom it is not using is withheld
+    from every other class, while unreserved capacity is shared, so order entry
+    cannot be starved by a burst of market-data requests. Each admitted charge
+    is a Reservation handle that can be refunded individually.
+
+    Callers that cannot be admitted immediately may wait in a bounded queue via
+    acquire(): they are served by priority class and then in arrival order,
+    delayed just long enough for budget to free up, and rejected up front when
+    their deadline cannot be met.
+    """
+
+    def __init__(
+        self,
+        max_calls: int = 1200,
+        window: int = 60,
+        max_queue: int = 256,
+        reservations: Optional[Dict[RequestPriority, float]] = None
+    ):
+        """
+        Initialize rate limiter.
+
+        Args:
+            max_calls: Maximum total weight allowed in the time window
+            window: Time window in seconds
+            max_queue: Maximum number of callers allowed to wait for budget
+            reservations: Optional fraction of the budget reserved per priority class
+        """
+        self.max_calls = max_calls
+        self.window = window
+        self.max_queue = max_queue
+        self.reserved = [0] * len(RequestPriority)
+        for priority, fraction in (reservations or {}).items():
+            self.reserved[priority.value] = int(max_calls * fraction)
+        self.calls: Deque[Reservation] = deque()
+        self._used = 0
+        self._used_by_class = [0] * len(RequestPriority)
+        self._synced_bucket: Optional[int] = None
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._waiters: List[List[Any]] = []
+        self._sequence = 0
+        self._stats = {
+            "admitted": 0,
+            "queued": 0,
+            "rejected_queue_full": 0,
+            "rejected_deadline": 0,
+            "max_queue_depth": 0,
+            "total_wait_seconds": 0.0,
+            "max_wait_seconds": 0.0,
+        }
+
+    def _evict(self, now: float) -> None:
+        """Drop charges that have left the window. Caller must hold the lock."""
+        calls = self.calls
+        cutoff = now - self.window
+        while calls and calls[0].timestamp <= cutoff:
+            charge = calls.popleft()
+            self._used -= charge.weight
+            self._used_by_class[charge.klass] -= charge.weight
+
+    def _clamp(self, weight: int) -> int:
+        """Cap a weight at the full budget so oversized requests can still run."""
+        return max(1, min(int(weight), self.max_calls))
+
+    @staticmethod
+    def _limit_for(klass: int, max_calls: int, reserved: List[int], used_by_class: List[int]) -> int:
+        """Budget usable by a class: everything except other classes' idle reservations."""
+        withheld = 0
+        for other, reserve in enumerate(reserved):
+            if other != klass and reserve > used_by_class[other]:
+                withheld += reserve - used_by_class[other]
+        return max_calls - withheld
+
+    def _fits(self, weight: int, klass: int) -> bool:
+        """Check whether a charge fits right now. Caller must hold the lock."""
+        limit = self._limit_for(klass, self.max_calls, self.reserved, self._used_by_class)
+        return self._used + weight <= limit
+
+    def _has_waiters_at_or_above(self, klass: int) -> bool:
+        """Check for queued callers that must be served first. Caller must hold the lock."""
+        return bool(self._waiters) and self._waiters[0][0] <= klass
+
+    def can_proceed(self, weight: int = 1, priority: RequestPriority = RequestPriority.MARKET_DATA) -> bool:
+        """
+        Check if we can make another API call without violating rate limits.
+
+        Args:
+            weight: Request weight to charge if the call is admitted
+            priority: Priority class the call is charged to
+
+        Returns:
+            bool: True if call can proceed, False if rate limited
+        """
+        weight = self._clamp(weight)
+        klass = priority.value
+        now = time.monotonic()
+
+        with self._lock:
+            self._evict(now)
+
+            # Queued callers of equal or higher priority are served first
+            if not self._has_waiters_at_or_above(klass) and self._fits(weight, klass):
+                self._charge(now, weight, klass)
+                return True
+
+        return False
+
+    def _charge(self, now: float, weight: int, klass: int) -> Reservation:
+        """Record an admitted charge. Caller must hold the lock."""
+        reservation = Reservation(now, weight, klass)
+        self.calls.append(reservation)
+        self._used += weight
+        self._used_by_class[klass] += weight
+        self._stats["admitted"] += 1
+        return reservation
+
+    def _wait_time(self, now: float, weight: int, klass: int) -> float:
+        """Seconds until ``weight`` fits for ``klass``. Caller must hold the lock."""
+        if self._fits(weight, klass):
+            return 0.0
+
+        # Replay expirations oldest-first until the charge would fit
+        used = self._used
+        used_by_class = list(self._used_by_class)
+        for timestamp, charged, charged_class, _ in self.calls:
+            used -= charged
+            used_by_class[charged_class] -= charged
+            if used + weight <= self._limit_for(klass, self.max_calls, self.reserved, used_by_class):
+                return max(0.0, timestamp + self.window - now)
+
+        return float(self.window)
+
+    def acquire(
+        self,
+        weight: int = 1,
+        timeout: Optional[float] = None,
+        priority: RequestPriority = RequestPriority.MARKET_DATA
+    ) -> Tuple[Optional[Reservation], Optional[str]]:
+        """
+        Wait in the admission queue until a call of the given weight can proceed.
+
+        Waiters are admitted by priority class, then in arrival order. A caller
+        is rejected without waiting when the queue is full, or as soon as the
+        budget it needs cannot free up before its deadline.
+
+        Args:
+            weight: Request weight to charge
+            timeout: Maximum seconds to wait (None waits indefinitely)
+            priority: Priority class the call is charged to
+
+        Returns:
+            Tuple of (reservation, rejection reason). The reservation is the
+            handle of the admitted charge (pass it to refund()), or None when
+            the call was rejected; the reason is then 'queue_full' or 'deadline'.
+        """
+        weight = self._clamp(weight)
+        klass = priority.value
+        start = time.monotonic()
+        deadline = None if timeout is None else start + timeout
+
+        with self._condition:
+            self._evict(start)
+
+            if not self._has_waiters_at_or_above(klass) and self._fits(weight, klass):
+                return self._charge(start, weight, klass), None
+
+            if len(self._waiters) >= self.max_queue:
+                self._stats["rejected_queue_full"] += 1
+                return None, "queue_full"
+
+            # Budget needed by everyone served before us plus this call
+            ahead = sum(waiter[2] for waiter in self._waiters if waiter[0] <= klass)
+            if deadline is not None and self._wait_time(start, ahead + weight, klass) > timeout:
+                self._stats["rejected_deadline"] += 1
+                return None, "deadline"
+
+            self._sequence += 1
+            waiter = [klass, self._sequence, weight]
+            bisect.insort(self._waiters, waiter)
+            self._stats["queued"] += 1
+            self._stats["max_queue_depth"] = max(self._stats["max_queue_depth"], len(self._waiters))
+
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._evict(now)
+                    is_head = self._waiters[0] is waiter
+
+                    if is_head and self._fits(weight, klass):
+                        self._waiters.pop(0)
+                        reservation = self._charge(now, weight, klass)
+                        waited = now - start
+                        self._stats["total_wait_seconds"] += waited
+                        self._stats["max_wait_seconds"] = max(self._stats["max_wait_seconds"], waited)
+                        return reservation, None
+
+                    # The head sleeps until budget expires; others until the head moves
+                    wait_for = self._wait_time(now, weight, klass) if is_head else None
+
+                    if deadline is not None:
+                        remaining = deadline - now
+                        if remaining <= 0 or (wait_for is not None and wait_for > remaining):
+                            self._waiters.remove(waiter)
+                            self._stats["rejected_deadline"] += 1
+                            return None, "deadline"
+                        wait_for = remaining if wait_for is None else wait_for
+
+                    self._condition.wait(wait_for)
+            finally:
+                self._condition.notify_all()
+
+    def refund(self, reservation: Reservation) -> None:
+        """
+        Return a charge that was admitted but never sent upstream.
+
+        Refunding a charge that already left the window, or was already
+        refunded, does nothing.
+
+        Args:
+            reservation: Handle returned by acquire() for the charge
+        """
+        with self._lock:
+            # Recent charges are at the right end of the deque
+            for index in range(len(self.calls) - 1, -1, -1):
+                if self.calls[index] is reservation:
+                    del self.calls[index]
+                    self._used -= reservation.weight
+                    self._used_by_class[reservation.klass] -= reservation.weight
+                    self._condition.notify_all()
+                    return
+
+    def time_until_available(self, weight: int = 1, priority: RequestPriority = RequestPriority.MARKET_DATA) -> float:
+        """
+        Get the number of seconds until a call of the given weight would be admitted.
+
+        Args:
+            weight: Request weight of the pending call
+            priority: Priority class of the pending call
+
+        Returns:
+            float: Seconds to wait, 0.0 if a call can proceed immediately
+        """
+        weight = self._clamp(weight)
+        now = time.monotonic()
+
+        with self._lock:
+            self._evict(now)
+            return self._wait_time(now, weight, priority.value)
+
+    def remaining(self) -> int:
+        """
+        Get the weight still available in the current window.
+
+        Returns:
+            int: Remaining weight budget
+        """
+        with self._lock:
+            self._evict(time.monotonic())
+            return self.max_calls - self._used
+
+    def sync_used(self, used: int) -> None:
+        """
+        Resynchronize the budget with usage reported by Binance.
+
+        Binance counts usage in fixed intervals aligned to the wall clock. Within
+        an interval the server figure can only grow, so the local total is raised
+        to match it. Usage the server reports beyond local accounting is charged
+        to the lowest priority class; once a new interval starts the server
+        counter has been reset, so those reported charges are dropped. Charges
+        admitted locally keep their priority class and stay in the window.
+
+        Args:
+            used: Weight (or order count) Binance reports as used in the interval
+        """
+        now = time.monotonic()
+        bucket = int(time.time() // self.window)
+        lowest = RequestPriority.HISTORY.value
+
+        with self._lock:
+            self._evict(now)
+
+            if self._synced_bucket is not None and bucket != self._synced_bucket:
+                reported = [charge for charge in self.calls if charge.reported]
+                if reported:
+                    self.calls = deque(charge for charge in self.calls if not charge.reported)
+                    for charge in reported:
+                        self._used -= charge.weight
+                        self._used_by_class[charge.klass] -= charge.weight
+                    self._condition.notify_all()
+            self._synced_bucket = bucket
+
+            if used > self._used:
+                delta = used - self._used
+                self.calls.append(Reservation(now, delta, lowest, reported=True))
+                self._used = used
+                self._used_by_class[lowest] += delta
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get admission metrics for monitoring.
+
+        Returns:
+            Dict containing budget usage, queue depth and wait-time statistics
+        """
+        with self._lock:
+            self._evict(time.monotonic())
+            stats = dict(self._stats)
+            stats.update({
+                "max_weight": self.max_calls,
+                "window_seconds": self.window,
+                "used_weight": self._used,
+                "queue_depth": len(self._waiters),
+                "max_queue": self.max_queue,
+                "classes": {
+                    priority.name: {
+                        "used_weight": self._used_by_class[priority.value],
+                        "reserved_weight": self.reserved[priority.value],
+                        "queued": sum(1 for waiter in self._waiters if waiter[0] == priority.value),
+                    }
+                    for priority in RequestPriority
+                },
+            })
+
+        queued = stats["queued"]
+        stats["avg_wait_seconds"] = stats["total_wait_seconds"] / queued if queued else 0.0
+        return stats
+
+    async def acquire_async(
+        self,
+        weight: int = 1,
+        timeout: Optional[float] = None,
+        priority: RequestPriority = RequestPriority.MARKET_DATA
+    ) -> Tuple[Optional[Reservation], Optional[str]]:
+        """
+        Wait without blocking the event loop until a call can proceed.
+
+        Runs acquire() in a worker thread, so async callers get the same
+        priority-ordered queue, class reservations and refundable handle.
+
+        Args:
+            weight: Request weight to charge
+            timeout: Maximum seconds to wait (None waits indefinitely)
+            priority: Priority class the call is charged to
+
+        Returns:
+            Tuple of (reservation, rejection reason), as returned by acquire()
+        """
+        return await asyncio.to_thread(self.acquire, weight, timeout, priority)
+
+
+_config = BinanceConfig()
+
+# Headroom held back for order entry and account calls on the shared weight budgets
+DEFAULT_RESERVATIONS = {
+    RequestPriority.ORDER: 0.10,
+    RequestPriority.ACCOUNT: 0.10,
+}
+
+# Spot REST API (/api) request weight per minute
+binance_rate_limiter = RateLimiter(
+    max_calls=_config.request_weight_limit,
+    window=60,
+    max_queue=_config.rate_limit_max_queue,
+    reservations=DEFAULT_RESERVATIONS
+)
+
+# Spot order placement limits (orders per 10 seconds and per day)
+order_rate_limiter = RateLimiter(max_calls=50, window=10, max_queue=_config.rate_limit_max_queue)
+daily_order_rate_limiter = RateLimiter(max_calls=160000, window=86400, max_queue=_config.rate_limit_max_queue)
+
+# Wallet/SAPI (/sapi) IP weight per minute
+sapi_rate_limiter = RateLimiter(
+    max_calls=12000, window=60, max_queue=_config.rate_limit_max_queue, reservations=DEFAULT_RESERVATIONS
+)
+
+# USD-M futures (/fapi) request weight per minute
+futures_rate_limiter = RateLimiter(
+    max_calls=2400, window=60, max_queue=_config.rate_limit_max_queue, reservations=DEFAULT_RESERVATIONS
+)
+
+# Default time a call may wait in the admission queue before being rejected
+DEFAULT_MAX_WAIT = _config.rate_limit_max_wait
+
+
+# (path prefix, usage header, limiter) triples used to resync local budgets
+_USAGE_HEADERS = (
+    ("/api/", "X-MBX-USED-WEIGHT-1M", binance_rate_limiter),
+    ("/api/", "X-MBX-ORDER-COUNT-10S", order_rate_limiter),
+    ("/api/", "X-MBX-ORDER-COUNT-1D", daily_order_rate_limiter),
+    ("/sapi/", "X-SAPI-USED-IP-WEIGHT-1M", sapi_rate_limiter),
+    ("/fapi/", "X-MBX-USED-WEIGHT-1M", futures_rate_limiter),
+)
+
+
+def sync_rate_limits(response: Any) -> None:
+    """
+    Update local limiters from the usage headers of a Binance HTTP response.
+
+    Registered as a ``requests`` response hook on pooled clients, so every
+    Binance reply keeps the local budgets aligned with the server's view.
+
+    Args:
+        response: HTTP response returned by the Binance API
+    """
+    try:
+        path = urlparse(response.url).path
+        headers = response.headers
+
+        for prefix, header, limiter in _USAGE_HEADERS:
+            if not path.startswith(prefix):
+                continue
+
+            value = headers.get(header)
+            if value is not None:
+                limiter.sync_used(int(value))
+
+    except Exception as e:
+        # A response hook must never break the request it observes
+        logger.debug(f"Ignoring unusable rate limit headers: {str(e)}")
+
+
+def get_rate_limit_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Get admission metrics for every process-wide limiter.
+
+    Returns:
+        Dict mapping limiter name to its statistics
+    """
+    return {
+        "spot": binance_rate_limiter.get_stats(),
+        "spot_orders_10s": order_rate_limiter.get_stats(),
+        "spot_orders_1d": daily_order_rate_limiter.get_stats(),
+        "sapi": sapi_rate_limiter.get_stats(),
+        "futures": futures_rate_limiter.get_stats(),
+    }
@@ -0,0 +1,112 @@
+"""
+Binance request weights for the REST endpoints used by the MCP tools.
+
+Weights follow the Binance API documentation. Spot endpoints are charged
+against the /api REQUEST_WEIGHT budget, wallet endpoints against the /sapi IP
+budget and futures endpoints against the /fapi budget. Entries are either a
+fixed integer or a callable that derives the weight from the call parameters.
+"""
+
+from typing import Any, Callable, Dict, Union
+
+
+def _depth_weight(limit: Any = None, **_: Any) -> int:
+    """Weight of GET /api/v3/depth, which scales with the requested depth."""
+    limit = limit or 100
+    if limit <= 100:
+        return 5
+    if limit <= 500:
+        return 25
+    if limit <= 1000:
+        return 50
+    return 250
+
+
+def _ticker_price_weight(symbol: Any = None, **_: Any) -> int:
+    """Weight of GET /api/v3/ticker/price (single symbol vs. many/all)."""
+    return 2 if symbol else 4
+
+
+def _ticker_24hr_weight(symbol: Any = None, symbols: Any = None, **_: Any) -> int:
+    """Weight of GET /api/v3/ticker/24hr, which scales with the symbol count."""
+    if symbol:
+        return 2
+    if symbols:
+        count = len(symbols)
+        if count <= 20:
+            return 2
+        if count <= 100:
+            return 40
+    return 80
+
+
+def _open_orders_weight(symbol: Any = None, **_: Any) -> int:
+    """Weight of GET /api/v3/openOrders (one symbol vs. all symbols)."""
+    return 6 if symbol else 80
+
+
+def _force_orders_weight(symbol: Any = None, **_: Any) -> int:
+    """Weight of GET /fapi/v1/forceOrders (with vs. without a symbol)."""
+    return 20 if symbol else 50
+
+
+def _premium_index_weight(symbol: Any = None, **_: Any) -> int:
+    """Weight of GET /fapi/v1/premiumIndex (one symbol vs. all symbols)."""
+    return 1 if symbol else 10
+
+
+REQUEST_WEIGHTS: Dict[str, Union[int, Callable[..., int]]] = {
+    # Spot REST API (/api/v3)
+    "ping": 1,
+    "ticker/price": _ticker_price_weight,
+    "ticker/24hr": _ticker_24hr_weight,
+    "depth": _depth_weight,
+    "exchangeInfo": 20,
+    "account": 20,
+    "allOrders": 20,
+    "openOrders": _open_orders_weight,
+    "order": 1,
+    "order/query": 4,
+    # Wallet API (/sapi), IP weights
+    "asset/tradeFee": 1,
+    "capital/deposit/address": 10,
+    "capital/deposit/hisrec": 1,
+    "capital/withdraw/history": 1,
+    "asset/transfer": 1,
+    "accountSnapshot": 2400,
+    # USD-M futures (/fapi)
+    "fapi/exchangeInfo": 1,
+    "fapi/positionRisk": 5,
+    "fapi/account": 5,
+    "fapi/forceOrders": _force_orders_weight,
+    "fapi/income": 30,
+    "fapi/premiumIndex": _premium_index_weight,
+    "fapi/batchOrders": 5,
+}
+
+
+# Endpoints that also count against the spot order-rate limits
+ORDER_ENDPOINTS = frozenset({"order"})
+
+
+def get_request_weight(endpoint: str, **params: Any) -> int:
+    """
+    Get the request weight for an endpoint and parameter combination.
+
+    Args:
+        endpoint: Endpoint key from REQUEST_WEIGHTS (e.g. 'depth')
+        **params: Call parameters that influence the weight (e.g. limit=5000)
+
+    Returns:
+        int: Request weight (1 for unknown endpoints, the default weight for
+             parameters that cannot be interpreted)
+    """
+    weight = REQUEST_WEIGHTS.get(endpoint, 1)
+    if not callable(weight):
+        return weight
+
+    try:
+        return weight(**params)
+    except (TypeError, ValueError):
+        # Parameters are validated by the tool after admission; charge the default
+        return weight()
@@ -9,10 +9,11 @@ tools that can be called by LLM clients.
 import sys
 import logging
 import argparse
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 from fastmcp import FastMCP
 from dotenv import load_dotenv
 from binance_mcp_server.security import SecurityConfig, validate_api_credentials, security_audit_log
+from binance_mcp_server.utils import run_tool
 
 
 logging.basicConfig(
@@ -42,8 +43,10 @@ mcp = FastMCP(
     
     Market Data:
     - get_ticker_price: Get current price for a trading symbol
+    - get_ticker_prices: Get current prices for many symbols in one request
     - get_ticker: Get 24-hour price statistics for a symbol  
     - get_order_book: Get current order book (bids/asks) for a trading symbol
+    - get_order_book_analytics: Get depth within price bands, VWAP for a size and imbalance
     - get_available_assets: Get exchange trading rules and symbol information
     - get_fee_info: Get trading fee rates (maker/taker commissions) for symbols
     
@@ -53,20 +56,27 @@ mcp = FastMCP(
     
     Trading Operations:
     - create_order: Create new trading orders (with enhanced validation)
-    - get_orders: Get order history for a specific symbol
+    - create_orders: Create a batch of orders in one call (futures batchOrders, parallel spot)
+    - get_orders: Get order history for a specific symbol (paginated with a cursor)
     
     Portfolio & Analytics:
-    - get_position_info: Get current futures position information
-    - get_pnl: Get profit and loss information
+    - get_position_info: Get open futures positions (optionally column-oriented)
+    - get_pnl: Get realized, unrealized and funding PnL per symbol and per day
+    - get_portfolio_value: Value all spot balances in one quote asset with per-asset weights
     
     Wallet Operations:
     - get_deposit_address: Get deposit address for a specific coin
     - get_deposit_history: Get deposit history for a specific coin
     - get_withdraw_history: Get withdrawal history for a specific coin
+    - get_transaction_history: Get deposits and withdrawals across coins and long date ranges
+    - get_universal_transfer_history: Get transfers between account types as one merged timeline
     
     Risk Management:
     - get_liquidation_history: Get liquidation history for futures trading
     
+    Monitoring:
+    - get_server_stats: Get the server's rate limit queue, coalescing and client pool metrics
+    
     All operations implement:
     - Comprehensive input validation
     - Rate limiting to respect Binance API limits
@@ -80,7 +90,7 @@ mcp = FastMCP(
 
 
 @mcp.tool()
-def get_ticker_price(symbol: str) -> Dict[str, Any]:
+async def get_ticker_price(symbol: str) -> Dict[str, Any]:
     """
     Get the current price for a trading symbol on Binance.
     
@@ -97,7 +107,7 @@ def get_ticker_price(symbol: str) -> Dict[str, Any]:
     
     try:
         from binance_mcp_server.tools.get_ticker_price import get_ticker_price as _get_ticker_price
-        result = _get_ticker_price(symbol)
+        result = await run_tool(_get_ticker_price, symbol)
         
         if result.get("success"):
             logger.info(f"Successfully fetched price for {symbol}")
@@ -118,7 +128,46 @@ def get_ticker_price(symbol: str) -> Dict[str, Any]:
 
 
 @mcp.tool()
-def get_ticker(symbol: str) -> Dict[str, Any]:
+async def get_ticker_prices(symbols: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Get current prices for many trading symbols in one request.
+    
+    Prefer this over repeated get_ticker_price calls: any number of symbols costs a
+    single weighted request and the result is one compact symbol-to-price mapping.
+    
+    Args:
+        symbols: Optional list of trading pair symbols (e.g., ['BTCUSDT', 'ETHUSDT']).
+                 Omit to get prices for all symbols.
+        
+    Returns:
+        Dictionary containing success status, price mapping, and metadata
+    """
+    logger.info(f"Tool called: get_ticker_prices with symbols={symbols}")
+    
+    try:
+        from binance_mcp_server.tools.get_ticker_prices import get_ticker_prices as _get_ticker_prices
+        result = await run_tool(_get_ticker_prices, symbols)
+        
+        if result.get("success"):
+            logger.info(f"Successfully fetched {result.get('data', {}).get('count', 0)} prices")
+        else:
+            logger.warning(f"Failed to fetch prices: {result.get('error', {}).get('message')}")
+            
+        return result
+        
+    except Exception as e:
+        logger.error(f"Unexpected error in get_ticker_prices tool: {str(e)}")
+        return {
+            "success": False,
+            "error": {
+                "type": "tool_error",
+                "message": f"Tool execution failed: {str(e)}"
+            }
+        }
+
+
+@mcp.tool()
+async def get_ticker(symbol: str) -> Dict[str, Any]:
     """
     Get 24-hour ticker price change statistics for a symbol.
     
@@ -132,7 +181,7 @@ def get_ticker(symbol: str) -> Dict[str, Any]:
     
     try:
         from binance_mcp_server.tools.get_ticker import get_ticker as _get_ticker
-        result = _get_ticker(symbol)
+        result = await run_tool(_get_ticker, symbol)
         
         if result.get("success"):
             logger.info(f"Successfully fetched ticker stats for {symbol}")
@@ -153,18 +202,45 @@ def get_ticker(symbol: str) -> Dict[str, Any]:
 
 
 @mcp.tool()
-def get_available_assets() -> Dict[str, Any]:
+async def get_available_assets(
+    quote_asset: Optional[str] = None,
+    base_asset: Optional[str] = None,
+    status: Optional[str] = None,
+    permissions: Optional[List[str]] = None,
+    symbol_prefix: Optional[str] = None,
+    fields: Optional[List[str]] = None
+) -> Dict[str, Any]:
     """
-    Get a list of all available assets and trading pairs on Binance.
+    Get a list of available assets and trading pairs on Binance.
+    
+    Use the filters and the fields projection to keep responses small; without
+    them every field of every listed symbol is returned.
+    
+    Args:
+        quote_asset: Only symbols quoted in this asset (e.g., 'USDT')
+        base_asset: Only symbols with this base asset (e.g., 'BTC')
+        status: Only symbols with this status (e.g., 'TRADING')
+        permissions: Only symbols with at least one of these permissions (e.g., ['SPOT'])
+        symbol_prefix: Only symbols whose name starts with this prefix (e.g., 'ETH')
+        fields: Keys to keep per symbol (e.g., ['status', 'filters']); 'symbol' is always kept
     
     Returns:
-        Dictionary containing comprehensive exchange information and available assets.
+        Dictionary containing matching symbols and exchange information metadata.
     """
-    logger.info("Tool called: get_available_assets")
+    logger.info(f"Tool called: get_available_assets with quote_asset={quote_asset}, base_asset={base_asset}, "
+                f"status={status}, permissions={permissions}, symbol_prefix={symbol_prefix}, fields={fields}")
     
     try:
         from binance_mcp_server.tools.get_available_assets import get_available_assets as _get_available_assets
-        result = _get_available_assets()
+        result = await run_tool(
+            _get_available_assets,
+            quote_asset=quote_asset,
+            base_asset=base_asset,
+            status=status,
+            permissions=permissions,
+            symbol_prefix=symbol_prefix,
+            fields=fields
+        )
         
         if result.get("success"):
             logger.info("Successfully fetched available assets")
@@ -185,7 +261,7 @@ def get_available_assets() -> Dict[str, Any]:
 
 
 @mcp.tool()
-def get_balance() -> Dict[str, Any]:
+async def get_balance() -> Dict[str, Any]:
     """
     Get the current account balance for all assets on Binance.
     
@@ -199,7 +275,7 @@ def get_balance() -> Dict[str, Any]:
     
     try:
         from binance_mcp_server.tools.get_balance import get_balance as _get_balance
-        result = _get_balance()
+        result = await run_tool(_get_balance)
         
         if result.get("success"):
             logger.info("Successfully fetched account balances")
@@ -220,7 +296,15 @@ def get_balance() -> Dict[str, Any]:
 
 
 @mcp.tool()
-def get_orders(symbol: str, start_time: Optional[int] = None, end_time: Optional[int] = None) -> Dict[str, Any]:
+async def get_orders(
+    symbol: str,
+    start_time: Optional[int] = None,
+    end_time: Optional[int] = None,
+    open_only: bool = False,
+    limit: int = 500,
+    cursor: Optional[str] = None,
+    fields: Optional[List[str]] = None
+) -> Dict[str, Any]:
     """
     Get all orders for a specific trading symbol on Binance.
     
@@ -228,15 +312,22 @@ def get_orders(symbol: str, start_time: Optional[int] = None, end_time: Optional
         symbol: Trading pair symbol (e.g., 'BTCUSDT', 'ETHUSDT')
         start_time: Optional start time for filtering orders (Unix timestamp)
         end_time: Optional end time for filtering orders (Unix timestamp)
+        open_only: Return only currently open orders (default: False)
+        limit: Maximum orders per call (1-5000, default: 500)
+        cursor: next_cursor from a previous response to continue paging
+        fields: Optional list of order fields to return (e.g. ['orderId', 'status'])
         
     Returns:
         Dictionary containing success status, order data, and metadata.
     """
-    logger.info(f"Tool called: get_orders with symbol={symbol}, start_time={start_time}, end_time={end_time}")
+    logger.info(f"Tool called: get_orders with symbol={symbol}, start_time={start_time}, end_time={end_time}, open_only={open_only}, cursor={cursor}")
     
     try:
         from binance_mcp_server.tools.get_orders import get_orders as _get_orders
-        result = _get_orders(symbol, start_time=start_time, end_time=end_time)
+        result = await run_tool(
+            _get_orders, symbol, start_time=start_time, end_time=end_time, open_only=open_only,
+            limit=limit, cursor=cursor, fields=fields
+        )
 
         if result.get("success"):
             logger.info(f"Successfully fetched orders for {symbol}")
@@ -257,20 +348,25 @@ def get_orders(symbol: str, start_time: Optional[int] = None, end_time: Optional
 
 
 @mcp.tool()
-def get_position_info() -> Dict[str, Any]:
+async def get_position_info(include_flat: bool = False, compact: bool = False) -> Dict[str, Any]:
     """
     Get the current position information for the user on Binance.
     
-    This tool retrieves the user's current positions in futures trading.
+    This tool retrieves the user's current positions in futures trading. Flat positions
+    are left out and numeric fields are returned as numbers.
+    
+    Args:
+        include_flat: Also return positions with a size of zero (default: False)
+        compact: Return {"columns": [...], "rows": [[...]]} with the main fields only (default: False)
     
     Returns:
         Dictionary containing success status, position data, and metadata.
     """
-    logger.info("Tool called: get_position_info")
+    logger.info(f"Tool called: get_position_info with include_flat={include_flat}, compact={compact}")
     
     try:
         from binance_mcp_server.tools.get_position_info import get_position_info as _get_position_info
-        result = _get_position_info()
+        result = await run_tool(_get_position_info, include_flat, compact)
         
         if result.get("success"):
             logger.info("Successfully fetched position info")
@@ -291,20 +387,31 @@ def get_position_info() -> Dict[str, Any]:
 
 
 @mcp.tool()
-def get_pnl() -> Dict[str, Any]:
+async def get_pnl(
+    symbol: Optional[str] = None,
+    start_time: Optional[int] = None,
+    end_time: Optional[int] = None
+) -> Dict[str, Any]:
     """
-    Get the current profit and loss (PnL) information for the user on Binance.
+    Get the futures profit and loss (PnL) breakdown for the user on Binance.
     
-    This tool retrieves the user's PnL data for futures trading.
+    Realized PnL, funding fees and commissions come from the income history (synced
+    incrementally into the local history store when enabled); unrealized PnL comes from
+    open positions at live mark prices.
     
+    Args:
+        symbol: Optional futures symbol to limit the breakdown to (e.g. 'BTCUSDT')
+        start_time: Start of the income range (Unix timestamp in ms, default: 30 days back)
+        end_time: End of the income range (Unix timestamp in ms, default: now)
+        
     Returns:
-        Dictionary containing success status, PnL data, and metadata.
+        Dictionary containing totals per asset and breakdowns per symbol and per UTC day.
     """
-    logger.info("Tool called: get_pnl")
+    logger.info(f"Tool called: get_pnl with symbol={symbol}, start_time={start_time}, end_time={end_time}")
     
     try:
         from binance_mcp_server.tools.get_pnl import get_pnl as _get_pnl
-        result = _get_pnl()
+        result = await run_tool(_get_pnl, symbol, start_time, end_time)
         
         if result.get("success"):
             logger.info("Successfully fetched PnL info")
@@ -325,22 +432,64 @@ def get_pnl() -> Dict[str, Any]:
 
 
 @mcp.tool()
-def create_order(
+async def get_portfolio_value(quote_asset: str = "USDT", min_value: float = 0.0) -> Dict[str, Any]:
+    """
+    Value the whole spot portfolio in one quote asset in a single call.
+    
+    Args:
+        quote_asset: Asset to value holdings in (default: 'USDT'); assets without a direct
+                     market are converted through intermediate assets such as BTC
+        min_value: Leave holdings worth less than this out of the list (still counted in the total)
+        
+    Returns:
+        Dictionary containing the total value and holdings with amount, price, value, weight and route.
+    """
+    logger.info(f"Tool called: get_portfolio_value with quote_asset={quote_asset}, min_value={min_value}")
+    
+    try:
+        from binance_mcp_server.tools.get_portfolio_value import get_portfolio_value as _get_portfolio_value
+        result = await run_tool(_get_portfolio_value, quote_asset, min_value)
+        
+        if result.get("success"):
+            logger.info(f"Successfully valued portfolio: {result['data']['total_value']} {result['data']['quote_asset']}")
+        else:
+            logger.warning(f"Failed to value portfolio: {result.get('error', {}).get('message')}")
+            
+        return result
+        
+    except Exception as e:
+        logger.error(f"Unexpected error in get_portfolio_value tool: {str(e)}")
+        return {
+            "success": False,
+            "error": {
+                "type": "tool_error",
+                "message": f"Tool execution failed: {str(e)}"
+            }
+        }
+
+
+@mcp.tool()
+async def create_order(
     symbol: str,
     side: str,
     order_type: str,
     quantity: float,
     price: Optional[float] = None,
+    auto_quantize: bool = False,
 ) -> Dict[str, Any]:
     """
     Create a new order on Binance.
     
+    Orders are checked against the symbol's exchange filters (tick size, step
+    size, min/max quantity, min notional, percent price) before being sent.
+    
     Args:
         symbol: Trading pair symbol (e.g., 'BTCUSDT').
         side: Order side ('BUY' or 'SELL').
         order_type: Type of order ('LIMIT', 'MARKET', etc.).
         quantity: Quantity of the asset to buy/sell.
         price: Price for limit orders (optional).
+        auto_quantize: Round quantity/price onto the symbol's step and tick sizes instead of rejecting them.
         
     Returns:
         Dictionary containing success status and order data.
@@ -349,7 +498,7 @@ def create_order(
     
     try:
         from binance_mcp_server.tools.create_order import create_order as _create_order
-        result = _create_order(symbol, side, order_type, quantity, price)
+        result = await run_tool(_create_order, symbol, side, order_type, quantity, price, auto_quantize)
         
         if result.get("success"):
             logger.info(f"Successfully created order for {symbol}")
@@ -370,7 +519,55 @@ def create_order(
 
 
 @mcp.tool()
-def get_liquidation_history() -> Dict[str, Any]:
+async def create_orders(
+    orders: List[Dict[str, Any]],
+    market: str = "spot",
+    all_or_none: bool = True,
+    auto_quantize: bool = False,
+    max_concurrency: int = 5,
+) -> Dict[str, Any]:
+    """
+    Create a batch of orders on Binance in one call.
+    
+    All orders are validated locally first. Futures orders are sent as batchOrders
+    requests of up to 5; spot orders are submitted in parallel with bounded concurrency.
+    
+    Args:
+        orders: List of orders, each with symbol, side, order_type, quantity and optional price (max 50).
+        market: 'spot' or 'futures' (default: 'spot').
+        all_or_none: Submit nothing if any order fails local validation (default: True).
+        auto_quantize: Round spot quantities/prices onto the symbol's step and tick sizes.
+        max_concurrency: Maximum parallel submissions, 1-10 (default: 5).
+        
+    Returns:
+        Dictionary containing per-order outcomes with timing and batch totals.
+    """
+    logger.info(f"Tool called: create_orders with {len(orders) if isinstance(orders, list) else '?'} {market} orders")
+    
+    try:
+        from binance_mcp_server.tools.create_orders import create_orders as _create_orders
+        result = await run_tool(_create_orders, orders, market, all_or_none, auto_quantize, max_concurrency)
+        
+        if result.get("success"):
+            logger.info(f"Batch processed: {result['data']['succeeded']} of {len(orders)} orders accepted")
+        else:
+            logger.warning(f"Failed to create batch orders: {result.get('error', {}).get('message')}")
+            
+        return result
+        
+    except Exception as e:
+        logger.error(f"Unexpected error in create_orders tool: {str(e)}")
+        return {
+            "success": False,
+            "error": {
+                "type": "tool_error",
+                "message": f"Tool execution failed: {str(e)}"
+            }
+        }
+
+
+@mcp.tool()
+async def get_liquidation_history() -> Dict[str, Any]:
     """
     Get the liquidation history on Binance account.
     
@@ -383,7 +580,7 @@ def get_liquidation_history() -> Dict[str, Any]:
     
     try:
         from binance_mcp_server.tools.get_liquidation_history import get_liquidation_history as _get_liquidation_history
-        result = _get_liquidation_history()
+        result = await run_tool(_get_liquidation_history)
         
         if result.get("success"):
             logger.info("Successfully fetched liquidation history")
@@ -403,7 +600,7 @@ def get_liquidation_history() -> Dict[str, Any]:
         }
 
 @mcp.tool()
-def get_deposit_address(coin: str) -> Dict[str, Any]:
+async def get_deposit_address(coin: str) -> Dict[str, Any]:
     """
     Get the deposit address for a specific coin on the user's Binance account.
     
@@ -417,7 +614,7 @@ def get_deposit_address(coin: str) -> Dict[str, Any]:
     
     try:
         from binance_mcp_server.tools.get_deposit_address import get_deposit_address as _get_deposit_address
-        result = _get_deposit_address(coin)
+        result = await run_tool(_get_deposit_address, coin)
         
         if result.get("success"):
             logger.info(f"Successfully fetched deposit address for {coin}")
@@ -438,12 +635,18 @@ def get_deposit_address(coin: str) -> Dict[str, Any]:
 
 
 @mcp.tool()
-def get_deposit_history(coin: str) -> Dict[str, Any]:
+async def get_deposit_history(
+    coin: str,
+    start_time: Optional[int] = None,
+    end_time: Optional[int] = None
+) -> Dict[str, Any]:
     """
     Get the deposit history for a specific coin on the user's Binance account.
     
     Args:
         coin (str): The coin for which to fetch the deposit history.
+        start_time (Optional[int]): Earliest deposit time (Unix timestamp in ms)
+        end_time (Optional[int]): Latest deposit time (Unix timestamp in ms)
         
     Returns:
         Dictionary containing success status and deposit history data.
@@ -452,7 +655,7 @@ def get_deposit_history(coin: str) -> Dict[str, Any]:
     
     try:
         from binance_mcp_server.tools.get_deposit_history import get_deposit_history as _get_deposit_history
-        result = _get_deposit_history(coin)
+        result = await run_tool(_get_deposit_history, coin, start_time=start_time, end_time=end_time)
         
         if result.get("success"):
             logger.info(f"Successfully fetched deposit history for {coin}")
@@ -473,12 +676,18 @@ def get_deposit_history(coin: str) -> Dict[str, Any]:
 
 
 @mcp.tool()
-def get_withdraw_history(coin: str) -> Dict[str, Any]:
+async def get_withdraw_history(
+    coin: str,
+    start_time: Optional[int] = None,
+    end_time: Optional[int] = None
+) -> Dict[str, Any]:
     """
     Get the withdrawal history for the user's Binance account.
     
     Args:
         coin (Optional[str]): The coin for which to fetch the withdrawal history. Defaults to 'BTC'.
+        start_time (Optional[int]): Earliest withdrawal time (Unix timestamp in ms)
+        end_time (Optional[int]): Latest withdrawal time (Unix timestamp in ms)
         
     Returns:
         Dictionary containing success status and withdrawal history data.
@@ -487,7 +696,7 @@ def get_withdraw_history(coin: str) -> Dict[str, Any]:
     
     try:
         from binance_mcp_server.tools.get_withdraw_history import get_withdraw_history as _get_withdraw_history
-        result = _get_withdraw_history(coin)
+        result = await run_tool(_get_withdraw_history, coin, start_time=start_time, end_time=end_time)
         
         if result.get("success"):
             logger.info(f"Successfully fetched withdrawal history for {coin}")
@@ -508,7 +717,102 @@ def get_withdraw_history(coin: str) -> Dict[str, Any]:
 
 
 @mcp.tool()
-def get_account_snapshot(account_type: str = "SPOT") -> Dict[str, Any]:
+async def get_transaction_history(
+    transaction_type: str = "all",
+    coins: Optional[List[str]] = None,
+    start_time: Optional[int] = None,
+    end_time: Optional[int] = None,
+    limit: int = 1000,
+    cursor: Optional[str] = None,
+    max_concurrency: int = 5
+) -> Dict[str, Any]:
+    """
+    Get deposits and withdrawals across many coins and long date ranges in one call.
+    
+    Args:
+        transaction_type: 'deposit', 'withdrawal' or 'all' (default: 'all')
+        coins: Optional list of coins (e.g. ['BTC', 'USDT']); all coins if not provided
+        start_time: Start of the range (Unix timestamp in ms, default: 90 days back)
+        end_time: End of the range (Unix timestamp in ms, default: now)
+        limit: Maximum records per call (1-10000, default: 1000)
+        cursor: next_cursor from a previous response to continue paging
+        max_concurrency: Maximum parallel requests (1-10, default: 5)
+        
+    Returns:
+        Dictionary containing merged records sorted by time, paging state and request count.
+    """
+    logger.info(f"Tool called: get_transaction_history with type={transaction_type}, coins={coins}, start_time={start_time}, end_time={end_time}")
+    
+    try:
+        from binance_mcp_server.tools.get_transaction_history import get_transaction_history as _get_transaction_history
+        result = await run_tool(
+            _get_transaction_history, transaction_type, coins, start_time, end_time, limit, cursor, max_concurrency
+        )
+        
+        if result.get("success"):
+            logger.info(f"Successfully fetched {result['data']['count']} transactions")
+        else:
+            logger.warning(f"Failed to fetch transaction history: {result.get('error', {}).get('message')}")
+            
+        return result
+        
+    except Exception as e:
+        logger.error(f"Unexpected error in get_transaction_history tool: {str(e)}")
+        return {
+            "success": False,
+            "error": {
+                "type": "tool_error",
+                "message": f"Tool execution failed: {str(e)}"
+            }
+        }
+
+
+@mcp.tool()
+async def get_universal_transfer_history(
+    transfer_types: Optional[List[str]] = None,
+    start_time: Optional[int] = None,
+    end_time: Optional[int] = None,
+    max_concurrency: int = 5
+) -> Dict[str, Any]:
+    """
+    Get transfers between account types (spot, futures, margin, funding, ...) as one merged timeline.
+    
+    Args:
+        transfer_types: Optional list of transfer types (e.g. ['MAIN_UMFUTURE', 'UMFUTURE_MAIN']);
+                        spot to/from futures, margin and funding if not provided
+        start_time: Start of the range (Unix timestamp in ms, default: 7 days back)
+        end_time: End of the range (Unix timestamp in ms, default: now)
+        max_concurrency: Maximum parallel requests (1-10, default: 5)
+        
+    Returns:
+        Dictionary containing a compact timeline (columns + rows), totals per type and asset, and request count.
+    """
+    logger.info(f"Tool called: get_universal_transfer_history with types={transfer_types}, start_time={start_time}, end_time={end_time}")
+    
+    try:
+        from binance_mcp_server.tools.get_universal_transfer_history import get_universal_transfer_history as _get_universal_transfer_history
+        result = await run_tool(_get_universal_transfer_history, transfer_types, start_time, end_time, max_concurrency)
+        
+        if result.get("success"):
+            logger.info(f"Successfully fetched {result['data']['count']} transfers")
+        else:
+            logger.warning(f"Failed to fetch transfer history: {result.get('error', {}).get('message')}")
+            
+        return result
+        
+    except Exception as e:
+        logger.error(f"Unexpected error in get_universal_transfer_history tool: {str(e)}")
+        return {
+            "success": False,
+            "error": {
+                "type": "tool_error",
+                "message": f"Tool execution failed: {str(e)}"
+            }
+        }
+
+
+@mcp.tool()
+async def get_account_snapshot(account_type: str = "SPOT") -> Dict[str, Any]:
     """
     Get the account snapshot for the user's Binance account.
     
@@ -522,7 +826,7 @@ def get_account_snapshot(account_type: str = "SPOT") -> Dict[str, Any]:
     
     try:
         from binance_mcp_server.tools.get_account_snapshot import get_account_snapshot as _get_account_snapshot
-        result = _get_account_snapshot(account_type)
+        result = await run_tool(_get_account_snapshot, account_type)
         
         if result.get("success"):
             logger.info(f"Successfully fetched account snapshot for {account_type} account")
@@ -543,7 +847,7 @@ def get_account_snapshot(account_type: str = "SPOT") -> Dict[str, Any]:
 
 
 @mcp.tool()
-def get_fee_info(symbol: Optional[str] = None) -> Dict[str, Any]:
+async def get_fee_info(symbol: Optional[str] = None) -> Dict[str, Any]:
     """
     Get trading fee information for symbols on Binance.
     
@@ -563,7 +867,7 @@ def get_fee_info(symbol: Optional[str] = None) -> Dict[str, Any]:
     
     try:
         from binance_mcp_server.tools.get_fee_info import get_fee_info as _get_fee_info
-        result = _get_fee_info(symbol)
+        result = await run_tool(_get_fee_info, symbol)
         
         if result.get("success"):
             fee_count = len(result.get("data", []))
@@ -585,7 +889,7 @@ def get_fee_info(symbol: Optional[str] = None) -> Dict[str, Any]:
 
 
 @mcp.tool()
-def get_order_book(symbol: str, limit: Optional[int] = None) -> Dict[str, Any]:
+async def get_order_book(symbol: str, limit: Optional[int] = None) -> Dict[str, Any]:
     """
     Get the current order book (bids/asks) for a trading symbol on Binance.
     
@@ -604,7 +908,7 @@ def get_order_book(symbol: str, limit: Optional[int] = None) -> Dict[str, Any]:
     
     try:
         from binance_mcp_server.tools.get_order_book import get_order_book as _get_order_book
-        result = _get_order_book(symbol, limit)
+        result = await run_tool(_get_order_book, symbol, limit)
         
         if result.get("success"):
             data = result.get("data", {})
@@ -627,6 +931,88 @@ def get_order_book(symbol: str, limit: Optional[int] = None) -> Dict[str, Any]:
         }
 
 
+@mcp.tool()
+async def get_order_book_analytics(
+    symbol: str,
+    bands_bps: Optional[List[float]] = None,
+    size: Optional[float] = None,
+    limit: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Get liquidity analytics for a trading symbol's order book on Binance.
+    
+    Returns cumulative depth within price bands around the mid price, expected fill
+    price (VWAP) and slippage for a given size, and bid/ask imbalance, without
+    transferring the raw order book levels.
+    
+    Args:
+        symbol: Trading pair symbol in format BASEQUOTE (e.g., 'BTCUSDT', 'ETHBTC')
+        bands_bps: Price bands in basis points from mid (default: [10, 50, 100])
+        size: Optional base asset quantity to simulate a market buy and sell for
+        limit: Levels per side to analyse (default: 500, max: 5000)
+        
+    Returns:
+        Dictionary containing success status, liquidity metrics, and metadata.
+    """
+    logger.info(f"Tool called: get_order_book_analytics with symbol={symbol}, bands_bps={bands_bps}, size={size}, limit={limit}")
+    
+    try:
+        from binance_mcp_server.tools.get_order_book_analytics import get_order_book_analytics as _get_order_book_analytics
+        result = await run_tool(_get_order_book_analytics, symbol, bands_bps=bands_bps, size=size, limit=limit)
+        
+        if result.get("success"):
+            logger.info(f"Successfully computed order book analytics for {symbol}")
+        else:
+            logger.warning(f"Failed to compute order book analytics for {symbol}: {result.get('error', {}).get('message')}")
+            
+        return result
+        
+    except Exception as e:
+        logger.error(f"Unexpected error in get_order_book_analytics tool: {str(e)}")
+        return {
+            "success": False,
+            "error": {
+                "type": "tool_error",
+                "message": f"Tool execution failed: {str(e)}"
+            }
+        }
+
+
+@mcp.tool()
+async def get_server_stats() -> Dict[str, Any]:
+    """
+    Get the server's operating metrics.
+    
+    Returns rate limit usage, admission queue depth and wait times per Binance API
+    family and priority class, the calls and weight saved by coalescing
+    identical concurrent calls, and the usage and health of pooled Binance
+    clients. Served from memory without any Binance request.
+    
+    Returns:
+        Dictionary containing success status, statistics per component, and metadata.
+    """
+    logger.info("Tool called: get_server_stats")
+    
+    try:
+        from binance_mcp_server.tools.get_server_stats import get_server_stats as _get_server_stats
+        result = await run_tool(_get_server_stats)
+        
+        if not result.get("success"):
+            logger.warning(f"Failed to collect server stats: {result.get('error', {}).get('message')}")
+            
+        return result
+        
+    except Exception as e:
+        logger.error(f"Unexpected error in get_server_stats tool: {str(e)}")
+        return {
+            "success": False,
+            "error": {
+                "type": "tool_error",
+                "message": f"Tool execution failed: {str(e)}"
+            }
+        }
+
+
 
 def validate_configuration() -> bool:
     """
@@ -686,6 +1072,26 @@ def validate_configuration() -> bool:
         return False
 
 
+def start_background_streams() -> None:
+    """
+    Start the WebSocket-backed caches enabled by configuration.
+    
+    Called by every entry point after the configuration has been validated, so
+    the depth, ticker and user data streams run whichever way the server starts.
+    """
+    # Local order books for BINANCE_DEPTH_STREAM_SYMBOLS sync in the background
+    from binance_mcp_server.order_book import start_depth_streams
+    start_depth_streams()
+    
+    # Live ticker cache (BINANCE_TICKER_STREAM=true)
+    from binance_mcp_server.ticker_cache import start_ticker_streams
+    start_ticker_streams()
+    
+    # Live account state (BINANCE_USER_STREAM / BINANCE_FUTURES_USER_STREAM)
+    from binance_mcp_server.account_state import start_user_streams
+    start_user_streams()
+
+
 def main() -> None:
     """
     Main entry point for the Binance MCP Server.
@@ -730,6 +1136,13 @@ def main() -> None:
         default="localhost",
         help="Host for HTTP transport (default: localhost)"
     )
+    parser.add_argument(
+        "--cache-ttl",
+        action="append",
+        default=[],
+        metavar="TOOL=SECONDS",
+        help="Override a tool's response cache TTL, e.g. get_fee_info=600 (0 disables caching; repeatable)"
+    )
     parser.add_argument(
         "--log-level",
         choices=["DEBUG", "INFO", "WARNING", "ERROR"],
@@ -742,6 +1155,14 @@ def main() -> None:
     # Configure logging level based on argument
     logging.getLogger().setLevel(getattr(logging, args.log_level))
     
+    if args.cache_ttl:
+        from binance_mcp_server.cache import response_cache
+        from binance_mcp_server.config import BinanceConfig
+        try:
+            response_cache.set_ttls(BinanceConfig.parse_ttl_map(",".join(args.cache_ttl)))
+        except ValueError as e:
+            parser.error(str(e))
+    
     
     logger.info(f"Starting Binance MCP Server with {args.transport} transport")
     logger.info(f"Log level set to: {args.log_level}")
@@ -755,6 +1176,9 @@ def main() -> None:
         sys.exit(84)
     
     
+    start_background_streams()
+    
+    
     if args.transport in ["streamable-http", "sse"]:
         logger.info(f"HTTP server will start on {args.host}:{args.port}")
         logger.info("HTTP mode is primarily for testing. Use STDIO for MCP clients.")
@@ -0,0 +1,120 @@
+"""
+Shared WebSocket stream manager for the Binance MCP Server.
+
+All in-memory market and account state is fed by one ThreadedWebsocketManager
+per process. This module owns its lifecycle so components only register
+callbacks and never start their own event loops.
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional
+from binance import ThreadedWebsocketManager
+from binance_mcp_server.config import BinanceConfig
+
+
+logger = logging.getLogger(__name__)
+
+
+class StreamManager:
+    """
+    Lazily started wrapper around a shared ThreadedWebsocketManager.
+
+    Components subscribe with one of the ThreadedWebsocketManager start_*
+    method names (e.g. 'start_depth_socket'); the manager is created and
+    started on the first subscription.
+    """
+
+    def __init__(self, config: Optional[BinanceConfig] = None):
+        """
+        Initialize the stream manager.
+
+        Args:
+            config: Configuration used for credentials and testnet selection
+        """
+        self._config = config
+        self._manager: Optional[ThreadedWebsocketManager] = None
+        self._sockets: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def _get_manager(self) -> ThreadedWebsocketManager:
+        """Create and start the WebSocket manager on first use. Caller holds the lock."""
+        if self._manager is None:
+            config = self._config or BinanceConfig()
+            self._manager = ThreadedWebsocketManager(
+                api_key=config.api_key,
+                api_secret=config.api_secret,
+                testnet=config.testnet
+            )
+            self._manager.start()
+            logger.info("Started shared WebSocket manager")
+        return self._manager
+
+    def subscribe(self, key: str, method: str, callback: Callable[[Dict[str, Any]], None], **kwargs: Any) -> str:
+        """
+        Start a stream unless one is already registered under key.
+
+        Args:
+            key: Caller-chosen identifier for the subscription (e.g. 'depth:BTCUSDT')
+            method: ThreadedWebsocketManager method name (e.g. 'start_depth_socket')
+            callback: Function receiving each decoded stream message
+            **kwargs: Extra arguments for the start method (e.g. symbol, interval)
+
+        Returns:
+            str: Socket name returned by the WebSocket manager
+        """
+        with self._lock:
+            if key in self._sockets:
+                return self._sockets[key]
+            manager = self._get_manager()
+            socket_name = getattr(manager, method)(callback=callback, **kwargs)
+            self._sockets[key] = socket_name
+            logger.info(f"Subscribed to stream {key}")
+            return socket_name
+
+    def unsubscribe(self, key: str) -> None:
+        """
+        Stop the stream registered under key, if any.
+
+        Args:
+            key: Identifier used when subscribing
+        """
+        with self._lock:
+            socket_name = self._sockets.pop(key, None)
+            if socket_name is not None and self._manager is not None:
+                self._manager.stop_socket(socket_name)
+                logger.info(f"Unsubscribed from stream {key}")
+
+    def is_subscribed(self, key: str) -> bool:
+        """Check whether a stream is registered under key."""
+        return key in self._sockets
+
+    def stop(self) -> None:
+        """Stop all streams and the WebSocket manager."""
+        with self._lock:
+            if self._manager is not None:
+                self._manager.stop()
+                self._manager = None
+            self._sockets.clear()
+
+
+# Global stream manager instance
+_stream_manager: Optional[StreamManager] = None
+_stream_manager_lock = threading.Lock()
+
+
+def get_stream_manager() -> StreamManager:
+    """
+    Get the process-wide stream manager.
+
+    Returns:
+        StreamManager: The shared stream manager
+    """
+    global _stream_manager
+
+    if _stream_manager is None:
+        with _stream_manager_lock:
+            if _stream_manager is None:
+                _stream_manager = StreamManager()
+
+    return _stream_manager
@@ -0,0 +1,295 @@
+"""
+Compiled symbol filters for local pre-trade validation.
+
+Binance rejects orders that violate a symbol's PRICE_FILTER, LOT_SIZE,
+MARKET_LOT_SIZE, MIN_NOTIONAL/NOTIONAL or PERCENT_PRICE(_BY_SIDE) filters only
+after a round trip that also spends order-rate budget. This module compiles
+each symbol's filters once from the cached exchange information into exact
+Decimal bounds, so orders can be validated (and optionally rounded onto the
+tick and step grids) in-process before any request is sent. Filters that
+Binance evaluates against its average price (market-order notional and
+PERCENT_PRICE) can only be estimated locally and are reported as warnings.
+"""
+
+import logging
+import threading
+from decimal import Decimal, ROUND_DOWN, ROUND_UP
+from typing import Any, Dict, List, Optional
+from binance_mcp_server.exchange_info import ExchangeInfoCache, exchange_info_cache, futures_exchange_info_cache
+
+
+logger = logging.getLogger(__name__)
+
+_ZERO = Decimal(0)
+
+
+def to_decimal(value: Any) -> Decimal:
+    """Convert a number or numeric string to an exact Decimal (floats via their repr)."""
+    return value if isinstance(value, Decimal) else Decimal(str(value))
+
+
+def format_decimal(value: Decimal) -> str:
+    """Format a Decimal in plain notation without trailing zeros, as Binance expects."""
+    text = format(value, "f")
+    return text.rstrip("0").rstrip(".") if "." in text else text
+
+
+def _round_to_grid(value: Decimal, base: Decimal, step: Decimal, rounding: str = ROUND_DOWN) -> Decimal:
+    """Round value onto the grid base + k * step."""
+    if step <= _ZERO:
+        return value
+    steps = ((value - base) / step).to_integral_value(rounding=rounding)
+    return base + steps * step
+
+
+def _on_grid(value: Decimal, base: Decimal, step: Decimal) -> bool:
+    return step <= _ZERO or (value - base) % step == _ZERO
+
+
+class SymbolFilters:
+    """
+    Exact Decimal bounds of one symbol's trading filters.
+
+    A bound of 0 means the exchange does not enforce it (as in exchangeInfo).
+    """
+
+    __slots__ = (
+        "symbol", "min_price", "max_price", "tick_size",
+        "min_qty", "max_qty", "step_size",
+        "market_min_qty", "market_max_qty", "market_step_size",
+        "min_notional", "max_notional", "min_notional_market", "max_notional_market",
+        "bid_multiplier_up", "bid_multiplier_down", "ask_multiplier_up", "ask_multiplier_down"
+    )
+
+    def __init__(self, entry: Dict[str, Any]):
+        """
+        Compile filters from an exchangeInfo symbol entry.
+
+        Args:
+            entry: Symbol entry containing a 'filters' list
+        """
+        filters = {f.get("filterType"): f for f in entry.get("filters", [])}
+        self.symbol = entry["symbol"]
+
+        price_filter = filters.get("PRICE_FILTER", {})
+        self.min_price = to_decimal(price_filter.get("minPrice", 0))
+        self.max_price = to_decimal(price_filter.get("maxPrice", 0))
+        self.tick_size = to_decimal(price_filter.get("tickSize", 0))
+
+        lot_size = filters.get("LOT_SIZE", {})
+        self.min_qty = to_decimal(lot_size.get("minQty", 0))
+        self.max_qty = to_decimal(lot_size.get("maxQty", 0))
+        self.step_size = to_decimal(lot_size.get("stepSize", 0))
+
+        market_lot_size = filters.get("MARKET_LOT_SIZE", {})
+        self.market_min_qty = to_decimal(market_lot_size.get("minQty", 0))
+        self.market_max_qty = to_decimal(market_lot_size.get("maxQty", 0))
+        self.market_step_size = to_decimal(market_lot_size.get("stepSize", 0))
+
+        if "NOTIONAL" in filters:
+            notional = filters["NOTIONAL"]
+            self.min_notional = to_decimal(notional.get("minNotional", 0))
+            self.max_notional = to_decimal(notional.get("maxNotional", 0))
+            self.min_notional_market = bool(notional.get("applyMinToMarket", True))
+            self.max_notional_market = bool(notional.get("applyMaxToMarket", True))
+        else:
+            # Futures exchangeInfo names the bound 'notional' instead of 'minNotional'
+            min_notional = filters.get("MIN_NOTIONAL", {})
+            self.min_notional = to_decimal(min_notional.get("minNotional", min_notional.get("notional", 0)))
+            self.max_notional = _ZERO
+            self.min_notional_market = bool(min_notional.get("applyToMarket", True))
+            self.max_notional_market = False
+
+        if "PERCENT_PRICE_BY_SIDE" in filters:
+            by_side = filters["PERCENT_PRICE_BY_SIDE"]
+            self.bid_multiplier_up = to_decimal(by_side.get("bidMultiplierUp", 0))
+            self.bid_multiplier_down = to_decimal(by_side.get("bidMultiplierDown", 0))
+            self.ask_multiplier_up = to_decimal(by_side.get("askMultiplierUp", 0))
+            self.ask_multiplier_down = to_decimal(by_side.get("askMultiplierDown", 0))
+        else:
+            percent_price = filters.get("PERCENT_PRICE", {})
+            self.bid_multiplier_up = self.ask_multiplier_up = to_decimal(percent_price.get("multiplierUp", 0))
+            self.bid_multiplier_down = self.ask_multiplier_down = to_decimal(percent_price.get("multiplierDown", 0))
+
+    def quantize_price(self, price: Decimal, side: str) -> Decimal:
+        """
+        Round a price onto the tick grid, never to a worse price for the order.
+
+        Args:
+            price: Requested limit price
+            side: 'BUY' rounds down, 'SELL' rounds up
+
+        Returns:
+            Decimal: Price on the tick grid
+        """
+        rounding = ROUND_DOWN if side == "BUY" else ROUND_UP
+        return _round_to_grid(price, self.min_price, self.tick_size, rounding)
+
+    def quantize_quantity(self, quantity: Decimal, market: bool = False) -> Decimal:
+        """
+        Round a quantity down onto the step grid.
+
+        Args:
+            quantity: Requested base asset quantity
+            market: Also apply the MARKET_LOT_SIZE step
+
+        Returns:
+            Decimal: Quantity on the step grid (never more than requested)
+        """
+        quantity = _round_to_grid(quantity, self.min_qty, self.step_size)
+        if market:
+            quantity = _round_to_grid(quantity, self.market_min_qty, self.market_step_size)
+        return quantity
+
+    def check(
+        self,
+        side: str,
+        market: bool,
+        quantity: Decimal,
+        price: Optional[Decimal] = None
+    ) -> List[Dict[str, str]]:
+        """
+        Check an order against the filters that can be evaluated exactly.
+
+        Market-order notional and PERCENT_PRICE bounds depend on the average
+        price Binance computes over avgPriceMins; see advise() for those.
+
+        Args:
+            side: 'BUY' or 'SELL'
+            market: Whether this is a MARKET order
+            quantity: Base asset quantity
+            price: Limit price (None for market orders)
+
+        Returns:
+            List[Dict[str, str]]: Violations as {'filter', 'message'}; empty if the order passes
+        """
+        violations: List[Dict[str, str]] = []
+
+        def violate(filter_type: str, message: str) -> None:
+            violations.append({"filter": filter_type, "message": message})
+
+        if price is not None:
+            if self.min_price > _ZERO and price < self.min_price:
+                violate("PRICE_FILTER", f"price {price} is below the minimum {format_decimal(self.min_price)}")
+            if self.max_price > _ZERO and price > self.max_price:
+                violate("PRICE_FILTER", f"price {price} is above the maximum {format_decimal(self.max_price)}")
+            if not _on_grid(price, self.min_price, self.tick_size):
+                violate("PRICE_FILTER", f"price {price} is not a multiple of the tick size {format_decimal(self.tick_size)}")
+
+        self._check_lot("LOT_SIZE", quantity, self.min_qty, self.max_qty, self.step_size, violate)
+        if market:
+            self._check_lot(
+                "MARKET_LOT_SIZE", quantity, self.market_min_qty, self.market_max_qty, self.market_step_size, violate
+            )
+        elif price is not None:
+            self._check_notional(False, quantity * price, violate)
+
+        return violations
+
+    def advise(
+        self,
+        side: str,
+        market: bool,
+        quantity: Decimal,
+        price: Optional[Decimal],
+        reference_price: Optional[Decimal]
+    ) -> List[Dict[str, str]]:
+        """
+        Estimate the average-price filters against a recent market price.
+
+        Binance evaluates market-order NOTIONAL and PERCENT_PRICE(_BY_SIDE)
+        against its weighted average price over avgPriceMins, which can differ
+        from the last trade price, so these results are warnings only.
+
+        Args:
+            side: 'BUY' or 'SELL'
+            market: Whether this is a MARKET order
+            quantity: Base asset quantity
+            price: Limit price (None for market orders)
+            reference_price: Recent market price, or None to skip the estimates
+
+        Returns:
+            List[Dict[str, str]]: Likely violations as {'filter', 'message'}
+        """
+        warnings: List[Dict[str, str]] = []
+        if reference_price is None:
+            return warnings
+
+        def warn(filter_type: str, message: str) -> None:
+            warnings.append({"filter": filter_type, "message": f"{message} (estimated from the last price)"})
+
+        if market:
+            self._check_notional(True, quantity * reference_price, warn)
+
+        if price is not None:
+            up, down = (
+                (self.bid_multiplier_up, self.bid_multiplier_down) if side == "BUY"
+                else (self.ask_multiplier_up, self.ask_multiplier_down)
+            )
+            if up > _ZERO and price > reference_price * up:
+                warn("PERCENT_PRICE", f"price {price} is more than {up}x the market price {reference_price}")
+            if down > _ZERO and price < reference_price * down:
+                warn("PERCENT_PRICE", f"price {price} is less than {down}x the market price {reference_price}")
+
+        return warnings
+
+    def _check_notional(self, market: bool, notional: Decimal, violate) -> None:
+        if self.min_notional > _ZERO and (not market or self.min_notional_market) and notional < self.min_notional:
+            violate("NOTIONAL", f"notional {notional.normalize():f} is below the minimum {format_decimal(self.min_notional)}")
+        if self.max_notional > _ZERO and (not market or self.max_notional_market) and notional > self.max_notional:
+            violate("NOTIONAL", f"notional {notional.normalize():f} is above the maximum {format_decimal(self.max_notional)}")
+
+    @staticmethod
+    def _check_lot(filter_type: str, quantity: Decimal, min_qty: Decimal, max_qty: Decimal, step: Decimal, violate) -> None:
+        if min_qty > _ZERO and quantity < min_qty:
+            violate(filter_type, f"quantity {quantity} is below the minimum {format_decimal(min_qty)}")
+        if max_qty > _ZERO and quantity > max_qty:
+            violate(filter_type, f"quantity {quantity} is above the maximum {format_decimal(max_qty)}")
+        if not _on_grid(quantity, min_qty, step):
+            violate(filter_type, f"quantity {quantity} is not a multiple of the step size {format_decimal(step)}")
+
+
+class SymbolFilterIndex:
+    """
+    Per-symbol compiled filters, rebuilt when the exchange information changes.
+
+    Filters are compiled on first use of a symbol and reused until the
+    exchange information digest changes.
+    """
+
+    def __init__(self, cache: ExchangeInfoCache):
+        self._cache = cache
+        self._digest: Optional[str] = None
+        self._compiled: Dict[str, SymbolFilters] = {}
+        self._lock = threading.Lock()
+
+    def get(self, symbol: str) -> Optional[SymbolFilters]:
+        """
+        Get the compiled filters of a symbol.
+
+        Args:
+            symbol: Normalized trading pair symbol
+
+        Returns:
+            Optional[SymbolFilters]: Compiled filters, or None if the symbol is not listed
+
+        Raises:
+            RuntimeError: If exchange information is unavailable
+        """
+        index = self._cache.get()
+        with self._lock:
+            if index.digest != self._digest:
+                self._compiled.clear()
+                self._digest = index.digest
+            filters = self._compiled.get(symbol)
+            if filters is None:
+                entry = index.get_symbol(symbol)
+                if entry is None:
+                    return None
+                filters = self._compiled[symbol] = SymbolFilters(entry)
+            return filters
+
+
+# Global compiled filter indexes backed by the spot and futures exchange info caches
+symbol_filter_index = SymbolFilterIndex(exchange_info_cache)
+futures_symbol_filter_index = SymbolFilterIndex(futures_exchange_info_cache)
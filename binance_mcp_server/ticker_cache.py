@@ -0,0 +1,232 @@
+"""
+Live ticker cache fed by the all-market WebSocket streams.
+
+When enabled, the cache subscribes to !miniTicker@arr (last price and rolling
+24h open/high/low/volume) and !bookTicker (best bid/ask) and keeps the latest
+values per symbol in a compact table. Ticker tools serve from it while the
+streams are live, and fall back to REST when a stream has gone quiet for longer
+than the configured staleness bound.
+"""
+
+import time
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Union
+from binance_mcp_server.config import BinanceConfig
+from binance_mcp_server.streams import get_stream_manager
+
+
+logger = logging.getLogger(__name__)
+
+_DAY_MS = 24 * 60 * 60 * 1000
+
+
+class _TickerRow:
+    """Latest stream values for one symbol."""
+
+    __slots__ = (
+        "last_price", "open_price", "high_price", "low_price", "volume", "quote_volume",
+        "event_time", "bid_price", "bid_quantity", "ask_price", "ask_quantity", "has_book"
+    )
+
+    def __init__(self):
+        self.last_price = self.open_price = self.high_price = self.low_price = 0.0
+        self.volume = self.quote_volume = 0.0
+        self.event_time = 0
+        self.bid_price = self.bid_quantity = self.ask_price = self.ask_quantity = 0.0
+        self.has_book = False
+
+
+class TickerCache:
+    """
+    Per-symbol table of live prices and 24h statistics.
+
+    Freshness is judged per stream rather than per symbol: the mini-ticker
+    stream only pushes symbols that changed, so a quiet symbol's row is still
+    current as long as the stream itself is delivering messages.
+    """
+
+    def __init__(self, max_age: float = 5.0):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_age: Seconds without stream messages after which data is stale
+        """
+        self.max_age = max_age
+        self._rows: Dict[str, _TickerRow] = {}
+        self._mini_received: Optional[float] = None
+        self._book_received: Optional[float] = None
+        self._lock = threading.Lock()
+        self._messages = 0
+
+    def start(self) -> None:
+        """Subscribe to the all-market mini-ticker and book-ticker streams."""
+        manager = get_stream_manager()
+        manager.subscribe("tickers:mini", "start_miniticker_socket", self.on_mini_tickers)
+        manager.subscribe("tickers:book", "start_book_ticker_socket", self.on_book_ticker)
+
+    def stop(self) -> None:
+        """Unsubscribe from the ticker streams."""
+        manager = get_stream_manager()
+        manager.unsubscribe("tickers:mini")
+        manager.unsubscribe("tickers:book")
+        self._mini_received = self._book_received = None
+
+    def on_mini_tickers(self, message: Union[List[Dict[str, Any]], Dict[str, Any]]) -> None:
+        """
+        Handle one !miniTicker@arr message.
+
+        Args:
+            message: List of 24hrMiniTicker events (or an error message)
+        """
+        if isinstance(message, dict):
+            if message.get("e") == "error":
+                logger.warning(f"Mini-ticker stream error: {message.get('m')}")
+            return
+
+        with self._lock:
+            for event in message:
+                row = self._rows.get(event["s"])
+                if row is None:
+                    row = self._rows[event["s"]] = _TickerRow()
+                row.last_price = float(event["c"])
+                row.open_price = float(event["o"])
+                row.high_price = float(event["h"])
+                row.low_price = float(event["l"])
+                row.volume = float(event["v"])
+                row.quote_volume = float(event["q"])
+                row.event_time = event["E"]
+            self._mini_received = time.monotonic()
+            self._messages += 1
+
+    def on_book_ticker(self, message: Dict[str, Any]) -> None:
+        """
+        Handle one !bookTicker message.
+
+        Args:
+            message: Book ticker event with best bid/ask (or an error message)
+        """
+        if message.get("e") == "error":
+            logger.warning(f"Book-ticker stream error: {message.get('m')}")
+            return
+
+        with self._lock:
+            row = self._rows.get(message["s"])
+            if row is None:
+                row = self._rows[message["s"]] = _TickerRow()
+            row.bid_price = float(message["b"])
+            row.bid_quantity = float(message["B"])
+            row.ask_price = float(message["a"])
+            row.ask_quantity = float(message["A"])
+            row.has_book = True
+            self._book_received = time.monotonic()
+            self._messages += 1
+
+    def _is_live(self, received: Optional[float]) -> bool:
+        return received is not None and time.monotonic() - received <= self.max_age
+
+    def get_price(self, symbol: str) -> Optional[float]:
+        """
+        Get the last traded price if the mini-ticker stream is live.
+
+        Args:
+            symbol: Normalized trading pair symbol
+
+        Returns:
+            Optional[float]: Last price, or None if REST must be used
+        """
+        row = self._rows.get(symbol)
+        if row is None or not row.event_time or not self._is_live(self._mini_received):
+            return None
+        return row.last_price
+
+    def get_prices(self, symbols: List[str]) -> Optional[Dict[str, float]]:
+        """
+        Get last prices for several symbols.
+
+        Args:
+            symbols: Normalized trading pair symbols
+
+        Returns:
+            Optional[Dict[str, float]]: Prices for all requested symbols, or None
+            if the stream is stale or any requested symbol is missing
+        """
+        if not self._is_live(self._mini_received):
+            return None
+
+        with self._lock:
+            rows = [self._rows.get(symbol) for symbol in symbols]
+            if any(row is None or not row.event_time for row in rows):
+                return None
+            return {symbol: row.last_price for symbol, row in zip(symbols, rows)}
+
+    def get_ticker(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        Get 24h statistics and best bid/ask if both streams are live.
+
+        Args:
+            symbol: Normalized trading pair symbol
+
+        Returns:
+            Optional[Dict]: Ticker fields in the get_ticker response layout, or
+            None if REST must be used. Fields the streams do not carry
+            (prev_close_price, count) are None.
+        """
+        with self._lock:
+            row = self._rows.get(symbol)
+            if (
+                row is None or not row.event_time or not row.has_book
+                or not self._is_live(self._mini_received) or not self._is_live(self._book_received)
+            ):
+                return None
+
+            price_change = row.last_price - row.open_price
+            return {
+                "symbol": symbol,
+                "price_change": price_change,
+                "price_change_percent": price_change / row.open_price * 100 if row.open_price else 0.0,
+                "weighted_avg_price": row.quote_volume / row.volume if row.volume else 0.0,
+                "prev_close_price": None,
+                "last_price": row.last_price,
+                "bid_price": row.bid_price,
+                "ask_price": row.ask_price,
+                "open_price": row.open_price,
+                "high_price": row.high_price,
+                "low_price": row.low_price,
+                "volume": row.volume,
+                "quote_volume": row.quote_volume,
+                "open_time": row.event_time - _DAY_MS,
+                "close_time": row.event_time,
+                "count": None
+            }
+
+    def age_ms(self) -> Optional[int]:
+        """Milliseconds since the last mini-ticker message, or None if none arrived."""
+        if self._mini_received is None:
+            return None
+        return int((time.monotonic() - self._mini_received) * 1000)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get message counts and stream liveness for monitoring."""
+        return {
+            "messages": self._messages,
+            "symbols": len(self._rows),
+            "max_age": self.max_age,
+            "mini_ticker_live": self._is_live(self._mini_received),
+            "book_ticker_live": self._is_live(self._book_received),
+        }
+
+
+# Global ticker cache instance
+ticker_cache = TickerCache(max_age=BinanceConfig().ticker_stream_max_age)
+
+
+def start_ticker_streams() -> None:
+    """Start the ticker cache streams if BINANCE_TICKER_STREAM is enabled."""
+    if not BinanceConfig().ticker_stream:
+        return
+    try:
+        ticker_cache.start()
+    except Exception as e:
+        logger.error(f"Failed to start ticker streams: {str(e)}")
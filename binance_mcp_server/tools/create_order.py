@@ -6,26 +6,164 @@ supporting various order types including market and limit orders for spot tradin
 """
 
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
+from requests.exceptions import RequestException
 from binance.exceptions import BinanceAPIException, BinanceRequestException
 from binance_mcp_server.utils import (
     get_binance_client, 
     create_error_response, 
     create_success_response,
+    invalidate_cache,
     rate_limited,
     binance_rate_limiter,
+    RequestPriority,
     validate_symbol,
     validate_and_get_order_side,
     validate_and_get_order_type,
     validate_positive_number
 )
+from binance_mcp_server.exchange_info import exchange_info_cache
+from binance_mcp_server.symbol_filters import symbol_filter_index, to_decimal, format_decimal
+from binance_mcp_server.ticker_cache import ticker_cache
+from binance_mcp_server.history_store import expire_history
 
 
 logger = logging.getLogger(__name__)
 
 
-@rate_limited(binance_rate_limiter)
-def create_order(symbol: str, side: str, order_type: str, quantity: float, price: Optional[float] = None) -> Dict[str, Any]:
+def _check_symbol_tradable(symbol: str) -> Optional[str]:
+    """
+    Check a symbol against the cached exchange information.
+    
+    Args:
+        symbol: Normalized trading pair symbol
+    
+    Returns:
+        Optional[str]: Error message if the symbol cannot be traded, None otherwise.
+        If exchange information is unavailable the check is skipped and the
+        exchange remains the source of truth.
+    """
+    try:
+        entry = exchange_info_cache.get_symbol(symbol)
+    except Exception as e:
+        logger.warning(f"Skipping local symbol check for {symbol}: {str(e)}")
+        return None
+
+    if entry is None:
+        return f"Symbol {symbol} is not listed on Binance"
+    if entry.get("status") != "TRADING":
+        return f"Symbol {symbol} is not trading (status: {entry.get('status')})"
+    return None
+
+
+def _prepare_order(
+    symbol: str,
+    side: str,
+    order_type: str,
+    quantity: float,
+    price: Optional[float] = None,
+    auto_quantize: bool = False
+) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, str]], Optional[Dict[str, Any]]]:
+    """
+    Validate an order locally and build its request parameters.
+
+    The order is checked against the symbol's compiled exchange filters
+    (PRICE_FILTER, LOT_SIZE, MARKET_LOT_SIZE, NOTIONAL for limit orders) so
+    that orders Binance would reject never leave the process. Filters Binance
+    evaluates against its average price (NOTIONAL for market orders,
+    PERCENT_PRICE) are estimated from the last price and only produce
+    warnings. If exchange information is unavailable the filter checks are
+    skipped.
+
+    Returns:
+        Tuple of (order parameters, warnings, None) or (None, [], error response)
+
+    Raises:
+        ValueError: If a parameter is malformed
+    """
+    normalized_symbol = validate_symbol(symbol)
+    validated_side = validate_and_get_order_side(side)
+    validated_order_type = validate_and_get_order_type(order_type)
+    
+    # Reject unlisted or halted symbols locally instead of spending an order request
+    symbol_error = _check_symbol_tradable(normalized_symbol)
+    if symbol_error:
+        return None, [], create_error_response("validation_error", symbol_error)
+    
+    # Validate quantity with enhanced checks
+    validated_quantity = validate_positive_number(quantity, "quantity", min_value=0.0)
+    
+    # Validate price for limit orders
+    validated_price = None
+    if order_type.upper() in ["LIMIT", "STOP_LOSS_LIMIT", "TAKE_PROFIT_LIMIT", "LIMIT_MAKER"]:
+        if price is None:
+            return None, [], create_error_response("validation_error", f"Price is required for {order_type} orders")
+        validated_price = validate_positive_number(price, "price", min_value=0.0)
+    elif price is not None and order_type.upper() == "MARKET":
+        # For market orders, price should be ignored
+        logger.info("Price parameter ignored for market order")
+        validated_price = None
+    else:
+        validated_price = price
+
+    # Create order with validated parameters
+    order_params = {
+        "symbol": normalized_symbol,
+        "side": validated_side,
+        "type": validated_order_type,
+        "quantity": validated_quantity
+    }
+    
+    if validated_price is not None:
+        order_params["price"] = validated_price
+
+    try:
+        filters = symbol_filter_index.get(normalized_symbol)
+    except Exception as e:
+        logger.warning(f"Skipping local filter checks for {normalized_symbol}: {str(e)}")
+        filters = None
+    if filters is None:
+        return order_params, [], None
+
+    market = order_type.upper() == "MARKET"
+    side_name = side.upper()
+    order_quantity = to_decimal(validated_quantity)
+    order_price = to_decimal(validated_price) if validated_price is not None else None
+
+    if auto_quantize:
+        order_quantity = filters.quantize_quantity(order_quantity, market)
+        if order_price is not None:
+            order_price = filters.quantize_price(order_price, side_name)
+        order_params["quantity"] = format_decimal(order_quantity)
+        if order_price is not None:
+            order_params["price"] = format_decimal(order_price)
+
+    violations = filters.check(side_name, market, order_quantity, order_price)
+    if violations:
+        message = f"Order violates {normalized_symbol} filters: " + "; ".join(v["message"] for v in violations)
+        return None, [], create_error_response("validation_error", message, {"violations": violations})
+
+    last_price = ticker_cache.get_price(normalized_symbol)
+    reference_price = to_decimal(last_price) if last_price is not None else None
+    warnings = filters.advise(side_name, market, order_quantity, order_price, reference_price)
+    return order_params, warnings, None
+
+
+@rate_limited(binance_rate_limiter, endpoint="order", priority=RequestPriority.ORDER)
+def _place_order(**order_params: Any) -> Any:
+    """Place a validated order (charged against the weight and order-rate budgets)."""
+    client = get_binance_client()
+    return client.create_order(**order_params)
+
+
+def create_order(
+    symbol: str,
+    side: str,
+    order_type: str,
+    quantity: float,
+    price: Optional[float] = None,
+    auto_quantize: bool = False
+) -> Dict[str, Any]:
     """
     Create a new trading order on Binance.
     
@@ -43,6 +181,15 @@ def create_order(symbol: str, side: str, order_type: str, quantity: float, price
                          and respect the symbol's minimum quantity requirements.
         price (Optional[float]): Price per unit for limit orders. Required for LIMIT orders,
                                ignored for MARKET orders. Must be greater than 0.
+        auto_quantize (bool): Round quantity down to the step size and price onto the
+                             tick size (down for BUY, up for SELL) instead of rejecting
+                             off-grid values. Defaults to False.
+    
+    Orders are validated locally against the symbol's exchange filters before any
+    request is sent; a violating order is rejected with a validation_error listing
+    each violated filter and does not spend order-rate budget. Filters Binance checks
+    against its average price (market-order notional, PERCENT_PRICE) are estimated
+    from the last price and reported in metadata.warnings without blocking the order.
     
     Returns:
         Dict containing:
@@ -75,41 +222,21 @@ def create_order(symbol: str, side: str, order_type: str, quantity: float, price
     logger.info(f"Creating order: {symbol}, Side: {side}, Type: {order_type}, Quantity: {quantity}")
 
     try:
-        client = get_binance_client()
-        
-        # Enhanced input validation
-        normalized_symbol = validate_symbol(symbol)
-        validated_side = validate_and_get_order_side(side)
-        validated_order_type = validate_and_get_order_type(order_type)
-        
-        # Validate quantity with enhanced checks
-        validated_quantity = validate_positive_number(quantity, "quantity", min_value=0.0)
-        
-        # Validate price for limit orders
-        validated_price = None
-        if order_type.upper() in ["LIMIT", "STOP_LOSS_LIMIT", "TAKE_PROFIT_LIMIT", "LIMIT_MAKER"]:
-            if price is None:
-                return create_error_response("validation_error", f"Price is required for {order_type} orders")
-            validated_price = validate_positive_number(price, "price", min_value=0.0)
-        elif price is not None and order_type.upper() == "MARKET":
-            # For market orders, price should be ignored
-            logger.info("Price parameter ignored for market order")
-            validated_price = None
-        else:
-            validated_price = price
-
-        # Create order with validated parameters
-        order_params = {
-            "symbol": normalized_symbol,
-            "side": validated_side,
-            "type": validated_order_type,
-            "quantity": validated_quantity
-        }
-        
-        if validated_price is not None:
-            order_params["price"] = validated_price
+        order_params, warnings, error = _prepare_order(symbol, side, order_type, quantity, price, auto_quantize)
+        if error:
+            return error
+        normalized_symbol = order_params["symbol"]
+        for warning in warnings:
+            logger.warning(f"Order for {normalized_symbol} may be rejected: {warning['message']}")
 
-        order = client.create_order(**order_params)
+        order = _place_order(**order_params)
+        if isinstance(order, dict) and not order.get("success", True):
+            # Rate limited before submission
+            return order
+        
+        # Balances cached before the order no longer reflect the account
+        invalidate_cache("get_balance")
+        expire_history("orders", normalized_symbol)
 
         logger.info(f"Successfully created order for {normalized_symbol}")
         return create_success_response(
@@ -117,7 +244,10 @@ def create_order(symbol: str, side: str, order_type: str, quantity: float, price
             metadata={
                 "source": "binance_api",
                 "endpoint": "create_order",
-                "order_type": order_type.upper()
+                "order_type": order_type.upper(),
+                "quantity": order_params["quantity"],
+                "price": order_params.get("price"),
+                "warnings": warnings
             }
         )
 
@@ -130,6 +260,14 @@ def create_order(symbol: str, side: str, order_type: str, quantity: float, price
         logger.error(f"Error creating order: {str(e)}")
         return create_error_response("binance_api_error", f"Error creating order: {str(e)}")
 
+    except RequestException as e:
+        # The order may have reached the exchange before the connection failed
+        logger.error(f"Network error creating order: {str(e)}")
+        return create_error_response(
+            "order_status_unknown",
+            f"Order status unknown after a network error; check open orders before retrying: {str(e)}"
+        )
+
     except Exception as e:
         logger.error(f"Unexpected error in create_order tool: {str(e)}")
         return create_error_response("tool_error", f"Tool execution failed: {str(e)}")
\ No newline at end of file
@@ -0,0 +1,346 @@
+"""
+Binance batch order creation tool implementation.
+
+This module provides functionality to place many orders in one tool call:
+all orders are validated locally first, then submitted as futures batchOrders
+requests (up to 5 orders each) or, for spot, in parallel with bounded
+concurrency. Each order gets its own outcome and timing.
+"""
+
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+from binance.exceptions import BinanceAPIException, BinanceRequestException
+from binance_mcp_server.utils import (
+    get_binance_client,
+    create_error_response,
+    create_success_response,
+    invalidate_cache,
+    rate_limited,
+    futures_rate_limiter,
+    RequestPriority,
+    validate_symbol,
+    validate_and_get_order_side,
+    validate_positive_number,
+)
+from binance_mcp_server.exchange_info import futures_exchange_info_cache
+from binance_mcp_server.history_store import expire_history
+from binance_mcp_server.symbol_filters import futures_symbol_filter_index, to_decimal, format_decimal
+from binance_mcp_server.tools.create_order import _prepare_order, _place_order
+
+
+logger = logging.getLogger(__name__)
+
+# Largest batch accepted in one call (the spot order-rate limit is 50 per 10s)
+MAX_BATCH_ORDERS = 50
+
+# Orders per futures batchOrders request (exchange maximum)
+FUTURES_BATCH_SIZE = 5
+
+# Upper bound on parallel submissions
+MAX_CONCURRENCY = 10
+
+_ORDER_FIELDS = {"symbol", "side", "order_type", "quantity", "price"}
+
+_FUTURES_ORDER_TYPES = {"LIMIT", "MARKET"}
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 3)
+
+
+def _failed(index: int, error: Dict[str, Any], elapsed_ms: float = 0.0) -> Dict[str, Any]:
+    """Per-order outcome for an order that was rejected or failed."""
+    return {"index": index, "success": False, "error": error, "elapsed_ms": elapsed_ms}
+
+
+def _check_fields(order: Any) -> None:
+    """Reject order entries that are not dicts or carry unknown fields."""
+    if not isinstance(order, dict):
+        raise ValueError("each order must be an object with symbol, side, order_type, quantity and optional price")
+    unknown = set(order) - _ORDER_FIELDS
+    if unknown:
+        raise ValueError(f"unknown order fields: {', '.join(sorted(unknown))}")
+
+
+def _prepare_spot(
+    order: Any, auto_quantize: bool
+) -> Tuple[Optional[Tuple[Dict[str, Any], List[Dict[str, str]]]], Optional[Dict[str, Any]]]:
+    """
+    Validate one spot order locally and build its request parameters.
+
+    Returns:
+        Tuple of ((order parameters, warnings), None) or (None, error)
+    """
+    try:
+        _check_fields(order)
+        order_params, warnings, error = _prepare_order(**order, auto_quantize=auto_quantize)
+    except (ValueError, TypeError) as e:
+        return None, create_error_response("validation_error", f"Invalid order: {str(e)}")["error"]
+    if error:
+        return None, error["error"]
+    return (order_params, warnings), None
+
+
+def _prepare_futures(order: Any, auto_quantize: bool) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """
+    Validate one futures order locally and build its batchOrders entry.
+
+    The order is checked against the symbol's USD-M futures exchange filters
+    (PRICE_FILTER, LOT_SIZE, MARKET_LOT_SIZE and, for limit orders, MIN_NOTIONAL).
+    If futures exchange information is unavailable the filter checks are skipped.
+
+    Returns:
+        Tuple of (batch entry, None) or (None, error)
+    """
+    try:
+        _check_fields(order)
+        order_type = str(order.get("order_type", "")).upper().strip()
+        if order_type not in _FUTURES_ORDER_TYPES:
+            raise ValueError(f"futures batch orders support order types: {', '.join(sorted(_FUTURES_ORDER_TYPES))}")
+
+        symbol = validate_symbol(order.get("symbol"))
+        side = validate_and_get_order_side(order.get("side"))
+        quantity = to_decimal(validate_positive_number(order.get("quantity"), "quantity"))
+        price = None
+        if order_type == "LIMIT":
+            if order.get("price") is None:
+                raise ValueError("price is required for LIMIT orders")
+            price = to_decimal(validate_positive_number(order["price"], "price"))
+    except (ValueError, TypeError) as e:
+        return None, create_error_response("validation_error", f"Invalid order: {str(e)}")["error"]
+
+    try:
+        symbol_entry = futures_exchange_info_cache.get_symbol(symbol)
+        filters = futures_symbol_filter_index.get(symbol)
+    except Exception as e:
+        logger.warning(f"Skipping local futures filter checks for {symbol}: {str(e)}")
+        symbol_entry = filters = None
+    else:
+        if symbol_entry is None:
+            return None, create_error_response("validation_error", f"Symbol {symbol} is not listed on Binance USD-M futures")["error"]
+        if symbol_entry.get("status") != "TRADING":
+            return None, create_error_response(
+                "validation_error", f"Symbol {symbol} is not trading (status: {symbol_entry.get('status')})"
+            )["error"]
+
+    if filters is not None:
+        market = order_type == "MARKET"
+        if auto_quantize:
+            quantity = filters.quantize_quantity(quantity, market)
+            if price is not None:
+                price = filters.quantize_price(price, side)
+        violations = filters.check(side, market, quantity, price)
+        if violations:
+            message = f"Order violates {symbol} filters: " + "; ".join(v["message"] for v in violations)
+            return None, create_error_response("validation_error", message, {"violations": violations})["error"]
+
+    entry = {"symbol": symbol, "side": side, "type": order_type, "quantity": format_decimal(quantity)}
+    if price is not None:
+        entry["price"] = format_decimal(price)
+        entry["timeInForce"] = "GTC"
+    return entry, None
+
+
+@rate_limited(futures_rate_limiter, endpoint="fapi/batchOrders", priority=RequestPriority.ORDER)
+def _submit_futures_batch(batch: List[Dict[str, Any]]) -> List[Any]:
+    """Place up to FUTURES_BATCH_SIZE futures orders with one batchOrders request."""
+    client = get_binance_client()
+    return client.futures_place_batch_order(batchOrders=[dict(entry) for entry in batch])
+
+
+def _status_unknown(action: str, e: Exception) -> Dict[str, Any]:
+    """Error for a submission whose outcome is unknown (e.g. a timeout after sending)."""
+    return create_error_response(
+        "order_status_unknown",
+        f"Order status unknown after {action} failed; check open orders before retrying: {str(e)}"
+    )["error"]
+
+
+def _run_futures_batch(batch: List[Tuple[int, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Submit one futures batch and map its response to per-order outcomes."""
+    started = time.perf_counter()
+    indexes = [index for index, _ in batch]
+    try:
+        response = _submit_futures_batch([entry for _, entry in batch])
+    except BinanceAPIException as e:
+        error = create_error_response("binance_api_error", f"Error placing batch orders: {str(e)}")["error"]
+        return [_failed(index, error, _elapsed_ms(started)) for index in indexes]
+    except Exception as e:
+        # Network errors and timeouts: the batch may or may not have been placed
+        logger.error(f"Futures batch submission failed: {str(e)}")
+        error = _status_unknown("the batch submission", e)
+        return [_failed(index, error, _elapsed_ms(started)) for index in indexes]
+
+    elapsed = _elapsed_ms(started)
+    if isinstance(response, dict) and not response.get("success", True):
+        # Rate limited before submission
+        return [_failed(index, response["error"], elapsed) for index in indexes]
+
+    outcomes = []
+    for index, result in zip(indexes, response):
+        if isinstance(result, dict) and "code" in result and "orderId" not in result:
+            error = create_error_response("binance_api_error", f"Error placing order: {result.get('msg')}")["error"]
+            outcomes.append(_failed(index, error, elapsed))
+        else:
+            outcomes.append({"index": index, "success": True, "order": result, "elapsed_ms": elapsed})
+    return outcomes
+
+
+def _run_spot_order(index: int, prepared: Tuple[Dict[str, Any], List[Dict[str, str]]]) -> Dict[str, Any]:
+    """Submit one locally validated spot order (rate limited per order)."""
+    order_params, warnings = prepared
+    started = time.perf_counter()
+    try:
+        order = _place_order(**order_params)
+    except (BinanceAPIException, BinanceRequestException) as e:
+        error = create_error_response("binance_api_error", f"Error creating order: {str(e)}")["error"]
+        return _failed(index, error, _elapsed_ms(started))
+    except Exception as e:
+        logger.error(f"Spot order submission failed: {str(e)}")
+        return _failed(index, _status_unknown("the order submission", e), _elapsed_ms(started))
+    elapsed = _elapsed_ms(started)
+    if isinstance(order, dict) and not order.get("success", True):
+        # Rate limited before submission
+        return _failed(index, order["error"], elapsed)
+
+    # Balances cached before the order no longer reflect the account
+    invalidate_cache("get_balance")
+    expire_history("orders", order_params["symbol"])
+
+    outcome = {"index": index, "success": True, "order": order, "elapsed_ms": elapsed}
+    if warnings:
+        outcome["warnings"] = warnings
+    return outcome
+
+
+def create_orders(
+    orders: List[Dict[str, Any]],
+    market: str = "spot",
+    all_or_none: bool = True,
+    auto_quantize: bool = False,
+    max_concurrency: int = 5
+) -> Dict[str, Any]:
+    """
+    Create many orders on Binance in one call.
+
+    Every order is validated locally first against the symbol's exchange
+    filters (spot or USD-M futures exchange information). Futures orders are
+    then sent as batchOrders requests of up to 5 orders; spot orders, for which
+    Binance has no batch endpoint, are submitted in parallel with bounded
+    concurrency. Each submission is charged to the rate limits like a single
+    order. A submission that fails without an exchange response (e.g. a
+    timeout) is reported per order as order_status_unknown, since it may have
+    been placed; outcomes of the other submissions are kept.
+
+    Args:
+        orders: List of orders, each with symbol, side, order_type, quantity and
+                optional price (same meaning as create_order). At most 50.
+        market: 'spot' or 'futures' (USD-M futures; LIMIT and MARKET orders)
+        all_or_none: If any order fails local validation, submit none (default: True)
+        auto_quantize: Round quantities/prices onto step and tick sizes
+        max_concurrency: Maximum parallel submissions (1-10, default: 5)
+
+    Returns:
+        Dict containing:
+        - success (bool): Whether the batch was processed (individual orders may still fail)
+        - data (dict): Per-order outcomes and totals
+        - timestamp (int): Unix timestamp of the response
+        - error (dict, optional): Error details if the batch could not be processed
+
+        Data structure includes:
+        - results (list): One outcome per input order, in input order, with index,
+          success, order (exchange response) or error, elapsed_ms and, for spot
+          orders that may break an average-price filter, warnings
+        - submitted (int): Orders sent to Binance
+        - succeeded (int): Orders accepted by Binance
+        - failed (int): Orders rejected locally or by Binance
+        - elapsed_ms (float): Wall time of the whole batch
+
+    Examples:
+        grid = [
+            {"symbol": "BTCUSDT", "side": "BUY", "order_type": "LIMIT", "quantity": 0.001, "price": p}
+            for p in (60000, 59900, 59800)
+        ]
+        result = create_orders(grid)
+        if result["success"]:
+            for outcome in result["data"]["results"]:
+                print(outcome["index"], outcome["success"], outcome["elapsed_ms"])
+    """
+    logger.info(f"Creating batch of {len(orders) if isinstance(orders, list) else '?'} {market} orders")
+    started = time.perf_counter()
+
+    try:
+        if not isinstance(orders, list) or not orders:
+            raise ValueError("orders must be a non-empty list")
+        if len(orders) > MAX_BATCH_ORDERS:
+            raise ValueError(f"at most {MAX_BATCH_ORDERS} orders can be placed per call")
+        market = str(market).lower().strip()
+        if market not in ("spot", "futures"):
+            raise ValueError("market must be 'spot' or 'futures'")
+        if not isinstance(max_concurrency, int) or not 1 <= max_concurrency <= MAX_CONCURRENCY:
+            raise ValueError(f"max_concurrency must be an integer between 1 and {MAX_CONCURRENCY}")
+
+        outcomes: Dict[int, Dict[str, Any]] = {}
+        accepted: List[Tuple[int, Any]] = []
+        for index, order in enumerate(orders):
+            if market == "futures":
+                entry, error = _prepare_futures(order, auto_quantize)
+            else:
+                entry, error = _prepare_spot(order, auto_quantize)
+            if error:
+                outcomes[index] = _failed(index, error)
+            else:
+                accepted.append((index, entry))
+
+        if outcomes and all_or_none:
+            rejected = sorted(outcomes)
+            return create_error_response(
+                "validation_error",
+                f"{len(rejected)} of {len(orders)} orders failed local validation; no orders were submitted",
+                {"results": [outcomes[index] for index in rejected]}
+            )
+
+        if accepted:
+            with ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="binance-batch") as pool:
+                if market == "futures":
+                    batches = [
+                        accepted[start:start + FUTURES_BATCH_SIZE]
+                        for start in range(0, len(accepted), FUTURES_BATCH_SIZE)
+                    ]
+                    for batch_outcomes in pool.map(_run_futures_batch, batches):
+                        outcomes.update((outcome["index"], outcome) for outcome in batch_outcomes)
+                else:
+                    spot_outcomes = pool.map(lambda item: _run_spot_order(*item), accepted)
+                    outcomes.update((outcome["index"], outcome) for outcome in spot_outcomes)
+
+        results = [outcomes[index] for index in range(len(orders))]
+        succeeded = sum(1 for outcome in results if outcome["success"])
+
+        logger.info(f"Batch complete: {succeeded}/{len(orders)} {market} orders accepted")
+
+        return create_success_response(
+            data={
+                "results": results,
+                "submitted": len(accepted),
+                "succeeded": succeeded,
+                "failed": len(results) - succeeded,
+                "elapsed_ms": _elapsed_ms(started)
+            },
+            metadata={
+                "source": "binance_api",
+                "endpoint": "batchOrders" if market == "futures" else "order",
+                "market": market,
+                "max_concurrency": max_concurrency
+            }
+        )
+
+    except ValueError as e:
+        error_msg = f"Invalid batch: {str(e)}"
+        logger.warning(f"Validation error for create_orders: {error_msg}")
+        return create_error_response("validation_error", error_msg)
+
+    except Exception as e:
+        logger.error(f"Unexpected error in create_orders tool: {str(e)}")
+        return create_error_response("tool_error", f"Tool execution failed: {str(e)}")
@@ -12,8 +12,11 @@ from binance_mcp_server.utils import (
     get_binance_client, 
     create_error_response, 
     create_success_response,
+    cached,
+    coalesced,
     rate_limited,
-    binance_rate_limiter,
+    sapi_rate_limiter,
+    RequestPriority,
     # validate_and_get_account_type
 )
 
@@ -21,7 +24,9 @@ from binance_mcp_server.utils import (
 logger = logging.getLogger(__name__)
 
 
-@rate_limited(binance_rate_limiter)
+@cached(ttl=3600, stale_ttl=3600)
+@coalesced()
+@rate_limited(sapi_rate_limiter, endpoint="accountSnapshot", priority=RequestPriority.ACCOUNT)
 def get_account_snapshot(account_type: str) -> Dict[str, Any]:
     """
     Get a point-in-time account snapshot for the user's Binance account.
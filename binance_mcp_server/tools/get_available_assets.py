@@ -5,22 +5,44 @@ This module provides the get_available_assets tool for retrieving a list of
 all available trading symbols and their information from the Binance API.
 """
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Union
 from binance.exceptions import BinanceAPIException, BinanceRequestException
 from binance_mcp_server.utils import (
-    get_binance_client, 
     create_error_response, 
     create_success_response,
-    rate_limited,
-    binance_rate_limiter,
 )
+from binance_mcp_server.exchange_info import exchange_info_cache
 
 
 logger = logging.getLogger(__name__)
 
 
-@rate_limited(binance_rate_limiter)
-def get_available_assets() -> Dict[str, Any]:
+def _normalize_list(value: Union[str, List[str], None]) -> Optional[List[str]]:
+    """Accept a list or a comma-separated string and return upper-cased items."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.split(",")
+    items = [str(item).strip().upper() for item in value if str(item).strip()]
+    return items or None
+
+
+def _normalize_value(value: Optional[str]) -> Optional[str]:
+    """Return an upper-cased, stripped filter value or None if empty."""
+    if value is None:
+        return None
+    value = str(value).strip().upper()
+    return value or None
+
+
+def get_available_assets(
+    quote_asset: Optional[str] = None,
+    base_asset: Optional[str] = None,
+    status: Optional[str] = None,
+    permissions: Optional[Union[str, List[str]]] = None,
+    symbol_prefix: Optional[str] = None,
+    fields: Optional[Union[str, List[str]]] = None
+) -> Dict[str, Any]:
     """
     Get a comprehensive list of all available trading assets and symbols on Binance.
     
@@ -28,6 +50,24 @@ def get_available_assets() -> Dict[str, Any]:
     their configurations, and trading rules. Essential for discovering available trading
     pairs and understanding their specifications.
     
+    Exchange information is served from the shared in-process cache, which is
+    refreshed in the background; the API is only called when the cache is cold
+    or stale. The refresh itself is charged against the request weight budget.
+    
+    Filters are evaluated against prebuilt indexes and combined with AND; the
+    `fields` projection trims each entry to the requested keys. Narrow queries
+    return a few KB instead of the full multi-megabyte symbol list.
+    
+    Args:
+        quote_asset (Optional[str]): Only symbols quoted in this asset (e.g., 'USDT')
+        base_asset (Optional[str]): Only symbols with this base asset (e.g., 'BTC')
+        status (Optional[str]): Only symbols with this status (e.g., 'TRADING')
+        permissions (Optional[Union[str, List[str]]]): Only symbols carrying at least
+                     one of these permissions (e.g., ['SPOT', 'MARGIN'])
+        symbol_prefix (Optional[str]): Only symbols whose name starts with this prefix
+        fields (Optional[Union[str, List[str]]]): Keys to keep in each symbol entry
+                (e.g., ['status', 'baseAsset', 'filters']). 'symbol' is always kept.
+    
     Returns:
         Dict containing:
         - success (bool): Whether the request was successful
@@ -37,7 +77,8 @@ def get_available_assets() -> Dict[str, Any]:
         
         Data structure includes:
         - assets (dict): Mapping of symbol names to detailed symbol information
-        - count (int): Total number of available trading symbols
+        - count (int): Number of symbols returned
+        - total (int): Total number of symbols listed on the exchange
         
         Each symbol entry contains:
         - symbol (str): Trading pair symbol (e.g., "BTCUSDT")
@@ -74,19 +115,59 @@ def get_available_assets() -> Dict[str, Any]:
                 btc_info = assets["BTCUSDT"]
                 print(f"BTC/USDT Status: {btc_info['status']}")
                 print(f"Order types: {btc_info['orderTypes']}")
+        
+        # Trading USDT pairs with only their status and filters
+        result = get_available_assets(
+            quote_asset="USDT",
+            status="TRADING",
+            fields=["status", "filters"]
+        )
     """
     logger.info("Fetching available assets from Binance")
 
     try:
-        client = get_binance_client()
-        exchange_info = client.get_exchange_info()
+        filters = {
+            "quote_asset": _normalize_value(quote_asset),
+            "base_asset": _normalize_value(base_asset),
+            "status": _normalize_value(status),
+            "permissions": _normalize_list(permissions),
+            "symbol_prefix": _normalize_value(symbol_prefix),
+        }
+        active_filters = {name: value for name, value in filters.items() if value is not None}
+
+        if fields is not None and isinstance(fields, str):
+            fields = fields.split(",")
+        projection = [str(field).strip() for field in fields if str(field).strip()] if fields else None
+
+        index = exchange_info_cache.get()
+
+        if active_filters:
+            selected = index.select(**active_filters)
+            assets = {name: index.symbols[name] for name in selected}
+        else:
+            assets = index.symbols
 
-        assets = {symbol["symbol"]: symbol for symbol in exchange_info["symbols"]}
+        if projection:
+            keys = ["symbol"] + [field for field in projection if field != "symbol"]
+            assets = {
+                name: {key: entry[key] for key in keys if key in entry}
+                for name, entry in assets.items()
+            }
 
-        return create_success_response({
-            "assets": assets,
-            "count": len(assets)
-        })
+        return create_success_response(
+            data={
+                "assets": assets,
+                "count": len(assets),
+                "total": len(index.symbols)
+            },
+            metadata={
+                "source": "exchange_info_cache",
+                "version": index.version,
+                "fetched_at": int(index.fetched_at * 1000),
+                "filters": active_filters,
+                "fields": projection
+            }
+        )
 
     except (BinanceAPIException, BinanceRequestException) as e:
         logger.error(f"Error fetching available assets: {str(e)}")
@@ -12,15 +12,27 @@ from binance_mcp_server.utils import (
     get_binance_client, 
     create_error_response, 
     create_success_response,
+    cached,
+    coalesced,
     rate_limited,
     binance_rate_limiter,
+    RequestPriority,
 )
+from binance_mcp_server.request_weights import get_request_weight
+from binance_mcp_server.account_state import spot_account_state
 
 
 logger = logging.getLogger(__name__)
 
 
-@rate_limited(binance_rate_limiter)
+def _balance_weight(**_: Any) -> int:
+    """Request weight of a get_balance call; 0 when the user data stream state can answer it."""
+    return 0 if spot_account_state.synced else get_request_weight("account")
+
+
+@cached(ttl=0)
+@coalesced()
+@rate_limited(binance_rate_limiter, weight=_balance_weight, priority=RequestPriority.ACCOUNT)
 def get_balance() -> Dict[str, Any]:
     """
     Get the current account balance for all assets on Binance.
@@ -29,6 +41,9 @@ def get_balance() -> Dict[str, Any]:
     including available (free) and locked amounts for each asset. Only assets with
     non-zero balances are returned to reduce response size.
     
+    When the spot user data stream is enabled (BINANCE_USER_STREAM) and synced,
+    balances are served from memory with metadata.source "user_data_stream".
+    
     Returns:
         Dict containing:
         - success (bool): Whether the request was successful
@@ -55,6 +70,10 @@ def get_balance() -> Dict[str, Any]:
     logger.info("Fetching account balance")
     
     try:
+        balances = spot_account_state.get_balances()
+        if balances is not None:
+            return create_success_response(data=balances, metadata=spot_account_state.freshness())
+        
         client = get_binance_client()
         
         account_info = client.get_account()
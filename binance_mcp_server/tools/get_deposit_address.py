@@ -12,15 +12,20 @@ from binance_mcp_server.utils import (
     get_binance_client, 
     create_error_response, 
     create_success_response,
+    cached,
+    coalesced,
     rate_limited,
-    binance_rate_limiter,
+    sapi_rate_limiter,
+    RequestPriority,
 )
 
 
 logger = logging.getLogger(__name__)
 
 
-@rate_limited(binance_rate_limiter)
+@cached(ttl=86400, stale_ttl=86400, persist=True)
+@coalesced()
+@rate_limited(sapi_rate_limiter, endpoint="capital/deposit/address", priority=RequestPriority.ACCOUNT)
 def get_deposit_address(coin: str) -> Dict[str, Any]:
     """
     Get the deposit address for a specific cryptocurrency on the user's Binance account.
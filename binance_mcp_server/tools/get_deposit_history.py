@@ -12,16 +12,53 @@ from binance_mcp_server.utils import (
     get_binance_client, 
     create_error_response, 
     create_success_response,
+    coalesced,
     rate_limited,
-    binance_rate_limiter,
+    sapi_rate_limiter,
+    RequestPriority,
 )
+from binance_mcp_server.request_weights import get_request_weight
+from binance_mcp_server.history_store import WindowedHistory, HistorySyncError
 
 
 logger = logging.getLogger(__name__)
 
+# Longest startTime/endTime range accepted by the deposit history endpoint
+DEPOSIT_WINDOW_MS = 90 * 24 * 60 * 60 * 1000
 
-@rate_limited(binance_rate_limiter)
-def get_deposit_history(coin: str) -> Dict[str, Any]:
+# Records per deposit history request (exchange maximum)
+DEPOSIT_PAGE_SIZE = 1000
+
+# Deposit statuses that no longer change (1=success, 2=rejected, 7=wrong deposit)
+_FINAL_DEPOSIT_STATUSES = frozenset({1, 2, 7})
+
+
+@rate_limited(sapi_rate_limiter, endpoint="capital/deposit/hisrec", priority=RequestPriority.HISTORY)
+def _fetch_deposit_window(coin: str, start_time: int, end_time: int, offset: int = 0, limit: Optional[int] = None) -> Any:
+    """Fetch one page of deposits in a time window, all coins if coin is empty (charged against the SAPI budget)."""
+    client = get_binance_client()
+    return client.get_deposit_history(coin=coin or None, startTime=start_time, endTime=end_time, offset=offset, limit=limit)
+
+
+deposit_history = WindowedHistory(
+    "deposits",
+    _fetch_deposit_window,
+    record_id=lambda deposit: str(deposit.get("id") or deposit.get("txId")),
+    record_time=lambda deposit: int(deposit["insertTime"]),
+    is_pending=lambda deposit: deposit.get("status") not in _FINAL_DEPOSIT_STATUSES,
+    window_ms=DEPOSIT_WINDOW_MS,
+    page_size=DEPOSIT_PAGE_SIZE
+)
+
+
+def _deposit_history_weight(**_: Any) -> int:
+    """Request weight of a get_deposit_history call; synced requests are charged individually."""
+    return 0 if deposit_history.store is not None else get_request_weight("capital/deposit/hisrec")
+
+
+@coalesced()
+@rate_limited(sapi_rate_limiter, weight=_deposit_history_weight, priority=RequestPriority.HISTORY)
+def get_deposit_history(coin: str, start_time: Optional[int] = None, end_time: Optional[int] = None) -> Dict[str, Any]:
     """
     Get the deposit transaction history for a specific cryptocurrency on the user's Binance account.
     
@@ -29,10 +66,17 @@ def get_deposit_history(coin: str) -> Dict[str, Any]:
     providing detailed information about each deposit transaction including status,
     amounts, and timestamps.
     
+    When the history store is enabled (BINANCE_HISTORY_DIR or BINANCE_CACHE_DIR),
+    deposits are kept locally: only deposits newer than the last sync (and ones
+    still pending) are fetched, and repeated queries are answered from the store.
+    
     Args:
         coin (str): The cryptocurrency symbol for which to fetch deposit history.
                    Examples: 'BTC', 'ETH', 'USDT', 'BNB', etc.
                    Must be a valid coin supported by Binance.
+        start_time (Optional[int]): Earliest deposit time in ms (default: 90 days back
+                                   on first sync, everything stored afterwards).
+        end_time (Optional[int]): Latest deposit time in ms (default: now).
     
     Returns:
         Dict containing:
@@ -76,10 +120,19 @@ def get_deposit_history(coin: str) -> Dict[str, Any]:
     logger.info("Fetching deposit history")
 
     try:
+        coin = coin.strip().upper()
+        if deposit_history.store is not None:
+            requests = deposit_history.sync(coin, start_time, end_time)
+            deposits = deposit_history.query(coin, start_time, end_time)
+            return create_success_response(deposits, metadata={"source": "history_store", "requests": requests})
+
         client = get_binance_client()
-        deposit_history = client.get_deposit_history(coin=coin)
+        deposits = client.get_deposit_history(coin=coin, startTime=start_time, endTime=end_time)
+
+        return create_success_response(deposits)
 
-        return create_success_response(deposit_history)
+    except HistorySyncError as e:
+        return e.response
 
     except (BinanceAPIException, BinanceRequestException) as e:
         logger.error(f"Error fetching deposit history: {str(e)}")
@@ -12,15 +12,20 @@ from binance_mcp_server.utils import (
     get_binance_client,
     create_error_response,
     create_success_response,
+    cached,
+    coalesced,
     rate_limited,
-    binance_rate_limiter,
+    sapi_rate_limiter,
+    RequestPriority,
     validate_symbol,
 )
 
 logger = logging.getLogger(__name__)
 
 
-@rate_limited(binance_rate_limiter)
+@cached(ttl=3600, stale_ttl=86400, persist=True)
+@coalesced()
+@rate_limited(sapi_rate_limiter, endpoint="asset/tradeFee", priority=RequestPriority.ACCOUNT)
 def get_fee_info(symbol: Optional[str] = None) -> Dict[str, Any]:
     """
     Get trading fee information for symbols on Binance.
@@ -12,15 +12,18 @@ from binance_mcp_server.utils import (
     get_binance_client, 
     create_error_response, 
     create_success_response,
+    coalesced,
     rate_limited,
-    binance_rate_limiter,
+    futures_rate_limiter,
+    RequestPriority,
 )
 
 
 logger = logging.getLogger(__name__)
 
 
-@rate_limited(binance_rate_limiter)
+@coalesced()
+@rate_limited(futures_rate_limiter, endpoint="fapi/forceOrders", priority=RequestPriority.HISTORY)
 def get_liquidation_history() -> Dict[str, Any]:
     """
     Get the liquidation history for the user's Binance futures account.
@@ -5,6 +5,7 @@ This module provides functionality to fetch current order book data (bids/asks)
 for trading symbols from the Binance exchange API.
 """
 
+import time
 import logging
 from typing import Dict, Any, Optional
 from binance.exceptions import BinanceAPIException, BinanceRequestException
@@ -12,16 +13,37 @@ from binance_mcp_server.utils import (
     get_binance_client,
     create_error_response,
     create_success_response,
+    coalesced,
     rate_limited,
     binance_rate_limiter,
+    RequestPriority,
     validate_symbol,
     validate_limit_parameter,
 )
+from binance_mcp_server.request_weights import get_request_weight
+from binance_mcp_server.order_book import order_book_manager, PriceLadder
 
 logger = logging.getLogger(__name__)
 
+# Levels per side returned by Binance when no limit is given
+DEFAULT_DEPTH = 100
 
-@rate_limited(binance_rate_limiter)
+
+def _order_book_weight(symbol: Any = None, limit: Any = None, **_: Any) -> int:
+    """Request weight of a get_order_book call; 0 when a synced local book can answer it."""
+    try:
+        normalized_symbol = validate_symbol(symbol)
+        depth = validate_limit_parameter(limit, max_limit=5000) or DEFAULT_DEPTH
+    except ValueError:
+        return get_request_weight("depth", limit=limit)
+
+    if order_book_manager.get_book(normalized_symbol, depth) is not None:
+        return 0
+    return get_request_weight("depth", limit=limit)
+
+
+@coalesced()
+@rate_limited(binance_rate_limiter, weight=_order_book_weight, priority=RequestPriority.MARKET_DATA)
 def get_order_book(symbol: str, limit: Optional[int] = None) -> Dict[str, Any]:
     """
     Get the current order book (bids/asks) for a trading symbol on Binance.
@@ -30,6 +52,11 @@ def get_order_book(symbol: str, limit: Optional[int] = None) -> Dict[str, Any]:
     on Binance. The order book contains arrays of bid and ask orders with their prices
     and quantities.
     
+    Symbols listed in BINANCE_DEPTH_STREAM_SYMBOLS are served from a local book kept
+    in sync from the diff-depth WebSocket stream, at no REST weight, as long as the
+    book is synced and deep enough for the requested limit. Other requests fetch
+    a REST snapshot.
+    
     Args:
         symbol: Trading pair symbol in format BASEQUOTE (e.g., 'BTCUSDT', 'ETHBTC')
             Must be a valid symbol listed on Binance exchange.
@@ -66,38 +93,37 @@ def get_order_book(symbol: str, limit: Optional[int] = None) -> Dict[str, Any]:
         # Validate limit parameter using enhanced validation
         validated_limit = validate_limit_parameter(limit, max_limit=5000)
         
-        client = get_binance_client()
-        
-        # Prepare API parameters
-        params = {"symbol": normalized_symbol}
-        if validated_limit is not None:
-            params["limit"] = validated_limit
-        
-        # Get order book data from Binance API
-        order_book_data = client.get_order_book(**params)
-        
-        # Process bids and asks arrays
-        def process_orders(orders_array):
-            """Convert order arrays to structured format with float values."""
-            return [
-                {
-                    "price": float(order[0]),
-                    "quantity": float(order[1])
-                }
-                for order in orders_array
-            ]
-        
-        # Process and structure the response data
-        processed_bids = process_orders(order_book_data["bids"])
-        processed_asks = process_orders(order_book_data["asks"])
-        
-        # Ensure proper sorting (bids descending by price, asks ascending by price)
-        processed_bids.sort(key=lambda x: x["price"], reverse=True)
-        processed_asks.sort(key=lambda x: x["price"])
+        depth = validated_limit or DEFAULT_DEPTH
+        book = order_book_manager.get_book(normalized_symbol, depth)
+        
+        if book is not None:
+            local = book.snapshot(depth)
+            last_update_id = local["lastUpdateId"]
+            bids, asks = local["bids"], local["asks"]
+            source = "local_order_book"
+        else:
+            client = get_binance_client()
+            
+            # Prepare API parameters
+            params = {"symbol": normalized_symbol}
+            if validated_limit is not None:
+                params["limit"] = validated_limit
+            
+            # Get order book data from Binance API
+            order_book_data = client.get_order_book(**params)
+            last_update_id = order_book_data["lastUpdateId"]
+            
+            # Ladders keep bids descending and asks ascending; already-sorted input is not re-sorted
+            bids = PriceLadder.from_levels(order_book_data["bids"], descending=True).top()
+            asks = PriceLadder.from_levels(order_book_data["asks"], descending=False).top()
+            source = "binance_api"
+        
+        processed_bids = [{"price": price, "quantity": quantity} for price, quantity in bids]
+        processed_asks = [{"price": price, "quantity": quantity} for price, quantity in asks]
         
         response_data = {
             "symbol": normalized_symbol,
-            "lastUpdateId": order_book_data["lastUpdateId"],
+            "lastUpdateId": last_update_id,
             "bids": processed_bids,
             "asks": processed_asks,
             "bidCount": len(processed_bids),
@@ -116,12 +142,14 @@ def get_order_book(symbol: str, limit: Optional[int] = None) -> Dict[str, Any]:
             response_data["bestAsk"] = processed_asks[0]
         
         metadata = {
-            "source": "binance_api",
+            "source": source,
             "endpoint": "order_book",
             "requested_limit": limit or 100,
             "actual_bids": len(processed_bids),
             "actual_asks": len(processed_asks)
         }
+        if book is not None and local["updatedAt"] is not None:
+            metadata["age_ms"] = int((time.time() - local["updatedAt"]) * 1000)
         
         logger.info(f"Successfully fetched order book for {normalized_symbol}: {len(processed_bids)} bids, {len(processed_asks)} asks")
         
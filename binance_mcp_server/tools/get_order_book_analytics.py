@@ -0,0 +1,189 @@
+"""
+Binance order book analytics tool implementation.
+
+This module provides liquidity metrics computed server-side from the order book
+(cumulative depth within price bands, expected fill price for a size and
+bid/ask imbalance) so clients do not have to download thousands of levels.
+"""
+
+import logging
+from typing import Dict, Any, List, Optional
+from binance.exceptions import BinanceAPIException, BinanceRequestException
+from binance_mcp_server.utils import (
+    get_binance_client,
+    create_error_response,
+    create_success_response,
+    coalesced,
+    rate_limited,
+    binance_rate_limiter,
+    RequestPriority,
+    validate_symbol,
+    validate_limit_parameter,
+    validate_positive_number,
+)
+from binance_mcp_server.request_weights import get_request_weight
+from binance_mcp_server.order_book import order_book_manager, PriceLadder
+
+logger = logging.getLogger(__name__)
+
+# Levels per side analysed when no limit is given
+DEFAULT_ANALYTICS_DEPTH = 500
+
+# Price bands (basis points from mid) reported when none are given
+DEFAULT_BANDS_BPS = [10, 50, 100]
+
+
+def _analytics_weight(symbol: Any = None, limit: Any = None, **_: Any) -> int:
+    """Request weight of an analytics call; 0 when a synced local book can answer it."""
+    try:
+        normalized_symbol = validate_symbol(symbol)
+        depth = validate_limit_parameter(limit, max_limit=5000) or DEFAULT_ANALYTICS_DEPTH
+    except ValueError:
+        return get_request_weight("depth", limit=limit)
+
+    if order_book_manager.get_book(normalized_symbol, depth) is not None:
+        return 0
+    return get_request_weight("depth", limit=depth)
+
+
+def _imbalance(bid_quantity: float, ask_quantity: float) -> Optional[float]:
+    """Signed imbalance in [-1, 1]; positive when bids outweigh asks."""
+    total = bid_quantity + ask_quantity
+    return (bid_quantity - ask_quantity) / total if total > 0 else None
+
+
+def _fill_summary(ladder: PriceLadder, size: float, mid_price: float, sign: float) -> Dict[str, Any]:
+    """Fill simulation with slippage against the mid price (positive = worse than mid)."""
+    fill = ladder.fill(size)
+    fill["slippageBps"] = (
+        sign * (fill["vwap"] - mid_price) / mid_price * 10000 if fill["vwap"] is not None else None
+    )
+    return fill
+
+
+@coalesced()
+@rate_limited(binance_rate_limiter, weight=_analytics_weight, priority=RequestPriority.MARKET_DATA)
+def get_order_book_analytics(
+    symbol: str,
+    bands_bps: Optional[List[float]] = None,
+    size: Optional[float] = None,
+    limit: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Get liquidity analytics for a trading symbol's order book.
+
+    Computes cumulative depth within price bands around the mid price, the
+    expected fill (VWAP, worst price, slippage) for a given size on both sides,
+    and bid/ask imbalance. Metrics are computed over array-backed price ladders
+    from the local stream-fed book when available, otherwise from one REST
+    depth snapshot.
+
+    Args:
+        symbol: Trading pair symbol in format BASEQUOTE (e.g., 'BTCUSDT', 'ETHBTC')
+        bands_bps: Price bands in basis points from mid (default: [10, 50, 100])
+        size: Optional base asset quantity to simulate a market buy and sell for
+        limit: Levels per side to analyse (default: 500, maximum: 5000)
+
+    Returns:
+        Dict containing:
+        - success (bool): Whether the request was successful
+        - data (dict): Best prices, spread, per-band depth and imbalance, and fills
+        - timestamp (int): Unix timestamp of the response
+        - error (dict, optional): Error details if request failed
+
+    Examples:
+        result = get_order_book_analytics("BTCUSDT", bands_bps=[5, 25], size=2.5)
+        if result["success"]:
+            for band in result["data"]["bands"]:
+                print(f"±{band['bps']}bps: {band['bidNotional']} / {band['askNotional']}")
+            print(f"Buying 2.5 BTC costs {result['data']['fill']['buy']['vwap']} on average")
+    """
+    logger.info(f"Fetching order book analytics for symbol: {symbol}, bands: {bands_bps}, size: {size}, limit: {limit}")
+
+    try:
+        normalized_symbol = validate_symbol(symbol)
+        depth = validate_limit_parameter(limit, max_limit=5000) or DEFAULT_ANALYTICS_DEPTH
+
+        bands = DEFAULT_BANDS_BPS if bands_bps is None else bands_bps
+        if not isinstance(bands, list) or not bands:
+            raise ValueError("bands_bps must be a non-empty list of numbers")
+        bands = sorted(validate_positive_number(band, "bands_bps", max_value=10000) for band in bands)
+
+        validated_size = validate_positive_number(size, "size") if size is not None else None
+
+        book = order_book_manager.get_book(normalized_symbol, depth)
+        if book is not None:
+            bids, asks, last_update_id = book.ladders(depth)
+            source = "local_order_book"
+        else:
+            client = get_binance_client()
+            order_book_data = client.get_order_book(symbol=normalized_symbol, limit=depth)
+            bids = PriceLadder.from_levels(order_book_data["bids"], descending=True)
+            asks = PriceLadder.from_levels(order_book_data["asks"], descending=False)
+            last_update_id = order_book_data["lastUpdateId"]
+            source = "binance_api"
+
+        best_bid, best_ask = bids.best_price(), asks.best_price()
+        if best_bid is None or best_ask is None:
+            return create_error_response("validation_error", f"Order book for {normalized_symbol} is empty on one side")
+
+        mid_price = (best_bid + best_ask) / 2
+
+        band_metrics = []
+        for band in bands:
+            bid_quantity, bid_notional = bids.depth_within(mid_price * (1 - band / 10000))
+            ask_quantity, ask_notional = asks.depth_within(mid_price * (1 + band / 10000))
+            band_metrics.append({
+                "bps": band,
+                "bidQuantity": bid_quantity,
+                "bidNotional": bid_notional,
+                "askQuantity": ask_quantity,
+                "askNotional": ask_notional,
+                "imbalance": _imbalance(bid_quantity, ask_quantity)
+            })
+
+        response_data = {
+            "symbol": normalized_symbol,
+            "lastUpdateId": last_update_id,
+            "bestBid": best_bid,
+            "bestAsk": best_ask,
+            "midPrice": mid_price,
+            "spread": best_ask - best_bid,
+            "spreadBps": (best_ask - best_bid) / mid_price * 10000,
+            "topOfBookImbalance": _imbalance(bids.quantities[0], asks.quantities[0]),
+            "bands": band_metrics,
+            "levels": {"bids": len(bids), "asks": len(asks)}
+        }
+
+        if validated_size is not None:
+            response_data["fill"] = {
+                "size": validated_size,
+                "buy": _fill_summary(asks, validated_size, mid_price, 1.0),
+                "sell": _fill_summary(bids, validated_size, mid_price, -1.0)
+            }
+
+        metadata = {
+            "source": source,
+            "endpoint": "order_book_analytics",
+            "analysed_depth": depth
+        }
+
+        logger.info(f"Successfully computed order book analytics for {normalized_symbol}")
+
+        return create_success_response(
+            data=response_data,
+            metadata=metadata
+        )
+
+    except ValueError as e:
+        error_msg = f"Invalid parameter: {str(e)}"
+        logger.warning(f"Validation error for order book analytics on '{symbol}': {error_msg}")
+        return create_error_response("validation_error", error_msg)
+
+    except (BinanceAPIException, BinanceRequestException) as e:
+        logger.error(f"Error fetching order book for analytics: {str(e)}")
+        return create_error_response("binance_api_error", f"Error fetching order book: {str(e)}")
+
+    except Exception as e:
+        logger.error(f"Unexpected error in get_order_book_analytics tool: {str(e)}")
+        return create_error_response("tool_error", f"Tool execution failed: {str(e)}")
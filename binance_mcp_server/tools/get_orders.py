@@ -5,24 +5,350 @@ This module provides functionality to fetch order history for specific trading s
 on Binance, enabling analysis of past trading activity and order management.
 """
 
+import json
+import time
+import base64
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from binance.exceptions import BinanceAPIException, BinanceRequestException
 from binance_mcp_server.utils import (
     get_binance_client, 
     create_error_response, 
     create_success_response,
+    coalesced,
     rate_limited,
     binance_rate_limiter,
+    RequestPriority,
     validate_symbol
 )
+from binance_mcp_server.request_weights import get_request_weight
+from binance_mcp_server.account_state import spot_account_state, _TERMINAL_ORDER_STATUSES
+from binance_mcp_server.config import BinanceConfig
+from binance_mcp_server.history_store import HistoryStore, history_store, history_scope, now_ms
 
 
 logger = logging.getLogger(__name__)
 
+_config = BinanceConfig()
 
-@rate_limited(binance_rate_limiter)
-def get_orders(symbol: str, start_time: Optional[int] = None, end_time: Optional[int] = None) -> Dict[str, Any]:
+# Orders per allOrders request (exchange maximum)
+PAGE_SIZE = 1000
+
+# Orders returned per call by default and at most
+DEFAULT_LIMIT = 500
+MAX_LIMIT = 5000
+
+# Longest startTime/endTime range accepted by allOrders
+WINDOW_MS = 24 * 60 * 60 * 1000
+
+# allOrders requests per call; a continuation cursor is returned beyond this
+MAX_REQUESTS_PER_CALL = 30
+
+
+# History store dataset of spot orders (keyed by symbol)
+ORDERS_DATASET = "orders"
+
+
+class _PageRejected(Exception):
+    """A history page was rejected by the rate limiter."""
+
+    def __init__(self, response: Dict[str, Any]):
+        super().__init__(response["error"]["message"])
+        self.response = response
+
+
+def _orders_weight(
+    symbol: Any = None,
+    start_time: Any = None,
+    open_only: bool = False,
+    cursor: Any = None,
+    **_: Any
+) -> int:
+    """
+    Request weight of a get_orders call.
+
+    Open orders cost nothing when they come from the user data stream, and
+    paginated history is charged per page request instead of up front.
+    """
+    if open_only:
+        return 0 if spot_account_state.synced else get_request_weight("openOrders", symbol=symbol)
+    if start_time is not None or cursor is not None or history_store is not None:
+        return 0
+    return get_request_weight("allOrders")
+
+
+@rate_limited(binance_rate_limiter, endpoint="allOrders", priority=RequestPriority.HISTORY)
+def _fetch_orders_page(symbol: str, **params: Any) -> Any:
+    """Fetch one allOrders page (charged against the request weight budget)."""
+    client = get_binance_client()
+    return client.get_all_orders(symbol=symbol, **params)
+
+
+@rate_limited(binance_rate_limiter, endpoint="openOrders", priority=RequestPriority.HISTORY)
+def _fetch_open_orders(symbol: str) -> Any:
+    """Fetch the open orders of a symbol (charged against the request weight budget)."""
+    client = get_binance_client()
+    return client.get_open_orders(symbol=symbol)
+
+
+@rate_limited(binance_rate_limiter, endpoint="order/query", priority=RequestPriority.HISTORY)
+def _fetch_order(symbol: str, orderId: int) -> Any:
+    """Fetch the current state of one order (charged against the request weight budget)."""
+    client = get_binance_client()
+    return client.get_order(symbol=symbol, orderId=orderId)
+
+
+def _encode_cursor(symbol: str, position: Dict[str, int], end_time: int) -> str:
+    """Encode a history position as an opaque continuation cursor."""
+    payload = {"s": symbol, "e": end_time, **position}
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode()
+
+
+def _decode_cursor(cursor: str, symbol: str) -> Tuple[Dict[str, int], int]:
+    """
+    Decode a continuation cursor.
+
+    Returns:
+        Tuple of (position, end_time) where position holds 'o' (next orderId)
+        or 't' (next window start)
+
+    Raises:
+        ValueError: If the cursor is malformed or belongs to another symbol
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        position = {key: int(payload[key]) for key in ("o", "t") if key in payload}
+        end_time = int(payload["e"])
+        cursor_symbol = payload["s"]
+    except (ValueError, TypeError, KeyError, AttributeError):
+        raise ValueError("cursor is not a valid get_orders cursor")
+    if cursor_symbol != symbol:
+        raise ValueError(f"cursor belongs to {cursor_symbol}, not {symbol}")
+    if len(position) != 1:
+        raise ValueError("cursor is not a valid get_orders cursor")
+    if "a" in payload and "t" in position:
+        # Keyset position within the local history store
+        position["a"] = str(payload["a"])
+    return position, end_time
+
+
+def iter_order_pages(
+    symbol: str,
+    position: Dict[str, int],
+    end_time: int,
+    limit: int
+) -> Iterator[Tuple[List[Dict[str, Any]], Optional[Dict[str, int]]]]:
+    """
+    Walk order history forward, yielding one page at a time.
+
+    Until the first order is found, history is scanned in 24h startTime/endTime
+    windows (the longest range allOrders accepts); from then on it is paged by
+    orderId, which skips quiet periods without extra requests. At most
+    ``limit`` orders and MAX_REQUESTS_PER_CALL requests are used.
+
+    Args:
+        symbol: Normalized trading pair symbol
+        position: {'t': window start} or {'o': first orderId} to resume from
+        end_time: Orders created after this time (ms) end the walk
+        limit: Maximum number of orders to yield in total
+
+    Yields:
+        Tuple of (orders, next position), where next position is None once
+        history up to end_time is exhausted
+
+    Raises:
+        _PageRejected: If a page request is rejected by the rate limiter
+    """
+    remaining = limit
+    requests = 0
+    next_position: Optional[Dict[str, int]] = position
+    while next_position is not None and remaining > 0 and requests < MAX_REQUESTS_PER_CALL:
+        page_size = min(PAGE_SIZE, remaining)
+        if "o" in next_position:
+            page = _fetch_orders_page(symbol, orderId=next_position["o"], limit=page_size)
+            window_end = end_time
+        else:
+            window_start = next_position["t"]
+            window_end = min(window_start + WINDOW_MS - 1, end_time)
+            page = _fetch_orders_page(symbol, startTime=window_start, endTime=window_end, limit=page_size)
+        requests += 1
+        if isinstance(page, dict):
+            raise _PageRejected(page)
+
+        orders = [order for order in page if order["time"] <= end_time]
+        if len(orders) < len(page) or (len(page) < page_size and window_end >= end_time):
+            next_position = None
+        elif page:
+            next_position = {"o": page[-1]["orderId"] + 1}
+        else:
+            next_position = {"t": window_end + 1}
+
+        remaining -= len(orders)
+        yield orders, next_position
+
+
+def _order_record(order: Dict[str, Any]) -> Tuple[str, int, bool, Dict[str, Any]]:
+    """History store record of an order (zero-padded ids keep the store in orderId order)."""
+    return f"{order['orderId']:020d}", order["time"], order["status"] not in _TERMINAL_ORDER_STATUSES, order
+
+
+def _refresh_pending_orders(store: HistoryStore, scope: str, symbol: str) -> int:
+    """
+    Update stored orders that were still open at the last sync.
+
+    Orders that are still open are refreshed from one openOrders request;
+    orders that closed since are fetched individually.
+
+    Returns:
+        int: Number of requests made
+    """
+    pending = store.pending(ORDERS_DATASET, scope, symbol)
+    if not pending:
+        return 0
+
+    open_orders = _fetch_open_orders(symbol)
+    if isinstance(open_orders, dict):
+        raise _PageRejected(open_orders)
+    requests = 1
+    still_open = {order["orderId"]: order for order in open_orders}
+    refreshed = []
+    for order in pending:
+        current = still_open.get(order["orderId"])
+        if current is None:
+            current = _fetch_order(symbol, orderId=order["orderId"])
+            requests += 1
+            if isinstance(current, dict) and "orderId" not in current:
+                raise _PageRejected(current)
+        refreshed.append(_order_record(current))
+    store.save(ORDERS_DATASET, scope, symbol, refreshed)
+    return requests
+
+
+def _sync_order_history(store: HistoryStore, symbol: str, end_time: Optional[int]) -> Tuple[int, bool]:
+    """
+    Fetch orders placed since the last sync of a symbol into the history store.
+
+    The first sync pages the full history by orderId; later syncs resume after
+    the last stored order and refresh the orders that were still open. Syncs
+    are skipped within BINANCE_HISTORY_SYNC_INTERVAL seconds of the previous
+    one, or when the queried range ends before anything that could change.
+
+    At most MAX_REQUESTS_PER_CALL pages are fetched per call. The resume point
+    is saved with every page, so a sync cut short by that cap or by the rate
+    limiter continues where it stopped on the next call.
+
+    Returns:
+        Tuple of (requests made, whether the store is now complete up to the present)
+    """
+    scope = history_scope()
+    with store.key_lock(ORDERS_DATASET, scope, symbol):
+        mark = store.get_mark(ORDERS_DATASET, scope, symbol)
+        if mark is not None:
+            if time.time() - mark["synced_at"] < _config.history_sync_interval:
+                return 0, True
+            if end_time is not None:
+                pending_times = [order["time"] for order in store.pending(ORDERS_DATASET, scope, symbol)]
+                if end_time < min(pending_times + [mark["high_water"]]):
+                    return 0, True
+
+        requests = _refresh_pending_orders(store, scope, symbol) if mark is not None else 0
+        sync_time = now_ms()
+        high_water = mark["high_water"] if mark is not None else 0
+        resume_from = mark["resume_from"] if mark is not None else 0
+        position: Optional[Dict[str, int]] = {"o": resume_from}
+        for page, position in iter_order_pages(symbol, position, sync_time, MAX_REQUESTS_PER_CALL * PAGE_SIZE):
+            requests += 1
+            if page:
+                resume_from = page[-1]["orderId"] + 1
+            complete = position is None
+            # Until history is complete, a zero synced_at makes the next call continue from here
+            store.save(ORDERS_DATASET, scope, symbol, [_order_record(order) for order in page], mark={
+                "low_water": 0,
+                "high_water": sync_time if complete else high_water,
+                "resume_from": resume_from,
+                "synced_at": time.time() if complete else 0
+            })
+        return requests, position is None
+
+
+def _get_orders_from_store(
+    store: HistoryStore,
+    symbol: str,
+    start_time: Optional[int],
+    end_time: Optional[int],
+    limit: int,
+    cursor: Optional[str],
+    fields: Optional[List[str]]
+) -> Dict[str, Any]:
+    """Answer an order history query from the local history store after a delta sync."""
+    position: Dict[str, Any] = {}
+    if cursor is not None:
+        position, end_time = _decode_cursor(cursor, symbol)
+    elif start_time is not None:
+        position = {"t": int(start_time)}
+        end_time = int(end_time) if end_time is not None else now_ms()
+        if end_time < position["t"]:
+            raise ValueError("end_time must not be before start_time")
+
+    requests, complete = _sync_order_history(store, symbol, end_time)
+    scope = history_scope()
+    if not complete:
+        logger.warning(f"Order history sync for {symbol} is incomplete; the next call continues it")
+
+    if not position:
+        # Most recent orders, oldest first, as allOrders returns them
+        rows = store.query(ORDERS_DATASET, scope, symbol, end_time=end_time, limit=limit, descending=True)[::-1]
+        has_more = False
+    else:
+        after = (position["t"], position["a"]) if "a" in position else None
+        rows = store.query(
+            ORDERS_DATASET, scope, symbol,
+            start_time=None if after else position["t"], end_time=end_time, after=after, limit=limit + 1
+        )
+        # Orders not synced yet are picked up by continuing from the cursor
+        has_more = len(rows) > limit or not complete
+        rows = rows[:limit]
+
+    orders = _project([order for _, _, order in rows], fields)
+    next_cursor = None
+    if has_more:
+        if rows:
+            last_time, last_id, _ = rows[-1]
+            position = {"t": last_time, "a": last_id}
+        next_cursor = _encode_cursor(symbol, position, end_time)
+
+    logger.info(f"Answered {len(orders)} {symbol} orders from the history store ({requests} requests)")
+
+    return create_success_response(
+        data={
+            "symbol": symbol,
+            "orders": orders,
+            "count": len(orders),
+            "has_more": has_more,
+            "next_cursor": next_cursor
+        },
+        metadata={"source": "history_store", "requests": requests, "sync_complete": complete}
+    )
+
+
+def _project(orders: List[Dict[str, Any]], fields: Optional[List[str]]) -> List[Dict[str, Any]]:
+    """Keep only the requested fields of each order."""
+    if not fields:
+        return orders
+    return [{field: order[field] for field in fields if field in order} for order in orders]
+
+
+@coalesced()
+@rate_limited(binance_rate_limiter, weight=_orders_weight, priority=RequestPriority.HISTORY)
+def get_orders(
+    symbol: str,
+    start_time: Optional[int] = None,
+    end_time: Optional[int] = None,
+    open_only: bool = False,
+    limit: int = DEFAULT_LIMIT,
+    cursor: Optional[str] = None,
+    fields: Optional[List[str]] = None
+) -> Dict[str, Any]:
     """
     Get all orders for a specific trading symbol on Binance.
     
@@ -30,21 +356,41 @@ def get_orders(symbol: str, start_time: Optional[int] = None, end_time: Optional
     with optional time filtering to focus on specific periods. Essential for
     analyzing trading patterns and order management.
     
+    With start_time (or a cursor), history is paged forward from that time
+    through as many allOrders requests as needed, up to ``limit`` orders per
+    call; the response carries a cursor to continue from. Without start_time,
+    the most recent ``limit`` orders (at most 1000) are returned in one request.
+    
     Args:
         symbol (str): Trading pair symbol in format BASEQUOTE (e.g., 'BTCUSDT', 'ETHBTC').
                      Must be a valid symbol listed on Binance exchange.
-        start_time (Optional[int]): Unix timestamp (milliseconds) to start retrieving orders from.
-                                   If not provided, retrieves from the beginning of order history.
+        start_time (Optional[int]): Unix timestamp (milliseconds) to page history forward from.
+                                   If not provided, the most recent orders are returned.
         end_time (Optional[int]): Unix timestamp (milliseconds) to stop retrieving orders.
                                  If not provided, retrieves up to the current time.
+        open_only (bool): Return only currently open orders (time filters are ignored).
+                         Served from memory when the spot user data stream is enabled
+                         (BINANCE_USER_STREAM) and synced.
+        limit (int): Maximum orders returned per call (1-5000, default: 500).
+        cursor (Optional[str]): next_cursor of a previous response to continue from;
+                               start_time and end_time are taken from the cursor.
+        fields (Optional[List[str]]): Order fields to return (e.g. ['orderId', 'status']);
+                                     all fields if not provided.
     
     Returns:
         Dict containing:
         - success (bool): Whether the request was successful
-        - data (list): List of order objects with detailed information
+        - data (dict): Symbol, orders and pagination state
         - timestamp (int): Unix timestamp of the response
         - error (dict, optional): Error details if request failed
         
+        Data structure includes:
+        - symbol (str): Normalized trading pair symbol
+        - orders (list): Order objects, oldest first when paging
+        - count (int): Number of orders returned
+        - has_more (bool): Whether more history remains up to end_time
+        - next_cursor (str or None): Cursor for the next page
+        
         Each order object includes:
         - orderId (int): Unique order identifier
         - symbol (str): Trading pair symbol
@@ -63,34 +409,96 @@ def get_orders(symbol: str, start_time: Optional[int] = None, end_time: Optional
             orders = result["data"]
             print(f"Found {len(orders)} orders for BTCUSDT")
             
-        # Get orders within a specific time range
+        # Page through a year of history, keeping only a few fields
         import time
-        week_ago = int((time.time() - 7*24*3600) * 1000)
-        result = get_orders("ETHUSDT", start_time=week_ago)
-        if result["success"]:
-            recent_orders = result["data"]
-            print(f"Found {len(recent_orders)} orders in the last week")
+        year_ago = int((time.time() - 365*24*3600) * 1000)
+        result = get_orders("ETHUSDT", start_time=year_ago, fields=["orderId", "status", "time"])
+        while result["success"] and result["data"]["has_more"]:
+            result = get_orders("ETHUSDT", cursor=result["data"]["next_cursor"])
     """
     logger.info("Fetching orders for symbol: %s", symbol)
 
     try:
         
         normalized_symbol = validate_symbol(symbol)
+        if not isinstance(limit, int) or not 1 <= limit <= MAX_LIMIT:
+            raise ValueError(f"limit must be an integer between 1 and {MAX_LIMIT}")
+        if fields is not None and (not isinstance(fields, list) or not all(isinstance(f, str) for f in fields)):
+            raise ValueError("fields must be a list of order field names")
+        
+        if open_only:
+            open_orders = spot_account_state.get_open_orders(normalized_symbol)
+            if open_orders is not None:
+                return create_success_response(
+                    data={"symbol": normalized_symbol, "orders": _project(open_orders, fields)},
+                    metadata=spot_account_state.freshness()
+                )
+            client = get_binance_client()
+            orders = client.get_open_orders(symbol=normalized_symbol)
+            return create_success_response(
+                data={"symbol": normalized_symbol, "orders": _project(orders, fields)}
+            )
+        
+        if history_store is not None:
+            position = _decode_cursor(cursor, normalized_symbol)[0] if cursor is not None else {}
+            if "o" not in position:
+                return _get_orders_from_store(
+                    history_store, normalized_symbol, start_time, end_time, limit, cursor, fields
+                )
+        
+        if cursor is None and start_time is None:
+            client = get_binance_client()
+            orders = client.get_all_orders(symbol=normalized_symbol, endTime=end_time, limit=min(limit, PAGE_SIZE))
+            logger.info("Successfully fetched orders for symbol: %s", symbol)
+            return create_success_response(
+                data={
+                    "symbol": normalized_symbol,
+                    "orders": _project(orders, fields),
+                    "count": len(orders),
+                    "has_more": False,
+                    "next_cursor": None
+                }
+            )
+        
+        if cursor is not None:
+            position, end_time = _decode_cursor(cursor, normalized_symbol)
+        else:
+            position = {"t": int(start_time)}
+            end_time = int(end_time) if end_time is not None else int(time.time() * 1000)
+            if end_time < position["t"]:
+                raise ValueError("end_time must not be before start_time")
+        
+        orders: List[Dict[str, Any]] = []
+        requests = 0
+        try:
+            for page, next_position in iter_order_pages(normalized_symbol, position, end_time, limit):
+                orders.extend(_project(page, fields))
+                position = next_position
+                requests += 1
+        except _PageRejected as e:
+            if not orders:
+                return e.response
+            logger.warning(f"Order history for {normalized_symbol} cut short by the rate limiter")
+        
+        logger.info(f"Fetched {len(orders)} orders for {normalized_symbol} in {requests} requests")
         
-        client = get_binance_client()
-
-        orders = client.get_all_orders(symbol=normalized_symbol, start_time=start_time, end_time=end_time)
-
-        logger.info("Successfully fetched orders for symbol: %s", symbol)
-
-        response_data = {
-            "symbol": normalized_symbol,
-            "orders": orders
-        }
-
         return create_success_response(
-            data=response_data
+            data={
+                "symbol": normalized_symbol,
+                "orders": orders,
+                "count": len(orders),
+                "has_more": position is not None,
+                "next_cursor": _encode_cursor(normalized_symbol, position, end_time) if position else None
+            },
+            metadata={"source": "binance_api", "endpoint": "allOrders", "requests": requests}
         )
+    
+    except _PageRejected as e:
+        return e.response
+    
+    except ValueError as e:
+        logger.warning(f"Validation error for get_orders: {str(e)}")
+        return create_error_response("validation_error", f"Invalid parameters: {str(e)}")
 
     except (BinanceAPIException, BinanceRequestException) as e:
         logger.error(f"Error fetching orders: {str(e)}")
@@ -3,87 +3,281 @@ Binance profit and loss (P&L) calculation tool implementation.
 
 This module provides functionality to calculate and retrieve profit and loss information
 for futures trading on Binance, essential for performance analysis and risk management.
+Realized PnL, funding fees and commissions come from the futures income history,
+which is kept in the local history store and synced incrementally; unrealized PnL
+comes from open positions valued at live mark prices.
 """
 
 import logging
-from typing import Dict, Any, Optional
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Dict, Any, List, Optional, Tuple
 from binance.exceptions import BinanceAPIException, BinanceRequestException
 from binance_mcp_server.utils import (
-    get_binance_client, 
-    create_error_response, 
+    get_binance_client,
+    create_error_response,
     create_success_response,
+    coalesced,
     rate_limited,
-    binance_rate_limiter,
+    futures_rate_limiter,
+    RequestPriority,
     validate_symbol
 )
+from binance_mcp_server.history_store import WindowedHistory, HistorySyncError, now_ms
+from binance_mcp_server.tools.get_position_info import get_position_info
 
 
 logger = logging.getLogger(__name__)
 
+# Dataset of futures income records in the history store
+INCOME_DATASET = "futures_income"
 
-@rate_limited(binance_rate_limiter)
-def get_pnl() -> Dict[str, Any]:
+# Longest startTime/endTime range requested from the income history endpoint
+INCOME_WINDOW_MS = 7 * 24 * 60 * 60 * 1000
+
+# Records per income history request (exchange maximum)
+INCOME_PAGE_SIZE = 1000
+
+# Range covered when start_time is not given (Binance keeps three months)
+DEFAULT_RANGE_MS = 30 * 24 * 60 * 60 * 1000
+
+# Income types that make up the PnL breakdown, and the breakdown field of each
+INCOME_FIELDS = {
+    "REALIZED_PNL": "realized_pnl",
+    "FUNDING_FEE": "funding_fee",
+    "COMMISSION": "commission",
+}
+
+# Margin assets recognized from a symbol's suffix when a position does not name one
+_MARGIN_ASSETS = ("USDT", "USDC", "FDUSD", "BUSD")
+
+
+@rate_limited(futures_rate_limiter, endpoint="fapi/income", priority=RequestPriority.HISTORY)
+def _fetch_income_window(key: str, start_time: int, end_time: int, offset: int = 0, limit: Optional[int] = None) -> Any:
+    """Fetch one page of income records of all symbols, oldest first (charged against the futures budget)."""
+    client = get_binance_client()
+    return client.futures_income_history(startTime=start_time, endTime=end_time, limit=limit)
+
+
+@rate_limited(futures_rate_limiter, endpoint="fapi/premiumIndex", priority=RequestPriority.ACCOUNT)
+def _fetch_mark_prices(symbol: Optional[str] = None) -> Any:
+    """Fetch mark prices of one or all symbols (charged against the futures budget)."""
+    client = get_binance_client()
+    return client.futures_mark_price(symbol=symbol) if symbol else client.futures_mark_price()
+
+
+income_history = WindowedHistory(
+    INCOME_DATASET,
+    _fetch_income_window,
+    record_id=lambda income: f"{income['incomeType']}:{income.get('symbol', '')}:{income['tranId']}",
+    record_time=lambda income: int(income["time"]),
+    is_pending=lambda income: False,
+    window_ms=INCOME_WINDOW_MS,
+    page_size=INCOME_PAGE_SIZE,
+    page_by_time=True
+)
+
+
+def _load_income(start_time: int, end_time: int) -> Tuple[List[Dict[str, Any]], int]:
     """
-    Get the current profit and loss (P&L) information for the user's Binance futures account.
-    
-    This function retrieves comprehensive P&L data from the futures account, including
-    unrealized and realized profits/losses, essential for portfolio performance analysis
-    and risk management in futures trading.
-    
+    Get income records of all symbols in a range, delta-synced through the history store when enabled.
+
+    Returns:
+        Tuple of (records oldest first, requests made)
+
+    Raises:
+        HistorySyncError: If an income request was rejected
+    """
+    if income_history.store is not None:
+        requests = income_history.sync("", start_time, end_time)
+        return income_history.query("", start_time, end_time, descending=False), requests
+
+    records: List[Dict[str, Any]] = []
+    requests = 0
+    for window_start, window_end in income_history.windows(start_time, end_time):
+        window_records, window_requests = income_history.fetch_window("", window_start, window_end)
+        records.extend(window_records)
+        requests += window_requests
+    return records, requests
+
+
+def _margin_asset(position: Dict[str, Any]) -> str:
+    """Margin asset of a position, from the position itself or the symbol's suffix."""
+    if position.get("marginAsset"):
+        return position["marginAsset"]
+    return next((asset for asset in _MARGIN_ASSETS if position["symbol"].endswith(asset)), "USDT")
+
+
+def _day(timestamp_ms: int) -> str:
+    """UTC date (YYYY-MM-DD) of a timestamp in ms."""
+    return datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc).strftime("%Y-%m-%d")
+
+
+def _empty_breakdown() -> Dict[str, Decimal]:
+    return {field: Decimal(0) for field in ("realized_pnl", "funding_fee", "commission", "unrealized_pnl")}
+
+
+def _finish(breakdown: Dict[str, Decimal], unrealized: bool = True) -> Dict[str, float]:
+    """Add the net total and convert the exact sums to floats."""
+    if not unrealized:
+        breakdown = {field: value for field, value in breakdown.items() if field != "unrealized_pnl"}
+    result = {field: float(value) for field, value in breakdown.items()}
+    result["net"] = float(sum(breakdown.values()))
+    return result
+
+
+@coalesced()
+def get_pnl(
+    symbol: Optional[str] = None,
+    start_time: Optional[int] = None,
+    end_time: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Get the profit and loss (P&L) breakdown of the user's Binance USD-M futures account.
+
+    Realized PnL, funding fees and commissions are summed from the futures
+    income history; unrealized PnL is computed from open positions at live mark
+    prices. Each is broken down per symbol and per UTC day, in the margin asset
+    of each record (commissions paid in BNB are kept separate from USDT).
+
+    When the history store is enabled (BINANCE_HISTORY_DIR or BINANCE_CACHE_DIR),
+    income records are stored locally and only records newer than the last sync
+    are fetched, so repeated queries cost a request or two instead of a full
+    re-download. Without the store, the range is fetched in 7-day windows.
+
+    Args:
+        symbol (Optional[str]): Limit the breakdown to one futures symbol (e.g. 'BTCUSDT')
+        start_time (Optional[int]): Start of the income range in ms (default: 30 days back;
+                                   Binance keeps three months of income history)
+        end_time (Optional[int]): End of the income range in ms (default: now)
+
     Returns:
         Dict containing:
         - success (bool): Whether the request was successful
-        - data (dict): Complete futures account P&L information
+        - data (dict): PnL breakdown
         - timestamp (int): Unix timestamp of the response
         - error (dict, optional): Error details if request failed
-        
-        P&L data includes:
-        - totalUnrealizedProfit (str): Total unrealized profit across all positions
-        - totalWalletBalance (str): Total wallet balance
-        - totalMarginBalance (str): Total margin balance
-        - totalPositionInitialMargin (str): Initial margin for positions
-        - totalOpenOrderInitialMargin (str): Initial margin for open orders
-        - totalCrossWalletBalance (str): Cross wallet balance
-        - totalCrossUnPnl (str): Cross margin unrealized P&L
-        - availableBalance (str): Available balance for new positions
-        - maxWithdrawAmount (str): Maximum withdrawable amount
-        - assets (list): Asset-specific balance information
-        - positions (list): Current position details with individual P&L
-        
+
+        Data structure includes:
+        - totals (dict): Per margin asset: realized_pnl, funding_fee, commission,
+          unrealized_pnl and net
+        - by_symbol (list): Per symbol and asset: the same fields plus position_amt,
+          entry_price and mark_price for open positions
+        - by_day (list): Per UTC date and asset: realized_pnl, funding_fee,
+          commission and net (unrealized PnL has no day)
+        - income_records (int): Income records in the range
+        - requests (int): Income history requests made
+
     Examples:
-        result = get_pnl()
+        result = get_pnl(start_time=int((time.time() - 7 * 86400) * 1000))
         if result["success"]:
-            pnl_data = result["data"]
-            total_pnl = float(pnl_data["totalUnrealizedProfit"])
-            wallet_balance = float(pnl_data["totalWalletBalance"])
-            
-            print(f"Total Unrealized P&L: ${total_pnl:.2f}")
-            print(f"Wallet Balance: ${wallet_balance:.2f}")
-            
-            # Check individual positions
-            for position in pnl_data.get("positions", []):
-                if float(position["positionAmt"]) != 0:
-                    symbol = position["symbol"]
-                    pnl = float(position["unrealizedProfit"])
-                    print(f"{symbol} P&L: ${pnl:.2f}")
+            usdt = result["data"]["totals"].get("USDT", {})
+            print(f"Realized: {usdt.get('realized_pnl')}, funding: {usdt.get('funding_fee')}")
+            for row in result["data"]["by_symbol"]:
+                print(f"{row['symbol']}: net {row['net']:.2f} {row['asset']}")
     """
-    logger.info("Fetching PnL information from Binance")
+    logger.info(f"Fetching PnL breakdown for symbol={symbol}")
 
     try:
-        client = get_binance_client()
-        pnl_info = client.futures_account()
+        if symbol is not None:
+            symbol = validate_symbol(symbol)
+        end_time = int(end_time) if end_time is not None else now_ms()
+        start_time = int(start_time) if start_time is not None else end_time - DEFAULT_RANGE_MS + 1
+        if end_time < start_time:
+            raise ValueError("end_time must not be before start_time")
+
+        records, requests = _load_income(start_time, end_time)
+
+        position_response = get_position_info()
+        if not position_response.get("success"):
+            return position_response
+        positions = [
+            position for position in position_response["data"]
+            if float(position["positionAmt"]) != 0 and (symbol is None or position["symbol"] == symbol)
+        ]
+        position_source = position_response.get("metadata", {}).get("source", "binance_api")
+
+        # Positions served from the user data stream carry stale mark prices
+        mark_prices = {position["symbol"]: position.get("markPrice") for position in positions}
+        mark_price_source = "position_risk"
+        if positions and position_source == "user_data_stream":
+            # One symbol costs weight 1; all symbols cost 10
+            marks = _fetch_mark_prices(symbol or (positions[0]["symbol"] if len(positions) == 1 else None))
+            if isinstance(marks, dict) and "success" in marks:
+                return marks
+            for mark in marks if isinstance(marks, list) else [marks]:
+                mark_prices[mark["symbol"]] = mark["markPrice"]
+            mark_price_source = "premium_index"
 
-        response_data = {}
+        by_symbol: Dict[Tuple[str, str], Dict[str, Decimal]] = {}
+        by_day: Dict[Tuple[str, str], Dict[str, Decimal]] = {}
+        counted = 0
+        for record in records:
+            field = INCOME_FIELDS.get(record["incomeType"])
+            if field is None or not start_time <= int(record["time"]) <= end_time:
+                continue
+            if symbol is not None and record.get("symbol") != symbol:
+                continue
+            amount = Decimal(str(record["income"]))
+            by_symbol.setdefault((record.get("symbol") or "", record["asset"]), _empty_breakdown())[field] += amount
+            by_day.setdefault((_day(int(record["time"])), record["asset"]), _empty_breakdown())[field] += amount
+            counted += 1
 
-        for asset in pnl_info['assets']:
-            response_data[asset['asset']] = {
-                "walletBalance": float(asset['walletBalance']),
-                "unrealizedProfit": float(asset['unrealizedProfit']),
-                "marginBalance": float(asset['marginBalance']),
-                "availableBalance": float(asset['availableBalance'])
+        position_details: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for position in positions:
+            key = (position["symbol"], _margin_asset(position))
+            amount = Decimal(str(position["positionAmt"]))
+            entry_price = Decimal(str(position["entryPrice"]))
+            mark_price = Decimal(str(mark_prices.get(position["symbol"]) or position["entryPrice"]))
+            by_symbol.setdefault(key, _empty_breakdown())["unrealized_pnl"] += amount * (mark_price - entry_price)
+            details = position_details.setdefault(key, {"position_amt": 0.0, "entry_price": None, "mark_price": None})
+            details["position_amt"] += float(amount)
+            details["entry_price"] = float(entry_price)
+            details["mark_price"] = float(mark_price)
+
+        totals: Dict[str, Dict[str, Decimal]] = {}
+        for (_, asset), breakdown in by_symbol.items():
+            total = totals.setdefault(asset, _empty_breakdown())
+            for field, value in breakdown.items():
+                total[field] += value
+
+        logger.info(f"Computed PnL from {counted} income records and {len(positions)} open positions")
+
+        return create_success_response(
+            data={
+                "totals": {asset: _finish(breakdown) for asset, breakdown in sorted(totals.items())},
+                "by_symbol": [
+                    {
+                        "symbol": row_symbol,
+                        "asset": asset,
+                        **_finish(breakdown),
+                        **position_details.get((row_symbol, asset), {})
+                    }
+                    for (row_symbol, asset), breakdown in sorted(by_symbol.items())
+                ],
+                "by_day": [
+                    {"date": day, "asset": asset, **_finish(breakdown, unrealized=False)}
+                    for (day, asset), breakdown in sorted(by_day.items())
+                ],
+                "income_records": counted,
+                "requests": requests
+            },
+            metadata={
+                "source": "history_store" if income_history.store is not None else "binance_api",
+                "start_time": start_time,
+                "end_time": end_time,
+                "position_source": position_source,
+                "mark_price_source": mark_price_source
             }
-        
-        return create_success_response(response_data)
+        )
+
+    except ValueError as e:
+        logger.warning(f"Validation error for get_pnl: {str(e)}")
+        return create_error_response("validation_error", f"Invalid parameters: {str(e)}")
+
+    except HistorySyncError as e:
+        logger.warning(f"Income history sync stopped: {e.response['error']['message']}")
+        return e.response
 
     except (BinanceAPIException, BinanceRequestException) as e:
         logger.error(f"Error fetching PnL info: {str(e)}")
@@ -91,4 +285,4 @@ def get_pnl() -> Dict[str, Any]:
 
     except Exception as e:
         logger.error(f"Unexpected error in get_pnl tool: {str(e)}")
-        return create_error_response("tool_error", f"Tool execution failed: {str(e)}")
\ No newline at end of file
+        return create_error_response("tool_error", f"Tool execution failed: {str(e)}")
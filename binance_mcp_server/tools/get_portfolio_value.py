@@ -0,0 +1,177 @@
+"""
+Binance portfolio valuation tool implementation.
+
+This module values the whole spot balance in one quote asset. Balances are
+joined with a single bulk price snapshot, and assets without a direct market
+are converted through intermediate assets (e.g. XYZ -> BTC -> USDT) using
+conversion routes precomputed from the cached exchange information.
+"""
+
+import time
+import logging
+from typing import Dict, Any, List
+from binance.exceptions import BinanceAPIException, BinanceRequestException
+from binance_mcp_server.utils import (
+    create_error_response,
+    create_success_response,
+    coalesced,
+)
+from binance_mcp_server.exchange_info import exchange_info_cache
+from binance_mcp_server.tools.get_balance import get_balance
+from binance_mcp_server.tools.get_ticker_prices import get_ticker_prices
+
+
+logger = logging.getLogger(__name__)
+
+# Longest conversion route (number of symbols) used to price an asset
+MAX_ROUTE_HOPS = 3
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 3)
+
+
+@coalesced()
+def get_portfolio_value(quote_asset: str = "USDT", min_value: float = 0.0) -> Dict[str, Any]:
+    """
+    Get the value of every spot balance and the portfolio total in one quote asset.
+
+    Balances come from get_balance (the user data stream when enabled) and all
+    prices from one get_ticker_prices snapshot (the live ticker cache when it
+    holds every needed symbol, otherwise one REST request). Each asset is
+    converted along its shortest route of TRADING symbols, preferring major
+    intermediate assets, so an asset with no market against the quote asset is
+    still valued (e.g. XYZ -> BTC -> USDT). Routes are computed once per
+    exchange information snapshot.
+
+    Args:
+        quote_asset (str): Asset to value the portfolio in (default: 'USDT')
+        min_value (float): Holdings worth less than this are left out of the
+            holdings list but still counted in the total (default: 0)
+
+    Returns:
+        Dict containing:
+        - success (bool): Whether the request was successful
+        - data (dict): Portfolio total and per-asset valuation
+        - timestamp (int): Unix timestamp of the response
+        - error (dict, optional): Error details if request failed
+
+        Data structure includes:
+        - quote_asset (str): Asset values are expressed in
+        - total_value (float): Value of all priced holdings
+        - holdings (list): Holdings sorted by value, largest first, each with
+          asset, free, locked, amount, price (per unit in quote_asset), value,
+          weight (share of total_value) and route (symbols used to convert)
+        - count (int): Number of holdings listed
+        - hidden (int): Holdings left out because they are worth less than min_value
+        - unpriced (list): Assets with no conversion route or price
+        - elapsed_ms (float): Wall time of the call
+
+    Examples:
+        result = get_portfolio_value("USDT", min_value=1)
+        if result["success"]:
+            print(f"Total: {result['data']['total_value']:.2f} USDT")
+            for holding in result["data"]["holdings"]:
+                print(f"{holding['asset']}: {holding['value']:.2f} ({holding['weight']:.1%})")
+    """
+    logger.info(f"Valuing portfolio in {quote_asset}")
+    started = time.perf_counter()
+
+    try:
+        quote_asset = str(quote_asset).strip().upper()
+        if not quote_asset.isalnum():
+            raise ValueError("quote_asset must be an asset symbol such as 'USDT'")
+        if not isinstance(min_value, (int, float)) or min_value < 0:
+            raise ValueError("min_value must be a non-negative number")
+
+        index = exchange_info_cache.get()
+        if quote_asset not in index.by_quote_asset and quote_asset not in index.by_base_asset:
+            raise ValueError(f"quote_asset {quote_asset} is not traded on Binance")
+
+        balance_response = get_balance()
+        if not balance_response.get("success"):
+            return balance_response
+        balances = balance_response["data"]
+
+        routes = index.conversion_routes(quote_asset, MAX_ROUTE_HOPS)
+        assets = sorted(asset for asset in balances if asset in routes)
+        symbols = sorted({symbol for asset in assets for symbol, _ in routes[asset]})
+
+        prices: Dict[str, float] = {}
+        price_source = None
+        if symbols:
+            price_response = get_ticker_prices(symbols)
+            if not price_response.get("success"):
+                return price_response
+            prices = price_response["data"]["prices"]
+            price_source = price_response.get("metadata", {}).get("source")
+
+        # Unit prices along each route, then amounts, values and weights as columns
+        unit_prices: List[float] = []
+        priced_assets: List[str] = []
+        unpriced = sorted(asset for asset in balances if asset not in routes)
+        for asset in assets:
+            price = 1.0
+            for symbol, inverse in routes[asset]:
+                step = prices.get(symbol)
+                if not step:
+                    price = None
+                    break
+                price = price / step if inverse else price * step
+            if price is None:
+                unpriced.append(asset)
+            else:
+                priced_assets.append(asset)
+                unit_prices.append(price)
+
+        amounts = [balances[asset]["free"] + balances[asset]["locked"] for asset in priced_assets]
+        values = [amount * price for amount, price in zip(amounts, unit_prices)]
+        total_value = sum(values)
+
+        holdings = [
+            {
+                "asset": asset,
+                "free": balances[asset]["free"],
+                "locked": balances[asset]["locked"],
+                "amount": amount,
+                "price": price,
+                "value": value,
+                "weight": round(value / total_value, 6) if total_value else 0.0,
+                "route": [symbol for symbol, _ in routes[asset]]
+            }
+            for asset, amount, price, value in zip(priced_assets, amounts, unit_prices, values)
+            if value >= min_value
+        ]
+        holdings.sort(key=lambda holding: (-holding["value"], holding["asset"]))
+
+        logger.info(f"Valued {len(priced_assets)} assets at {total_value} {quote_asset}")
+
+        return create_success_response(
+            data={
+                "quote_asset": quote_asset,
+                "total_value": total_value,
+                "holdings": holdings,
+                "count": len(holdings),
+                "hidden": len(priced_assets) - len(holdings),
+                "unpriced": sorted(unpriced),
+                "elapsed_ms": _elapsed_ms(started)
+            },
+            metadata={
+                "balance_source": balance_response.get("metadata", {}).get("source", "binance_api"),
+                "price_source": price_source,
+                "price_symbols": len(symbols),
+                "exchange_info_version": index.version
+            }
+        )
+
+    except ValueError as e:
+        logger.warning(f"Validation error for get_portfolio_value: {str(e)}")
+        return create_error_response("validation_error", f"Invalid parameters: {str(e)}")
+
+    except (BinanceAPIException, BinanceRequestException) as e:
+        logger.error(f"Error valuing portfolio: {str(e)}")
+        return create_error_response("binance_api_error", f"Error valuing portfolio: {str(e)}")
+
+    except Exception as e:
+        logger.error(f"Unexpected error in get_portfolio_value tool: {str(e)}")
+        return create_error_response("tool_error", f"Tool execution failed: {str(e)}")
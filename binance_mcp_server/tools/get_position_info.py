@@ -12,75 +12,150 @@ from binance_mcp_server.utils import (
     get_binance_client, 
     create_error_response, 
     create_success_response,
+    coalesced,
     rate_limited,
-    binance_rate_limiter,
-    validate_symbol
+    futures_rate_limiter,
+    RequestPriority
 )
+from binance_mcp_server.request_weights import get_request_weight
+from binance_mcp_server.account_state import futures_account_state, MARK_PRICE_FIELDS
 
 
 logger = logging.getLogger(__name__)
 
+# Position fields returned by Binance as numeric strings
+NUMERIC_FIELDS = frozenset({
+    "positionAmt", "entryPrice", "breakEvenPrice", "markPrice", "unRealizedProfit", "liquidationPrice",
+    "leverage", "maxNotionalValue", "isolatedMargin", "notional", "isolatedWallet",
+    "initialMargin", "maintMargin", "positionInitialMargin", "openOrderInitialMargin", "adl",
+    "bidNotional", "askNotional",
+})
 
-@rate_limited(binance_rate_limiter)
-def get_position_info() -> Dict[str, Any]:
+# Columns of the compact output, in order
+COMPACT_COLUMNS = [
+    "symbol", "positionSide", "positionAmt", "entryPrice", "markPrice", "unRealizedProfit",
+    "liquidationPrice", "leverage", "notional", "marginType", "isolatedWallet", "updateTime",
+]
+
+
+def _coerce(position: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert numeric strings to floats and the auto-add-margin flag to a bool."""
+    coerced = {}
+    for field, value in position.items():
+        if field in NUMERIC_FIELDS and isinstance(value, str):
+            try:
+                value = float(value)
+            except ValueError:
+                pass
+        elif field == "isAutoAddMargin" and isinstance(value, str):
+            value = value.lower() == "true"
+        coerced[field] = value
+    return coerced
+
+
+def _is_open(position: Dict[str, Any]) -> bool:
+    return float(position.get("positionAmt") or 0) != 0
+
+
+def _position_info_weight(**_: Any) -> int:
+    """Request weight of a get_position_info call; 0 when the user data stream state can answer it."""
+    return 0 if futures_account_state.synced else get_request_weight("fapi/positionRisk")
+
+
+@coalesced()
+@rate_limited(futures_rate_limiter, weight=_position_info_weight, priority=RequestPriority.ACCOUNT)
+def get_position_info(include_flat: bool = False, compact: bool = False) -> Dict[str, Any]:
     """
     Get the current position information for the user's Binance futures account.
     
-    This function retrieves detailed information about all current futures positions,
+    This function retrieves detailed information about current futures positions,
     including position sizes, entry prices, unrealized P&L, and margin requirements.
     Essential for position monitoring and risk management.
     
+    Binance returns an entry for every futures symbol, almost all of them flat;
+    flat positions (positionAmt of zero) are dropped unless include_flat is set,
+    and numeric strings are converted to floats.
+    
+    When the futures user data stream is enabled (BINANCE_FUTURES_USER_STREAM) and
+    synced, positions are served from memory. The stream does not keep fields that
+    move with the mark price current (markPrice, unRealizedProfit, liquidationPrice,
+    notional and the margin fields), so those are left out of such responses and
+    listed in metadata.omitted_fields; use get_pnl for live unrealized PnL.
+    
+    Args:
+        include_flat (bool): Also return positions with a size of zero (default: False)
+        compact (bool): Return column-oriented data ({"columns": [...], "rows": [[...]]})
+                        with the most used fields only (default: False)
+    
     Returns:
         Dict containing:
         - success (bool): Whether the request was successful
-        - data (list): List of position information for all symbols
+        - data (list or dict): List of positions, or columns and rows in compact mode
         - timestamp (int): Unix timestamp of the response
         - error (dict, optional): Error details if request failed
         
         Each position object includes:
         - symbol (str): Trading pair symbol
-        - positionAmt (str): Position size (positive for long, negative for short)
-        - entryPrice (str): Average entry price
-        - markPrice (str): Current mark price
-        - unRealizedProfit (str): Unrealized profit/loss
-        - liquidationPrice (str): Liquidation price
-        - leverage (str): Current leverage
-        - maxNotionalValue (str): Maximum notional value
+        - positionAmt (float): Position size (positive for long, negative for short)
+        - entryPrice (float): Average entry price
+        - markPrice (float): Current mark price
+        - unRealizedProfit (float): Unrealized profit/loss
+        - liquidationPrice (float): Liquidation price
+        - leverage (float): Current leverage
+        - maxNotionalValue (float): Maximum notional value
         - marginType (str): Margin type (isolated/cross)
-        - isolatedMargin (str): Isolated margin amount
-        - isAutoAddMargin (str): Auto-add margin flag
+        - isolatedMargin (float): Isolated margin amount
+        - isAutoAddMargin (bool): Auto-add margin flag
         - positionSide (str): Position side (BOTH/LONG/SHORT)
-        - notional (str): Notional value
-        - isolatedWallet (str): Isolated wallet amount
+        - notional (float): Notional value
+        - isolatedWallet (float): Isolated wallet amount
         - updateTime (int): Last update timestamp
         
+        Compact data includes:
+        - columns (list): symbol, positionSide, positionAmt, entryPrice, markPrice,
+          unRealizedProfit, liquidationPrice, leverage, notional, marginType,
+          isolatedWallet, updateTime
+        - rows (list): One list of values per position (null for omitted fields)
+        
     Examples:
         result = get_position_info()
         if result["success"]:
             positions = result["data"]
             
-            # Filter for active positions (non-zero size)
-            active_positions = [p for p in positions if float(p["positionAmt"]) != 0]
-            
-            print(f"Active positions: {len(active_positions)}")
-            for position in active_positions:
-                symbol = position["symbol"]
-                size = float(position["positionAmt"])
-                pnl = float(position["unRealizedProfit"])
-                entry_price = float(position["entryPrice"])
-                
+            print(f"Open positions: {len(positions)}")
+            for position in positions:
+                size = position["positionAmt"]
                 side = "LONG" if size > 0 else "SHORT"
-                print(f"{symbol}: {side} {abs(size):.4f} @ ${entry_price:.2f}")
-                print(f"  Unrealized P&L: ${pnl:.2f}")
-                print(f"  Liquidation: ${float(position['liquidationPrice']):.2f}")
+                print(f"{position['symbol']}: {side} {abs(size):.4f} @ ${position['entryPrice']:.2f}")
+                print(f"  Unrealized P&L: ${position['unRealizedProfit']:.2f}")
+                print(f"  Liquidation: ${position['liquidationPrice']:.2f}")
+        
+        compact = get_position_info(compact=True)
+        for row in compact["data"]["rows"]:
+            print(dict(zip(compact["data"]["columns"], row)))
     """
     logger.info("Fetching position information from Binance")
 
     try:
-        client = get_binance_client()
-        positions = client.futures_position_information()
+        positions = futures_account_state.get_positions(open_only=not include_flat)
+        metadata: Optional[Dict[str, Any]] = None
+        if positions is not None:
+            metadata = {**futures_account_state.freshness(), "omitted_fields": list(MARK_PRICE_FIELDS)}
+        else:
+            client = get_binance_client()
+            positions = client.futures_position_information()
+            if not include_flat:
+                positions = [position for position in positions if _is_open(position)]
+
+        positions = [_coerce(position) for position in positions]
+        data: Any = positions
+        if compact:
+            data = {
+                "columns": COMPACT_COLUMNS,
+                "rows": [[position.get(column) for column in COMPACT_COLUMNS] for position in positions]
+            }
 
-        return create_success_response(positions)
+        return create_success_response(data, metadata=metadata)
 
     except (BinanceAPIException, BinanceRequestException) as e:
         logger.error(f"Error fetching position info: {str(e)}")
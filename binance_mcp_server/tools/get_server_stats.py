@@ -0,0 +1,65 @@
+"""
+Server statistics tool implementation.
+
+This module exposes the server's own operating metrics, such as rate limit
+admission queue depth and wait times, the weight saved by coalescing
+identical calls and the health of pooled Binance clients, so they can be
+monitored from an MCP client. It makes no Binance requests.
+"""
+
+import logging
+from typing import Dict, Any
+from binance_mcp_server.utils import create_error_response, create_success_response, get_coalescing_stats
+from binance_mcp_server.rate_limiter import get_rate_limit_stats
+from binance_mcp_server.client_pool import get_client_pool
+
+
+logger = logging.getLogger(__name__)
+
+
+def get_server_stats() -> Dict[str, Any]:
+    """
+    Get the server's operating metrics.
+
+    Served from process memory without any Binance request or rate limit charge.
+
+    Returns:
+        Dict containing:
+        - success (bool): Whether the statistics were collected
+        - data (dict): Statistics per component
+        - timestamp (int): Unix timestamp of the response
+        - error (dict, optional): Error details if collection failed
+
+        Data structure includes:
+        - rate_limits (dict): Per limiter (spot, spot_orders_10s, spot_orders_1d,
+          sapi, futures): used and maximum weight, admitted/queued/rejected
+          counts, current and maximum queue depth, average and maximum wait
+          seconds, and per priority class usage, reservation and queue depth
+        - coalescing (dict): Per tool and in total, calls that made a request
+          (leaders), calls that shared one (coalesced) and the weight saved,
+          plus the number of calls in flight
+        - client_pool (dict): Connection pool settings and, per pooled client,
+          checkouts, HTTP requests made and health check results
+
+    Examples:
+        result = get_server_stats()
+        if result["success"]:
+            spot = result["data"]["rate_limits"]["spot"]
+            print(f"Spot weight {spot['used_weight']}/{spot['max_weight']}, queue {spot['queue_depth']}")
+            print(f"Weight saved by coalescing: {result['data']['coalescing']['totals']['weight_saved']}")
+    """
+    logger.info("Collecting server statistics")
+
+    try:
+        return create_success_response(
+            data={
+                "rate_limits": get_rate_limit_stats(),
+                "coalescing": get_coalescing_stats(),
+                "client_pool": get_client_pool().get_stats()
+            },
+            metadata={"source": "server"}
+        )
+
+    except Exception as e:
+        logger.error(f"Unexpected error in get_server_stats tool: {str(e)}")
+        return create_error_response("tool_error", f"Tool execution failed: {str(e)}")
@@ -11,21 +11,40 @@ from binance.exceptions import BinanceAPIException, BinanceRequestException
 from binance_mcp_server.utils import  (
     get_binance_client, 
     validate_symbol, 
+    coalesced,
     rate_limited, 
     binance_rate_limiter,
+    RequestPriority,
     create_success_response,
     create_error_response
 )
+from binance_mcp_server.request_weights import get_request_weight
+from binance_mcp_server.ticker_cache import ticker_cache
 
 
 logger = logging.getLogger(__name__)
 
 
-@rate_limited(binance_rate_limiter)
+def _ticker_weight(symbol: Any = None, **_: Any) -> int:
+    """Request weight of a get_ticker call; 0 when the live ticker cache can answer it."""
+    try:
+        if ticker_cache.get_ticker(validate_symbol(symbol)) is not None:
+            return 0
+    except ValueError:
+        pass
+    return get_request_weight("ticker/24hr", symbol=symbol)
+
+
+@coalesced()
+@rate_limited(binance_rate_limiter, weight=_ticker_weight, priority=RequestPriority.MARKET_DATA)
 def get_ticker(symbol: str) -> Dict[str, Any]:
     """
     Get 24-hour ticker price change statistics for a symbol.
     
+    When the live ticker cache is enabled (BINANCE_TICKER_STREAM) and both of its
+    streams are fresh, statistics are served from memory without a REST request.
+    The streams do not carry prev_close_price or count, which are then None.
+    
     Args:
         symbol: Trading pair symbol (e.g., 'BTCUSDT', 'ETHUSDT')
         
@@ -49,6 +68,17 @@ def get_ticker(symbol: str) -> Dict[str, Any]:
         
         normalized_symbol = validate_symbol(symbol)
         
+        cached_ticker = ticker_cache.get_ticker(normalized_symbol)
+        if cached_ticker is not None:
+            return create_success_response(
+                data=cached_ticker,
+                metadata={
+                    "source": "ticker_stream",
+                    "endpoint": "24h_ticker",
+                    "age_ms": ticker_cache.age_ms()
+                }
+            )
+        
         client = get_binance_client()
         ticker = client.get_ticker(symbol=normalized_symbol)
 
@@ -12,16 +12,31 @@ from binance_mcp_server.utils import (
     get_binance_client, 
     create_error_response, 
     create_success_response,
+    coalesced,
     rate_limited,
     binance_rate_limiter,
+    RequestPriority,
     validate_symbol
 )
+from binance_mcp_server.request_weights import get_request_weight
+from binance_mcp_server.ticker_cache import ticker_cache
 
 
 logger = logging.getLogger(__name__)
 
 
-@rate_limited(binance_rate_limiter)
+def _ticker_price_weight(symbol: Any = None, **_: Any) -> int:
+    """Request weight of a get_ticker_price call; 0 when the live ticker cache can answer it."""
+    try:
+        if ticker_cache.get_price(validate_symbol(symbol)) is not None:
+            return 0
+    except ValueError:
+        pass
+    return get_request_weight("ticker/price", symbol=symbol)
+
+
+@coalesced()
+@rate_limited(binance_rate_limiter, weight=_ticker_price_weight, priority=RequestPriority.MARKET_DATA)
 def get_ticker_price(symbol: str) -> Dict[str, Any]:
     """
     Get the current price for a trading symbol on Binance.
@@ -29,6 +44,9 @@ def get_ticker_price(symbol: str) -> Dict[str, Any]:
     This function fetches real-time price data for any valid trading pair available
     on Binance. The price is returned in the quote currency of the pair.
     
+    When the live ticker cache is enabled (BINANCE_TICKER_STREAM) and its stream
+    is fresh, the price is served from memory without a REST request.
+    
     Args:
         symbol: Trading pair symbol in format BASEQUOTE (e.g., 'BTCUSDT', 'ETHBTC')
             Must be a valid symbol listed on Binance exchange.
@@ -51,6 +69,17 @@ def get_ticker_price(symbol: str) -> Dict[str, Any]:
     try:
         normalized_symbol = validate_symbol(symbol)
         
+        cached_price = ticker_cache.get_price(normalized_symbol)
+        if cached_price is not None:
+            return create_success_response(
+                data={"symbol": normalized_symbol, "price": cached_price},
+                metadata={
+                    "source": "ticker_stream",
+                    "endpoint": "ticker_price",
+                    "age_ms": ticker_cache.age_ms()
+                }
+            )
+        
         client = get_binance_client()
         
         ticker_data = client.get_symbol_ticker(symbol=normalized_symbol)
@@ -0,0 +1,191 @@
+"""
+Binance batch ticker price tool implementation.
+
+This module provides functionality to fetch current prices for many trading
+symbols in a single weighted request to the Binance exchange API.
+"""
+
+import json
+import logging
+from typing import Dict, Any, List, Optional, Tuple
+from binance.exceptions import BinanceAPIException, BinanceRequestException
+from binance_mcp_server.utils import (
+    get_binance_client,
+    create_error_response,
+    create_success_response,
+    coalesced,
+    rate_limited,
+    binance_rate_limiter,
+    RequestPriority,
+    validate_symbol
+)
+from binance_mcp_server.request_weights import get_request_weight
+from binance_mcp_server.exchange_info import exchange_info_cache
+from binance_mcp_server.ticker_cache import ticker_cache
+
+
+logger = logging.getLogger(__name__)
+
+# Above this many symbols the all-symbol endpoint is used: it costs the same
+# weight as the symbols= form and avoids very long query strings
+MAX_SYMBOLS_PER_REQUEST = 100
+
+
+def _normalize_symbols(symbols: Optional[List[str]]) -> Optional[List[str]]:
+    """Validate, normalize and de-duplicate symbols, keeping their order."""
+    if symbols is None:
+        return None
+    if isinstance(symbols, str):
+        symbols = symbols.split(",")
+    if not isinstance(symbols, list):
+        raise ValueError("symbols must be a list of trading pair symbols")
+
+    normalized = list(dict.fromkeys(validate_symbol(symbol) for symbol in symbols))
+    if not normalized:
+        raise ValueError("symbols must contain at least one symbol")
+    return normalized
+
+
+def _plan_request(symbols: Optional[List[str]]) -> Tuple[str, Dict[str, Any]]:
+    """
+    Choose the cheapest endpoint form for a set of symbols.
+
+    Returns:
+        Tuple of (mode, request parameters) where mode is 'single', 'multi' or 'all'
+    """
+    if symbols is None or len(symbols) > MAX_SYMBOLS_PER_REQUEST:
+        return "all", {}
+    if len(symbols) == 1:
+        return "single", {"symbol": symbols[0]}
+    return "multi", {"symbols": json.dumps(symbols, separators=(",", ":"))}
+
+
+def _ticker_prices_weight(symbols: Any = None, **_: Any) -> int:
+    """Request weight of a get_ticker_prices call for the endpoint form it will use."""
+    try:
+        requested = _normalize_symbols(symbols)
+        if requested is not None and ticker_cache.get_prices(requested) is not None:
+            return 0
+        _, params = _plan_request(requested)
+    except ValueError:
+        return get_request_weight("ticker/price")
+    return get_request_weight("ticker/price", **params)
+
+
+def _split_listed(symbols: List[str]) -> Tuple[List[str], List[str]]:
+    """
+    Split symbols into listed and unknown using cached exchange information.
+
+    A single unknown symbol makes Binance reject the whole symbols= request, so
+    unknown symbols are dropped up front when exchange information is available.
+    """
+    try:
+        index = exchange_info_cache.get()
+    except Exception as e:
+        logger.warning(f"Skipping listed-symbol check: {str(e)}")
+        return symbols, []
+
+    listed = [symbol for symbol in symbols if symbol in index.symbols]
+    unknown = [symbol for symbol in symbols if symbol not in index.symbols]
+    return listed, unknown
+
+
+@coalesced()
+@rate_limited(binance_rate_limiter, weight=_ticker_prices_weight, priority=RequestPriority.MARKET_DATA)
+def get_ticker_prices(symbols: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Get current prices for many trading symbols in one request.
+
+    One symbol uses the single-symbol endpoint (weight 2). Up to 100 symbols use
+    the multi-symbol form (weight 4); larger lists and None fetch every symbol
+    (weight 4) and filter locally. When the live ticker cache is enabled and
+    fresh and holds every requested symbol, no REST request is made.
+
+    Args:
+        symbols: Optional list of trading pair symbols (e.g., ['BTCUSDT', 'ETHUSDT']).
+                 None returns prices for all symbols.
+
+    Returns:
+        Dict containing:
+        - success (bool): Whether the request was successful
+        - data (dict): Compact price mapping and lookup details
+        - timestamp (int): Unix timestamp of the response
+        - error (dict, optional): Error details if request failed
+
+        Data structure includes:
+        - prices (dict): Mapping of symbol to price (float)
+        - count (int): Number of prices returned
+        - missing (list): Requested symbols without a price (not listed)
+
+    Examples:
+        result = get_ticker_prices(["BTCUSDT", "ETHUSDT", "BNBUSDT"])
+        if result["success"]:
+            for symbol, price in result["data"]["prices"].items():
+                print(f"{symbol}: {price}")
+    """
+    logger.info(f"Fetching ticker prices for symbols: {symbols}")
+
+    try:
+        requested = _normalize_symbols(symbols)
+
+        missing: List[str] = []
+        if requested is not None:
+            requested, missing = _split_listed(requested)
+            if not requested:
+                return create_success_response(
+                    data={"prices": {}, "count": 0, "missing": missing},
+                    metadata={"source": "binance_api", "endpoint": "ticker_price", "mode": "none"}
+                )
+
+        # The stream only carries symbols that traded since it started, so
+        # all-symbol requests always go to REST
+        cached_prices = ticker_cache.get_prices(requested) if requested is not None else None
+        if cached_prices is not None:
+            return create_success_response(
+                data={"prices": cached_prices, "count": len(cached_prices), "missing": missing},
+                metadata={"source": "ticker_stream", "endpoint": "ticker_price", "age_ms": ticker_cache.age_ms()}
+            )
+
+        mode, params = _plan_request(requested)
+
+        client = get_binance_client()
+        ticker_data = client.get_symbol_ticker(**params)
+        if isinstance(ticker_data, dict):
+            ticker_data = [ticker_data]
+
+        prices = {ticker["symbol"]: float(ticker["price"]) for ticker in ticker_data}
+
+        if requested is not None:
+            wanted = set(requested)
+            if mode == "all":
+                prices = {symbol: price for symbol, price in prices.items() if symbol in wanted}
+            missing.extend(symbol for symbol in requested if symbol not in prices)
+
+        logger.info(f"Successfully fetched {len(prices)} ticker prices ({mode} request)")
+
+        return create_success_response(
+            data={
+                "prices": prices,
+                "count": len(prices),
+                "missing": missing
+            },
+            metadata={
+                "source": "binance_api",
+                "endpoint": "ticker_price",
+                "mode": mode,
+                "weight": get_request_weight("ticker/price", **params)
+            }
+        )
+
+    except ValueError as e:
+        error_msg = f"Invalid symbol format: {str(e)}"
+        logger.warning(f"Validation error for symbols '{symbols}': {error_msg}")
+        return create_error_response("validation_error", error_msg)
+
+    except (BinanceAPIException, BinanceRequestException) as e:
+        logger.error(f"Error fetching ticker prices: {str(e)}")
+        return create_error_response("binance_api_error", f"Error fetching ticker prices: {str(e)}")
+
+    except Exception as e:
+        logger.error(f"Unexpected error in get_ticker_prices tool: {str(e)}")
+        return create_error_response("tool_error", f"Tool execution failed: {str(e)}")
@@ -0,0 +1,345 @@
+"""
+Binance multi-coin transaction history tool implementation.
+
+This module merges deposit and withdrawal history across many coins and long
+date ranges in one call. Ranges are split into the 90-day windows the wallet
+history endpoints accept and fetched in parallel with bounded concurrency
+under the SAPI rate limiter (or synced per coin through the history store
+when it is enabled); results are de-duplicated and returned sorted by time.
+"""
+
+import json
+import time
+import base64
+import logging
+from collections import deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+from binance.exceptions import BinanceAPIException, BinanceRequestException
+from binance_mcp_server.utils import (
+    create_error_response,
+    create_success_response,
+    coalesced,
+)
+from binance_mcp_server.history_store import WindowedHistory, HistorySyncError, now_ms
+from binance_mcp_server.tools.get_deposit_history import deposit_history
+from binance_mcp_server.tools.get_withdraw_history import withdraw_history
+
+
+logger = logging.getLogger(__name__)
+
+# Transaction types and the history each is read from
+TRANSACTION_HISTORIES: Dict[str, WindowedHistory] = {
+    "deposit": deposit_history,
+    "withdrawal": withdraw_history,
+}
+
+# Range covered when start_time is not given
+DEFAULT_RANGE_MS = 90 * 24 * 60 * 60 * 1000
+
+# Most coins per call
+MAX_COINS = 50
+
+# Most window requests planned per call (coins x types x windows)
+MAX_WINDOW_REQUESTS = 1000
+
+# Upper bound on parallel requests
+MAX_CONCURRENCY = 10
+
+# Records returned per call by default and at most
+DEFAULT_LIMIT = 1000
+MAX_LIMIT = 10000
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 3)
+
+
+def _encode_cursor(position: Tuple[int, str, str], start_time: int, end_time: int) -> str:
+    """Encode the last returned record and the range as an opaque continuation cursor."""
+    payload = {"p": list(position), "s": start_time, "e": end_time}
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[Tuple[int, str, str], int, int]:
+    """
+    Decode a continuation cursor.
+
+    Returns:
+        Tuple of ((time, type, id) of the last returned record, start_time, end_time)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        event_time, transaction_type, record_id = payload["p"]
+        return (int(event_time), str(transaction_type), str(record_id)), int(payload["s"]), int(payload["e"])
+    except (ValueError, TypeError, KeyError, AttributeError):
+        raise ValueError("cursor is not a valid get_transaction_history cursor")
+
+
+def _normalize_coins(coins: Optional[List[str]]) -> List[str]:
+    """Validate the coin list; an empty key ('') stands for all coins in one request per window."""
+    if coins is None:
+        return [""]
+    if not isinstance(coins, list) or not coins or not all(isinstance(coin, str) and coin.strip() for coin in coins):
+        raise ValueError("coins must be a non-empty list of coin symbols")
+    normalized = sorted({coin.strip().upper() for coin in coins})
+    if len(normalized) > MAX_COINS:
+        raise ValueError(f"at most {MAX_COINS} coins can be queried per call")
+    return normalized
+
+
+def _fetch_task(
+    history: WindowedHistory,
+    coin: str,
+    start_time: int,
+    end_time: int
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Fetch one unit of work: a whole coin through the history store, or one window from the API.
+
+    Returns:
+        Tuple of (records, requests made)
+    """
+    if history.store is not None:
+        requests = history.sync(coin, start_time, end_time)
+        return history.query(coin, start_time, end_time, descending=False), requests
+    return history.fetch_window(coin, start_time, end_time)
+
+
+def _task_error(error: Exception) -> Dict[str, Any]:
+    """Error details of a failed unit of work."""
+    if isinstance(error, HistorySyncError):
+        return error.response["error"]
+    if isinstance(error, (BinanceAPIException, BinanceRequestException)):
+        return create_error_response("binance_api_error", f"Error fetching history: {str(error)}")["error"]
+    return create_error_response("tool_error", f"Error fetching history: {str(error)}")["error"]
+
+
+@coalesced()
+def get_transaction_history(
+    transaction_type: str = "all",
+    coins: Optional[List[str]] = None,
+    start_time: Optional[int] = None,
+    end_time: Optional[int] = None,
+    limit: int = DEFAULT_LIMIT,
+    cursor: Optional[str] = None,
+    max_concurrency: int = 5
+) -> Dict[str, Any]:
+    """
+    Get deposits and withdrawals across coins and long date ranges in one call.
+
+    The range is split into the 90-day windows the wallet history endpoints
+    accept, and the (type, coin, window) requests run in parallel with
+    bounded concurrency, each charged to the SAPI rate limiter. Windows are
+    merged oldest first and the call stops once a page of ``limit`` records
+    is complete; a cursor resumes at the window holding its last record, so
+    earlier windows are not fetched again. If a window fails after earlier
+    records were collected, the page ends before it and the next call retries
+    it. With the history store enabled, each (type, coin) is delta-synced
+    instead, so repeated queries cost no request weight. Records are
+    de-duplicated by id and returned oldest first.
+
+    Args:
+        transaction_type: 'deposit', 'withdrawal' or 'all' (default: 'all')
+        coins: Coins to include (at most 50); all coins if not provided
+        start_time: Start of the range in ms (default: 90 days before end_time)
+        end_time: End of the range in ms (default: now)
+        limit: Maximum records returned per call (1-10000, default: 1000)
+        cursor: next_cursor of a previous response to continue from; pass the
+                same transaction_type and coins (the range is taken from the cursor)
+        max_concurrency: Maximum parallel requests (1-10, default: 5)
+
+    Returns:
+        Dict containing:
+        - success (bool): Whether any history could be fetched
+        - data (dict): Merged records and paging state
+        - timestamp (int): Unix timestamp of the response
+        - error (dict, optional): Error details if every request failed
+
+        Data structure includes:
+        - records (list): Deposit and withdrawal records oldest first, each with
+          the exchange fields plus type ('deposit'/'withdrawal') and time (ms)
+        - count (int): Number of records returned
+        - has_more (bool): Whether more records remain in the range
+        - next_cursor (str or None): Cursor for the next page
+        - requests (int): Requests made to Binance
+        - errors (list): Failed (type, coin) fetches with the failed window, if any
+        - elapsed_ms (float): Wall time of the call
+
+    Examples:
+        year_ago = int((time.time() - 365 * 24 * 3600) * 1000)
+        result = get_transaction_history(coins=["BTC", "ETH", "USDT"], start_time=year_ago)
+        while result["success"]:
+            for record in result["data"]["records"]:
+                print(record["time"], record["type"], record["coin"], record["amount"])
+            if not result["data"]["has_more"]:
+                break
+            result = get_transaction_history(coins=["BTC", "ETH", "USDT"], cursor=result["data"]["next_cursor"])
+    """
+    logger.info(f"Fetching {transaction_type} history for coins={coins}")
+    started = time.perf_counter()
+
+    try:
+        transaction_type = str(transaction_type).lower().strip()
+        if transaction_type == "all":
+            histories = list(TRANSACTION_HISTORIES.items())
+        elif transaction_type in TRANSACTION_HISTORIES:
+            histories = [(transaction_type, TRANSACTION_HISTORIES[transaction_type])]
+        else:
+            raise ValueError("transaction_type must be 'deposit', 'withdrawal' or 'all'")
+        keys = _normalize_coins(coins)
+        if not isinstance(limit, int) or not 1 <= limit <= MAX_LIMIT:
+            raise ValueError(f"limit must be an integer between 1 and {MAX_LIMIT}")
+        if not isinstance(max_concurrency, int) or not 1 <= max_concurrency <= MAX_CONCURRENCY:
+            raise ValueError(f"max_concurrency must be an integer between 1 and {MAX_CONCURRENCY}")
+
+        after = None
+        if cursor is not None:
+            after, start_time, end_time = _decode_cursor(cursor)
+        else:
+            end_time = int(end_time) if end_time is not None else now_ms()
+            start_time = int(start_time) if start_time is not None else end_time - DEFAULT_RANGE_MS + 1
+        if end_time < start_time:
+            raise ValueError("end_time must not be before start_time")
+
+        planned = sum(len(history.windows(start_time, end_time)) for _, history in histories) * len(keys)
+        if planned > MAX_WINDOW_REQUESTS:
+            raise ValueError(
+                f"range needs {planned} window requests (at most {MAX_WINDOW_REQUESTS}); narrow the range or coins"
+            )
+
+        # A cursor resumes at the window holding its record; earlier windows are not fetched again
+        resume_time = after[0] if after is not None else start_time
+        tasks = []
+        for name, history in histories:
+            for coin in keys:
+                if history.store is not None:
+                    tasks.append((name, history, coin, start_time, end_time))
+                else:
+                    tasks.extend(
+                        (name, history, coin, window_start, window_end)
+                        for window_start, window_end in history.windows(start_time, end_time)
+                        if window_end >= resume_time
+                    )
+        tasks.sort(key=lambda task: task[3])
+
+        def run(task):
+            name, history, coin, task_start, task_end = task
+            try:
+                return _fetch_task(history, coin, task_start, task_end), None
+            except Exception as e:
+                return None, e
+
+        def sort_key(item):
+            return item[1]["time"], item[0][0], item[0][1]
+
+        def unseen(item):
+            return after is None or sort_key(item) > after
+
+        def ready(until):
+            """Merged records not returned yet, up to a time."""
+            return sum(1 for item in merged.items() if unseen(item) and item[1]["time"] <= until)
+
+        merged: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        errors: List[Dict[str, Any]] = []
+        failed_keys = set()
+        failed_tasks = 0
+        requests = 0
+        # Records up to this time are complete: every window that can hold them has been merged
+        settled = start_time - 1
+        with ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="binance-history") as pool:
+            def completed():
+                """Task results in task order, with at most max_concurrency tasks submitted ahead."""
+                queued = iter(tasks)
+                pending = deque()
+                while True:
+                    for task in islice(queued, max_concurrency - len(pending)):
+                        pending.append((task, pool.submit(run, task)))
+                    if not pending:
+                        return
+                    task, future = pending.popleft()
+                    yield task, future.result()
+
+            # Windows are merged in time order, so the call can stop once a page is complete
+            window_failed = False
+            for index, (task, (result, error)) in enumerate(completed()):
+                name, history, coin, task_start, task_end = task
+                if error is not None:
+                    window_failed = True
+                    failed_tasks += 1
+                    if (name, coin) not in failed_keys:
+                        failed_keys.add((name, coin))
+                        errors.append({
+                            "type": name,
+                            "coin": coin or None,
+                            "start_time": task_start,
+                            "end_time": task_end,
+                            "error": _task_error(error)
+                        })
+                else:
+                    records, task_requests = result
+                    requests += task_requests
+                    for record in records:
+                        event_time = history.record_time(record)
+                        if start_time <= event_time <= end_time:
+                            merged[(name, history.record_id(record))] = {**record, "type": name, "time": event_time}
+
+                if index + 1 < len(tasks) and tasks[index + 1][3] == task_start:
+                    continue
+                # Last task of a window start
+                if window_failed and ready(settled):
+                    # Return what precedes the failed window; the next call retries it
+                    break
+                window_failed = False
+                settled = tasks[index + 1][3] - 1 if index + 1 < len(tasks) else end_time
+                if settled < end_time and ready(settled) > limit:
+                    break
+
+        if errors and failed_tasks == len(tasks):
+            return create_error_response(
+                "binance_api_error",
+                f"Failed to fetch history for every coin: {errors[0]['error'].get('message')}",
+                {"errors": errors}
+            )
+
+        ordered = sorted(
+            (item for item in merged.items() if unseen(item) and item[1]["time"] <= settled), key=sort_key
+        )
+        page = ordered[:limit]
+        has_more = bool(page) and (len(ordered) > limit or settled < end_time)
+        next_cursor = None
+        if has_more:
+            (last_type, last_id), last_record = page[-1]
+            next_cursor = _encode_cursor((last_record["time"], last_type, last_id), start_time, end_time)
+
+        logger.info(f"Merged {len(merged)} transactions from {requests} requests")
+
+        return create_success_response(
+            data={
+                "records": [record for _, record in page],
+                "count": len(page),
+                "has_more": has_more,
+                "next_cursor": next_cursor,
+                "requests": requests,
+                "errors": errors,
+                "elapsed_ms": _elapsed_ms(started)
+            },
+            metadata={
+                "source": "history_store" if any(h.store is not None for _, h in histories) else "binance_api",
+                "start_time": start_time,
+                "end_time": end_time,
+                "max_concurrency": max_concurrency
+            }
+        )
+
+    except ValueError as e:
+        logger.warning(f"Validation error for get_transaction_history: {str(e)}")
+        return create_error_response("validation_error", f"Invalid parameters: {str(e)}")
+
+    except Exception as e:
+        logger.error(f"Unexpected error in get_transaction_history tool: {str(e)}")
+        return create_error_response("tool_error", f"Tool execution failed: {str(e)}")
@@ -3,18 +3,283 @@ Binance universal transfer history retrieval tool implementation.
 
 This module provides functionality to fetch universal transfer history between different
 account types on Binance, enabling comprehensive transfer tracking and analysis.
+Transfer types are paged through in parallel, pages of ranges that ended long
+enough ago are cached (they no longer change), and all transfers are merged
+into one compact timeline.
 """
 
+import math
+import time
 import logging
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from typing import Dict, Any, List, Optional, Tuple
 from binance.exceptions import BinanceAPIException, BinanceRequestException
 from binance_mcp_server.utils import (
-    get_binance_client, 
-    create_error_response, 
+    get_binance_client,
+    create_error_response,
     create_success_response,
+    cached,
+    coalesced,
     rate_limited,
-    binance_rate_limiter,
+    sapi_rate_limiter,
+    RequestPriority,
 )
+from binance_mcp_server.symbol_filters import format_decimal
 
 
-logger = logging.getLogger(__name__)
\ No newline at end of file
+logger = logging.getLogger(__name__)
+
+# Transfer types accepted by GET /sapi/v1/asset/transfer
+TRANSFER_TYPES = frozenset({
+    "MAIN_C2C", "MAIN_UMFUTURE", "MAIN_CMFUTURE", "MAIN_MARGIN", "MAIN_FUNDING", "MAIN_OPTION",
+    "MAIN_PORTFOLIO_MARGIN", "MAIN_ISOLATED_MARGIN",
+    "UMFUTURE_MAIN", "UMFUTURE_MARGIN", "UMFUTURE_FUNDING", "UMFUTURE_OPTION",
+    "CMFUTURE_MAIN", "CMFUTURE_MARGIN", "CMFUTURE_FUNDING",
+    "MARGIN_MAIN", "MARGIN_UMFUTURE", "MARGIN_CMFUTURE", "MARGIN_FUNDING", "MARGIN_OPTION",
+    "MARGIN_ISOLATED_MARGIN", "ISOLATED_MARGIN_MARGIN", "ISOLATED_MARGIN_ISOLATED_MARGIN",
+    "FUNDING_MAIN", "FUNDING_UMFUTURE", "FUNDING_CMFUTURE", "FUNDING_MARGIN", "FUNDING_OPTION",
+    "OPTION_MAIN", "OPTION_UMFUTURE", "OPTION_MARGIN", "OPTION_FUNDING",
+    "C2C_MAIN", "PORTFOLIO_MARGIN_MAIN", "ISOLATED_MARGIN_MAIN",
+})
+
+# Transfer types queried when none are given: spot to and from futures, margin and funding
+DEFAULT_TRANSFER_TYPES = (
+    "MAIN_UMFUTURE", "UMFUTURE_MAIN", "MAIN_CMFUTURE", "CMFUTURE_MAIN",
+    "MAIN_MARGIN", "MARGIN_MAIN", "MAIN_FUNDING", "FUNDING_MAIN",
+)
+
+# Rows per page (exchange maximum)
+PAGE_SIZE = 100
+
+# Pages fetched per transfer type and range before the result is truncated
+MAX_PAGES_PER_TYPE = 50
+
+# Upper bound on parallel requests
+MAX_CONCURRENCY = 10
+
+# Range covered when start_time is not given (the exchange default)
+DEFAULT_RANGE_MS = 7 * 24 * 60 * 60 * 1000
+
+# Transfers older than this no longer change, so pages of ranges ending before it are cached
+SETTLE_MS = 24 * 60 * 60 * 1000
+
+_DAY_MS = 24 * 60 * 60 * 1000
+
+# Columns of the compact timeline rows
+TIMELINE_COLUMNS = ["timestamp", "type", "asset", "amount", "status", "tranId"]
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 3)
+
+
+@rate_limited(sapi_rate_limiter, endpoint="asset/transfer", priority=RequestPriority.HISTORY)
+def _fetch_transfer_page(transfer_type: str, start_time: int, end_time: int, current: int) -> Dict[str, Any]:
+    """Fetch one page of transfers of one type (charged against the SAPI budget)."""
+    client = get_binance_client()
+    page = client.query_universal_transfer_history(
+        type=transfer_type, startTime=start_time, endTime=end_time, current=current, size=PAGE_SIZE
+    )
+    return create_success_response(page)
+
+
+@cached(ttl=30 * 24 * 3600, persist=True)
+def _fetch_settled_transfer_page(transfer_type: str, start_time: int, end_time: int, current: int) -> Dict[str, Any]:
+    """Fetch a page of a range that ended before SETTLE_MS; such pages never change and are cached."""
+    return _fetch_transfer_page(transfer_type, start_time, end_time, current)
+
+
+def _split_settled(start_time: int, end_time: int, now: int) -> List[Tuple[int, int, bool]]:
+    """
+    Split a range into settled whole-day windows and a live part.
+
+    Settled windows are UTC days that ended at least SETTLE_MS ago. They are
+    aligned to the day grid rather than to the caller's range, so their page
+    cache keys are the same for every call covering them (rolling ranges
+    included); rows outside the caller's range are dropped after fetching.
+
+    Returns:
+        List of (start, end, settled) segments
+    """
+    boundary = (now - SETTLE_MS) // _DAY_MS * _DAY_MS - 1
+    segments = []
+    day = start_time // _DAY_MS * _DAY_MS
+    while day <= min(end_time, boundary):
+        segments.append((day, day + _DAY_MS - 1, True))
+        day += _DAY_MS
+    if end_time > boundary:
+        segments.append((max(start_time, boundary + 1), end_time, False))
+    return segments
+
+
+def _fetch_page(task: Tuple[str, int, int, bool, int]) -> Tuple[Tuple[str, int, int, bool, int], Dict[str, Any]]:
+    """Fetch one (type, segment, page) task, through the page cache when the segment is settled."""
+    transfer_type, start_time, end_time, settled, current = task
+    fetch = _fetch_settled_transfer_page if settled else _fetch_transfer_page
+    try:
+        return task, fetch(transfer_type, start_time, end_time, current)
+    except (BinanceAPIException, BinanceRequestException) as e:
+        return task, create_error_response("binance_api_error", f"Error fetching transfers: {str(e)}")
+    except Exception as e:
+        return task, create_error_response("tool_error", f"Error fetching transfers: {str(e)}")
+
+
+@coalesced()
+def get_universal_transfer_history(
+    transfer_types: Optional[List[str]] = None,
+    start_time: Optional[int] = None,
+    end_time: Optional[int] = None,
+    max_concurrency: int = 5
+) -> Dict[str, Any]:
+    """
+    Get universal transfer history between account types as one merged timeline.
+
+    Each transfer type is paged through with current/size (100 rows per page):
+    the first page of every type is fetched in parallel, then the remaining
+    pages, with bounded concurrency under the SAPI rate limiter. The part of
+    the range that ended more than a day ago is fetched in whole UTC days whose
+    pages never change and are cached (on disk when BINANCE_CACHE_DIR is set),
+    so repeated queries, including rolling ones, only fetch recent transfers.
+
+    Args:
+        transfer_types (Optional[List[str]]): Transfer types such as 'MAIN_UMFUTURE' or
+            'MARGIN_MAIN'. Defaults to spot to/from USD-M futures, COIN-M futures,
+            margin and funding.
+        start_time (Optional[int]): Start of the range in ms (default: 7 days before end_time).
+            Binance only keeps the last 6 months.
+        end_time (Optional[int]): End of the range in ms (default: now).
+        max_concurrency (int): Maximum parallel requests (1-10, default: 5).
+
+    Returns:
+        Dict containing:
+        - success (bool): Whether any transfer history could be fetched
+        - data (dict): Compact timeline and totals
+        - timestamp (int): Unix timestamp of the response
+        - error (dict, optional): Error details if every transfer type failed
+
+        Data structure includes:
+        - columns (list): Column names of each timeline row
+          (timestamp, type, asset, amount, status, tranId)
+        - rows (list): Transfers oldest first, one list per transfer
+        - count (int): Number of transfers
+        - totals (dict): Summed amount per transfer type and asset
+        - truncated (list): Transfer types with more than 5000 transfers in a range segment
+        - errors (list): Transfer types that failed, if any
+        - requests (int): Page requests made (cached pages excluded)
+        - elapsed_ms (float): Wall time of the call
+
+    Examples:
+        result = get_universal_transfer_history(["MAIN_UMFUTURE", "UMFUTURE_MAIN"])
+        if result["success"]:
+            for timestamp, kind, asset, amount, status, tran_id in result["data"]["rows"]:
+                print(timestamp, kind, asset, amount, status)
+            print(result["data"]["totals"])
+    """
+    logger.info(f"Fetching universal transfer history for types={transfer_types}")
+    started = time.perf_counter()
+
+    try:
+        if transfer_types is None:
+            types = list(DEFAULT_TRANSFER_TYPES)
+        else:
+            if not isinstance(transfer_types, list) or not transfer_types:
+                raise ValueError("transfer_types must be a non-empty list")
+            types = sorted({str(transfer_type).upper().strip() for transfer_type in transfer_types})
+            unknown = [transfer_type for transfer_type in types if transfer_type not in TRANSFER_TYPES]
+            if unknown:
+                raise ValueError(f"unknown transfer types: {', '.join(unknown)}")
+        if not isinstance(max_concurrency, int) or not 1 <= max_concurrency <= MAX_CONCURRENCY:
+            raise ValueError(f"max_concurrency must be an integer between 1 and {MAX_CONCURRENCY}")
+
+        now = int(time.time() * 1000)
+        end_time = int(end_time) if end_time is not None else now
+        start_time = int(start_time) if start_time is not None else end_time - DEFAULT_RANGE_MS + 1
+        if end_time < start_time:
+            raise ValueError("end_time must not be before start_time")
+        segments = _split_settled(start_time, end_time, now)
+
+        pages: List[Tuple[Tuple[str, int, int, bool, int], Dict[str, Any]]] = []
+        with ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="binance-transfers") as pool:
+            first_pages = list(pool.map(_fetch_page, [
+                (transfer_type, segment_start, segment_end, settled, 1)
+                for transfer_type in types
+                for segment_start, segment_end, settled in segments
+            ]))
+            pages.extend(first_pages)
+
+            more = []
+            truncated = set()
+            for (transfer_type, segment_start, segment_end, settled, _), response in first_pages:
+                if not response.get("success"):
+                    continue
+                page_count = math.ceil(response["data"].get("total", 0) / PAGE_SIZE)
+                if page_count > MAX_PAGES_PER_TYPE:
+                    truncated.add(transfer_type)
+                more.extend(
+                    (transfer_type, segment_start, segment_end, settled, current)
+                    for current in range(2, min(page_count, MAX_PAGES_PER_TYPE) + 1)
+                )
+            pages.extend(pool.map(_fetch_page, more))
+
+        transfers: Dict[Any, Dict[str, Any]] = {}
+        errors: Dict[str, Dict[str, Any]] = {}
+        requests = 0
+        for (transfer_type, _, _, _, _), response in pages:
+            if not response.get("success"):
+                errors.setdefault(transfer_type, response["error"])
+                continue
+            if "cache" not in response.get("metadata", {}):
+                requests += 1
+            for row in response["data"].get("rows", []):
+                # Settled windows cover whole days, possibly beyond the requested range
+                if not start_time <= row["timestamp"] <= end_time:
+                    continue
+                transfers[(transfer_type, row["tranId"])] = {**row, "type": row.get("type", transfer_type)}
+
+        if len(errors) == len(types):
+            first_error = next(iter(errors.values()))
+            return create_error_response(
+                first_error.get("type", "binance_api_error"),
+                f"Failed to fetch transfer history: {first_error.get('message')}",
+                {"errors": [{"type": t, "error": e} for t, e in sorted(errors.items())]}
+            )
+
+        timeline = sorted(transfers.values(), key=lambda row: (row["timestamp"], row["tranId"]))
+        totals: Dict[str, Dict[str, Decimal]] = {}
+        for row in timeline:
+            by_asset = totals.setdefault(row["type"], {})
+            by_asset[row["asset"]] = by_asset.get(row["asset"], Decimal(0)) + Decimal(str(row["amount"]))
+
+        logger.info(f"Merged {len(timeline)} transfers of {len(types)} types from {requests} requests")
+
+        return create_success_response(
+            data={
+                "columns": TIMELINE_COLUMNS,
+                "rows": [[row.get(column) for column in TIMELINE_COLUMNS] for row in timeline],
+                "count": len(timeline),
+                "totals": {
+                    transfer_type: {asset: format_decimal(amount) for asset, amount in sorted(by_asset.items())}
+                    for transfer_type, by_asset in sorted(totals.items())
+                },
+                "truncated": sorted(truncated),
+                "errors": [{"type": t, "error": e} for t, e in sorted(errors.items())],
+                "requests": requests,
+                "elapsed_ms": _elapsed_ms(started)
+            },
+            metadata={
+                "source": "binance_api",
+                "endpoint": "asset/transfer",
+                "start_time": start_time,
+                "end_time": end_time,
+                "transfer_types": types
+            }
+        )
+
+    except ValueError as e:
+        logger.warning(f"Validation error for get_universal_transfer_history: {str(e)}")
+        return create_error_response("validation_error", f"Invalid parameters: {str(e)}")
+
+    except Exception as e:
+        logger.error(f"Unexpected error in get_universal_transfer_history tool: {str(e)}")
+        return create_error_response("tool_error", f"Tool execution failed: {str(e)}")
@@ -6,22 +6,66 @@ cryptocurrencies on a user's Binance account, enabling transaction tracking and
 """
 
 import logging
+from datetime import datetime, timezone
 from typing import Dict, Any, Optional
 from binance.exceptions import BinanceAPIException, BinanceRequestException
 from binance_mcp_server.utils import (
     get_binance_client, 
     create_error_response, 
     create_success_response,
+    coalesced,
     rate_limited,
-    binance_rate_limiter,
+    sapi_rate_limiter,
+    RequestPriority,
 )
+from binance_mcp_server.request_weights import get_request_weight
+from binance_mcp_server.history_store import WindowedHistory, HistorySyncError
 
 
 logger = logging.getLogger(__name__)
 
+# Longest startTime/endTime range accepted by the withdrawal history endpoint
+WITHDRAW_WINDOW_MS = 90 * 24 * 60 * 60 * 1000
 
-@rate_limited(binance_rate_limiter)
-def get_withdraw_history(coin: str) -> Dict[str, Any]:
+# Records per withdrawal history request (exchange maximum)
+WITHDRAW_PAGE_SIZE = 1000
+
+# Withdrawal statuses that no longer change (1=cancelled, 3=rejected, 5=failure, 6=completed)
+_FINAL_WITHDRAW_STATUSES = frozenset({1, 3, 5, 6})
+
+
+def _apply_time_ms(withdrawal: Dict[str, Any]) -> int:
+    """Withdrawal request time in ms (applyTime is a UTC 'YYYY-MM-DD HH:MM:SS' string)."""
+    apply_time = datetime.strptime(withdrawal["applyTime"], "%Y-%m-%d %H:%M:%S").replace(tzinfo=timezone.utc)
+    return int(apply_time.timestamp() * 1000)
+
+
+@rate_limited(sapi_rate_limiter, endpoint="capital/withdraw/history", priority=RequestPriority.HISTORY)
+def _fetch_withdraw_window(coin: str, start_time: int, end_time: int, offset: int = 0, limit: Optional[int] = None) -> Any:
+    """Fetch one page of withdrawals in a time window, all coins if coin is empty (charged against the SAPI budget)."""
+    client = get_binance_client()
+    return client.get_withdraw_history(coin=coin or None, startTime=start_time, endTime=end_time, offset=offset, limit=limit)
+
+
+withdraw_history = WindowedHistory(
+    "withdrawals",
+    _fetch_withdraw_window,
+    record_id=lambda withdrawal: str(withdrawal["id"]),
+    record_time=_apply_time_ms,
+    is_pending=lambda withdrawal: withdrawal.get("status") not in _FINAL_WITHDRAW_STATUSES,
+    window_ms=WITHDRAW_WINDOW_MS,
+    page_size=WITHDRAW_PAGE_SIZE
+)
+
+
+def _withdraw_history_weight(**_: Any) -> int:
+    """Request weight of a get_withdraw_history call; synced requests are charged individually."""
+    return 0 if withdraw_history.store is not None else get_request_weight("capital/withdraw/history")
+
+
+@coalesced()
+@rate_limited(sapi_rate_limiter, weight=_withdraw_history_weight, priority=RequestPriority.HISTORY)
+def get_withdraw_history(coin: str, start_time: Optional[int] = None, end_time: Optional[int] = None) -> Dict[str, Any]:
     """
     Get the withdrawal transaction history for a specific cryptocurrency on the user's Binance account.
     
@@ -29,10 +73,18 @@ def get_withdraw_history(coin: str) -> Dict[str, Any]:
     providing detailed information about each withdrawal transaction including status,
     amounts, fees, and destination addresses.
     
+    When the history store is enabled (BINANCE_HISTORY_DIR or BINANCE_CACHE_DIR),
+    withdrawals are kept locally: only withdrawals newer than the last sync (and
+    ones still in progress) are fetched, and repeated queries are answered from
+    the store.
+    
     Args:
         coin (str): The cryptocurrency symbol for which to fetch withdrawal history.
                    Examples: 'BTC', 'ETH', 'USDT', 'BNB', etc.
                    Must be a valid coin supported by Binance.
+        start_time (Optional[int]): Earliest withdrawal time in ms (default: 90 days back
+                                   on first sync, everything stored afterwards).
+        end_time (Optional[int]): Latest withdrawal time in ms (default: now).
     
     Returns:
         Dict containing:
@@ -74,10 +126,19 @@ def get_withdraw_history(coin: str) -> Dict[str, Any]:
     logger.info("Fetching withdrawal history")
 
     try:
+        coin = coin.strip().upper()
+        if withdraw_history.store is not None:
+            requests = withdraw_history.sync(coin, start_time, end_time)
+            withdrawals = withdraw_history.query(coin, start_time, end_time)
+            return create_success_response(withdrawals, metadata={"source": "history_store", "requests": requests})
+
         client = get_binance_client()
-        withdraw_history = client.get_withdraw_history(coin=coin)
+        withdrawals = client.get_withdraw_history(coin=coin, startTime=start_time, endTime=end_time)
+
+        return create_success_response(withdrawals)
 
-        return create_success_response(withdraw_history)
+    except HistorySyncError as e:
+        return e.response
 
     except (BinanceAPIException, BinanceRequestException) as e:
         logger.error(f"Error fetching withdrawal history: {str(e)}")
@@ -6,12 +6,30 @@ client initialization, rate limiting, and error handling utilities.
 """
 
 import time
+import asyncio
+import inspect
 import logging
-from typing import Dict, Any, Optional
-from functools import wraps
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Callable, Union
+from functools import wraps, partial
 from binance.client import Client
 from binance.exceptions import BinanceAPIException, BinanceRequestException
 from binance_mcp_server.config import BinanceConfig
+from binance_mcp_server.client_pool import get_client_pool
+from binance_mcp_server.rate_limiter import (
+    RateLimiter,
+    RequestPriority,
+    binance_rate_limiter,
+    order_rate_limiter,
+    daily_order_rate_limiter,
+    sapi_rate_limiter,
+    futures_rate_limiter,
+    DEFAULT_MAX_WAIT,
+)
+from binance_mcp_server.request_weights import get_request_weight, ORDER_ENDPOINTS
+from binance_mcp_server.coalescing import coalesced, single_flight, get_coalescing_stats
+from binance_mcp_server.cache import cached, invalidate_cache, response_cache
 from enum import Enum as PyEnum
 
 logger = logging.getLogger(__name__)
@@ -20,6 +38,10 @@ logger = logging.getLogger(__name__)
 # Global configuration instance
 _config: Optional[BinanceConfig] = None
 
+# Worker pool used to run blocking tool implementations off the event loop
+_tool_executor: Optional[ThreadPoolExecutor] = None
+_tool_executor_lock = threading.Lock()
+
 
 class OrderSide(PyEnum):
     """
@@ -81,7 +103,7 @@ def get_config() -> BinanceConfig:
     """
     global _config
     
-    if _config is None:
+    if _config is None or _config.has_changed():
         _config = BinanceConfig()
     
     if not _config.is_valid():
@@ -94,10 +116,11 @@ def get_config() -> BinanceConfig:
 
 def get_binance_client() -> Client:
     """
-    Create and return a configured Binance client instance.
+    Return the pooled Binance client for the current configuration.
     
-    This function uses the global configuration to create a properly configured
-    Binance client with appropriate base URL for testnet/production.
+    Clients are long-lived and shared across tool calls so requests reuse
+    keep-alive connections. The client is rebuilt transparently when the
+    credentials change or a background health check fails.
     
     Returns:
         Client: Configured Binance API client
@@ -113,18 +136,7 @@ def get_binance_client() -> Client:
     config = get_config()
     
     try:
-        # Create client with appropriate configuration
-        client = Client(
-            api_key=config.api_key,
-            api_secret=config.api_secret,
-            # testnet=config.testnet
-        )
-        
-        # Test connection
-        client.ping()
-        
-        logger.info(f"Successfully initialized Binance client (testnet: {config.testnet})")
-        return client
+        return get_client_pool(config).get_client(config)
         
     except BinanceAPIException as e:
         error_msg = f"Binance API error during client initialization: {str(e)}"
@@ -140,42 +152,47 @@ def get_binance_client() -> Client:
         raise RuntimeError(error_msg) from e
 
 
-class RateLimiter:
+def get_tool_executor() -> ThreadPoolExecutor:
     """
-    Rate limiter for API calls to respect Binance limits.
+    Get the shared worker pool that executes blocking tool implementations.
+    
+    The pool size is read from BINANCE_MAX_WORKERS on first use and bounds the
+    number of Binance requests that can be in flight at the same time.
+    
+    Returns:
+        ThreadPoolExecutor: The shared tool executor
+    """
+    global _tool_executor
+    
+    if _tool_executor is None:
+        with _tool_executor_lock:
+            if _tool_executor is None:
+                _tool_executor = ThreadPoolExecutor(
+                    max_workers=BinanceConfig().max_workers,
+                    thread_name_prefix="binance-tool"
+                )
+    
+    return _tool_executor
+
 
-    Binance has strict rate limits (1200 requests per minute for most endpoints).
-    This class helps prevent rate limit violations.
+async def run_tool(func: Callable[..., Dict[str, Any]], *args, **kwargs) -> Dict[str, Any]:
     """
+    Run a synchronous tool implementation without blocking the event loop.
     
-    def __init__(self, max_calls: int = 1200, window: int = 60):
-        """
-        Initialize rate limiter.
-        
-        Args:
-            max_calls: Maximum number of calls allowed in the time window
-            window: Time window in seconds
-        """
-        self.max_calls = max_calls
-        self.window = window
-        self.calls = []
-    
-    def can_proceed(self) -> bool:
-        """
-        Check if we can make another API call without violating rate limits.
-        
-        Returns:
-            bool: True if call can proceed, False if rate limited
-        """
-        now = time.time()
-        
-        self.calls = [call_time for call_time in self.calls if now - call_time < self.window]
+    Tool modules stay synchronous (and directly callable for backwards
+    compatibility); the MCP layer awaits them through this helper so one slow
+    request does not stall every other session on the same worker.
+    
+    Args:
+        func: Synchronous tool implementation
+        *args: Positional arguments for the tool
+        **kwargs: Keyword arguments for the tool
         
-        if len(self.calls) < self.max_calls:
-            self.calls.append(now)
-            return True
-            
-        return False
+    Returns:
+        Dict[str, Any]: The tool's standardized response
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_tool_executor(), partial(func, *args, **kwargs))
 
 
 def create_error_response(error_type: str, message: str, details: Optional[Dict] = None) -> Dict[str, Any]:
@@ -292,25 +309,104 @@ def create_success_response(data: Any, metadata: Optional[Dict] = None) -> Dict[
     return response
 
 
-def rate_limited(rate_limiter: Optional[RateLimiter] = None):
+def rate_limited(
+    rate_limiter: Optional[RateLimiter] = None,
+    endpoint: Optional[str] = None,
+    weight: Union[int, Callable[..., int], None] = None,
+    max_wait: Optional[float] = None,
+    priority: RequestPriority = RequestPriority.MARKET_DATA
+):
     """
-    Decorator to apply rate limiting to functions.
+    Decorator to apply weight-aware rate limiting to functions.
+    
+    The weight charged per call comes from ``weight`` if given, otherwise from
+    the request weight table entry for ``endpoint`` evaluated against the
+    call's arguments (e.g. get_order_book(limit=5000) costs 250). Order
+    endpoints are additionally charged against the spot order-rate limits.
+    
+    When the budget is exhausted the call waits in the limiter's admission
+    queue for up to ``max_wait`` seconds, and is rejected with
+    ``rate_limit_exceeded`` only when that deadline cannot be met. The
+    ``priority`` class decides which reserved capacity the call may use and
+    its place in the queue (order entry > account > market data > history).
+    
+    A call whose weight resolves to 0 is served without a REST request (for
+    example from a local stream-fed cache) and bypasses admission entirely.
     
     Args:
         rate_limiter: Optional custom rate limiter instance
+        endpoint: Optional Binance endpoint key used to look up the request weight
+        weight: Optional fixed weight or callable receiving the call arguments
+        max_wait: Maximum seconds to wait for budget (defaults to BINANCE_RATE_LIMIT_MAX_WAIT)
+        priority: Priority class the call is charged to
     """
     if rate_limiter is None:
         rate_limiter = RateLimiter(max_calls=1200, window=60)
     
+    order_limiters = (order_rate_limiter, daily_order_rate_limiter) if endpoint in ORDER_ENDPOINTS else ()
+    
     def decorator(func):
+        signature = inspect.signature(func)
+        
+        def resolve_weight(args, kwargs) -> int:
+            if weight is None and endpoint is None:
+                return 1
+            try:
+                bound = signature.bind_partial(*args, **kwargs)
+                bound.apply_defaults()
+                params = bound.arguments
+            except TypeError:
+                params = {}
+            if callable(weight):
+                return weight(**params)
+            if weight is not None:
+                return weight
+            return get_request_weight(endpoint, **params)
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            if not rate_limiter.can_proceed():
+            request_weight = resolve_weight(args, kwargs)
+            if request_weight <= 0:
+                return func(*args, **kwargs)
+            
+            wait_budget = DEFAULT_MAX_WAIT if max_wait is None else max_wait
+            deadline = time.monotonic() + wait_budget
+            
+            reservation, reason = rate_limiter.acquire(request_weight, timeout=wait_budget, priority=priority)
+            if not reservation:
                 return create_error_response(
                     "rate_limit_exceeded",
-                    "API rate limit exceeded. Please try again later."
+                    "API rate limit exceeded. Please try again later.",
+                    {
+                        "reason": reason,
+                        "retry_after": round(rate_limiter.time_until_available(request_weight, priority), 3)
+                    }
+                )
+            
+            charged = [(rate_limiter, reservation)]
+            for limiter in order_limiters:
+                order_reservation, reason = limiter.acquire(
+                    timeout=max(0.0, deadline - time.monotonic()),
+                    priority=priority
                 )
+                if not order_reservation:
+                    # Give back exactly what was already charged for this call
+                    for charged_limiter, charged_reservation in charged:
+                        charged_limiter.refund(charged_reservation)
+                    return create_error_response(
+                        "rate_limit_exceeded",
+                        "Order rate limit exceeded. Please try again later.",
+                        {
+                            "reason": reason,
+                            "retry_after": round(limiter.time_until_available(priority=priority), 3)
+                        }
+                    )
+                charged.append((limiter, order_reservation))
+            
             return func(*args, **kwargs)
+        
+        # Lets outer decorators (e.g. @coalesced) price a call without making it
+        wrapper.request_weight = resolve_weight
         return wrapper
     return decorator
 
@@ -500,8 +596,3 @@ def validate_limit_parameter(limit: Optional[int], max_limit: int = 5000) -> Opt
 #         return AccountType.FUTURES
 #     elif any(account for account in AccountType if account.value != account_type):
 #         raise ValueError("Invalid account type. Must be 'SPOT', 'MARGIN', or 'FUTURES'.")
-
-
-
-# Global rate limiter instance
-binance_rate_limiter = RateLimiter(max_calls=1200, window=60)
\ No newline at end of file
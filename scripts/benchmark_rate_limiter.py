@@ -0,0 +1,68 @@
+"""
+Micro-benchmark for RateLimiter.can_proceed().
+
+Measures the per-check cost at increasing window fill levels for the current
+deque-based limiter and for the previous list-rebuilding implementation. The
+deque-based cost should stay flat as the window fills.
+
+Usage:
+    python scripts/benchmark_rate_limiter.py [--max-calls 1200] [--checks 20000]
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from binance_mcp_server.rate_limiter import RateLimiter  # noqa: E402
+
+
+class ListRateLimiter:
+    """The previous implementation, kept here as a baseline."""
+
+    def __init__(self, max_calls: int = 1200, window: int = 60):
+        self.max_calls = max_calls
+        self.window = window
+        self.calls = []
+
+    def can_proceed(self) -> bool:
+        now = time.time()
+        self.calls = [call_time for call_time in self.calls if now - call_time < self.window]
+        if len(self.calls) < self.max_calls:
+            self.calls.append(now)
+            return True
+        return False
+
+
+def measure(limiter_cls, max_calls: int, fill: float, checks: int) -> float:
+    """Return the mean cost of one can_proceed() call in nanoseconds."""
+    limiter = limiter_cls(max_calls=max_calls, window=3600)
+    for _ in range(int(max_calls * fill)):
+        limiter.can_proceed()
+
+    # Keep the fill level constant by rejecting once the window is full
+    limiter.max_calls = int(max_calls * fill) if fill < 1.0 else max_calls
+
+    start = time.perf_counter_ns()
+    for _ in range(checks):
+        limiter.can_proceed()
+    return (time.perf_counter_ns() - start) / checks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark RateLimiter.can_proceed()")
+    parser.add_argument("--max-calls", type=int, default=1200)
+    parser.add_argument("--checks", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"{'fill':>6}  {'deque (ns/check)':>18}  {'list (ns/check)':>17}")
+    for fill in (0.0, 0.25, 0.5, 0.75, 1.0):
+        deque_ns = measure(RateLimiter, args.max_calls, fill, args.checks)
+        list_ns = measure(ListRateLimiter, args.max_calls, fill, args.checks)
+        print(f"{fill:>6.0%}  {deque_ns:>18.0f}  {list_ns:>17.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,13 @@
-# validators.py
\ No newline at end of file
+# validators.py
+
+import pytest
+
+from binance_mcp_server.cache import response_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    """Keep cached tool responses from leaking between tests."""
+    response_cache.invalidate()
+    yield
+    response_cache.invalidate()
@@ -0,0 +1,165 @@
+"""
+Tests for the live account state kept from the user data streams.
+
+This module verifies the snapshot-and-replay sync, that events older than the
+snapshot are ignored, that stream errors unsync the state, that exhausted
+resyncs are retried, and that account
+tools answer from a synced state without spending request weight.
+"""
+
+import time
+from unittest.mock import Mock, patch
+
+from binance_mcp_server.account_state import SpotAccountState, FuturesAccountState
+from binance_mcp_server.rate_limiter import binance_rate_limiter
+from binance_mcp_server.tools.get_balance import get_balance
+from binance_mcp_server.tools.get_orders import get_orders
+
+
+ACCOUNT_SNAPSHOT = {
+    "updateTime": 1000,
+    "balances": [
+        {"asset": "BTC", "free": "0.5", "locked": "0.1"},
+        {"asset": "USDT", "free": "1000", "locked": "0"},
+        {"asset": "ETH", "free": "0", "locked": "0"},
+    ],
+}
+
+OPEN_ORDER = {
+    "symbol": "BTCUSDT", "orderId": 1, "price": "60000", "origQty": "0.1",
+    "status": "NEW", "side": "SELL", "time": 900, "updateTime": 900,
+}
+
+POSITIONS_SNAPSHOT = [
+    {"symbol": "BTCUSDT", "positionSide": "BOTH", "positionAmt": "0.000", "entryPrice": "0.0",
+     "markPrice": "60000", "unRealizedProfit": "0", "updateTime": 1000},
+]
+
+
+def balance_event(update_time, free):
+    return {"e": "outboundAccountPosition", "E": update_time, "u": update_time,
+            "B": [{"a": "USDT", "f": free, "l": "0"}]}
+
+
+def execution_report(order_id, status, transaction_time, executed="0"):
+    return {
+        "e": "executionReport", "E": transaction_time, "s": "BTCUSDT", "i": order_id, "c": "client",
+        "p": "59000", "q": "0.2", "z": executed, "Z": "0", "X": status, "f": "GTC", "o": "LIMIT",
+        "S": "BUY", "P": "0", "O": transaction_time, "T": transaction_time, "L": "0", "l": "0",
+    }
+
+
+def synced_spot_state(*events):
+    """Build a spot state that buffered events before its snapshot arrived."""
+    state = SpotAccountState(max_snapshot_attempts=1)
+    for event in events:
+        state.on_message(event)
+    with patch.object(state, "_fetch_snapshot", return_value=(ACCOUNT_SNAPSHOT, [dict(OPEN_ORDER)])):
+        state._resync()
+    return state
+
+
+class TestSpotAccountState:
+    """Test cases for SpotAccountState."""
+
+    def test_buffered_events_replayed_after_snapshot(self):
+        state = synced_spot_state(
+            balance_event(900, "1"),  # older than the snapshot
+            balance_event(1100, "750"),
+            execution_report(2, "NEW", 1100),
+        )
+
+        assert state.synced
+        balances = state.get_balances()
+        assert balances["USDT"] == {"free": 750.0, "locked": 0.0}
+        assert balances["BTC"] == {"free": 0.5, "locked": 0.1}
+        assert "ETH" not in balances
+        assert [order["orderId"] for order in state.get_open_orders("BTCUSDT")] == [1, 2]
+
+    def test_execution_reports_update_and_close_orders(self):
+        state = synced_spot_state()
+
+        state.on_message(execution_report(1, "PARTIALLY_FILLED", 1200, executed="0.05"))
+        state.on_message(execution_report(1, "NEW", 1150))  # stale, ignored
+        assert state.get_open_orders("BTCUSDT")[0]["executedQty"] == "0.05"
+
+        state.on_message(execution_report(1, "FILLED", 1300, executed="0.2"))
+        assert state.get_open_orders("BTCUSDT") == []
+        assert state.get_open_orders("ETHUSDT") == []
+
+    def test_stream_error_unsyncs_state(self):
+        state = synced_spot_state()
+
+        with patch.object(state, "resync") as resync:
+            state.on_message({"e": "error", "m": "connection lost"})
+
+        resync.assert_called_once()
+        assert not state.synced
+        assert state.get_balances() is None
+        assert state.get_stats()["errors"] == 1
+
+
+    def test_exhausted_resync_is_restarted_from_stream(self):
+        state = SpotAccountState(max_snapshot_attempts=1)
+        with patch.object(state, "_fetch_snapshot", side_effect=RuntimeError("unavailable")), \
+             patch("binance_mcp_server.account_state.time.sleep"):
+            state._resync()
+
+        with patch.object(state, "resync") as resync:
+            state.on_message(balance_event(1100, "750"))
+            resync.assert_not_called()
+            with patch("binance_mcp_server.account_state.time.time", return_value=time.time() + 3600):
+                state.on_message(balance_event(1200, "700"))
+            resync.assert_called_once()
+
+        with patch.object(state, "_fetch_snapshot", return_value=(ACCOUNT_SNAPSHOT, [])):
+            state._resync()
+        assert state.synced
+        assert state.get_balances()["USDT"]["free"] == 700.0
+
+
+class TestFuturesAccountState:
+    """Test cases for FuturesAccountState."""
+
+    def test_account_update_changes_positions(self):
+        state = FuturesAccountState(max_snapshot_attempts=1)
+        with patch.object(state, "_fetch_snapshot", return_value=[dict(p) for p in POSITIONS_SNAPSHOT]):
+            state._resync()
+
+        state.on_message({
+            "e": "ACCOUNT_UPDATE", "E": 1200, "T": 1200,
+            "a": {"m": "ORDER", "B": [], "P": [
+                {"s": "BTCUSDT", "pa": "0.010", "ep": "60100", "up": "1.5", "mt": "cross", "iw": "0", "ps": "BOTH"},
+                {"s": "ETHUSDT", "pa": "-1", "ep": "3000", "up": "0", "mt": "isolated", "iw": "150", "ps": "BOTH"},
+            ]},
+        })
+
+        positions = {position["symbol"]: position for position in state.get_positions()}
+        assert positions["BTCUSDT"]["positionAmt"] == "0.010"
+        # Mark-price fields would go stale between events, so they are not kept
+        assert "markPrice" not in positions["BTCUSDT"] and "unRealizedProfit" not in positions["BTCUSDT"]
+        assert positions["ETHUSDT"]["isolatedWallet"] == "150"
+        assert state.freshness()["last_event_time"] == 1200
+
+
+class TestAccountToolsFromStream:
+    """Account tools served from a synced state."""
+
+    def test_get_balance_and_open_orders_skip_rest(self):
+        state = synced_spot_state()
+        client = Mock()
+
+        with patch("binance_mcp_server.tools.get_balance.spot_account_state", state), \
+             patch("binance_mcp_server.tools.get_orders.spot_account_state", state), \
+             patch("binance_mcp_server.tools.get_balance.get_binance_client", return_value=client), \
+             patch("binance_mcp_server.tools.get_orders.get_binance_client", return_value=client), \
+             patch.object(binance_rate_limiter, "acquire") as acquire:
+            balance = get_balance()
+            orders = get_orders("BTCUSDT", open_only=True)
+
+        assert balance["success"] and orders["success"]
+        assert balance["data"]["USDT"]["free"] == 1000.0
+        assert balance["metadata"]["source"] == "user_data_stream"
+        assert [order["orderId"] for order in orders["data"]["orders"]] == [1]
+        acquire.assert_not_called()
+        assert client.method_calls == []
@@ -0,0 +1,120 @@
+"""
+Tests for the TTL + stale-while-revalidate response cache.
+
+This module verifies fresh hits, stale serving with background refresh, LRU
+eviction, TTL overrides and invalidation.
+"""
+
+import time
+import pytest
+from unittest.mock import Mock, patch
+
+from binance_mcp_server.cache import ResponseCache, cached
+from binance_mcp_server.config import BinanceConfig
+
+
+def make_tool(cache, ttl, stale_ttl=0.0):
+    """Build a cached tool whose upstream calls are recorded by a Mock."""
+    upstream = Mock(side_effect=lambda coin: {"success": True, "data": {"coin": coin}})
+
+    @cached(ttl=ttl, stale_ttl=stale_ttl, cache=cache)
+    def get_thing(coin):
+        return upstream(coin)
+
+    return get_thing, upstream
+
+
+class TestResponseCache:
+    """Test cases for the cached decorator and ResponseCache."""
+
+    def test_fresh_hit_skips_upstream(self):
+        """Test that repeated calls within the TTL are served from the cache."""
+        cache = ResponseCache()
+        get_thing, upstream = make_tool(cache, ttl=60)
+
+        first = get_thing("btc")
+        second = get_thing("BTC")
+
+        assert upstream.call_count == 1
+        assert "metadata" not in first
+        assert second["metadata"]["cache"] == "fresh"
+        assert second["data"] == {"coin": "btc"}
+        assert cache.get_stats()["tools"]["get_thing"]["hits"] == 1
+
+    def test_errors_are_not_cached(self):
+        """Test that failed responses are always re-fetched."""
+        cache = ResponseCache()
+        upstream = Mock(return_value={"success": False, "error": {"type": "binance_api_error"}})
+
+        @cached(ttl=60, cache=cache)
+        def get_thing():
+            return upstream()
+
+        get_thing()
+        get_thing()
+
+        assert upstream.call_count == 2
+
+    def test_stale_entry_served_while_refreshing(self):
+        """Test that an expired entry inside the stale window is served and refreshed once."""
+        cache = ResponseCache()
+        get_thing, upstream = make_tool(cache, ttl=60, stale_ttl=60)
+        get_thing("ETH")
+
+        with patch("binance_mcp_server.cache.time.monotonic", return_value=time.monotonic() + 90):
+            result = get_thing("ETH")
+            for _ in range(200):
+                if upstream.call_count == 2 and not cache._refreshing:
+                    break
+                time.sleep(0.005)
+            assert result["metadata"]["cache"] == "stale"
+            assert upstream.call_count == 2
+            assert get_thing("ETH")["metadata"]["cache"] == "fresh"
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted when the cache is full."""
+        cache = ResponseCache(max_entries=2)
+        get_thing, upstream = make_tool(cache, ttl=60)
+
+        get_thing("A")
+        get_thing("B")
+        get_thing("A")
+        get_thing("C")
+        get_thing("A")
+        get_thing("B")
+
+        assert [call.args[0] for call in upstream.call_args_list] == ["A", "B", "C", "B"]
+
+    def test_ttl_override_and_invalidation(self):
+        """Test that a TTL of 0 disables caching and invalidation drops entries."""
+        cache = ResponseCache(ttl_overrides={"get_thing": 0})
+        get_thing, upstream = make_tool(cache, ttl=60)
+        get_thing("BTC")
+        get_thing("BTC")
+        assert upstream.call_count == 2
+
+        cache.set_ttls({"get_thing": 30})
+        get_thing("BTC")
+        get_thing("BTC")
+        assert upstream.call_count == 3
+
+        assert cache.invalidate("get_thing") == 1
+        get_thing("BTC")
+        assert upstream.call_count == 4
+
+    def test_parse_ttl_map(self):
+        """Test parsing of BINANCE_CACHE_TTL values."""
+        assert BinanceConfig.parse_ttl_map("get_fee_info=600, get_balance=5") == {
+            "get_fee_info": 600.0,
+            "get_balance": 5.0
+        }
+        assert BinanceConfig.parse_ttl_map("") == {}
+
+    def test_malformed_ttl_env_falls_back_to_defaults(self):
+        """Test that a bad BINANCE_CACHE_TTL entry is ignored instead of failing at import time."""
+        with patch.dict("os.environ", {"BINANCE_CACHE_TTL": "get_fee_info=600,get_balance,get_ticker=soon"}):
+            config = BinanceConfig()
+
+        assert config.cache_ttls == {"get_fee_info": 600.0}
+        with pytest.raises(ValueError):
+            BinanceConfig.parse_ttl_map("get_balance")
@@ -0,0 +1,119 @@
+"""
+Tests for the pooled Binance client registry.
+
+This module verifies that clients are reused across calls, rebuilt when the
+configuration changes or a health check fails, and that pool stats are exposed.
+"""
+
+import threading
+from unittest.mock import Mock, patch
+
+from binance_mcp_server.client_pool import BinanceClientPool
+from binance_mcp_server.config import BinanceConfig
+
+
+VALID_ENV = {
+    "BINANCE_API_KEY": "a" * 64,
+    "BINANCE_API_SECRET": "b" * 64,
+    "BINANCE_TESTNET": "true",
+}
+
+
+class TestBinanceClientPool:
+    """Test cases for BinanceClientPool."""
+
+    @patch.dict('os.environ', VALID_ENV)
+    @patch('binance_mcp_server.client_pool.Client')
+    def test_client_is_reused(self, mock_client_cls):
+        """Test that repeated checkouts return the same client without pinging."""
+        mock_client_cls.return_value = Mock(session=Mock(hooks={"response": []}))
+        pool = BinanceClientPool(health_check_interval=0)
+        config = BinanceConfig()
+
+        first = pool.get_client(config)
+        second = pool.get_client(config)
+
+        assert first is second
+        assert mock_client_cls.call_count == 1
+        assert mock_client_cls.call_args.kwargs["ping"] is False
+        first.ping.assert_not_called()
+
+    @patch('binance_mcp_server.client_pool.Client')
+    def test_client_rebuilt_when_credentials_change(self, mock_client_cls):
+        """Test that a new credential set retires the previous client."""
+        mock_client_cls.side_effect = lambda **kwargs: Mock(session=Mock(hooks={"response": []}))
+        pool = BinanceClientPool(health_check_interval=0)
+
+        with patch.dict('os.environ', VALID_ENV):
+            first = pool.get_client(BinanceConfig())
+
+        with patch.dict('os.environ', {**VALID_ENV, "BINANCE_API_KEY": "c" * 64}):
+            second = pool.get_client(BinanceConfig())
+
+        assert first is not second
+        first.session.close.assert_called_once()
+        assert pool.get_stats()["active_clients"] == 1
+
+    @patch('binance_mcp_server.client_pool.Client')
+    def test_retired_client_closed_after_in_flight_request(self, mock_client_cls):
+        """Test that a credential change does not close a session with a request in flight."""
+        started, release = threading.Event(), threading.Event()
+        send = Mock(side_effect=lambda *args, **kwargs: (started.set(), release.wait(5)))
+        sessions = iter([Mock(hooks={"response": []}, request=send), Mock(hooks={"response": []})])
+        mock_client_cls.side_effect = lambda **kwargs: Mock(session=next(sessions))
+        pool = BinanceClientPool(health_check_interval=0)
+
+        with patch.dict('os.environ', VALID_ENV):
+            first = pool.get_client(BinanceConfig())
+        request = threading.Thread(target=first.session.request, args=("GET", "https://api.binance.com/api/v3/time"))
+        request.start()
+        assert started.wait(5)
+
+        with patch.dict('os.environ', {**VALID_ENV, "BINANCE_API_KEY": "c" * 64}):
+            second = pool.get_client(BinanceConfig())
+
+        assert second is not first
+        first.session.close.assert_not_called()
+        assert pool.get_stats()["active_clients"] == 1
+
+        release.set()
+        request.join(5)
+        first.session.close.assert_called_once()
+        send.assert_called_once()
+
+    @patch.dict('os.environ', VALID_ENV)
+    @patch('binance_mcp_server.client_pool.Client')
+    def test_unhealthy_client_is_rebuilt(self, mock_client_cls):
+        """Test that a failed background health check forces a rebuild."""
+        mock_client_cls.side_effect = lambda **kwargs: Mock(session=Mock(hooks={"response": []}))
+        pool = BinanceClientPool(health_check_interval=0)
+        config = BinanceConfig()
+
+        first = pool.get_client(config)
+        first.ping.side_effect = Exception("Connection reset")
+        pool.run_health_checks()
+
+        stats = pool.get_stats()
+        assert stats["clients"][0]["healthy"] is False
+        assert stats["clients"][0]["consecutive_failures"] == 1
+
+        second = pool.get_client(config)
+        assert second is not first
+        assert pool.get_stats()["rebuilds"] == 1
+
+    @patch.dict('os.environ', VALID_ENV)
+    @patch('binance_mcp_server.client_pool.Client')
+    def test_pool_stats_count_requests(self, mock_client_cls):
+        """Test that the session response hook feeds the request counter."""
+        session = Mock(hooks={"response": []})
+        mock_client_cls.return_value = Mock(session=session)
+        pool = BinanceClientPool(pool_maxsize=16, health_check_interval=0)
+
+        pool.get_client(BinanceConfig())
+        for hook in session.hooks["response"]:
+            hook(Mock(url="https://api.binance.com/api/v3/ping", headers={}))
+
+        stats = pool.get_stats()
+        assert stats["pool_maxsize"] == 16
+        assert stats["clients"][0]["checkouts"] == 1
+        assert stats["clients"][0]["requests"] == 1
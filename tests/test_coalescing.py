@@ -0,0 +1,112 @@
+"""
+Tests for single-flight request coalescing.
+
+This module verifies that identical concurrent calls share one upstream call,
+that different arguments do not (only symbols and assets are case-insensitive),
+and that saved weight is counted.
+"""
+
+import threading
+
+from binance_mcp_server.coalescing import SingleFlight, coalesced, _freeze_arguments
+from binance_mcp_server.rate_limiter import RateLimiter
+from binance_mcp_server.utils import rate_limited
+
+
+def run_concurrently(func, calls):
+    """Start all calls, let them block on the gate, and collect results."""
+    results = [None] * len(calls)
+
+    def worker(index, args):
+        results[index] = func(*args)
+
+    threads = [threading.Thread(target=worker, args=(i, args)) for i, args in enumerate(calls)]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+class TestCoalescing:
+    """Test cases for the coalesced decorator."""
+
+    def test_identical_calls_share_one_request(self):
+        """Test that concurrent identical calls (after normalization) make one upstream call."""
+        registry = SingleFlight()
+        limiter = RateLimiter(max_calls=1000, window=60)
+        gate = threading.Event()
+        upstream = []
+
+        @coalesced(registry)
+        @rate_limited(limiter, endpoint="depth")
+        def fetch(symbol, limit=None):
+            upstream.append(symbol)
+            gate.wait(5)
+            return {"success": True, "symbol": symbol}
+
+        threads, results = run_concurrently(fetch, [("BTCUSDT", 500), ("btcusdt ", 500), ("BTCUSDT", 500)])
+        while registry.get_stats().get("fetch", {}).get("coalesced", 0) < 2:
+            gate.wait(0.001)
+        gate.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(upstream) == 1
+        assert all(result["success"] for result in results)
+        stats = registry.get_stats()["fetch"]
+        assert stats == {"leaders": 1, "coalesced": 2, "weight_saved": 50}
+        assert limiter.remaining() == 975
+        assert registry.in_flight() == 0
+
+    def test_different_arguments_are_not_coalesced(self):
+        """Test that calls with different arguments run independently."""
+        registry = SingleFlight()
+        calls = []
+
+        @coalesced(registry)
+        def fetch(symbol, limit=None):
+            calls.append((symbol, limit))
+            return {"success": True}
+
+        fetch("BTCUSDT")
+        fetch("BTCUSDT", limit=10)
+        fetch("ETHUSDT")
+
+        assert len(calls) == 3
+        assert registry.get_stats()["fetch"]["coalesced"] == 0
+
+    def test_only_symbol_and_asset_arguments_are_normalized(self):
+        """Test that cursors, fields and enum-like strings keep their case in call keys."""
+        key = _freeze_arguments({"symbol": " btcusdt", "coins": ["eth"], "quote_asset": "usdt", "cursor": "aBc"})
+
+        assert key == _freeze_arguments({"symbol": "BTCUSDT", "coins": ["ETH"], "quote_asset": "USDT", "cursor": "aBc"})
+        assert key != _freeze_arguments({"symbol": "BTCUSDT", "coins": ["ETH"], "quote_asset": "USDT", "cursor": "ABC"})
+        assert _freeze_arguments({"fields": ["orderId"]}) != _freeze_arguments({"fields": ["ORDERID"]})
+
+    def test_leader_exception_propagates_to_followers(self):
+        """Test that followers see the leader's exception and the key is released."""
+        registry = SingleFlight()
+        gate = threading.Event()
+        errors = []
+
+        @coalesced(registry)
+        def fetch(symbol):
+            gate.wait(5)
+            raise RuntimeError("upstream failed")
+
+        def worker():
+            try:
+                fetch("BTCUSDT")
+            except RuntimeError as e:
+                errors.append(str(e))
+
+        threads = [threading.Thread(target=worker) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        while registry.get_stats().get("fetch", {}).get("coalesced", 0) < 1:
+            gate.wait(0.001)
+        gate.set()
+        for thread in threads:
+            thread.join()
+
+        assert errors == ["upstream failed", "upstream failed"]
+        assert registry.in_flight() == 0
@@ -0,0 +1,103 @@
+"""
+Tests for the cached exchange information.
+
+This module verifies that exchangeInfo is indexed, served from memory while
+fresh, and that the content digest skips index rebuilds when nothing changed.
+"""
+
+from unittest.mock import Mock, patch
+
+from binance_mcp_server.exchange_info import ExchangeInfoCache, ExchangeInfoIndex
+
+
+EXCHANGE_INFO = {
+    "serverTime": 1700000000000,
+    "rateLimits": [],
+    "symbols": [
+        {"symbol": "BTCUSDT", "status": "TRADING", "baseAsset": "BTC", "quoteAsset": "USDT",
+         "permissions": ["SPOT", "MARGIN"]},
+        {"symbol": "ETHBTC", "status": "TRADING", "baseAsset": "ETH", "quoteAsset": "BTC",
+         "permissionSets": [["SPOT"]]},
+        {"symbol": "LUNAUSDT", "status": "BREAK", "baseAsset": "LUNA", "quoteAsset": "USDT",
+         "permissions": []},
+    ],
+}
+
+
+class TestExchangeInfoCache:
+    """Test cases for ExchangeInfoCache."""
+
+    @patch('binance_mcp_server.utils.get_binance_client')
+    def test_indexes_are_built(self, mock_get_client):
+        """Test that symbols are indexed by asset, status and permission."""
+        mock_get_client.return_value = Mock(get_exchange_info=Mock(return_value=EXCHANGE_INFO))
+        cache = ExchangeInfoCache(ttl=60)
+
+        index = cache.get()
+        cache.stop()
+
+        assert index.get_symbol("BTCUSDT")["baseAsset"] == "BTC"
+        assert index.by_quote_asset["USDT"] == {"BTCUSDT", "LUNAUSDT"}
+        assert index.by_base_asset["ETH"] == {"ETHBTC"}
+        assert index.by_status["BREAK"] == {"LUNAUSDT"}
+        assert index.by_permission["SPOT"] == {"BTCUSDT", "ETHBTC"}
+        assert index.by_permission["MARGIN"] == {"BTCUSDT"}
+
+    @patch('binance_mcp_server.utils.get_binance_client')
+    def test_fresh_data_is_served_from_memory(self, mock_get_client):
+        """Test that reads within the TTL do not call the API."""
+        client = Mock(get_exchange_info=Mock(return_value=EXCHANGE_INFO))
+        mock_get_client.return_value = client
+        cache = ExchangeInfoCache(ttl=60)
+
+        for _ in range(5):
+            cache.get()
+        cache.stop()
+
+        assert client.get_exchange_info.call_count == 1
+        assert cache.get_stats()["hits"] == 4
+
+    @patch('binance_mcp_server.utils.get_binance_client')
+    def test_unchanged_content_keeps_index(self, mock_get_client):
+        """Test that a refresh with identical content reuses the existing index."""
+        refreshed = {**EXCHANGE_INFO, "serverTime": 1700000060000}
+        client = Mock(get_exchange_info=Mock(side_effect=[EXCHANGE_INFO, refreshed]))
+        mock_get_client.return_value = client
+        cache = ExchangeInfoCache(ttl=60)
+
+        first = cache.refresh()
+        second = cache.refresh()
+
+        assert first is second
+        assert second.version == 1
+        assert cache.get_stats()["changes"] == 1
+
+    @patch('binance_mcp_server.utils.get_binance_client')
+    def test_stale_copy_served_when_refresh_fails(self, mock_get_client):
+        """Test that a failed refresh falls back to the previous snapshot."""
+        client = Mock(get_exchange_info=Mock(side_effect=[EXCHANGE_INFO, Exception("timeout")]))
+        mock_get_client.return_value = client
+        cache = ExchangeInfoCache(ttl=60)
+        first = cache.refresh()
+        first.fetched_at -= 120
+
+        assert cache.get() is first
+        cache.stop()
+        assert cache.get_stats()["errors"] == 1
+
+
+class TestConversionRoutes:
+    """Test cases for ExchangeInfoIndex.conversion_routes."""
+
+    def test_routes_skip_halted_symbols_and_are_memoized(self):
+        """Test that routes follow TRADING symbols through intermediate assets."""
+        index = ExchangeInfoIndex(EXCHANGE_INFO, "digest", 1)
+
+        routes = index.conversion_routes("USDT")
+
+        assert routes["USDT"] == []
+        assert routes["BTC"] == [("BTCUSDT", False)]
+        assert routes["ETH"] == [("ETHBTC", False), ("BTCUSDT", False)]
+        assert "LUNA" not in routes
+        assert index.conversion_routes("BTC")["USDT"] == [("BTCUSDT", True)]
+        assert index.conversion_routes("USDT") is routes
@@ -0,0 +1,67 @@
+"""
+Tests for the get_available_assets tool.
+
+This module verifies index-backed filtering and field projection of the
+cached exchange information.
+"""
+
+from unittest.mock import patch
+
+from binance_mcp_server.exchange_info import ExchangeInfoIndex
+from binance_mcp_server.tools.get_available_assets import get_available_assets
+
+
+EXCHANGE_INFO = {
+    "symbols": [
+        {"symbol": "BTCUSDT", "status": "TRADING", "baseAsset": "BTC", "quoteAsset": "USDT",
+         "permissions": ["SPOT", "MARGIN"], "filters": [{"filterType": "PRICE_FILTER"}]},
+        {"symbol": "ETHUSDT", "status": "TRADING", "baseAsset": "ETH", "quoteAsset": "USDT",
+         "permissionSets": [["SPOT"]], "filters": []},
+        {"symbol": "ETHBTC", "status": "TRADING", "baseAsset": "ETH", "quoteAsset": "BTC",
+         "permissions": ["SPOT"], "filters": []},
+        {"symbol": "LUNAUSDT", "status": "BREAK", "baseAsset": "LUNA", "quoteAsset": "USDT",
+         "permissions": [], "filters": []},
+    ],
+}
+
+INDEX = ExchangeInfoIndex(EXCHANGE_INFO, digest="test", version=1)
+
+
+class TestGetAvailableAssets:
+    """Test cases for get_available_assets function."""
+
+    @patch('binance_mcp_server.tools.get_available_assets.exchange_info_cache')
+    def test_no_filters_returns_all(self, mock_cache):
+        """Test that the unfiltered call keeps returning every symbol."""
+        mock_cache.get.return_value = INDEX
+
+        result = get_available_assets()
+
+        assert result["success"] is True
+        assert result["data"]["count"] == 4
+        assert result["data"]["assets"]["BTCUSDT"]["filters"] == [{"filterType": "PRICE_FILTER"}]
+
+    @patch('binance_mcp_server.tools.get_available_assets.exchange_info_cache')
+    def test_filters_are_combined(self, mock_cache):
+        """Test that filters are intersected and normalized."""
+        mock_cache.get.return_value = INDEX
+
+        result = get_available_assets(quote_asset="usdt", status="TRADING")
+        assert sorted(result["data"]["assets"]) == ["BTCUSDT", "ETHUSDT"]
+        assert result["data"]["total"] == 4
+
+        result = get_available_assets(base_asset="ETH", permissions="MARGIN")
+        assert result["data"]["count"] == 0
+
+        result = get_available_assets(symbol_prefix="eth", permissions=["SPOT"])
+        assert sorted(result["data"]["assets"]) == ["ETHBTC", "ETHUSDT"]
+
+    @patch('binance_mcp_server.tools.get_available_assets.exchange_info_cache')
+    def test_fields_projection(self, mock_cache):
+        """Test that only requested fields (plus symbol) are returned."""
+        mock_cache.get.return_value = INDEX
+
+        result = get_available_assets(symbol_prefix="BTC", fields=["status", "unknown"])
+
+        assert result["data"]["assets"] == {"BTCUSDT": {"symbol": "BTCUSDT", "status": "TRADING"}}
+        assert result["metadata"]["fields"] == ["status", "unknown"]
@@ -0,0 +1,161 @@
+"""
+Tests for the local history store and its delta sync.
+
+This module verifies that the first query of a history key downloads it,
+that repeated queries are answered locally, and that later syncs fetch only
+new records plus records that were still pending.
+"""
+
+import tempfile
+from unittest.mock import Mock, patch
+
+from binance_mcp_server.history_store import HistoryStore, now_ms
+from binance_mcp_server.rate_limiter import binance_rate_limiter, sapi_rate_limiter
+from binance_mcp_server.tools import get_orders as get_orders_module
+from binance_mcp_server.tools.get_deposit_history import get_deposit_history, deposit_history
+
+
+DAY = 24 * 60 * 60 * 1000
+
+
+def make_orders(first_id, count, start, status="FILLED"):
+    return [
+        {"symbol": "BTCUSDT", "orderId": first_id + i, "status": status, "time": start + i * 1000}
+        for i in range(count)
+    ]
+
+
+class FakeExchange:
+    """allOrders / openOrders / order endpoints over an in-memory order list."""
+
+    def __init__(self, orders):
+        self.orders = orders
+        self.client = Mock()
+        self.client.get_all_orders.side_effect = self.all_orders
+        self.client.get_open_orders.side_effect = lambda symbol: [
+            dict(o) for o in self.orders if o["status"] == "NEW"
+        ]
+        self.client.get_order.side_effect = lambda symbol, orderId: dict(
+            next(o for o in self.orders if o["orderId"] == orderId)
+        )
+
+    def all_orders(self, symbol, orderId=None, startTime=None, endTime=None, limit=500):
+        matches = [o for o in self.orders if o["orderId"] >= orderId]
+        return [dict(o) for o in matches[:limit]]
+
+
+class TestOrderHistorySync:
+    """Test cases for get_orders backed by the history store."""
+
+    def test_delta_sync_fetches_only_new_and_open_orders(self):
+        start = now_ms() - 30 * DAY
+        exchange = FakeExchange(make_orders(1, 2500, start) + make_orders(2501, 1, start + 5 * DAY, status="NEW"))
+
+        with tempfile.TemporaryDirectory() as directory:
+            store = HistoryStore(directory)
+            with patch.object(get_orders_module, "history_store", store), \
+                 patch.object(get_orders_module, "get_binance_client", return_value=exchange.client), \
+                 patch.object(get_orders_module._config, "history_sync_interval", 0), \
+                 patch.object(binance_rate_limiter, "acquire", return_value=(True, "")):
+                first = get_orders_module.get_orders("BTCUSDT", start_time=start, limit=2000)
+                assert first["metadata"]["requests"] == 3
+                assert first["data"]["count"] == 2000
+
+                second = get_orders_module.get_orders("BTCUSDT", cursor=first["data"]["next_cursor"], limit=1000)
+                assert [o["orderId"] for o in second["data"]["orders"]] == list(range(2001, 2502))
+                assert not second["data"]["has_more"]
+
+                exchange.orders[-1]["status"] = "FILLED"
+                exchange.orders.extend(make_orders(2502, 3, start + 6 * DAY))
+                exchange.client.get_all_orders.reset_mock()
+                third = get_orders_module.get_orders("BTCUSDT", start_time=start + 5 * DAY)
+
+            store.close()
+
+        # openOrders + one order query for the filled order + one allOrders page from 2502
+        assert third["metadata"]["requests"] == 3
+        exchange.client.get_all_orders.assert_called_once_with(symbol="BTCUSDT", orderId=2502, limit=1000)
+        assert [(o["orderId"], o["status"]) for o in third["data"]["orders"]] == [
+            (2501, "FILLED"), (2502, "FILLED"), (2503, "FILLED"), (2504, "FILLED")
+        ]
+
+    def test_first_sync_is_capped_and_resumes(self):
+        start = now_ms() - 30 * DAY
+        exchange = FakeExchange(make_orders(1, 2500, start))
+        scope = get_orders_module.history_scope()
+
+        with tempfile.TemporaryDirectory() as directory:
+            store = HistoryStore(directory)
+            with patch.object(get_orders_module, "history_store", store), \
+                 patch.object(get_orders_module, "get_binance_client", return_value=exchange.client), \
+                 patch.object(get_orders_module, "MAX_REQUESTS_PER_CALL", 1), \
+                 patch.object(binance_rate_limiter, "acquire", return_value=(True, "")) as acquire:
+                first = get_orders_module.get_orders("BTCUSDT", start_time=start, limit=2000)
+                # A rejected page keeps the progress saved by earlier pages
+                acquire.return_value = (False, "queue full")
+                rejected = get_orders_module.get_orders("BTCUSDT", cursor=first["data"]["next_cursor"])
+                resume_from = store.get_mark(get_orders_module.ORDERS_DATASET, scope, "BTCUSDT")["resume_from"]
+                acquire.return_value = (True, "")
+                second = get_orders_module.get_orders("BTCUSDT", cursor=first["data"]["next_cursor"], limit=2000)
+            store.close()
+
+        assert first["metadata"]["requests"] == 1 and not first["metadata"]["sync_complete"]
+        assert first["data"]["count"] == 1000 and first["data"]["has_more"]
+        assert not rejected["success"] and resume_from == 1001
+        assert [o["orderId"] for o in second["data"]["orders"]] == list(range(1001, 2001))
+        assert second["data"]["has_more"]
+
+    def test_repeated_query_within_sync_interval_is_local(self):
+        start = now_ms() - DAY
+        exchange = FakeExchange(make_orders(1, 10, start))
+
+        with tempfile.TemporaryDirectory() as directory:
+            store = HistoryStore(directory)
+            with patch.object(get_orders_module, "history_store", store), \
+                 patch.object(get_orders_module, "get_binance_client", return_value=exchange.client), \
+                 patch.object(binance_rate_limiter, "acquire", return_value=(True, "")) as acquire:
+                get_orders_module.get_orders("BTCUSDT")
+                calls = acquire.call_count
+                repeat = get_orders_module.get_orders("BTCUSDT", start_time=start + 5000, end_time=start + 7000)
+            store.close()
+
+        assert acquire.call_count == calls
+        assert repeat["metadata"]["requests"] == 0
+        assert [o["orderId"] for o in repeat["data"]["orders"]] == [6, 7, 8]
+
+
+class TestDepositHistorySync:
+    """Test cases for get_deposit_history backed by the history store."""
+
+    def test_resyncs_from_oldest_pending_deposit(self):
+        now = now_ms()
+        deposits = [
+            {"id": "a", "coin": "USDT", "amount": "100", "status": 1, "insertTime": now - 10 * DAY},
+            {"id": "b", "coin": "USDT", "amount": "50", "status": 0, "insertTime": now - 2 * DAY},
+        ]
+        client = Mock()
+        client.get_deposit_history.side_effect = lambda coin, startTime, endTime, offset, limit: [
+            dict(d) for d in deposits if startTime <= d["insertTime"] <= endTime
+        ]
+
+        with tempfile.TemporaryDirectory() as directory:
+            store = HistoryStore(directory)
+            with patch.object(deposit_history, "store", store), \
+                 patch.object(deposit_history, "sync_interval", 0), \
+                 patch("binance_mcp_server.tools.get_deposit_history.get_binance_client", return_value=client), \
+                 patch.object(sapi_rate_limiter, "acquire", return_value=(True, "")):
+                first = get_deposit_history("USDT")
+                deposits[1]["status"] = 1
+                second = get_deposit_history("USDT")
+                historical = get_deposit_history("USDT", end_time=now - 5 * DAY)
+                lowercase = get_deposit_history(" usdt ", end_time=now - 5 * DAY)
+            store.close()
+
+        assert [d["id"] for d in first["data"]] == ["b", "a"]
+        assert second["data"][0]["status"] == 1
+        assert client.get_deposit_history.call_args_list[-1].kwargs["startTime"] == now - 2 * DAY
+        assert historical["metadata"]["requests"] == 0
+        assert [d["id"] for d in historical["data"]] == ["a"]
+        # The coin is normalized, so differently cased queries share the stored history
+        assert lowercase["metadata"]["requests"] == 0
+        assert lowercase["data"] == historical["data"]
@@ -0,0 +1,139 @@
+"""
+Tests for the local order book engine.
+
+This module verifies the price ladders, snapshot + diff sequencing with gap
+detection and resync retries, and that get_order_book serves synced books
+without REST calls.
+"""
+
+import time
+from unittest.mock import patch
+
+from binance_mcp_server.rate_limiter import binance_rate_limiter
+from binance_mcp_server.order_book import LocalOrderBook, OrderBookManager, PriceLadder
+from binance_mcp_server.tools.get_order_book import get_order_book
+
+
+SNAPSHOT = {
+    "lastUpdateId": 100,
+    "bids": [["4.00", "10"], ["3.99", "5"], ["3.98", "1"]],
+    "asks": [["4.01", "2"], ["4.02", "3"]],
+}
+
+
+def depth_event(first_id, last_id, bids=(), asks=()):
+    return {"e": "depthUpdate", "E": 1700000000000, "s": "BTCUSDT",
+            "U": first_id, "u": last_id, "b": list(bids), "a": list(asks)}
+
+
+def synced_book():
+    book = LocalOrderBook("BTCUSDT")
+    assert book._load_snapshot(SNAPSHOT) is True
+    return book
+
+
+class TestPriceLadder:
+    """Test cases for PriceLadder."""
+
+    def test_bids_best_first(self):
+        """Test that bids are kept in descending price order with updates and removals."""
+        ladder = PriceLadder(descending=True)
+        ladder.replace([["1.0", "1"], ["3.0", "3"], ["2.0", "2"]])
+
+        ladder.update(2.5, 7.0)
+        ladder.update(3.0, 0.0)
+        ladder.update(1.0, 4.0)
+
+        assert ladder.top() == [(2.5, 7.0), (2.0, 2.0), (1.0, 4.0)]
+        assert ladder.top(1) == [(2.5, 7.0)]
+
+
+class TestLocalOrderBook:
+    """Test cases for LocalOrderBook sequencing."""
+
+    def test_buffered_events_replayed_after_snapshot(self):
+        """Test that stale buffered events are dropped and the rest applied."""
+        book = LocalOrderBook("BTCUSDT")
+        with patch.object(book, "resync"):
+            book.on_message(depth_event(95, 99, bids=[["4.00", "99"]]))
+            book.on_message(depth_event(100, 103, bids=[["4.00", "12"]], asks=[["4.01", "0"]]))
+
+        assert book._load_snapshot(SNAPSHOT) is True
+        snapshot = book.snapshot()
+        assert snapshot["lastUpdateId"] == 103
+        assert snapshot["bids"][0] == (4.0, 12.0)
+        assert snapshot["asks"][0] == (4.02, 3.0)
+
+    def test_snapshot_older_than_stream_is_rejected(self):
+        """Test that a snapshot preceding the first buffered event is retried."""
+        book = LocalOrderBook("BTCUSDT")
+        with patch.object(book, "resync"):
+            book.on_message(depth_event(150, 160))
+
+        assert book._load_snapshot(SNAPSHOT) is False
+        assert book.synced is False
+
+    def test_gap_triggers_resync(self):
+        """Test that a missing update ID unsyncs the book and requests a resync."""
+        book = synced_book()
+        with patch.object(book, "resync") as mock_resync:
+            book.on_message(depth_event(101, 105, asks=[["4.03", "1"]]))
+            book.on_message(depth_event(107, 110))
+
+        assert book.synced is False
+        assert book.last_update_id == 105
+        assert book.get_stats()["gaps"] == 1
+        mock_resync.assert_called_once()
+
+
+    def test_exhausted_resync_is_restarted_from_stream(self):
+        """Test that a resync that ran out of attempts is retried after its delay, not abandoned."""
+        book = LocalOrderBook("BTCUSDT", max_snapshot_attempts=1)
+        with patch.object(book, "_fetch_snapshot", side_effect=RuntimeError("unavailable")), \
+             patch("binance_mcp_server.order_book.time.sleep"):
+            book._resync()
+
+        with patch.object(book, "resync") as mock_resync:
+            book.on_message(depth_event(101, 105))
+            mock_resync.assert_not_called()
+            with patch("binance_mcp_server.order_book.time.time", return_value=time.time() + 3600):
+                book.on_message(depth_event(106, 110))
+            mock_resync.assert_called_once()
+
+        with patch.object(book, "_fetch_snapshot", return_value=dict(SNAPSHOT, lastUpdateId=104)):
+            book._resync()
+        assert book.synced and book.last_update_id == 110
+
+
+class TestLocalOrderBookServing:
+    """Test cases for serving get_order_book from a local book."""
+
+    @patch('binance_mcp_server.tools.get_order_book.get_binance_client')
+    def test_synced_book_served_without_rest(self, mock_get_client):
+        """Test that a synced book answers without REST calls or weight."""
+        manager = OrderBookManager()
+        manager._books["BTCUSDT"] = synced_book()
+
+        with patch('binance_mcp_server.tools.get_order_book.order_book_manager', manager), \
+                patch.object(binance_rate_limiter, "acquire") as mock_acquire:
+            result = get_order_book("btcusdt", limit=2)
+
+        assert result["success"] is True
+        assert result["metadata"]["source"] == "local_order_book"
+        assert result["data"]["bids"] == [{"price": 4.0, "quantity": 10.0}, {"price": 3.99, "quantity": 5.0}]
+        assert result["data"]["bestAsk"] == {"price": 4.01, "quantity": 2.0}
+        mock_get_client.assert_not_called()
+        mock_acquire.assert_not_called()
+
+    @patch('binance_mcp_server.tools.get_order_book.get_binance_client')
+    def test_deep_request_falls_back_to_rest(self, mock_get_client):
+        """Test that requests deeper than the local book use REST."""
+        manager = OrderBookManager(snapshot_limit=1000)
+        manager._books["BTCUSDT"] = synced_book()
+        mock_get_client.return_value.get_order_book.return_value = SNAPSHOT
+
+        with patch('binance_mcp_server.tools.get_order_book.order_book_manager', manager):
+            result = get_order_book("BTCUSDT", limit=5000)
+
+        assert result["metadata"]["source"] == "binance_api"
+        mock_get_client.return_value.get_order_book.assert_called_once_with(symbol="BTCUSDT", limit=5000)
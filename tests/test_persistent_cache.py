@@ -0,0 +1,106 @@
+"""
+Tests for the persistent on-disk cache.
+
+This module verifies that exchange information and persisted tool responses
+survive a restart (a new cache instance on the same directory) and that
+version stamps reject outdated entries.
+"""
+
+import time
+import tempfile
+from unittest.mock import Mock, patch
+
+from binance_mcp_server.cache import ResponseCache, cached
+from binance_mcp_server.exchange_info import ExchangeInfoCache
+from binance_mcp_server.persistent_cache import PersistentStore
+
+
+EXCHANGE_INFO = {
+    "serverTime": 1700000000000,
+    "rateLimits": [],
+    "symbols": [
+        {"symbol": "BTCUSDT", "status": "TRADING", "baseAsset": "BTC", "quoteAsset": "USDT",
+         "permissions": ["SPOT"]},
+    ],
+}
+
+
+def make_fee_tool(cache, upstream):
+    """Build a persisted cached tool backed by a Mock."""
+    @cached(ttl=60, stale_ttl=600, persist=True, cache=cache)
+    def get_fees(symbol=None):
+        return upstream(symbol)
+
+    return get_fees
+
+
+class TestPersistentStore:
+    """Test cases for PersistentStore."""
+
+    def test_round_trip_and_version_stamp(self):
+        """Test that values round-trip and a mismatched version is ignored."""
+        with tempfile.TemporaryDirectory() as directory:
+            store = PersistentStore(directory)
+            store.put("response", "key", {"a": [1, 2]}, "1", stored_at=123.0)
+
+            assert store.get("response", "key") == ({"a": [1, 2]}, "1", 123.0)
+            assert store.get("response", "key", version="2") is None
+
+            store.delete("response", key_prefix="k")
+            assert store.get("response", "key") is None
+            store.close()
+
+
+class TestRestart:
+    """Test cases for answering from disk after a restart."""
+
+    @patch('binance_mcp_server.utils.get_binance_client')
+    def test_exchange_info_restored_and_refreshed_in_background(self, mock_get_client):
+        """Test that a restarted cache serves the persisted copy without waiting for the API."""
+        client = Mock(get_exchange_info=Mock(return_value=EXCHANGE_INFO))
+        mock_get_client.return_value = client
+
+        with tempfile.TemporaryDirectory() as directory:
+            store = PersistentStore(directory)
+            first = ExchangeInfoCache(ttl=60, store=store)
+            first.get()
+            first.stop()
+            assert client.get_exchange_info.call_count == 1
+
+            # Age the persisted copy past the TTL, then restart
+            store.touch(ExchangeInfoCache._STORE_NAMESPACE, "spot", time.time() - 120)
+            client.get_exchange_info.reset_mock()
+            restarted = ExchangeInfoCache(ttl=60, store=store)
+
+            index = restarted.get()
+            assert index.get_symbol("BTCUSDT")["status"] == "TRADING"
+            assert restarted.get_stats()["restored"] == 1
+
+            for _ in range(200):
+                if client.get_exchange_info.call_count and not restarted._refresh_lock.locked():
+                    break
+                time.sleep(0.005)
+            restarted.stop()
+            assert client.get_exchange_info.call_count == 1
+            assert time.time() - restarted.get().fetched_at < 60
+            store.close()
+
+    def test_persisted_response_survives_restart(self):
+        """Test that a persisted tool response is served by a new cache instance."""
+        upstream = Mock(return_value={"success": True, "data": [{"symbol": "BTCUSDT"}]})
+
+        with tempfile.TemporaryDirectory() as directory:
+            store = PersistentStore(directory)
+            make_fee_tool(ResponseCache(store=store), upstream)("btcusdt")
+
+            restarted = ResponseCache(store=store)
+            result = make_fee_tool(restarted, upstream)("BTCUSDT")
+
+            assert upstream.call_count == 1
+            assert result["metadata"]["cache"] == "fresh"
+            assert restarted.get_stats()["tools"]["get_fees"]["restored"] == 1
+
+            restarted.invalidate("get_fees")
+            make_fee_tool(ResponseCache(store=store), upstream)("BTCUSDT")
+            assert upstream.call_count == 2
+            store.close()
@@ -0,0 +1,364 @@
+"""
+Tests for the RateLimiter class.
+
+This module covers window accounting, expiry, thread safety, request
+weights, header resynchronization and the async-aware acquisition path of the
+sliding-window rate limiter.
+"""
+
+import time
+import asyncio
+import threading
+from unittest.mock import Mock, patch
+
+from binance_mcp_server.rate_limiter import RateLimiter, Reservation, RequestPriority, sync_rate_limits
+from binance_mcp_server.request_weights import get_request_weight
+from binance_mcp_server.utils import rate_limited
+
+
+class TestRateLimiter:
+    """Test cases for the sliding-window RateLimiter."""
+
+    def test_allows_up_to_max_calls(self):
+        """Test that calls are admitted until the window is full."""
+        limiter = RateLimiter(max_calls=3, window=60)
+
+        assert [limiter.can_proceed() for _ in range(4)] == [True, True, True, False]
+        assert limiter.remaining() == 0
+
+    @patch('binance_mcp_server.rate_limiter.time.monotonic')
+    def test_window_expiry(self, mock_monotonic):
+        """Test that calls leave the window after it elapses."""
+        limiter = RateLimiter(max_calls=2, window=10)
+
+        mock_monotonic.return_value = 100.0
+        assert limiter.can_proceed() is True
+        mock_monotonic.return_value = 105.0
+        assert limiter.can_proceed() is True
+        assert limiter.can_proceed() is False
+        assert limiter.time_until_available() == 5.0
+
+        mock_monotonic.return_value = 110.0
+        assert limiter.time_until_available() == 0.0
+        assert limiter.can_proceed() is True
+        assert len(limiter.calls) == 2
+
+    def test_thread_safety(self):
+        """Test that concurrent callers never exceed the budget."""
+        limiter = RateLimiter(max_calls=500, window=60)
+        admitted = []
+        lock = threading.Lock()
+
+        def worker():
+            count = sum(1 for _ in range(200) if limiter.can_proceed())
+            with lock:
+                admitted.append(count)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sum(admitted) == 500
+
+    def test_acquire_async_times_out(self):
+        """Test that acquire_async gives up when the wait exceeds the timeout."""
+        limiter = RateLimiter(max_calls=1, window=60)
+        assert limiter.can_proceed() is True
+
+        assert asyncio.run(limiter.acquire_async(timeout=0.01)) == (None, "deadline")
+
+    def test_acquire_async_waits_for_budget(self):
+        """Test that acquire_async waits for the window to free up."""
+        limiter = RateLimiter(max_calls=1, window=0.05)
+        assert limiter.can_proceed() is True
+
+        reservation, reason = asyncio.run(limiter.acquire_async(timeout=1.0))
+        assert isinstance(reservation, Reservation) and reason is None
+
+        # The handle refunds the charge like one taken by acquire()
+        limiter.refund(reservation)
+        assert limiter.remaining() == 1
+
+    def test_acquire_async_uses_priority_queue(self):
+        """Test that acquire_async respects class reservations instead of polling around them."""
+        limiter = RateLimiter(max_calls=10, window=60, reservations={RequestPriority.ORDER: 0.5})
+        assert limiter.can_proceed(5, RequestPriority.MARKET_DATA) is True
+
+        assert asyncio.run(limiter.acquire_async(1, timeout=0.01)) == (None, "deadline")
+        reservation, _ = asyncio.run(limiter.acquire_async(5, timeout=0.01, priority=RequestPriority.ORDER))
+        assert reservation.klass == RequestPriority.ORDER.value
+
+    def test_weighted_charges(self):
+        """Test that weights are charged against the budget."""
+        limiter = RateLimiter(max_calls=300, window=60)
+
+        assert limiter.can_proceed(250) is True
+        assert limiter.can_proceed(50) is True
+        assert limiter.can_proceed(1) is False
+        assert limiter.remaining() == 0
+
+    def test_oversized_weight_is_clamped(self):
+        """Test that a weight above the whole budget can still run on an empty window."""
+        limiter = RateLimiter(max_calls=100, window=60)
+
+        assert limiter.can_proceed(2400) is True
+        assert limiter.can_proceed(1) is False
+
+    def test_refund(self):
+        """Test that a refunded charge frees its weight."""
+        limiter = RateLimiter(max_calls=10, window=60)
+        limiter.can_proceed(4)
+        reservation, _ = limiter.acquire(6)
+
+        limiter.refund(reservation)
+
+        assert limiter.remaining() == 6
+
+    def test_refund_removes_only_its_own_charge(self):
+        """Test that a refund removes the reserved charge, not a later one of the same weight."""
+        limiter = RateLimiter(max_calls=10, window=60)
+        first, _ = limiter.acquire(2, priority=RequestPriority.ORDER)
+        second, _ = limiter.acquire(2, priority=RequestPriority.ORDER)
+
+        limiter.refund(first)
+        limiter.refund(first)
+
+        assert list(limiter.calls) == [second]
+        assert limiter.remaining() == 8
+
+    @patch('binance_mcp_server.rate_limiter.time.time')
+    def test_sync_used_raises_within_interval(self, mock_time):
+        """Test that server-reported usage raises the local total."""
+        mock_time.return_value = 120.0
+        limiter = RateLimiter(max_calls=6000, window=60)
+        limiter.can_proceed(20)
+
+        limiter.sync_used(500)
+        assert limiter.remaining() == 5500
+
+        # Lower figures inside the same interval are ignored
+        limiter.sync_used(100)
+        assert limiter.remaining() == 5500
+
+    @patch('binance_mcp_server.rate_limiter.time.time')
+    def test_sync_used_resets_on_new_interval(self, mock_time):
+        """Test that a new server interval replaces the local window."""
+        limiter = RateLimiter(max_calls=6000, window=60)
+
+        mock_time.return_value = 120.0
+        limiter.sync_used(5000)
+        mock_time.return_value = 181.0
+        limiter.sync_used(40)
+
+        assert limiter.remaining() == 5960
+
+    @patch('binance_mcp_server.rate_limiter.time.time')
+    def test_sync_used_keeps_class_accounting_on_new_interval(self, mock_time):
+        """Test that a new server interval drops reported usage but keeps local per-class charges."""
+        limiter = RateLimiter(max_calls=1000, window=60, reservations={RequestPriority.ORDER: 0.1})
+
+        mock_time.return_value = 120.0
+        order, _ = limiter.acquire(30, priority=RequestPriority.ORDER)
+        limiter.sync_used(500)
+        mock_time.return_value = 181.0
+        limiter.sync_used(10)
+
+        assert list(limiter.calls) == [order]
+        stats = limiter.get_stats()
+        assert stats["classes"]["ORDER"]["used_weight"] == 30
+        assert stats["classes"]["HISTORY"]["used_weight"] == 0
+
+        # The handle still refunds the charge after the resync
+        limiter.refund(order)
+        assert limiter.remaining() == 1000
+
+    def test_acquire_waits_for_budget(self):
+        """Test that acquire delays the caller until budget frees up."""
+        limiter = RateLimiter(max_calls=1, window=0.05)
+        assert limiter.can_proceed() is True
+
+        admitted, reason = limiter.acquire(timeout=1.0)
+
+        assert isinstance(admitted, Reservation)
+        assert reason is None
+        stats = limiter.get_stats()
+        assert stats["queued"] == 1
+        assert stats["max_wait_seconds"] > 0
+
+    def test_acquire_rejects_unmeetable_deadline(self):
+        """Test that acquire rejects immediately when the deadline cannot be met."""
+        limiter = RateLimiter(max_calls=1, window=60)
+        assert limiter.can_proceed() is True
+
+        assert limiter.acquire(timeout=1.0) == (None, "deadline")
+        assert limiter.get_stats()["rejected_deadline"] == 1
+        assert limiter.get_stats()["queue_depth"] == 0
+
+    def test_acquire_rejects_when_queue_full(self):
+        """Test that the wait queue is bounded."""
+        limiter = RateLimiter(max_calls=1, window=60, max_queue=0)
+        assert limiter.can_proceed() is True
+
+        assert limiter.acquire(timeout=120) == (None, "queue_full")
+
+    def test_acquire_is_fifo(self):
+        """Test that queued callers are admitted in arrival order."""
+        limiter = RateLimiter(max_calls=1, window=0.05)
+        assert limiter.can_proceed() is True
+        order = []
+        lock = threading.Lock()
+
+        def worker(index):
+            if limiter.acquire(timeout=5)[0]:
+                with lock:
+                    order.append(index)
+
+        threads = []
+        for index in range(4):
+            thread = threading.Thread(target=worker, args=(index,))
+            thread.start()
+            threads.append(thread)
+            # Let each worker enqueue before starting the next one
+            while limiter.get_stats()["queue_depth"] < index + 1:
+                time.sleep(0.001)
+        for thread in threads:
+            thread.join()
+
+        assert order == [0, 1, 2, 3]
+        assert limiter.get_stats()["max_queue_depth"] == 4
+
+    def test_can_proceed_does_not_barge_queue(self):
+        """Test that non-waiting callers cannot overtake queued callers."""
+        limiter = RateLimiter(max_calls=1, window=0.2)
+        assert limiter.can_proceed() is True
+        waiter = threading.Thread(target=limiter.acquire, kwargs={"timeout": 5})
+        waiter.start()
+        while limiter.get_stats()["queue_depth"] < 1:
+            time.sleep(0.001)
+
+        assert limiter.can_proceed() is False
+        waiter.join()
+
+
+class TestPriorityLanes:
+    """Test cases for priority classes and reserved capacity."""
+
+    def _limiter(self, window=60):
+        return RateLimiter(
+            max_calls=100,
+            window=window,
+            reservations={RequestPriority.ORDER: 0.2, RequestPriority.ACCOUNT: 0.1}
+        )
+
+    def test_market_data_cannot_consume_reserved_capacity(self):
+        """Test that a market-data burst leaves order and account headroom untouched."""
+        limiter = self._limiter()
+
+        admitted = sum(1 for _ in range(100) if limiter.can_proceed(1, RequestPriority.MARKET_DATA))
+
+        assert admitted == 70
+        assert limiter.can_proceed(1, RequestPriority.ORDER) is True
+        assert limiter.can_proceed(1, RequestPriority.ACCOUNT) is True
+
+    def test_classes_borrow_idle_shared_capacity(self):
+        """Test that a class may exceed its reservation using idle shared capacity."""
+        limiter = self._limiter()
+
+        admitted = sum(1 for _ in range(100) if limiter.can_proceed(1, RequestPriority.ORDER))
+
+        # Everything except the account reservation is available to order entry
+        assert admitted == 90
+
+    def test_reservation_shrinks_as_class_uses_it(self):
+        """Test that a class's own usage counts against its reservation."""
+        limiter = self._limiter()
+        for _ in range(20):
+            assert limiter.can_proceed(1, RequestPriority.ORDER) is True
+
+        admitted = sum(1 for _ in range(100) if limiter.can_proceed(1, RequestPriority.HISTORY))
+
+        assert admitted == 70
+        stats = limiter.get_stats()["classes"]
+        assert stats["ORDER"]["used_weight"] == 20
+        assert stats["HISTORY"]["used_weight"] == 70
+
+    def test_queue_serves_higher_priority_first(self):
+        """Test that a queued order overtakes earlier queued market-data calls."""
+        limiter = RateLimiter(max_calls=1, window=0.1)
+        assert limiter.can_proceed(1, RequestPriority.MARKET_DATA) is True
+        order = []
+        lock = threading.Lock()
+
+        def worker(name, priority):
+            if limiter.acquire(timeout=5, priority=priority)[0]:
+                with lock:
+                    order.append(name)
+
+        threads = []
+        for name, priority in (("md1", RequestPriority.MARKET_DATA),
+                               ("md2", RequestPriority.MARKET_DATA),
+                               ("order", RequestPriority.ORDER)):
+            thread = threading.Thread(target=worker, args=(name, priority))
+            thread.start()
+            threads.append(thread)
+            while limiter.get_stats()["queue_depth"] < len(threads):
+                time.sleep(0.001)
+        for thread in threads:
+            thread.join()
+
+        assert order == ["order", "md1", "md2"]
+
+
+class TestRequestWeights:
+    """Test cases for request weights and header resynchronization."""
+
+    def test_depth_weights(self):
+        """Test that order book weight scales with limit."""
+        assert get_request_weight("depth") == 5
+        assert get_request_weight("depth", limit=500) == 25
+        assert get_request_weight("depth", limit=1000) == 50
+        assert get_request_weight("depth", limit=5000) == 250
+
+    def test_fixed_and_unknown_weights(self):
+        """Test fixed weights and the default for unknown endpoints."""
+        assert get_request_weight("exchangeInfo") == 20
+        assert get_request_weight("ticker/price", symbol="BTCUSDT") == 2
+        assert get_request_weight("ticker/price") == 4
+        assert get_request_weight("unknown") == 1
+
+    def test_sync_rate_limits_routes_headers(self):
+        """Test that usage headers update the limiter for the matching API family."""
+        spot = RateLimiter(max_calls=6000, window=60)
+        futures = RateLimiter(max_calls=2400, window=60)
+        headers = (
+            ("/api/", "X-MBX-USED-WEIGHT-1M", spot),
+            ("/fapi/", "X-MBX-USED-WEIGHT-1M", futures),
+        )
+        response = Mock(
+            url="https://api.binance.com/api/v3/depth?symbol=BTCUSDT",
+            headers={"X-MBX-USED-WEIGHT-1M": "1200"}
+        )
+
+        with patch('binance_mcp_server.rate_limiter._USAGE_HEADERS', headers):
+            sync_rate_limits(response)
+
+        assert spot.remaining() == 4800
+        assert futures.remaining() == 2400
+
+    def test_rate_limited_charges_endpoint_weight(self):
+        """Test that the decorator charges the weight derived from call arguments."""
+        limiter = RateLimiter(max_calls=300, window=60)
+
+        @rate_limited(limiter, endpoint="depth")
+        def fetch(symbol, limit=None):
+            return {"success": True}
+
+        assert fetch("BTCUSDT", limit=5000)["success"] is True
+        assert limiter.remaining() == 50
+
+        result = fetch("BTCUSDT", limit=5000)
+        assert result["success"] is False
+        assert result["error"]["type"] == "rate_limit_exceeded"
+        assert result["error"]["details"]["retry_after"] > 0
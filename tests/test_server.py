@@ -1 +1,100 @@
-# validators.py
\ No newline at end of file
+"""
+Tests for the MCP server tool layer.
+
+This module verifies that tools are exposed as coroutines and that blocking
+tool implementations run on the shared worker pool instead of the event loop,
+and that both entry points load .env and start the background streams.
+"""
+
+import os
+import sys
+import asyncio
+import inspect
+import subprocess
+import threading
+from unittest.mock import patch
+
+from binance_mcp_server import server
+from binance_mcp_server.utils import run_tool
+
+
+class TestAsyncToolLayer:
+    """Test cases for the async tool layer."""
+
+    def test_tools_are_coroutines(self):
+        """Test that every registered tool is an async function."""
+        for name in ("get_ticker_price", "get_order_book", "get_balance", "create_order"):
+            assert inspect.iscoroutinefunction(getattr(server, name))
+
+    def test_run_tool_executes_off_event_loop(self):
+        """Test that run_tool executes the implementation in a worker thread."""
+        def blocking_tool(value, suffix=""):
+            return {"success": True, "data": f"{value}{suffix}", "thread": threading.get_ident()}
+
+        async def call():
+            return await run_tool(blocking_tool, "BTC", suffix="USDT"), threading.get_ident()
+
+        result, loop_thread = asyncio.run(call())
+
+        assert result["data"] == "BTCUSDT"
+        assert result["thread"] != loop_thread
+
+    def test_concurrent_tool_calls_overlap(self):
+        """Test that several slow tool calls are in flight at the same time."""
+        barrier = threading.Barrier(4, timeout=5)
+
+        def slow_tool():
+            barrier.wait()
+            return {"success": True}
+
+        async def call_all():
+            return await asyncio.gather(*(run_tool(slow_tool) for _ in range(4)))
+
+        results = asyncio.run(call_all())
+        assert all(result["success"] for result in results)
+
+    @patch('binance_mcp_server.tools.get_ticker_price.get_ticker_price')
+    def test_server_tool_delegates_to_module(self, mock_impl):
+        """Test that the server tool awaits the tool module implementation."""
+        mock_impl.return_value = {"success": True, "data": {"symbol": "BTCUSDT", "price": 1.0}}
+
+        result = asyncio.run(server.get_ticker_price("BTCUSDT"))
+
+        assert result["success"] is True
+        mock_impl.assert_called_once_with("BTCUSDT")
+
+
+class TestEntryPoints:
+    """Test cases for the server entry points."""
+
+    def test_cli_starts_background_streams(self):
+        """Test that the console script starts the depth, ticker and user streams."""
+        from typer.testing import CliRunner
+        from binance_mcp_server.cli import app
+
+        with patch("binance_mcp_server.order_book.start_depth_streams") as depth, \
+             patch("binance_mcp_server.ticker_cache.start_ticker_streams") as tickers, \
+             patch("binance_mcp_server.account_state.start_user_streams") as users, \
+             patch("binance_mcp_server.cli.mcp.run") as run, \
+             patch.dict("os.environ"):
+            result = CliRunner().invoke(app, ["--api-key", "key", "--api-secret", "secret"])
+
+        assert result.exit_code == 0, result.output
+        depth.assert_called_once_with()
+        tickers.assert_called_once_with()
+        users.assert_called_once_with()
+        run.assert_called_once_with(transport="stdio")
+
+    def test_dotenv_loaded_before_global_instances(self):
+        """Test that .env settings reach configuration read when modules are imported."""
+        script = (
+            "import os, dotenv\n"
+            "dotenv.load_dotenv = lambda *args, **kwargs: os.environ.update(BINANCE_REQUEST_WEIGHT_LIMIT='1234')\n"
+            "from binance_mcp_server.rate_limiter import binance_rate_limiter\n"
+            "print(binance_rate_limiter.max_calls)\n"
+        )
+        env = {key: value for key, value in os.environ.items() if not key.startswith("BINANCE_")}
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, env=env, timeout=60)
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "1234"
@@ -0,0 +1,126 @@
+"""
+Tests for compiled symbol filters and local pre-trade validation.
+
+This module verifies Decimal filter checks, auto-quantization, that
+create_order rejects violating orders without calling the API or spending
+order-rate budget, and that average-price filters only produce warnings.
+"""
+
+from decimal import Decimal
+from unittest.mock import Mock, patch
+
+from binance_mcp_server.symbol_filters import SymbolFilters
+from binance_mcp_server.rate_limiter import binance_rate_limiter
+from binance_mcp_server.tools.create_order import create_order
+
+
+BTCUSDT = {
+    "symbol": "BTCUSDT",
+    "status": "TRADING",
+    "filters": [
+        {"filterType": "PRICE_FILTER", "minPrice": "0.01000000", "maxPrice": "1000000.00000000", "tickSize": "0.01000000"},
+        {"filterType": "LOT_SIZE", "minQty": "0.00001000", "maxQty": "9000.00000000", "stepSize": "0.00001000"},
+        {"filterType": "MARKET_LOT_SIZE", "minQty": "0.00000000", "maxQty": "100.00000000", "stepSize": "0.00000000"},
+        {"filterType": "NOTIONAL", "minNotional": "5.00000000", "applyMinToMarket": True,
+         "maxNotional": "9000000.00000000", "applyMaxToMarket": False, "avgPriceMins": 5},
+        {"filterType": "PERCENT_PRICE_BY_SIDE", "bidMultiplierUp": "5", "bidMultiplierDown": "0.2",
+         "askMultiplierUp": "5", "askMultiplierDown": "0.2", "avgPriceMins": 5},
+    ],
+}
+
+FILTERS = SymbolFilters(BTCUSDT)
+
+
+def violated(violations):
+    return [v["filter"] for v in violations]
+
+
+class TestSymbolFilters:
+    """Test cases for SymbolFilters."""
+
+    def test_valid_limit_order_passes(self):
+        """Test that an on-grid order within all bounds has no violations."""
+        assert FILTERS.check("BUY", False, Decimal("0.001"), Decimal("50000.01")) == []
+
+    def test_grid_and_notional_violations(self):
+        """Test tick size, step size and min notional violations."""
+        violations = FILTERS.check("BUY", False, Decimal("0.000015"), Decimal("50000.005"))
+        assert violated(violations) == ["PRICE_FILTER", "LOT_SIZE", "NOTIONAL"]
+
+    def test_market_order_notional_is_advisory(self):
+        """Test that market notional is only estimated from the reference price, as a warning."""
+        assert violated(FILTERS.advise("SELL", True, Decimal("0.00005"), None, Decimal("50000"))) == ["NOTIONAL"]
+        assert violated(FILTERS.check("SELL", True, Decimal("200"), None)) == ["MARKET_LOT_SIZE"]
+        assert FILTERS.check("SELL", True, Decimal("0.00005"), None) == []
+        assert FILTERS.advise("SELL", True, Decimal("0.00005"), None, None) == []
+
+    def test_percent_price_by_side_is_advisory(self):
+        """Test that limit prices far from the market price produce warnings, not violations."""
+        assert violated(FILTERS.advise("BUY", False, Decimal("1"), Decimal("5000.00"), Decimal("50000"))) == ["PERCENT_PRICE"]
+        assert FILTERS.check("BUY", False, Decimal("1"), Decimal("5000.00")) == []
+        assert FILTERS.advise("BUY", False, Decimal("1"), Decimal("50000.00"), Decimal("50000")) == []
+
+    def test_quantize_never_worsens_the_order(self):
+        """Test that quantities round down and prices round towards the order's favour."""
+        assert FILTERS.quantize_quantity(Decimal("0.0012345")) == Decimal("0.00123")
+        assert FILTERS.quantize_price(Decimal("50000.019"), "BUY") == Decimal("50000.01")
+        assert FILTERS.quantize_price(Decimal("50000.011"), "SELL") == Decimal("50000.02")
+
+
+class TestCreateOrderPreTradeValidation:
+    """Test cases for local validation in create_order."""
+
+    @patch('binance_mcp_server.tools.create_order.get_binance_client')
+    @patch('binance_mcp_server.tools.create_order.symbol_filter_index')
+    @patch('binance_mcp_server.tools.create_order._check_symbol_tradable', return_value=None)
+    def test_violating_order_is_rejected_locally(self, _, mock_index, mock_get_client):
+        """Test that a violating order never reaches the API or the order-rate budget."""
+        mock_index.get.return_value = FILTERS
+        client = Mock()
+        mock_get_client.return_value = client
+
+        with patch.object(binance_rate_limiter, "acquire") as acquire:
+            result = create_order("BTCUSDT", "BUY", "LIMIT", 0.0000155, 50000.005)
+
+        assert result["success"] is False
+        assert result["error"]["type"] == "validation_error"
+        assert violated(result["error"]["details"]["violations"]) == ["PRICE_FILTER", "LOT_SIZE", "NOTIONAL"]
+        acquire.assert_not_called()
+        client.create_order.assert_not_called()
+
+    @patch('binance_mcp_server.tools.create_order.get_binance_client')
+    @patch('binance_mcp_server.tools.create_order.symbol_filter_index')
+    @patch('binance_mcp_server.tools.create_order._check_symbol_tradable', return_value=None)
+    def test_auto_quantize_sends_on_grid_values(self, _, mock_index, mock_get_client):
+        """Test that auto_quantize rounds onto the grids and sends exact decimal strings."""
+        mock_index.get.return_value = FILTERS
+        client = Mock(create_order=Mock(return_value={"orderId": 1}))
+        mock_get_client.return_value = client
+
+        result = create_order("BTCUSDT", "BUY", "LIMIT", 0.0012345, 50000.019, auto_quantize=True)
+
+        assert result["success"] is True
+        kwargs = client.create_order.call_args.kwargs
+        assert kwargs["quantity"] == "0.00123"
+        assert kwargs["price"] == "50000.01"
+
+    @patch('binance_mcp_server.tools.create_order.get_binance_client')
+    @patch('binance_mcp_server.tools.create_order.ticker_cache')
+    @patch('binance_mcp_server.tools.create_order.symbol_filter_index')
+    @patch('binance_mcp_server.tools.create_order._check_symbol_tradable', return_value=None)
+    def test_average_price_filters_only_warn(self, _, mock_index, mock_ticker_cache, mock_get_client):
+        """Test that a market order below the estimated notional is still sent, with a warning."""
+        mock_index.get.return_value = FILTERS
+        mock_ticker_cache.get_price.return_value = 50000.0
+        client = Mock(create_order=Mock(return_value={"orderId": 1}))
+        mock_get_client.return_value = client
+
+        with patch.object(binance_rate_limiter, "acquire", return_value=(True, "")) as acquire:
+            result = create_order("BTCUSDT", "SELL", "MARKET", 0.00005)
+
+        assert result["success"] is True
+        assert violated(result["metadata"]["warnings"]) == ["NOTIONAL"]
+        client.create_order.assert_called_once()
+        # Local validation runs once per call
+        assert mock_index.get.call_count == 1
+        acquire.assert_called_once()
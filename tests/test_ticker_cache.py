@@ -0,0 +1,85 @@
+"""
+Tests for the live ticker cache.
+
+This module verifies stream message handling, staleness bounds and that the
+ticker tools are served from the cache without REST requests.
+"""
+
+from unittest.mock import patch
+
+from binance_mcp_server.rate_limiter import binance_rate_limiter
+from binance_mcp_server.ticker_cache import TickerCache
+from binance_mcp_server.tools.get_ticker import get_ticker
+from binance_mcp_server.tools.get_ticker_price import get_ticker_price
+
+
+MINI_TICKERS = [
+    {"e": "24hrMiniTicker", "E": 1700000000000, "s": "BTCUSDT", "c": "43000.0", "o": "42000.0",
+     "h": "43500.0", "l": "41800.0", "v": "100.0", "q": "4250000.0"},
+]
+
+BOOK_TICKER = {"u": 400900217, "s": "BTCUSDT", "b": "42999.5", "B": "1.2", "a": "43000.5", "A": "0.8"}
+
+
+def live_cache():
+    cache = TickerCache(max_age=5)
+    cache.on_mini_tickers(MINI_TICKERS)
+    cache.on_book_ticker(BOOK_TICKER)
+    return cache
+
+
+class TestTickerCache:
+    """Test cases for TickerCache."""
+
+    def test_ticker_derived_from_streams(self):
+        """Test that 24h statistics are derived from the mini and book tickers."""
+        ticker = live_cache().get_ticker("BTCUSDT")
+
+        assert ticker["last_price"] == 43000.0
+        assert ticker["price_change"] == 1000.0
+        assert ticker["weighted_avg_price"] == 42500.0
+        assert ticker["bid_price"] == 42999.5
+        assert ticker["count"] is None
+
+    @patch('binance_mcp_server.ticker_cache.time.monotonic')
+    def test_stale_stream_is_not_served(self, mock_monotonic):
+        """Test that data older than max_age is treated as a miss."""
+        mock_monotonic.return_value = 100.0
+        cache = live_cache()
+        assert cache.get_price("BTCUSDT") == 43000.0
+
+        mock_monotonic.return_value = 106.0
+        assert cache.get_price("BTCUSDT") is None
+        assert cache.get_prices(["BTCUSDT"]) is None
+        assert cache.get_ticker("BTCUSDT") is None
+
+    def test_ticker_requires_book_data(self):
+        """Test that get_ticker misses until the book ticker has been seen."""
+        cache = TickerCache(max_age=5)
+        cache.on_mini_tickers(MINI_TICKERS)
+
+        assert cache.get_price("BTCUSDT") == 43000.0
+        assert cache.get_ticker("BTCUSDT") is None
+        assert cache.get_prices(["BTCUSDT", "ETHUSDT"]) is None
+
+    @patch('binance_mcp_server.tools.get_ticker_price.get_binance_client')
+    def test_ticker_price_served_from_cache(self, mock_get_client):
+        """Test that get_ticker_price skips REST and rate limiting on a hit."""
+        with patch('binance_mcp_server.tools.get_ticker_price.ticker_cache', live_cache()), \
+                patch.object(binance_rate_limiter, "acquire") as mock_acquire:
+            result = get_ticker_price("btcusdt")
+
+        assert result["data"] == {"symbol": "BTCUSDT", "price": 43000.0}
+        assert result["metadata"]["source"] == "ticker_stream"
+        mock_get_client.assert_not_called()
+        mock_acquire.assert_not_called()
+
+    @patch('binance_mcp_server.tools.get_ticker.get_binance_client')
+    def test_ticker_falls_back_to_rest(self, mock_get_client):
+        """Test that get_ticker uses REST when the cache has no data."""
+        mock_get_client.return_value.get_ticker.side_effect = Exception("REST called")
+
+        with patch('binance_mcp_server.tools.get_ticker.ticker_cache', TickerCache()):
+            result = get_ticker("BTCUSDT")
+
+        assert "REST called" in result["error"]["message"]
@@ -0,0 +1,160 @@
+"""
+Tests for the create_orders batch tool.
+
+This module verifies local validation of the whole batch (including futures
+exchange filters), futures batchOrders chunking with per-order outcomes,
+parallel spot submission, and that failed submissions keep the other outcomes.
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+from requests.exceptions import ReadTimeout
+
+from binance_mcp_server.exchange_info import ExchangeInfoIndex, futures_exchange_info_cache
+from binance_mcp_server.tools.create_orders import create_orders
+
+
+FUTURES_INFO = {
+    "symbols": [{
+        "symbol": "BTCUSDT",
+        "status": "TRADING",
+        "baseAsset": "BTC",
+        "quoteAsset": "USDT",
+        "filters": [
+            {"filterType": "PRICE_FILTER", "minPrice": "556.80", "maxPrice": "4529764", "tickSize": "0.10"},
+            {"filterType": "LOT_SIZE", "minQty": "0.001", "maxQty": "1000", "stepSize": "0.001"},
+            {"filterType": "MARKET_LOT_SIZE", "minQty": "0.001", "maxQty": "120", "stepSize": "0.001"},
+            {"filterType": "MIN_NOTIONAL", "notional": "50"},
+        ],
+    }],
+}
+
+
+@pytest.fixture(autouse=True)
+def futures_exchange_info():
+    """Serve futures exchange information without a request."""
+    index = ExchangeInfoIndex(FUTURES_INFO, "futures-digest", 1)
+    with patch.object(futures_exchange_info_cache, "get", return_value=index):
+        yield
+
+
+def grid(count, order_type="LIMIT"):
+    """Build a simple BUY ladder."""
+    return [
+        {"symbol": "BTCUSDT", "side": "BUY", "order_type": order_type, "quantity": 0.001, "price": 60000 - i * 100}
+        for i in range(count)
+    ]
+
+
+class TestCreateOrders:
+    """Test cases for the create_orders function."""
+
+    @patch('binance_mcp_server.tools.create_orders.get_binance_client')
+    def test_invalid_order_blocks_batch(self, mock_get_client):
+        """Test that with all_or_none nothing is submitted when one order is invalid."""
+        orders = grid(3)
+        orders[1]["side"] = "HOLD"
+
+        result = create_orders(orders, market="futures")
+
+        assert result["success"] is False
+        assert result["error"]["type"] == "validation_error"
+        assert [r["index"] for r in result["error"]["details"]["results"]] == [1]
+        mock_get_client.assert_not_called()
+
+    @patch('binance_mcp_server.tools.create_orders.get_binance_client')
+    def test_futures_orders_are_chunked_into_batches(self, mock_get_client):
+        """Test that futures orders go out in batchOrders requests of at most 5."""
+        client = Mock()
+
+        def place(batchOrders):
+            return [
+                {"code": -2019, "msg": "Margin is insufficient."} if entry["price"] == "59400" else {"orderId": 1}
+                for entry in batchOrders
+            ]
+
+        client.futures_place_batch_order.side_effect = place
+        mock_get_client.return_value = client
+
+        result = create_orders(grid(7), market="futures")
+
+        assert result["success"] is True
+        sizes = sorted(len(call.kwargs["batchOrders"]) for call in client.futures_place_batch_order.call_args_list)
+        assert sizes == [2, 5]
+        assert result["data"]["submitted"] == 7
+        assert result["data"]["succeeded"] == 6
+        failed = [r for r in result["data"]["results"] if not r["success"]]
+        assert [r["index"] for r in failed] == [6]
+        assert "Margin is insufficient" in failed[0]["error"]["message"]
+        assert [r["index"] for r in result["data"]["results"]] == list(range(7))
+
+    @patch('binance_mcp_server.tools.create_orders.expire_history')
+    @patch('binance_mcp_server.tools.create_orders.invalidate_cache')
+    @patch('binance_mcp_server.tools.create_orders._place_order')
+    @patch('binance_mcp_server.tools.create_orders._prepare_order')
+    def test_spot_orders_submitted_individually(self, mock_prepare, mock_place, mock_invalidate, mock_expire):
+        """Test that spot orders are validated once, then placed one by one with outcomes in input order."""
+        mock_prepare.side_effect = lambda symbol, side, order_type, quantity, price=None, auto_quantize=False: (
+            {"symbol": symbol, "side": side, "type": order_type, "quantity": quantity, "price": price}, [], None
+        )
+        mock_place.side_effect = lambda **params: {"price": params["price"]}
+
+        result = create_orders(grid(4), max_concurrency=2)
+
+        assert result["success"] is True
+        assert mock_prepare.call_count == mock_place.call_count == 4
+        assert [r["order"]["price"] for r in result["data"]["results"]] == [60000, 59900, 59800, 59700]
+        assert all(r["elapsed_ms"] >= 0 for r in result["data"]["results"])
+        mock_invalidate.assert_called_with("get_balance")
+        mock_expire.assert_called_with("orders", "BTCUSDT")
+
+    @patch('binance_mcp_server.tools.create_orders.get_binance_client')
+    def test_futures_orders_checked_against_exchange_filters(self, mock_get_client):
+        """Test that futures orders are validated against the futures symbol filters."""
+        orders = grid(3)
+        orders[0]["price"] = 60000.05
+        orders[1]["quantity"] = 0.0005
+        orders[2]["symbol"] = "NOPEUSDT"
+
+        result = create_orders(orders, market="futures", all_or_none=False)
+
+        assert result["data"]["submitted"] == 0
+        errors = [r["error"]["message"] for r in result["data"]["results"]]
+        assert "tick size" in errors[0]
+        assert "LOT_SIZE" in str(result["data"]["results"][1]["error"]["details"]) and "notional" in errors[1]
+        assert "not listed" in errors[2]
+        mock_get_client.assert_not_called()
+
+        client = mock_get_client.return_value
+        client.futures_place_batch_order.side_effect = lambda batchOrders: [{"orderId": 1} for _ in batchOrders]
+        quantized = create_orders(orders[:1], market="futures", auto_quantize=True)
+        assert quantized["data"]["succeeded"] == 1
+        assert client.futures_place_batch_order.call_args.kwargs["batchOrders"][0]["price"] == "60000"
+
+    @patch('binance_mcp_server.tools.create_orders.get_binance_client')
+    def test_timed_out_batch_keeps_other_outcomes(self, mock_get_client):
+        """Test that a network failure marks only its own batch as status unknown."""
+        client = Mock()
+
+        def place(batchOrders):
+            if len(batchOrders) < 5:
+                raise ReadTimeout("read timed out")
+            return [{"orderId": 1} for _ in batchOrders]
+
+        client.futures_place_batch_order.side_effect = place
+        mock_get_client.return_value = client
+
+        result = create_orders(grid(7), market="futures")
+
+        assert result["success"] is True
+        assert result["data"]["succeeded"] == 5
+        unknown = [r for r in result["data"]["results"] if not r["success"]]
+        assert [r["index"] for r in unknown] == [5, 6]
+        assert all(r["error"]["type"] == "order_status_unknown" for r in unknown)
+
+    def test_batch_size_limit(self):
+        """Test that oversized batches are rejected."""
+        result = create_orders(grid(51))
+
+        assert result["success"] is False
+        assert "at most 50" in result["error"]["message"]
@@ -0,0 +1,76 @@
+"""
+Tests for the get_order_book_analytics tool.
+
+This module verifies depth within price bands, fill simulation and imbalance
+computed from array-backed price ladders.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from binance_mcp_server.order_book import PriceLadder
+from binance_mcp_server.tools.get_order_book_analytics import get_order_book_analytics
+
+
+ORDER_BOOK = {
+    "lastUpdateId": 1027024,
+    "bids": [["4.00", "10"], ["3.99", "5"], ["3.98", "1"]],
+    "asks": [["4.01", "2"], ["4.02", "3"]],
+}
+
+
+class TestPriceLadderAnalytics:
+    """Test cases for ladder analytics."""
+
+    def test_unsorted_levels_are_sorted(self):
+        """Test that out-of-order input is sorted best first."""
+        ladder = PriceLadder.from_levels([["3.98", "1"], ["4.00", "10"], ["3.99", "5"]], descending=True)
+
+        assert [price for price, _ in ladder.top()] == [4.0, 3.99, 3.98]
+
+    def test_fill_beyond_visible_depth(self):
+        """Test that a fill larger than the book is reported as incomplete."""
+        ladder = PriceLadder.from_levels(ORDER_BOOK["bids"], descending=True)
+
+        fill = ladder.fill(20)
+
+        assert fill["complete"] is False
+        assert fill["filledQuantity"] == 16
+        assert fill["worstPrice"] == 3.98
+        assert fill["levelsConsumed"] == 3
+
+
+class TestGetOrderBookAnalytics:
+    """Test cases for the get_order_book_analytics function."""
+
+    @patch('binance_mcp_server.tools.get_order_book_analytics.get_binance_client')
+    def test_bands_fill_and_imbalance(self, mock_get_client):
+        """Test band depth, buy fill and imbalance on a REST snapshot."""
+        mock_get_client.return_value.get_order_book.return_value = ORDER_BOOK
+
+        result = get_order_book_analytics("BTCUSDT", bands_bps=[50], size=3)
+
+        assert result["success"] is True
+        data = result["data"]
+        assert data["midPrice"] == pytest.approx(4.005)
+        band = data["bands"][0]
+        assert band["bidQuantity"] == 15
+        assert band["bidNotional"] == pytest.approx(59.95)
+        assert band["askQuantity"] == 5
+        assert band["imbalance"] == pytest.approx(0.5)
+        buy = data["fill"]["buy"]
+        assert buy["vwap"] == pytest.approx(12.04 / 3)
+        assert buy["worstPrice"] == 4.02
+        assert buy["complete"] is True
+        assert buy["slippageBps"] > 0
+        mock_get_client.return_value.get_order_book.assert_called_once_with(symbol="BTCUSDT", limit=500)
+
+    @patch('binance_mcp_server.tools.get_order_book_analytics.get_binance_client')
+    def test_parameter_validation(self, mock_get_client):
+        """Test that invalid bands and sizes are rejected before any request."""
+        for kwargs in ({"bands_bps": []}, {"bands_bps": [-5]}, {"size": 0}, {"limit": 0}):
+            result = get_order_book_analytics("BTCUSDT", **kwargs)
+            assert result["success"] is False
+            assert result["error"]["type"] == "validation_error"
+
+        mock_get_client.assert_not_called()
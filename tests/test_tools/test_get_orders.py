@@ -0,0 +1,78 @@
+"""
+Tests for paginated get_orders.
+
+This module verifies that order history is walked across 24h windows and
+orderId pages, that cursors resume exactly where the previous page stopped,
+and that limits and field projection are applied.
+"""
+
+from unittest.mock import Mock, patch
+
+from binance_mcp_server.rate_limiter import binance_rate_limiter
+from binance_mcp_server.tools.get_orders import get_orders, WINDOW_MS
+
+
+START = 1_700_000_000_000
+DAY = WINDOW_MS
+
+# 40 orders in bursts separated by long quiet periods (spanning ~300 days)
+HISTORY = [
+    {"symbol": "BTCUSDT", "orderId": 100 + i, "status": "FILLED", "side": "BUY",
+     "time": START + (i // 10) * 100 * DAY + i * 1000}
+    for i in range(40)
+]
+
+
+def fake_all_orders(symbol, orderId=None, startTime=None, endTime=None, limit=500):
+    """Emulate allOrders: ascending from orderId, or within a window of at most 24h."""
+    if orderId is not None:
+        matches = [o for o in HISTORY if o["orderId"] >= orderId]
+    else:
+        assert endTime - startTime < DAY
+        matches = [o for o in HISTORY if startTime <= o["time"] <= endTime]
+    return [dict(o) for o in matches[:limit]]
+
+
+def fetch_all(**kwargs):
+    """Follow cursors until history is exhausted; returns (orders, calls)."""
+    client = Mock()
+    client.get_all_orders.side_effect = fake_all_orders
+    orders, calls = [], 0
+    with patch("binance_mcp_server.tools.get_orders.get_binance_client", return_value=client), \
+         patch.object(binance_rate_limiter, "acquire", return_value=(True, "")):
+        result = get_orders("BTCUSDT", start_time=START, end_time=START + 365 * DAY, **kwargs)
+        while True:
+            assert result["success"], result
+            calls += 1
+            orders.extend(result["data"]["orders"])
+            if not result["data"]["has_more"]:
+                return orders, calls
+            result = get_orders("BTCUSDT", cursor=result["data"]["next_cursor"], **kwargs)
+
+
+class TestGetOrdersPagination:
+    """Test cases for paginated order history."""
+
+    def test_year_of_history_paged_with_cursor(self):
+        orders, calls = fetch_all(limit=7)
+
+        assert [o["orderId"] for o in orders] == [o["orderId"] for o in HISTORY]
+        assert calls == 6
+
+    def test_field_projection(self):
+        orders, _ = fetch_all(limit=100, fields=["orderId", "status"])
+
+        assert len(orders) == 40
+        assert orders[0] == {"orderId": 100, "status": "FILLED"}
+
+    def test_cursor_rejected_for_other_symbol(self):
+        client = Mock()
+        client.get_all_orders.side_effect = fake_all_orders
+        with patch("binance_mcp_server.tools.get_orders.get_binance_client", return_value=client), \
+             patch.object(binance_rate_limiter, "acquire", return_value=(True, "")):
+            first = get_orders("BTCUSDT", start_time=START, limit=5)
+            other = get_orders("ETHUSDT", cursor=first["data"]["next_cursor"])
+
+        assert first["data"]["count"] == 5
+        assert not other["success"]
+        assert other["error"]["type"] == "validation_error"
@@ -0,0 +1,135 @@
+"""
+Tests for get_pnl.
+
+This module verifies that income records are synced into the history store
+incrementally (paging full windows by time), that repeated queries only fetch
+new records, and that realized, funding, commission and unrealized PnL are
+broken down per symbol, per asset and per day.
+"""
+
+import time
+import tempfile
+from unittest.mock import Mock, patch
+
+from binance_mcp_server.history_store import HistoryStore, now_ms
+from binance_mcp_server.rate_limiter import futures_rate_limiter
+from binance_mcp_server.tools import get_pnl as get_pnl_module
+
+
+DAY = 24 * 60 * 60 * 1000
+HOUR = 60 * 60 * 1000
+
+
+def income(tran_id, income_type, amount, at, symbol="BTCUSDT", asset="USDT"):
+    return {"symbol": symbol, "incomeType": income_type, "income": amount, "asset": asset,
+            "time": at, "tranId": tran_id, "info": "", "tradeId": ""}
+
+
+class FakeIncome:
+    """/fapi/v1/income over an in-memory record list, oldest first."""
+
+    def __init__(self, records):
+        self.records = records
+        self.calls = []
+
+    def __call__(self, startTime, endTime, limit):
+        self.calls.append((startTime, endTime))
+        matches = sorted((r for r in self.records if startTime <= r["time"] <= endTime), key=lambda r: r["time"])
+        return [dict(r) for r in matches[:limit]]
+
+
+def make_client(records, positions):
+    client = Mock()
+    client.futures_income_history.side_effect = FakeIncome(records)
+    client.futures_position_information.return_value = positions
+    client.futures_mark_price.return_value = [{"symbol": "BTCUSDT", "markPrice": "41000"}]
+    return client
+
+
+def call(client, store, **kwargs):
+    with patch.object(get_pnl_module.income_history, "store", store), \
+         patch("binance_mcp_server.tools.get_pnl.get_binance_client", return_value=client), \
+         patch("binance_mcp_server.tools.get_position_info.get_binance_client", return_value=client), \
+         patch.object(futures_rate_limiter, "acquire", return_value=(True, "")):
+        return get_pnl_module.get_pnl(**kwargs)
+
+
+class TestGetPnl:
+    """Test cases for get_pnl."""
+
+    def test_income_is_synced_incrementally(self):
+        start = now_ms() - 3 * DAY
+        # 1500 funding records in one window need a second, time-advanced page
+        records = [income(i, "FUNDING_FEE", "-0.01", start + i * 60 * 1000) for i in range(1500)]
+        client = make_client(records, [])
+
+        with tempfile.TemporaryDirectory() as directory:
+            store = HistoryStore(directory)
+            with patch.object(get_pnl_module.income_history, "sync_interval", 0):
+                first = call(client, store, start_time=start)
+                time.sleep(0.005)
+                records.append(income(9999, "REALIZED_PNL", "25.5", now_ms()))
+                second = call(client, store, start_time=start)
+            with patch.object(get_pnl_module.income_history, "sync_interval", 3600):
+                third = call(client, store, start_time=start)
+            store.close()
+
+        assert first["data"]["requests"] == 2
+        assert first["data"]["income_records"] == 1500
+        assert first["data"]["totals"]["USDT"]["funding_fee"] == -15.0
+        # Only the records since the previous sync are fetched again
+        assert second["data"]["requests"] == 1
+        assert client.futures_income_history.side_effect.calls[-1][0] > start + 1499 * 60 * 1000
+        assert second["data"]["totals"]["USDT"]["realized_pnl"] == 25.5
+        assert third["data"]["requests"] == 0
+        assert third["data"]["income_records"] == 1501
+
+    def test_breakdown_per_symbol_asset_and_day(self):
+        start = now_ms() - 2 * DAY
+        records = [
+            income(1, "REALIZED_PNL", "100", start + HOUR),
+            income(1, "COMMISSION", "-0.01", start + HOUR, asset="BNB"),
+            income(2, "FUNDING_FEE", "-2", start + DAY + HOUR),
+            income(3, "REALIZED_PNL", "-30", start + DAY + HOUR, symbol="ETHUSDT"),
+            income(4, "TRANSFER", "1000", start + 2 * HOUR, symbol=""),
+        ]
+        positions = [
+            {"symbol": "BTCUSDT", "positionAmt": "0.5", "entryPrice": "40000", "markPrice": "40500"},
+            {"symbol": "ETHUSDT", "positionAmt": "0", "entryPrice": "0", "markPrice": "2000"},
+        ]
+        client = make_client(records, positions)
+
+        result = call(client, None, start_time=start)
+
+        assert result["success"]
+        data = result["data"]
+        assert data["income_records"] == 4
+        assert data["totals"]["USDT"] == {
+            "realized_pnl": 70.0, "funding_fee": -2.0, "commission": 0.0, "unrealized_pnl": 250.0, "net": 318.0
+        }
+        assert data["totals"]["BNB"]["commission"] == -0.01
+        btc = next(row for row in data["by_symbol"] if row["symbol"] == "BTCUSDT" and row["asset"] == "USDT")
+        assert (btc["unrealized_pnl"], btc["mark_price"]) == (250.0, 40500.0)
+        assert len(data["by_day"]) == len({(row["date"], row["asset"]) for row in data["by_day"]}) >= 3
+        assert "unrealized_pnl" not in data["by_day"][0]
+
+        only_eth = call(client, None, symbol="ethusdt", start_time=start)
+        assert [row["symbol"] for row in only_eth["data"]["by_symbol"]] == ["ETHUSDT"]
+        assert only_eth["data"]["totals"]["USDT"]["net"] == -30.0
+
+    def test_single_stream_position_fetches_one_mark_price(self):
+        start = now_ms() - DAY
+        client = make_client([income(1, "REALIZED_PNL", "5", start + HOUR)], [])
+        client.futures_mark_price.return_value = {"symbol": "BTCUSDT", "markPrice": "41000"}
+        positions = {
+            "success": True,
+            "data": [{"symbol": "BTCUSDT", "positionAmt": "0.5", "entryPrice": "40000", "markPrice": "39000"}],
+            "metadata": {"source": "user_data_stream"},
+        }
+
+        with patch("binance_mcp_server.tools.get_pnl.get_position_info", return_value=positions):
+            result = call(client, None, start_time=start)
+
+        client.futures_mark_price.assert_called_once_with(symbol="BTCUSDT")
+        assert result["metadata"]["mark_price_source"] == "premium_index"
+        assert result["data"]["totals"]["USDT"]["unrealized_pnl"] == 500.0
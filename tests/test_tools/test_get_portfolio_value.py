@@ -0,0 +1,77 @@
+"""
+Tests for get_portfolio_value.
+
+This module verifies that balances are valued from one bulk price request,
+that assets without a direct market are converted through intermediate
+assets, and that weights and totals are consistent.
+"""
+
+from unittest.mock import Mock, patch
+
+from binance_mcp_server.exchange_info import ExchangeInfoIndex
+from binance_mcp_server.tools.get_portfolio_value import get_portfolio_value
+
+
+def symbol(name, base, quote, status="TRADING"):
+    return {"symbol": name, "status": status, "baseAsset": base, "quoteAsset": quote}
+
+
+INDEX = ExchangeInfoIndex({"symbols": [
+    symbol("BTCUSDT", "BTC", "USDT"),
+    symbol("ETHUSDT", "ETH", "USDT"),
+    symbol("XYZBTC", "XYZ", "BTC"),
+    symbol("XYZETH", "XYZ", "ETH"),
+    symbol("USDTBRL", "USDT", "BRL"),
+    symbol("OLDUSDT", "OLD", "USDT", status="BREAK"),
+]}, "digest", 1)
+
+BALANCES = {
+    "BTC": {"free": 0.1, "locked": 0.0},
+    "XYZ": {"free": 1000.0, "locked": 500.0},
+    "USDT": {"free": 100.0, "locked": 0.0},
+    "BRL": {"free": 50.0, "locked": 0.0},
+    "OLD": {"free": 5.0, "locked": 0.0},
+}
+
+PRICES = {"BTCUSDT": 40000.0, "ETHUSDT": 2000.0, "XYZBTC": 0.00001, "XYZETH": 0.0002, "USDTBRL": 5.0}
+
+
+def call(**kwargs):
+    def ticker_prices(symbols):
+        return {"success": True, "data": {"prices": {s: PRICES[s] for s in symbols}}, "metadata": {"source": "binance_api"}}
+
+    prices = Mock(side_effect=ticker_prices)
+    with patch("binance_mcp_server.tools.get_portfolio_value.exchange_info_cache.get", return_value=INDEX), \
+         patch("binance_mcp_server.tools.get_portfolio_value.get_balance",
+               return_value={"success": True, "data": BALANCES}), \
+         patch("binance_mcp_server.tools.get_portfolio_value.get_ticker_prices", prices):
+        return get_portfolio_value(**kwargs), prices
+
+
+class TestGetPortfolioValue:
+    """Test cases for get_portfolio_value."""
+
+    def test_values_all_assets_from_one_price_snapshot(self):
+        result, prices = call()
+
+        assert result["success"]
+        data = result["data"]
+        holdings = {holding["asset"]: holding for holding in data["holdings"]}
+        prices.assert_called_once_with(["BTCUSDT", "USDTBRL", "XYZBTC"])
+        assert holdings["XYZ"]["route"] == ["XYZBTC", "BTCUSDT"]
+        assert abs(holdings["XYZ"]["value"] - 600.0) < 1e-9
+        assert abs(holdings["BRL"]["value"] - 10.0) < 1e-9
+        assert abs(data["total_value"] - 4710.0) < 1e-9
+        assert abs(sum(holding["weight"] for holding in data["holdings"]) - 1) < 1e-5
+        assert [holding["asset"] for holding in data["holdings"]] == ["BTC", "XYZ", "USDT", "BRL"]
+        assert data["unpriced"] == ["OLD"]
+
+    def test_min_value_hides_small_holdings_but_keeps_total(self):
+        result, _ = call(quote_asset="usdt", min_value=50)
+
+        assert [holding["asset"] for holding in result["data"]["holdings"]] == ["BTC", "XYZ", "USDT"]
+        assert result["data"]["hidden"] == 1
+        assert abs(result["data"]["total_value"] - 4710.0) < 1e-9
+
+        unknown, _ = call(quote_asset="NOPE")
+        assert unknown["error"]["type"] == "validation_error"
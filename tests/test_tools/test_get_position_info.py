@@ -0,0 +1,69 @@
+"""
+Tests for get_position_info.
+
+This module verifies that flat positions are dropped server-side, that numeric
+strings are coerced, that the compact mode is column-oriented, and that a
+synced futures user data stream answers without a REST request.
+"""
+
+from unittest.mock import Mock, patch
+
+from binance_mcp_server.account_state import FuturesAccountState
+from binance_mcp_server.rate_limiter import futures_rate_limiter
+from binance_mcp_server.tools.get_position_info import get_position_info, COMPACT_COLUMNS
+
+
+def position(symbol, amount, entry="0.0", mark="100"):
+    return {
+        "symbol": symbol, "positionSide": "BOTH", "positionAmt": amount, "entryPrice": entry,
+        "markPrice": mark, "unRealizedProfit": "0.00000000", "liquidationPrice": "0", "leverage": "20",
+        "marginType": "cross", "isolatedWallet": "0", "isAutoAddMargin": "false", "notional": "0",
+        "updateTime": 1000,
+    }
+
+
+POSITIONS = [position(f"COIN{i}USDT", "0.000") for i in range(300)] + [
+    position("BTCUSDT", "0.010", entry="60000", mark="61000"),
+    position("ETHUSDT", "-1.5", entry="3000", mark="2900"),
+]
+
+
+def call(client, **kwargs):
+    with patch("binance_mcp_server.tools.get_position_info.get_binance_client", return_value=client), \
+         patch.object(futures_rate_limiter, "acquire", return_value=(True, "")):
+        return get_position_info(**kwargs)
+
+
+class TestGetPositionInfo:
+    """Test cases for get_position_info."""
+
+    def test_flat_positions_dropped_and_numbers_coerced(self):
+        client = Mock(futures_position_information=Mock(return_value=[dict(p) for p in POSITIONS]))
+
+        result = call(client)
+
+        assert [p["symbol"] for p in result["data"]] == ["BTCUSDT", "ETHUSDT"]
+        eth = result["data"][1]
+        assert eth["positionAmt"] == -1.5 and eth["leverage"] == 20.0
+        assert eth["isAutoAddMargin"] is False
+        assert eth["marginType"] == "cross" and eth["updateTime"] == 1000
+        assert len(call(client, include_flat=True)["data"]) == len(POSITIONS)
+
+    def test_compact_mode_from_synced_stream(self):
+        state = FuturesAccountState(max_snapshot_attempts=1)
+        with patch.object(state, "_fetch_snapshot", return_value=[dict(p) for p in POSITIONS]):
+            state._resync()
+        client = Mock()
+
+        with patch("binance_mcp_server.tools.get_position_info.futures_account_state", state):
+            result = call(client, compact=True)
+
+        assert result["metadata"]["source"] == "user_data_stream"
+        assert {"markPrice", "unRealizedProfit", "liquidationPrice", "notional"} <= set(result["metadata"]["omitted_fields"])
+        assert result["data"]["columns"] == COMPACT_COLUMNS
+        rows = [dict(zip(COMPACT_COLUMNS, row)) for row in result["data"]["rows"]]
+        # Snapshot mark prices are not presented as live
+        assert [(row["symbol"], row["positionAmt"], row["markPrice"], row["notional"]) for row in rows] == [
+            ("BTCUSDT", 0.01, None, None), ("ETHUSDT", -1.5, None, None)
+        ]
+        assert client.method_calls == []
@@ -0,0 +1,56 @@
+"""
+Tests for get_server_stats.
+
+This module verifies that the server's rate limit, coalescing and client
+pool metrics are exported without making Binance requests.
+"""
+
+from unittest.mock import Mock, patch
+
+from binance_mcp_server.client_pool import BinanceClientPool, _PooledClient
+from binance_mcp_server.coalescing import single_flight
+from binance_mcp_server.rate_limiter import RequestPriority, sapi_rate_limiter
+from binance_mcp_server.tools.get_server_stats import get_server_stats
+
+
+class TestGetServerStats:
+    """Test cases for get_server_stats."""
+
+    @patch('binance_mcp_server.utils.get_binance_client')
+    def test_rate_limit_metrics_exported(self, mock_get_client):
+        reservation, _ = sapi_rate_limiter.acquire(7, priority=RequestPriority.HISTORY)
+        try:
+            result = get_server_stats()
+        finally:
+            sapi_rate_limiter.refund(reservation)
+
+        assert result["success"] is True
+        limits = result["data"]["rate_limits"]
+        assert set(limits) == {"spot", "spot_orders_10s", "spot_orders_1d", "sapi", "futures"}
+        sapi = limits["sapi"]
+        assert sapi["classes"]["HISTORY"]["used_weight"] >= 7
+        assert {"queue_depth", "max_queue_depth", "avg_wait_seconds", "max_wait_seconds"} <= set(sapi)
+        mock_get_client.assert_not_called()
+
+    def test_coalescing_savings_exported(self):
+        with patch.dict(single_flight._stats, {"get_ticker": {"leaders": 3, "coalesced": 5, "weight_saved": 10}}):
+            result = get_server_stats()
+
+        coalescing = result["data"]["coalescing"]
+        assert coalescing["tools"]["get_ticker"] == {"leaders": 3, "coalesced": 5, "weight_saved": 10}
+        assert coalescing["totals"]["weight_saved"] >= 10
+        assert coalescing["in_flight"] >= 0
+
+    def test_client_pool_stats_exported(self):
+        pool = BinanceClientPool(pool_maxsize=16, health_check_interval=0)
+        entry = _PooledClient(Mock(), "fingerprint")
+        entry.checkouts, entry.requests = 4, 3
+        pool._clients["fingerprint"] = entry
+
+        with patch("binance_mcp_server.tools.get_server_stats.get_client_pool", return_value=pool):
+            result = get_server_stats()
+
+        stats = result["data"]["client_pool"]
+        assert stats["pool_maxsize"] == 16 and stats["active_clients"] == 1
+        assert stats["clients"][0]["checkouts"] == 4 and stats["clients"][0]["requests"] == 3
+        entry.client.ping.assert_not_called()
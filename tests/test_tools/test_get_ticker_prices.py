@@ -0,0 +1,66 @@
+"""
+Tests for the get_ticker_prices tool.
+
+This module verifies endpoint selection by weight, unknown-symbol handling and
+the compact price mapping.
+"""
+
+import json
+from unittest.mock import Mock, patch
+
+from binance_mcp_server.tools.get_ticker_prices import get_ticker_prices, _ticker_prices_weight
+
+
+LISTED = Mock(symbols={"BTCUSDT": {}, "ETHUSDT": {}, "BNBUSDT": {}})
+
+
+class TestGetTickerPrices:
+    """Test cases for the get_ticker_prices function."""
+
+    @patch('binance_mcp_server.tools.get_ticker_prices.exchange_info_cache')
+    @patch('binance_mcp_server.tools.get_ticker_prices.get_binance_client')
+    def test_multi_symbol_request(self, mock_get_client, mock_cache):
+        """Test that several symbols are fetched in one symbols= request."""
+        mock_cache.get.return_value = LISTED
+        mock_client = mock_get_client.return_value
+        mock_client.get_symbol_ticker.return_value = [
+            {"symbol": "BTCUSDT", "price": "43000.10"},
+            {"symbol": "ETHUSDT", "price": "2300.50"},
+        ]
+
+        result = get_ticker_prices(["btcusdt", "ETHUSDT", "BTCUSDT", "FAKEUSDT"])
+
+        assert result["success"] is True
+        assert result["data"]["prices"] == {"BTCUSDT": 43000.10, "ETHUSDT": 2300.50}
+        assert result["data"]["missing"] == ["FAKEUSDT"]
+        assert result["metadata"]["mode"] == "multi"
+        params = mock_client.get_symbol_ticker.call_args.kwargs
+        assert json.loads(params["symbols"]) == ["BTCUSDT", "ETHUSDT"]
+
+    @patch('binance_mcp_server.tools.get_ticker_prices.get_binance_client')
+    def test_all_symbols_request(self, mock_get_client):
+        """Test that no symbol list fetches every price in one request."""
+        mock_get_client.return_value.get_symbol_ticker.return_value = [
+            {"symbol": "BTCUSDT", "price": "43000.10"},
+            {"symbol": "ETHBTC", "price": "0.053"},
+        ]
+
+        result = get_ticker_prices()
+
+        assert result["data"]["count"] == 2
+        assert result["metadata"]["mode"] == "all"
+        mock_get_client.return_value.get_symbol_ticker.assert_called_once_with()
+
+    def test_weight_follows_endpoint_form(self):
+        """Test that one symbol costs 2 and any larger set costs 4."""
+        assert _ticker_prices_weight(["BTCUSDT"]) == 2
+        assert _ticker_prices_weight(["BTCUSDT", "ETHUSDT"]) == 4
+        assert _ticker_prices_weight([f"SYM{i}USDT" for i in range(500)]) == 4
+        assert _ticker_prices_weight(None) == 4
+
+    def test_invalid_symbols_rejected(self):
+        """Test validation of the symbols parameter."""
+        for symbols in ([], ["B$"], 42):
+            result = get_ticker_prices(symbols)
+            assert result["success"] is False
+            assert result["error"]["type"] == "validation_error"
@@ -0,0 +1,139 @@
+"""
+Tests for get_transaction_history.
+
+This module verifies that long ranges are split into legal 90-day windows per
+coin and type, that results are merged, de-duplicated and sorted by time, that
+cursors resume at their window instead of refetching the range, and that
+failures of one coin are reported without losing the others or skipping records.
+"""
+
+from unittest.mock import Mock, patch
+
+from binance.exceptions import BinanceAPIException
+
+from binance_mcp_server.rate_limiter import sapi_rate_limiter
+from binance_mcp_server.tools.get_transaction_history import get_transaction_history
+
+
+DAY = 24 * 60 * 60 * 1000
+START = 1_700_000_000_000
+END = START + 365 * DAY - 1
+
+DEPOSITS = [
+    {"id": f"d{coin}{i}", "coin": coin, "amount": "1", "status": 1, "insertTime": START + i * 7 * DAY + n}
+    for n, coin in enumerate(["BTC", "ETH", "USDT"])
+    for i in range(52)
+]
+
+WITHDRAWALS = [
+    {"id": "w1", "coin": "USDT", "amount": "5", "status": 6, "applyTime": "2023-11-20 00:00:00"},
+    {"id": "w2", "coin": "BTC", "amount": "0.1", "status": 6, "applyTime": "2024-03-01 12:30:00"},
+]
+
+
+def windowed(records, time_of):
+    """Fake wallet history endpoint enforcing the 90-day window."""
+    def fetch(coin=None, startTime=None, endTime=None, offset=0, limit=None):
+        assert endTime - startTime < 90 * DAY
+        matches = [r for r in records if (coin is None or r["coin"] == coin) and startTime <= time_of(r) <= endTime]
+        # The exchange may repeat a record at a window edge; it must be de-duplicated
+        return [dict(r) for r in matches] + [dict(matches[0])] if matches else []
+    return fetch
+
+
+def make_client():
+    from binance_mcp_server.tools.get_withdraw_history import _apply_time_ms
+    client = Mock()
+    client.get_deposit_history.side_effect = windowed(DEPOSITS, lambda r: r["insertTime"])
+    client.get_withdraw_history.side_effect = windowed(WITHDRAWALS, _apply_time_ms)
+    return client
+
+
+def call(client, **kwargs):
+    with patch("binance_mcp_server.tools.get_deposit_history.get_binance_client", return_value=client), \
+         patch("binance_mcp_server.tools.get_withdraw_history.get_binance_client", return_value=client), \
+         patch.object(sapi_rate_limiter, "acquire", return_value=(True, "")):
+        return get_transaction_history(start_time=START, end_time=END, **kwargs)
+
+
+class TestGetTransactionHistory:
+    """Test cases for get_transaction_history."""
+
+    def test_fans_out_windows_and_merges_sorted(self):
+        client = make_client()
+        result = call(client, coins=["btc", "ETH", "USDT"], limit=10000)
+
+        assert result["success"]
+        data = result["data"]
+        # 3 coins x 2 types x 5 windows of at most 90 days
+        assert data["requests"] == 30
+        assert data["count"] == len(DEPOSITS) + len(WITHDRAWALS)
+        times = [record["time"] for record in data["records"]]
+        assert times == sorted(times)
+        assert {record["type"] for record in data["records"]} == {"deposit", "withdrawal"}
+
+    def test_cursor_pages_through_merged_records(self):
+        client = make_client()
+        seen = []
+        result = call(client, transaction_type="deposit", limit=40)
+        while True:
+            seen.extend(record["id"] + record["coin"] for record in result["data"]["records"])
+            if not result["data"]["has_more"]:
+                break
+            result = call(client, transaction_type="deposit", cursor=result["data"]["next_cursor"], limit=40)
+
+        assert len(seen) == len(set(seen)) == len(DEPOSITS)
+        # Without a coin list every window is one all-coins request
+        assert all(c.kwargs["coin"] is None for c in client.get_deposit_history.call_args_list)
+
+    def test_failed_coin_reported_with_partial_results(self):
+        client = make_client()
+        fetch = client.get_withdraw_history.side_effect
+
+        def failing(coin=None, **kwargs):
+            if coin == "BTC":
+                raise BinanceAPIException(Mock(status_code=400, text='{"code": -1100, "msg": "bad coin"}'), 400, '{"code": -1100, "msg": "bad coin"}')
+            return fetch(coin=coin, **kwargs)
+
+        client.get_withdraw_history.side_effect = failing
+        result = call(client, transaction_type="withdrawal", coins=["BTC", "USDT"])
+
+        assert result["success"]
+        assert [record["id"] for record in result["data"]["records"]] == ["w1"]
+        assert result["data"]["errors"][0]["coin"] == "BTC"
+
+    def test_cursor_resumes_at_its_window(self):
+        client = make_client()
+        first = call(client, transaction_type="deposit", limit=40, max_concurrency=1)
+
+        # 39 deposits fit in the first window, so the page is complete after the second
+        assert client.get_deposit_history.call_count == 2
+        client.get_deposit_history.reset_mock()
+        cursor_time = first["data"]["records"][-1]["time"]
+        second = call(client, transaction_type="deposit", cursor=first["data"]["next_cursor"], limit=40, max_concurrency=1)
+
+        starts = [c.kwargs["startTime"] for c in client.get_deposit_history.call_args_list]
+        assert min(starts) <= cursor_time < min(starts) + 90 * DAY
+        assert len(starts) == 2
+        assert second["data"]["records"][0]["time"] > cursor_time
+
+    def test_failed_window_is_retried_not_skipped(self):
+        client = make_client()
+        fetch = client.get_deposit_history.side_effect
+        failures = []
+
+        def flaky(startTime=None, **kwargs):
+            if startTime >= START + 180 * DAY and not failures:
+                failures.append(startTime)
+                raise BinanceAPIException(Mock(status_code=500, text='{"code": -1001, "msg": "internal"}'), 500, '{"code": -1001, "msg": "internal"}')
+            return fetch(startTime=startTime, **kwargs)
+
+        client.get_deposit_history.side_effect = flaky
+        first = call(client, transaction_type="deposit", limit=10000, max_concurrency=1)
+        second = call(client, transaction_type="deposit", cursor=first["data"]["next_cursor"], limit=10000)
+
+        assert first["data"]["errors"][0]["start_time"] == failures[0]
+        assert first["data"]["has_more"] and first["data"]["records"][-1]["time"] < failures[0]
+        ids = [r["id"] for r in first["data"]["records"] + second["data"]["records"]]
+        assert len(ids) == len(set(ids)) == len(DEPOSITS)
+        assert not second["data"]["has_more"]
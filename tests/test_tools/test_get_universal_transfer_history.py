@@ -0,0 +1,140 @@
+"""
+Tests for get_universal_transfer_history.
+
+This module verifies that every transfer type is paged through with
+current/size and merged into one sorted timeline, that pages of settled
+ranges are cached while recent ones are refetched, and that a failing
+transfer type is reported without losing the others.
+"""
+
+import time
+from unittest.mock import Mock, patch
+
+from binance.exceptions import BinanceAPIException
+
+from binance_mcp_server.rate_limiter import sapi_rate_limiter
+from binance_mcp_server.tools.get_universal_transfer_history import get_universal_transfer_history
+
+
+DAY = 24 * 60 * 60 * 1000
+NOW = int(time.time() * 1000)
+START = NOW - 30 * DAY
+
+TRANSFERS = {
+    "MAIN_UMFUTURE": [
+        {"asset": "USDT", "amount": "10", "type": "MAIN_UMFUTURE", "status": "CONFIRMED",
+         "tranId": 1000 + i, "timestamp": START + i * 3600 * 1000}
+        for i in range(250)
+    ],
+    "UMFUTURE_MAIN": [
+        {"asset": "USDT", "amount": "2.5", "type": "UMFUTURE_MAIN", "status": "CONFIRMED",
+         "tranId": 5000 + i, "timestamp": START + i * DAY + 1}
+        for i in range(30)
+    ],
+}
+
+
+def fake_transfers(type, startTime, endTime, current, size):
+    """Fake /sapi/v1/asset/transfer: newest first, paged with current/size."""
+    matches = sorted(
+        (row for row in TRANSFERS.get(type, []) if startTime <= row["timestamp"] <= endTime),
+        key=lambda row: -row["timestamp"]
+    )
+    rows = matches[(current - 1) * size:current * size]
+    return {"total": len(matches), "rows": [dict(row) for row in rows]} if matches else {"total": 0}
+
+
+def make_client():
+    client = Mock()
+    client.query_universal_transfer_history.side_effect = fake_transfers
+    return client
+
+
+def call(client, **kwargs):
+    with patch("binance_mcp_server.tools.get_universal_transfer_history.get_binance_client", return_value=client), \
+         patch.object(sapi_rate_limiter, "acquire", return_value=(True, "")):
+        return get_universal_transfer_history(**kwargs)
+
+
+class TestGetUniversalTransferHistory:
+    """Test cases for get_universal_transfer_history."""
+
+    def test_pages_every_type_and_merges_timeline(self):
+        client = make_client()
+        result = call(client, transfer_types=["MAIN_UMFUTURE", "umfuture_main"], start_time=START, end_time=NOW)
+
+        assert result["success"]
+        data = result["data"]
+        assert data["count"] == 280
+        timestamps = [row[0] for row in data["rows"]]
+        assert timestamps == sorted(timestamps)
+        assert data["columns"] == ["timestamp", "type", "asset", "amount", "status", "tranId"]
+        assert data["totals"] == {"MAIN_UMFUTURE": {"USDT": "2500"}, "UMFUTURE_MAIN": {"USDT": "75"}}
+        assert all(c.kwargs["size"] == 100 for c in client.query_universal_transfer_history.call_args_list)
+
+    def test_settled_pages_are_cached(self):
+        client = make_client()
+        first = call(client, transfer_types=["MAIN_UMFUTURE"], start_time=START, end_time=NOW)
+        client.query_universal_transfer_history.reset_mock()
+        second = call(client, transfer_types=["MAIN_UMFUTURE"], start_time=START, end_time=NOW)
+
+        assert second["data"]["rows"] == first["data"]["rows"]
+        # Only the live part of the range (the last day or two) is fetched again
+        assert second["data"]["requests"] == 1
+        live_start = client.query_universal_transfer_history.call_args.kwargs["startTime"]
+        assert NOW - 3 * DAY < live_start <= NOW - DAY
+
+        client.query_universal_transfer_history.reset_mock()
+        historical = call(client, transfer_types=["MAIN_UMFUTURE"], start_time=START, end_time=START + 5 * DAY)
+        again = call(client, transfer_types=["MAIN_UMFUTURE"], start_time=START, end_time=START + 5 * DAY)
+        assert historical["data"]["count"] == again["data"]["count"] == 121
+        assert again["data"]["requests"] == 0
+
+    def test_rolling_default_range_reuses_settled_pages(self):
+        client = make_client()
+        clock = "binance_mcp_server.tools.get_universal_transfer_history.time.time"
+        with patch(clock, return_value=NOW / 1000):
+            first = call(client, transfer_types=["UMFUTURE_MAIN"])
+        client.query_universal_transfer_history.reset_mock()
+        # A minute later the default range has moved, but its settled days have not
+        later = NOW / 1000 + 60
+        with patch(clock, return_value=later):
+            second = call(client, transfer_types=["UMFUTURE_MAIN"])
+
+        assert first["data"]["count"] == 7
+        # The oldest transfer has left the moved range and is dropped locally
+        assert second["data"]["count"] == 6
+        # Zero settled-window requests: only the live part of the range is fetched again
+        assert second["data"]["requests"] == 1
+        live_start = client.query_universal_transfer_history.call_args.kwargs["startTime"]
+        assert live_start % DAY == 0 and live_start > int(later * 1000) - 3 * DAY
+
+    def test_failed_type_reported_with_partial_results(self):
+        client = make_client()
+
+        def failing(type, **kwargs):
+            if type == "MAIN_MARGIN":
+                raise BinanceAPIException(Mock(status_code=400, text='{"code": -1002, "msg": "unauthorized"}'), 400, '{"code": -1002, "msg": "unauthorized"}')
+            return fake_transfers(type, **kwargs)
+
+        client.query_universal_transfer_history.side_effect = failing
+        result = call(client, transfer_types=["MAIN_MARGIN", "UMFUTURE_MAIN"], start_time=START, end_time=NOW)
+
+        assert result["success"]
+        assert result["data"]["count"] == 30
+        assert result["data"]["errors"][0]["type"] == "MAIN_MARGIN"
+
+        def timing_out(type, **kwargs):
+            if type == "MAIN_MARGIN":
+                raise TimeoutError("read timed out")
+            return fake_transfers(type, **kwargs)
+
+        client.query_universal_transfer_history.side_effect = timing_out
+        timed_out = call(client, transfer_types=["MAIN_MARGIN", "UMFUTURE_MAIN"], start_time=START, end_time=NOW)
+
+        assert timed_out["success"]
+        assert timed_out["data"]["count"] == 30
+        assert timed_out["data"]["errors"][0]["type"] == "MAIN_MARGIN"
+
+        invalid = call(client, transfer_types=["MAIN_MOON"])
+        assert invalid["error"]["type"] == "validation_error"